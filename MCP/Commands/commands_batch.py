@@ -0,0 +1,59 @@
+"""Batch command for Unreal Engine.
+
+This module contains the batch command for the UnrealMCP bridge, which runs
+many commands in a single round trip.
+"""
+
+import sys
+import os
+from mcp.server.fastmcp import Context
+
+# Import async_send_command from the parent module
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from unreal_mcp_bridge import async_send_command
+
+def register_all(mcp):
+    """Register the batch command with the MCP server."""
+
+    @mcp.tool()
+    async def batch(ctx: Context, commands: list, stop_on_error: bool = False) -> dict:
+        """Run several commands in Unreal Engine in one round trip.
+
+        The commands run in order during a single server tick, which is much faster than
+        calling the individual tools one by one (e.g. when creating hundreds of objects).
+
+        Args:
+            commands: Ordered list of commands, each a dictionary with:
+                - type: str, the command name (e.g., 'create_object', 'modify_object', 'create_material')
+                - params: dict, the parameters for that command
+            stop_on_error: If True, commands after the first failure are skipped
+
+        Returns:
+            Dictionary containing:
+                - count: int, number of commands in the batch
+                - succeeded / failed / skipped: int, number of commands with each outcome
+                - results: list, one entry per command in order with index, type, status and
+                  either result or message
+                - error: str, only present if at least one command failed
+
+        Examples:
+            batch(commands=[
+                {"type": "create_object", "params": {"type": "CUBE", "location": [0, 0, 0], "label": "Pillar1"}},
+                {"type": "create_object", "params": {"type": "CUBE", "location": [200, 0, 0], "label": "Pillar2"}}
+            ])
+        """
+        try:
+            params = {
+                "commands": commands,
+                "stop_on_error": stop_on_error
+            }
+            response = await async_send_command("batch", params)
+            if response["status"] == "success":
+                return response["result"]
+            else:
+                # Partial failures still carry the per-command results
+                result = dict(response.get("result", {}))
+                result["error"] = response["message"]
+                return result
+        except Exception as e:
+            return {"error": str(e)}
@@ -0,0 +1,135 @@
+"""Blueprint-related commands for Unreal Engine.
+
+This module contains all blueprint-related commands for the UnrealMCP bridge,
+including creation, modification, events and querying of blueprints.
+
+get_blueprint_info is answered from a cache of blueprint info keyed by path.
+The server only walks a blueprint's graphs and class options again after
+it has changed, and create_blueprint, modify_blueprint and
+create_blueprint_event drop the cached info of their blueprint; batch and
+execute_python, which may edit any blueprint, drop it all.
+"""
+
+import sys
+import os
+from mcp.server.fastmcp import Context
+
+# Import async_send_command from the parent module
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from unreal_mcp_bridge import async_send_command
+from utils.cache import AssetInfoCache
+
+# Blueprint info by object path, shared by the blueprint tools
+blueprint_cache = AssetInfoCache("get_blueprint_info", path_param="blueprint_path").attach()
+
+def register_all(mcp):
+    """Register all blueprint-related commands with the MCP server."""
+
+    # Create blueprint command
+    @mcp.tool()
+    async def create_blueprint(ctx: Context, package_path: str, name: str, parent_class: str = "Actor") -> str:
+        """Create a new blueprint in the Unreal project.
+
+        Args:
+            package_path: The path where the blueprint should be created (e.g., '/Game/Blueprints')
+            name: The name of the blueprint
+            parent_class: The class the blueprint derives from (default: 'Actor')
+        """
+        try:
+            params = {
+                "package_path": package_path,
+                "name": name,
+                "properties": {"parent_class": parent_class}
+            }
+            response = await async_send_command("create_blueprint", params)
+            blueprint_cache.invalidate(f"{package_path.rstrip('/')}/{name}")
+            if response["status"] == "success":
+                return f"Created blueprint: {response['result']['name']} at path: {response['result']['path']}"
+            else:
+                return f"Error: {response['message']}"
+        except Exception as e:
+            return f"Error creating blueprint: {str(e)}"
+
+    # Modify blueprint command
+    @mcp.tool()
+    async def modify_blueprint(ctx: Context, blueprint_path: str, properties: dict) -> str:
+        """Modify an existing blueprint's properties.
+
+        Args:
+            blueprint_path: The full path to the blueprint (e.g., '/Game/Blueprints/BP_Door')
+            properties: Dictionary of blueprint properties to set. Can include:
+                - description: str
+                - category: str
+                - parent_class: str
+                - options: dict with namespace, display_name, compile_mode ("Default", "Development",
+                  "FinalRelease"), hide_categories (list), abstract_class, const_class and deprecate (bool)
+        """
+        try:
+            params = {
+                "blueprint_path": blueprint_path,
+                "properties": properties
+            }
+            response = await async_send_command("modify_blueprint", params)
+            blueprint_cache.invalidate(blueprint_path)
+            if response["status"] == "success":
+                return f"Modified blueprint: {blueprint_path}"
+            else:
+                return f"Error: {response['message']}"
+        except Exception as e:
+            return f"Error modifying blueprint: {str(e)}"
+
+    # Get blueprint info command
+    @mcp.tool()
+    async def get_blueprint_info(ctx: Context, blueprint_path: str) -> dict:
+        """Get information about a blueprint.
+
+        Args:
+            blueprint_path: The full path to the blueprint (e.g., '/Game/Blueprints/BP_Door')
+
+        Returns:
+            Dictionary containing blueprint information including:
+                - name, path, parent_class: str
+                - category, description, display_name, namespace, blueprint_type: str
+                - class_options: dict
+                - functions: list of function graphs
+                - events: list of event nodes
+        """
+        try:
+            response = await blueprint_cache.aget(async_send_command, blueprint_path)
+            if response["status"] == "success":
+                info = response["result"]
+                info.pop("stamp", None)
+                return info
+            else:
+                return {"error": response["message"]}
+        except Exception as e:
+            return {"error": str(e)}
+
+    # Create blueprint event command
+    @mcp.tool()
+    async def create_blueprint_event(ctx: Context, event_name: str, blueprint_path: str = None,
+                                     parameters: dict = None) -> str:
+        """Add an event node to a blueprint's event graph.
+
+        Args:
+            event_name: The name of the event (e.g., 'BeginPlay')
+            blueprint_path: The full path to the blueprint; a new blueprint under
+                            /Game/GeneratedBlueprints is created if omitted or missing
+            parameters: Optional event parameters
+        """
+        try:
+            params = {"event_name": event_name}
+            if blueprint_path:
+                params["blueprint_path"] = blueprint_path
+            if parameters:
+                params["parameters"] = parameters
+            response = await async_send_command("create_blueprint_event", params)
+            if blueprint_path:
+                blueprint_cache.invalidate(blueprint_path)
+            if response["status"] == "success":
+                blueprint_cache.invalidate(response["result"]["path"])
+                return f"Created event: {event_name} in blueprint: {response['result']['path']}"
+            else:
+                return f"Error: {response['message']}"
+        except Exception as e:
+            return f"Error creating blueprint event: {str(e)}"
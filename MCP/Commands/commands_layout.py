@@ -0,0 +1,176 @@
+"""Layout commands for Unreal Engine.
+
+This module contains the tools that arrange groups of actors: grid, circle,
+path, scatter and align layouts. Each tool reads the selected actors with one
+columnar query_actors snapshot, computes all new locations at once with
+utils.layout and moves the actors with a single modify_objects command, so
+the whole arrangement is one undo step in the editor.
+
+The layout tools need NumPy (see requirements.txt); without it they are
+still listed but answer with an error telling how to install it.
+"""
+
+import sys
+import os
+import json
+import importlib.util
+from mcp.server.fastmcp import Context
+
+# Import async_send_command from the parent module
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from unreal_mcp_bridge import async_send_command
+from utils.layout import (
+    aapply_layout, align_layout, aread_layout_selection, circle_layout, distribute_layout, facing_rotations,
+    grid_layout, path_layout, scatter_layout
+)
+
+
+def _selection_filter(class_name, label, tag):
+    """Build the query_actors filter selecting the actors to arrange."""
+    return {key: value for key, value in (("class", class_name), ("label", label), ("tag", tag)) if value}
+
+
+async def _arrange(names, class_name, label, tag, layout):
+    """Read the selected actors, lay them out and move them in one request.
+
+    layout is called with the current (N, 3) locations and returns the new
+    locations and optional rotations. If it returns fewer locations than
+    there are actors, the remaining actors are not moved and are listed in
+    'not_placed'.
+    """
+    if importlib.util.find_spec("numpy") is None:
+        return "Error: The layout tools need NumPy. Install it into the bridge's Python environment with: pip install numpy"
+    selected, locations = await aread_layout_selection(async_send_command, names,
+                                                       _selection_filter(class_name, label, tag))
+    if not selected:
+        return "Error: No actors matched the selection"
+    new_locations, rotations = layout(locations)
+    moved = selected[:len(new_locations)]
+    result = await aapply_layout(async_send_command, moved, new_locations, rotations)
+    if len(moved) < len(selected):
+        result["not_placed"] = selected[len(moved):]
+    return json.dumps(result, indent=2)
+
+
+def register_all(mcp):
+    """Register all layout commands with the MCP server."""
+
+    @mcp.tool()
+    async def arrange_in_grid(ctx: Context, names: list = None, class_name: str = None, label: str = None,
+                              tag: str = None, columns: int = None, spacing: list = None, origin: list = None) -> str:
+        """Arrange actors on a grid in the XY plane with a single request.
+
+        Select the actors by names and/or filter conditions. With names, the actors are placed
+        in the order given, row by row.
+
+        Args:
+            names: Names or labels of the actors to arrange
+            class_name: Arrange actors of this class or a subclass
+            label: Wildcard pattern for the labels of the actors to arrange (e.g. 'Crate_*')
+            tag: Arrange actors with this actor tag
+            columns: Actors per row (default: a square grid)
+            spacing: Distance between columns and rows as [x, y] (default: [200, 200])
+            origin: Position [x, y, z] of the first actor (default: the minimum corner of the current locations)
+        """
+        try:
+            def layout(locations):
+                start = origin if origin is not None else locations.min(axis=0)
+                return grid_layout(len(locations), columns, spacing or (200.0, 200.0), start), None
+            return await _arrange(names, class_name, label, tag, layout)
+        except Exception as e:
+            return f"Error arranging actors in a grid: {str(e)}"
+
+    @mcp.tool()
+    async def arrange_in_circle(ctx: Context, radius: float, names: list = None, class_name: str = None,
+                                label: str = None, tag: str = None, center: list = None, start_angle: float = 0.0,
+                                face_center: bool = False) -> str:
+        """Arrange actors evenly on a circle in the XY plane with a single request.
+
+        Args:
+            radius: Radius of the circle in Unreal units
+            names: Names or labels of the actors to arrange, in order around the circle
+            class_name: Arrange actors of this class or a subclass
+            label: Wildcard pattern for the labels of the actors to arrange
+            tag: Arrange actors with this actor tag
+            center: Center [x, y, z] of the circle (default: the centroid of the current locations)
+            start_angle: Angle of the first actor in degrees, counter-clockwise from +X (default: 0)
+            face_center: Turn every actor to face the center (default: False)
+        """
+        try:
+            def layout(locations):
+                middle = center if center is not None else locations.mean(axis=0)
+                positions = circle_layout(len(locations), middle, radius, start_angle)
+                return positions, facing_rotations(positions, middle) if face_center else None
+            return await _arrange(names, class_name, label, tag, layout)
+        except Exception as e:
+            return f"Error arranging actors in a circle: {str(e)}"
+
+    @mcp.tool()
+    async def arrange_along_path(ctx: Context, points: list, names: list = None, class_name: str = None,
+                                 label: str = None, tag: str = None, closed: bool = False) -> str:
+        """Distribute actors at equal distances along a line or path with a single request.
+
+        Two points give a straight line. For a curve or spline, pass points sampled along it.
+
+        Args:
+            points: Path points as a list of [x, y, z] (at least two)
+            names: Names or labels of the actors to distribute, in order along the path
+            class_name: Distribute actors of this class or a subclass
+            label: Wildcard pattern for the labels of the actors to distribute
+            tag: Distribute actors with this actor tag
+            closed: Treat the path as a loop back to the first point (default: False)
+        """
+        try:
+            return await _arrange(names, class_name, label, tag,
+                                  lambda locations: (path_layout(len(locations), points, closed), None))
+        except Exception as e:
+            return f"Error arranging actors along a path: {str(e)}"
+
+    @mcp.tool()
+    async def scatter_actors(ctx: Context, box_min: list, box_max: list, min_distance: float, names: list = None,
+                             class_name: str = None, label: str = None, tag: str = None, seed: int = None) -> str:
+        """Scatter actors randomly in a box, keeping a minimum distance between them, with a single request.
+
+        Uses Poisson-disk sampling in the XY plane, so the actors are spread evenly without clumps.
+        If the box cannot fit every actor at min_distance, the remaining actors are not moved and
+        are listed in 'not_placed'.
+
+        Args:
+            box_min: Minimum corner [x, y, z] of the box
+            box_max: Maximum corner [x, y, z] of the box (use the same Z as box_min to scatter on a plane)
+            min_distance: Minimum distance between two actors in Unreal units
+            names: Names or labels of the actors to scatter
+            class_name: Scatter actors of this class or a subclass
+            label: Wildcard pattern for the labels of the actors to scatter
+            tag: Scatter actors with this actor tag
+            seed: Random seed, for a repeatable result
+        """
+        try:
+            return await _arrange(names, class_name, label, tag, lambda locations: (
+                scatter_layout(len(locations), box_min, box_max, min_distance, seed), None))
+        except Exception as e:
+            return f"Error scattering actors: {str(e)}"
+
+    @mcp.tool()
+    async def align_actors(ctx: Context, axis: str = "x", mode: str = "min", names: list = None,
+                           class_name: str = None, label: str = None, tag: str = None) -> str:
+        """Align or evenly distribute actors along an axis with a single request.
+
+        Args:
+            axis: 'x', 'y' or 'z'
+            mode: 'min', 'center' or 'max' to move every actor to the minimum, middle or maximum of
+                  their current locations on the axis; 'distribute' to space them evenly between the
+                  two outermost actors
+            names: Names or labels of the actors to align
+            class_name: Align actors of this class or a subclass
+            label: Wildcard pattern for the labels of the actors to align
+            tag: Align actors with this actor tag
+        """
+        try:
+            def layout(locations):
+                if mode == "distribute":
+                    return distribute_layout(locations, axis), None
+                return align_layout(locations, axis, mode), None
+            return await _arrange(names, class_name, label, tag, layout)
+        except Exception as e:
+            return f"Error aligning actors: {str(e)}"
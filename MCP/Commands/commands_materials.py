@@ -2,6 +2,11 @@
 
 This module contains all material-related commands for the UnrealMCP bridge,
 including creation, modification, and querying of materials.
+
+get_material_info is answered from a cache of material info keyed by path.
+The server only re-sends a material's properties after it has changed, and
+create_material and modify_material drop the cached info of their material,
+and batch and execute_python, which may edit any material, drop it all.
 """
 
 import sys
@@ -10,16 +15,20 @@ import importlib.util
 import importlib
 from mcp.server.fastmcp import Context
 
-# Import send_command from the parent module
+# Import async_send_command from the parent module
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from unreal_mcp_bridge import send_command
+from unreal_mcp_bridge import async_send_command
+from utils.cache import AssetInfoCache
+
+# Material info by object path, shared by the material tools
+material_cache = AssetInfoCache("get_material_info").attach()
 
 def register_all(mcp):
     """Register all material-related commands with the MCP server."""
     
     # Create material command
     @mcp.tool()
-    def create_material(ctx: Context, package_path: str, name: str, properties: dict = None) -> str:
+    async def create_material(ctx: Context, package_path: str, name: str, properties: dict = None) -> str:
         """Create a new material in the Unreal project.
         
         Args:
@@ -42,7 +51,8 @@ def register_all(mcp):
             }
             if properties:
                 params["properties"] = properties
-            response = send_command("create_material", params)
+            response = await async_send_command("create_material", params)
+            material_cache.invalidate(f"{package_path.rstrip('/')}/{name}")
             if response["status"] == "success":
                 return f"Created material: {response['result']['name']} at path: {response['result']['path']}"
             else:
@@ -52,7 +62,7 @@ def register_all(mcp):
 
     # Modify material command
     @mcp.tool()
-    def modify_material(ctx: Context, path: str, properties: dict) -> str:
+    async def modify_material(ctx: Context, path: str, properties: dict) -> str:
         """Modify an existing material's properties.
         
         Args:
@@ -72,7 +82,8 @@ def register_all(mcp):
                 "path": path,
                 "properties": properties
             }
-            response = send_command("modify_material", params)
+            response = await async_send_command("modify_material", params)
+            material_cache.invalidate(path)
             if response["status"] == "success":
                 return f"Modified material: {response['result']['name']} at path: {response['result']['path']}"
             else:
@@ -82,7 +93,7 @@ def register_all(mcp):
 
     # Get material info command
     @mcp.tool()
-    def get_material_info(ctx: Context, path: str) -> dict:
+    async def get_material_info(ctx: Context, path: str) -> dict:
         """Get information about a material.
         
         Args:
@@ -102,10 +113,11 @@ def register_all(mcp):
                 - roughness: float
         """
         try:
-            params = {"path": path}
-            response = send_command("get_material_info", params)
+            response = await material_cache.aget(async_send_command, path)
             if response["status"] == "success":
-                return response["result"]
+                info = response["result"]
+                info.pop("stamp", None)
+                return info
             else:
                 return {"error": response["message"]}
         except Exception as e:
@@ -7,15 +7,15 @@ import sys
 import os
 from mcp.server.fastmcp import Context
 
-# Import send_command from the parent module
+# Import async_send_command from the parent module
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from unreal_mcp_bridge import send_command
+from unreal_mcp_bridge import async_send_command
 
 def register_all(mcp):
     """Register all Python execution commands with the MCP server."""
     
     @mcp.tool()
-    def execute_python(ctx: Context, code: str = None, file: str = None) -> str:
+    async def execute_python(ctx: Context, code: str = None, file: str = None) -> str:
         """Execute Python code or a Python script file in Unreal Engine.
         
         This function allows you to execute arbitrary Python code directly in the Unreal Engine
@@ -64,7 +64,7 @@ def register_all(mcp):
             if file:
                 params["file"] = file
                 
-            response = send_command("execute_python", params)
+            response = await async_send_command("execute_python", params)
             
             # Handle the response
             if response["status"] == "success":
@@ -6,29 +6,137 @@ including getting scene information, creating, modifying, and deleting objects.
 
 import sys
 import os
+import json
 from mcp.server.fastmcp import Context
 
-# Import send_command from the parent module
+# Import async_send_command from the parent module
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from unreal_mcp_bridge import send_command
+from unreal_mcp_bridge import async_send_command
+from utils.bulk import acreate_objects, adelete_objects, amodify_objects
+
+
+def _format_result(result, compact):
+    """Serialize a result for the client, without indentation if compact is set."""
+    if compact:
+        return json.dumps(result, separators=(",", ":"))
+    return json.dumps(result, indent=2)
+
+
+def _actor_filter(class_name=None, name=None, label=None, label_regex=None, tag=None, box_min=None, box_max=None,
+                  near_point=None, radius=None):
+    """Build the 'filter' object of query_actors and delete_objects from tool arguments."""
+    actor_filter = {}
+    for key, value in (("class", class_name), ("name", name), ("label", label),
+                       ("label_regex", label_regex), ("tag", tag)):
+        if value:
+            actor_filter[key] = value
+    if box_min is not None or box_max is not None:
+        actor_filter["box"] = {"min": box_min, "max": box_max}
+    if near_point is not None or radius is not None:
+        actor_filter["near"] = {"point": near_point, "radius": radius}
+    return actor_filter
+
 
 def register_all(mcp):
     """Register all scene-related commands with the MCP server."""
     
     @mcp.tool()
-    def get_scene_info(ctx: Context) -> str:
-        """Get detailed information about the current Unreal scene."""
+    async def get_scene_info(ctx: Context, offset: int = 0, limit: int = None, fields: list = None,
+                             compact: bool = False) -> str:
+        """Get detailed information about the current Unreal scene.
+        
+        Large levels are returned in pages. If 'next_offset' in the result is not null,
+        call again with offset=next_offset to get the next page.
+        
+        Args:
+            offset: Index of the first actor to return (default: 0)
+            limit: Maximum number of actors to return (default: 1000, at most 10000)
+            fields: Per-actor fields to return, any of 'name', 'type', 'label', 'location', 'rotation'
+                    and 'scale' (default: name, type, label and location). Use ['name'] to list actors or ['type'] to count them per class;
+                    an empty list returns only the counts.
+            compact: Return JSON without indentation (default: False)
+        """
         try:
-            response = send_command("get_scene_info")
+            params = {"offset": offset}
+            if limit:
+                params["limit"] = limit
+            if fields is not None:
+                params["fields"] = fields
+            response = await async_send_command("get_scene_info", params)
             if response["status"] == "success":
-                return json.dumps(response["result"], indent=2)
+                return _format_result(response["result"], compact)
             else:
                 return f"Error: {response['message']}"
         except Exception as e:
             return f"Error getting scene info: {str(e)}"
 
     @mcp.tool()
-    def create_object(ctx: Context, type: str, location: list = None, label: str = None) -> str:
+    async def get_scene_changes(ctx: Context, since_version: int, fields: list = None, compact: bool = False) -> str:
+        """Get the actors added, modified and removed since a scene version.
+
+        get_scene_info and get_scene_changes both return the current scene 'version'.
+        If 'full_resync' in the result is true, the version is too old for a delta and
+        the scene has to be read again with get_scene_info.
+
+        Args:
+            since_version: The 'version' returned by the last get_scene_info or get_scene_changes call
+            fields: Fields of added and modified actors to return, as for get_scene_info (default: all)
+            compact: Return JSON without indentation (default: False)
+        """
+        try:
+            params = {"since_version": since_version}
+            if fields is not None:
+                params["fields"] = fields
+            response = await async_send_command("get_scene_changes", params)
+            if response["status"] == "success":
+                return _format_result(response["result"], compact)
+            else:
+                return f"Error: {response['message']}"
+        except Exception as e:
+            return f"Error getting scene changes: {str(e)}"
+
+    @mcp.tool()
+    async def query_actors(ctx: Context, class_name: str = None, name: str = None, label: str = None,
+                           label_regex: str = None, tag: str = None, box_min: list = None, box_max: list = None,
+                           near_point: list = None, radius: float = None, offset: int = 0, limit: int = None,
+                           fields: list = None, compact: bool = False) -> str:
+        """Find the actors in the current level that match every given condition.
+
+        The filtering happens in the editor, so only matching actors are returned. The result
+        is paged like get_scene_info.
+
+        Args:
+            class_name: Class of the actor or one of its parent classes (e.g. 'Light' also matches PointLight)
+            name: Wildcard pattern for the actor name (e.g. 'StaticMeshActor_*')
+            label: Wildcard pattern for the actor label, case-insensitive (e.g. 'Wall*')
+            label_regex: Regular expression the actor label must contain a match for
+            tag: Actor tag the actor must have
+            box_min: Minimum corner [x, y, z] of a box the actor location must be in (with box_max)
+            box_max: Maximum corner [x, y, z] of the box
+            near_point: Point [x, y, z] the actor location must be close to (with radius)
+            radius: Maximum distance from near_point in Unreal units
+            offset: Index of the first matching actor to return (default: 0)
+            limit: Maximum number of actors to return (default: 1000, at most 10000)
+            fields: Per-actor fields to return, as for get_scene_info
+            compact: Return JSON without indentation (default: False)
+        """
+        try:
+            actor_filter = _actor_filter(class_name, name, label, label_regex, tag, box_min, box_max, near_point, radius)
+            params = {"filter": actor_filter, "offset": offset}
+            if limit:
+                params["limit"] = limit
+            if fields is not None:
+                params["fields"] = fields
+            response = await async_send_command("query_actors", params)
+            if response["status"] == "success":
+                return _format_result(response["result"], compact)
+            else:
+                return f"Error: {response['message']}"
+        except Exception as e:
+            return f"Error querying actors: {str(e)}"
+
+    @mcp.tool()
+    async def create_object(ctx: Context, type: str, location: list = None, label: str = None) -> str:
         """Create a new object in the Unreal scene.
         
         Args:
@@ -42,7 +150,7 @@ def register_all(mcp):
                 params["location"] = location
             if label:
                 params["label"] = label
-            response = send_command("create_object", params)
+            response = await async_send_command("create_object", params)
             if response["status"] == "success":
                 return f"Created object: {response['result']['name']} with label: {response['result']['label']}"
             else:
@@ -51,11 +159,33 @@ def register_all(mcp):
             return f"Error creating object: {str(e)}"
 
     @mcp.tool()
-    def modify_object(ctx: Context, name: str, location: list = None, rotation: list = None, scale: list = None) -> str:
+    async def create_objects(ctx: Context, type: str, locations: list, rotations: list = None, scales: list = None,
+                             labels: list = None, mesh: str = None, compact: bool = True) -> str:
+        """Create many objects of one type in the Unreal scene with a single request.
+
+        Use this instead of calling create_object repeatedly, e.g. to scatter props or lights.
+
+        Args:
+            type: The type of object to create ('cube' or 'StaticMeshActor')
+            locations: One [x, y, z] per object
+            rotations: Optional [pitch, yaw, roll] per object
+            scales: Optional [x, y, z] scale per object
+            labels: Optional label per object
+            mesh: Static mesh path for 'StaticMeshActor' (e.g. '/Engine/BasicShapes/Sphere.Sphere')
+            compact: Return JSON without indentation (default: True)
+        """
+        try:
+            result = await acreate_objects(async_send_command, type, locations, rotations, scales, labels, mesh)
+            return _format_result(result, compact)
+        except Exception as e:
+            return f"Error creating objects: {str(e)}"
+
+    @mcp.tool()
+    async def modify_object(ctx: Context, name: str, location: list = None, rotation: list = None, scale: list = None) -> str:
         """Modify an existing object in the Unreal scene.
         
         Args:
-            name: The name of the object to modify
+            name: The name of the object to modify, or its label
             location: Optional 3D location as [x, y, z]
             rotation: Optional rotation as [pitch, yaw, roll]
             scale: Optional scale as [x, y, z]
@@ -68,7 +198,7 @@ def register_all(mcp):
                 params["rotation"] = rotation
             if scale:
                 params["scale"] = scale
-            response = send_command("modify_object", params)
+            response = await async_send_command("modify_object", params)
             if response["status"] == "success":
                 return f"Modified object: {response['result']['name']}"
             else:
@@ -77,17 +207,69 @@ def register_all(mcp):
             return f"Error modifying object: {str(e)}"
 
     @mcp.tool()
-    def delete_object(ctx: Context, name: str) -> str:
+    async def modify_objects(ctx: Context, names: list, locations: list = None, rotations: list = None,
+                             scales: list = None, relative: bool = False, compact: bool = True) -> str:
+        """Move, rotate or scale many objects in the Unreal scene with a single request.
+
+        The whole change is one undo step in the editor. Use it for aligning, distributing or
+        snapping groups of objects instead of calling modify_object repeatedly.
+
+        Args:
+            names: Names or labels of the objects
+            locations: One [x, y, z] per name, or a single [x, y, z] for all of them
+            rotations: One [pitch, yaw, roll] per name, or a single one for all of them
+            scales: One [x, y, z] scale per name, or a single one for all of them
+            relative: Treat locations and rotations as offsets and scales as factors (default: False)
+            compact: Return JSON without indentation (default: True)
+        """
+        try:
+            result = await amodify_objects(async_send_command, names, locations, rotations, scales, relative)
+            return _format_result(result, compact)
+        except Exception as e:
+            return f"Error modifying objects: {str(e)}"
+
+    @mcp.tool()
+    async def delete_object(ctx: Context, name: str) -> str:
         """Delete an object from the Unreal scene.
         
         Args:
-            name: The name of the object to delete
+            name: The name of the object to delete, or its label
         """
         try:
-            response = send_command("delete_object", {"name": name})
+            response = await async_send_command("delete_object", {"name": name})
             if response["status"] == "success":
                 return f"Deleted object: {name}"
             else:
                 return f"Error: {response['message']}"
         except Exception as e:
-            return f"Error deleting object: {str(e)}" 
\ No newline at end of file
+            return f"Error deleting object: {str(e)}" 
+
+    @mcp.tool()
+    async def delete_objects(ctx: Context, names: list = None, class_name: str = None, label: str = None,
+                             tag: str = None, box_min: list = None, box_max: list = None, near_point: list = None,
+                             radius: float = None, dry_run: bool = False, compact: bool = True) -> str:
+        """Delete many objects from the Unreal scene with a single request.
+
+        Give either a list of names or at least one filter condition; every object matching
+        all given conditions is deleted. Use dry_run=True first to see what would be deleted.
+
+        Args:
+            names: Names or labels of the objects to delete
+            class_name: Delete objects of this class or a subclass (e.g. 'Light')
+            label: Wildcard pattern for the label, case-insensitive (e.g. 'Test_*' for a prefix)
+            tag: Delete objects with this actor tag
+            box_min: Minimum corner [x, y, z] of a box to delete objects in (with box_max)
+            box_max: Maximum corner [x, y, z] of the box
+            near_point: Delete objects within radius of this [x, y, z] point
+            radius: Distance from near_point in Unreal units
+            dry_run: Only list the objects that would be deleted (default: False)
+            compact: Return JSON without indentation (default: True)
+        """
+        try:
+            actor_filter = _actor_filter(class_name, None, label, None, tag, box_min, box_max, near_point, radius)
+            if names and actor_filter:
+                return "Error: Provide either names or filter conditions, not both"
+            result = await adelete_objects(async_send_command, names or None, actor_filter or None, dry_run)
+            return _format_result(result, compact)
+        except Exception as e:
+            return f"Error deleting objects: {str(e)}"
@@ -0,0 +1,109 @@
+"""Spatial query commands for Unreal Engine.
+
+This module contains the region and nearest-neighbour queries of the
+UnrealMCP bridge. They are answered from a bridge-side spatial index of the
+level (utils.spatial) that catches up with the editor through
+get_scene_changes, so a query does not download the whole scene.
+"""
+
+import sys
+import os
+import json
+from mcp.server.fastmcp import Context
+
+# Import async_send_command from the parent module
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from unreal_mcp_bridge import async_send_command
+from utils.spatial import AsyncSceneSpatialIndex
+
+_index = None
+
+
+def get_spatial_index():
+    """Return the spatial index shared by the spatial tools, creating it on first use."""
+    global _index
+    if _index is None:
+        _index = AsyncSceneSpatialIndex(async_send_command).attach()
+    return _index
+
+
+async def _resolve_point(index, point, actor_name):
+    """Return the query point: an explicit [x, y, z] or the location of a named actor."""
+    if actor_name:
+        await index.refresh()
+        actor = index.actors.get(actor_name)
+        if actor is None:
+            raise ValueError(f"Actor not found: {actor_name}")
+        return actor["location"]
+    if not isinstance(point, list) or len(point) != 3:
+        raise ValueError("Provide a point as [x, y, z] or an actor_name")
+    return point
+
+
+def _format_actors(actors):
+    return json.dumps({"count": len(actors), "actors": actors}, indent=2)
+
+
+def register_all(mcp):
+    """Register all spatial query commands with the MCP server."""
+
+    @mcp.tool()
+    async def find_actors_in_radius(ctx: Context, radius: float, center: list = None, actor_name: str = None,
+                                    actor_type: str = None, limit: int = 100) -> str:
+        """Find the actors within a distance of a point or of another actor, nearest first.
+
+        Args:
+            radius: Search radius in Unreal units
+            center: Center of the search as [x, y, z]
+            actor_name: Name of an actor to search around instead of center (the actor itself is included)
+            actor_type: Only return actors of this class (e.g. 'PointLight')
+            limit: Maximum number of actors to return (default: 100)
+        """
+        try:
+            index = get_spatial_index()
+            point = await _resolve_point(index, center, actor_name)
+            return _format_actors(await index.find_in_radius(point, radius, actor_type, limit))
+        except Exception as e:
+            return f"Error finding actors in radius: {str(e)}"
+
+    @mcp.tool()
+    async def find_actors_in_box(ctx: Context, min_corner: list, max_corner: list, actor_type: str = None,
+                                 limit: int = 100) -> str:
+        """Find the actors inside an axis-aligned box, closest to its center first.
+
+        Args:
+            min_corner: Minimum corner of the box as [x, y, z]
+            max_corner: Maximum corner of the box as [x, y, z]
+            actor_type: Only return actors of this class (e.g. 'PointLight')
+            limit: Maximum number of actors to return (default: 100)
+        """
+        try:
+            if len(min_corner) != 3 or len(max_corner) != 3:
+                return "Error: Box corners must be [x, y, z]"
+            index = get_spatial_index()
+            return _format_actors(await index.find_in_box(min_corner, max_corner, actor_type, limit))
+        except Exception as e:
+            return f"Error finding actors in box: {str(e)}"
+
+    @mcp.tool()
+    async def find_nearest_actors(ctx: Context, k: int = 5, point: list = None, actor_name: str = None,
+                                  actor_type: str = None) -> str:
+        """Find the k actors closest to a point or to another actor.
+
+        Args:
+            k: Number of actors to return (default: 5)
+            point: Query point as [x, y, z]
+            actor_name: Name of an actor to search around instead of point (the actor itself is excluded)
+            actor_type: Only return actors of this class (e.g. 'PointLight')
+        """
+        try:
+            index = get_spatial_index()
+            query_point = await _resolve_point(index, point, actor_name)
+            if actor_name:
+                actors = await index.find_nearest(query_point, k + 1, actor_type)
+                actors = [actor for actor in actors if actor["name"] != actor_name][:k]
+            else:
+                actors = await index.find_nearest(query_point, k, actor_type)
+            return _format_actors(actors)
+        except Exception as e:
+            return f"Error finding nearest actors: {str(e)}"
@@ -0,0 +1,305 @@
+#!/usr/bin/env python3
+"""
+Transport benchmark for the UnrealMCP bridge
+
+This script measures the latency (p50/p95/p99) and throughput (commands per
+second) of the bridge transport for several payload sizes and concurrency
+levels, using the same clients as the bridge:
+
+- sync: utils.connection.ConnectionPool driven from a thread pool, the path
+  taken by send_command.
+- async: utils.async_connection.AsyncCommandMultiplexer, the path taken by
+  async_send_command.
+
+Payloads:
+
+- tiny: get_material_info for a single material
+- scene_1k: get_scene_info on a level with 1000 actors
+- python_1mb: execute_python with a 1MB script
+
+By default the benchmark starts mock_unreal_server.MockUnrealServer in this
+process. Use --target editor to benchmark a running editor instead (open a
+level with about 1000 actors so scene_1k means the same thing).
+
+Results are printed as a table and can be written as JSON with --output. With
+--baseline the results are compared with a stored run and the script exits
+with code 1 if any scenario got slower than the tolerance allows, or if the
+baseline was recorded with a different target, framing, iteration count or
+tick interval:
+
+    python benchmark_transport.py --baseline benchmark_baseline.json
+    python benchmark_transport.py --save-baseline benchmark_baseline.json
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import os
+import platform
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+# Add the MCP directory to sys.path so we can import the bridge utilities
+mcp_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if mcp_dir not in sys.path:
+    sys.path.insert(0, mcp_dir)
+
+from mock_unreal_server import DEFAULT_PORT, DEFAULT_TICK_INTERVAL_SECONDS, MockUnrealServer
+from utils.async_connection import AsyncCommandMultiplexer, AsyncConnectionPool
+from utils.connection import ConnectionPool
+from utils.protocol import FRAMING_AUTO, FRAMING_LENGTH_PREFIXED, FRAMING_RAW
+
+TINY_MATERIAL_PACKAGE = "/Engine/EngineMaterials"
+TINY_MATERIAL_NAME = "WorldGridMaterial"
+SCENE_ACTOR_COUNT = 1000
+PYTHON_SCRIPT_SIZE = 1024 * 1024
+
+PAYLOADS = {
+    "tiny": ("get_material_info", {"path": f"{TINY_MATERIAL_PACKAGE}/{TINY_MATERIAL_NAME}"}),
+    "scene_1k": ("get_scene_info", {}),
+    "python_1mb": ("execute_python", {"code": "# " + "x" * (PYTHON_SCRIPT_SIZE - 3) + "\n"})
+}
+CLIENTS = ("sync", "async")
+DEFAULT_CONCURRENCY = (1, 4, 16)
+DEFAULT_ITERATIONS = 40
+# Measure at least this many commands per concurrent worker, so p95 is not decided by one or two slow samples
+MIN_COMMANDS_PER_WORKER = 20
+DEFAULT_TOLERANCE = 0.5
+# Latency changes smaller than this are noise, whatever the tolerance says
+MIN_LATENCY_REGRESSION_MS = 2.0
+
+
+def percentile(sorted_values, percent):
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(math.ceil(percent / 100.0 * len(sorted_values)), 1)
+    return sorted_values[rank - 1]
+
+
+def measured_commands(iterations, concurrency):
+    """Number of commands measured in a scenario; grows with concurrency."""
+    return max(iterations, MIN_COMMANDS_PER_WORKER * concurrency)
+
+
+def summarize(latencies, failures, wall_time):
+    """Turn per-command latencies (seconds) into the reported statistics."""
+    values = sorted(latency * 1000.0 for latency in latencies)
+    return {
+        "commands": len(values),
+        "failures": failures,
+        "p50_ms": round(percentile(values, 50), 3),
+        "p95_ms": round(percentile(values, 95), 3),
+        "p99_ms": round(percentile(values, 99), 3),
+        "mean_ms": round(sum(values) / len(values), 3) if values else 0.0,
+        "max_ms": round(values[-1], 3) if values else 0.0,
+        "commands_per_second": round(len(values) / wall_time, 2) if wall_time > 0 else 0.0
+    }
+
+
+def run_sync(host, port, framing, command_type, params, concurrency, iterations, timeout):
+    """Run the scenario through ConnectionPool from `concurrency` threads."""
+    pool = ConnectionPool(host, port, timeout=timeout, max_idle=concurrency, framing=framing)
+
+    def timed_command():
+        start = time.perf_counter()
+        try:
+            pool.send_command(command_type, params)
+        except Exception as e:
+            print(f"  {command_type} failed: {e}", file=sys.stderr)
+            return None
+        return time.perf_counter() - start
+
+    try:
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            # Warm up one connection per worker so connects are not measured
+            list(executor.map(lambda _: timed_command(), range(concurrency)))
+            start = time.perf_counter()
+            results = list(executor.map(lambda _: timed_command(), range(iterations)))
+            wall_time = time.perf_counter() - start
+    finally:
+        pool.close()
+
+    latencies = [result for result in results if result is not None]
+    return summarize(latencies, len(results) - len(latencies), wall_time)
+
+
+async def run_async(host, port, framing, command_type, params, concurrency, iterations, timeout):
+    """Run the scenario through AsyncCommandMultiplexer with `concurrency` commands in flight."""
+    multiplexer = AsyncCommandMultiplexer(host, port, timeout=timeout, framing=framing,
+                                          fallback_pool=AsyncConnectionPool(host, port, timeout=timeout, framing=framing))
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def timed_command():
+        async with semaphore:
+            start = time.perf_counter()
+            try:
+                await multiplexer.send_command(command_type, params)
+            except Exception as e:
+                print(f"  {command_type} failed: {e!r}", file=sys.stderr)
+                return None
+            return time.perf_counter() - start
+
+    try:
+        await asyncio.gather(*(timed_command() for _ in range(concurrency)))
+        start = time.perf_counter()
+        results = await asyncio.gather(*(timed_command() for _ in range(iterations)))
+        wall_time = time.perf_counter() - start
+    finally:
+        multiplexer.close()
+
+    latencies = [result for result in results if result is not None]
+    return summarize(latencies, len(results) - len(latencies), wall_time)
+
+
+def run_benchmark(host, port, args):
+    """Run every payload/client/concurrency combination and return the results by scenario name."""
+    scenarios = {}
+    for payload in args.payloads:
+        command_type, params = PAYLOADS[payload]
+        for client in args.clients:
+            for concurrency in args.concurrency:
+                name = f"{payload}/{client}/c{concurrency}"
+                iterations = measured_commands(args.iterations, concurrency)
+                print(f"Running {name} ({iterations} commands)...")
+                if client == "sync":
+                    stats = run_sync(host, port, args.framing, command_type, params, concurrency, iterations, args.timeout)
+                else:
+                    stats = asyncio.run(run_async(host, port, args.framing, command_type, params, concurrency,
+                                                  iterations, args.timeout))
+                scenarios[name] = dict(stats, payload=payload, client=client, concurrency=concurrency)
+    return scenarios
+
+
+# Settings that must match between a run and its baseline for the numbers to be comparable
+COMPARED_SETTINGS = ("target", "framing", "iterations", "tick_interval")
+
+
+def compare_with_baseline(results, baseline, tolerance):
+    """Return a list of regression messages, empty if nothing got slower than the tolerance allows.
+
+    Raises:
+        ValueError: If the baseline was recorded with different settings
+    """
+    mismatched = [f"{setting} is {results['environment'].get(setting)!r}, "
+                  f"baseline has {baseline['environment'].get(setting)!r}"
+                  for setting in COMPARED_SETTINGS
+                  if results["environment"].get(setting) != baseline["environment"].get(setting)]
+    if mismatched:
+        raise ValueError("the baseline was recorded with different settings: " + "; ".join(mismatched))
+
+    regressions = []
+    for name, stats in results["scenarios"].items():
+        reference = baseline["scenarios"].get(name)
+        if reference is None:
+            continue
+        latency_limit = max(reference["p95_ms"] * (1.0 + tolerance), reference["p95_ms"] + MIN_LATENCY_REGRESSION_MS)
+        if stats["p95_ms"] > latency_limit:
+            regressions.append(f"{name}: p95 {stats['p95_ms']:.1f}ms exceeds {latency_limit:.1f}ms "
+                               f"(baseline {reference['p95_ms']:.1f}ms)")
+        throughput_limit = reference["commands_per_second"] / (1.0 + tolerance)
+        if stats["commands_per_second"] < throughput_limit:
+            regressions.append(f"{name}: {stats['commands_per_second']:.1f} commands/s is below {throughput_limit:.1f} "
+                               f"(baseline {reference['commands_per_second']:.1f})")
+    return regressions
+
+
+def print_table(scenarios):
+    print("\nBenchmark Results:")
+    print("-" * 86)
+    print(f"{'scenario':<28}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'max ms':>10}{'cmd/s':>10}{'failed':>8}")
+    print("-" * 86)
+    for name, stats in scenarios.items():
+        print(f"{name:<28}{stats['p50_ms']:>10.2f}{stats['p95_ms']:>10.2f}{stats['p99_ms']:>10.2f}"
+              f"{stats['max_ms']:>10.2f}{stats['commands_per_second']:>10.1f}{stats['failures']:>8}")
+    print("-" * 86)
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Latency and throughput benchmark for the UnrealMCP bridge transport")
+    parser.add_argument("--target", choices=("mock", "editor"), default="mock",
+                        help="Benchmark an in-process mock server (default) or a running editor")
+    parser.add_argument("--host", default="127.0.0.1", help="Editor host (with --target editor)")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help="Editor port (with --target editor)")
+    parser.add_argument("--tick-interval", type=float, default=DEFAULT_TICK_INTERVAL_SECONDS,
+                        help="Mock server tick interval in seconds")
+    parser.add_argument("--framing", choices=(FRAMING_AUTO, FRAMING_RAW, FRAMING_LENGTH_PREFIXED), default=FRAMING_AUTO)
+    parser.add_argument("--payloads", nargs="+", choices=list(PAYLOADS), default=list(PAYLOADS))
+    parser.add_argument("--clients", nargs="+", choices=CLIENTS, default=list(CLIENTS))
+    parser.add_argument("--concurrency", nargs="+", type=int, default=list(DEFAULT_CONCURRENCY))
+    parser.add_argument("--iterations", type=int, default=DEFAULT_ITERATIONS, help="Measured commands per scenario; at least "
+                        f"{MIN_COMMANDS_PER_WORKER} per concurrent worker are measured")
+    parser.add_argument("--timeout", type=float, default=30.0, help="Per-command timeout in seconds")
+    parser.add_argument("--output", help="Write the results as JSON to this file")
+    parser.add_argument("--baseline", help="Compare the results with this JSON file and fail on regressions")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE,
+                        help="Allowed slowdown against the baseline as a fraction (default: 0.5)")
+    parser.add_argument("--save-baseline", help="Write the results to this file as the new baseline")
+    return parser.parse_args()
+
+
+def main():
+    """Run the benchmark and compare it with the baseline."""
+    args = parse_args()
+    print("Starting UnrealMCP transport benchmark...")
+
+    environment = {
+        "target": args.target,
+        "framing": args.framing,
+        "iterations": args.iterations,
+        "python": platform.python_version(),
+        "platform": platform.platform()
+    }
+    try:
+        if args.target == "mock":
+            environment["tick_interval"] = args.tick_interval
+            with MockUnrealServer(tick_interval=args.tick_interval) as server:
+                server.scene.populate(SCENE_ACTOR_COUNT)
+                server.scene.add_material(TINY_MATERIAL_PACKAGE, TINY_MATERIAL_NAME)
+                scenarios = run_benchmark("127.0.0.1", server.port, args)
+        else:
+            environment["host"] = f"{args.host}:{args.port}"
+            scenarios = run_benchmark(args.host, args.port, args)
+    except Exception as e:
+        print(f"\nError during benchmark: {e}")
+        sys.exit(1)
+
+    results = {"environment": environment, "scenarios": scenarios}
+    print_table(scenarios)
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2)
+        print(f"\nResults written to {args.output}")
+    if args.save_baseline:
+        with open(args.save_baseline, 'w') as f:
+            json.dump(results, f, indent=2)
+            f.write("\n")
+        print(f"\nBaseline written to {args.save_baseline}")
+
+    failed = [name for name, stats in scenarios.items() if stats["failures"]]
+    if failed:
+        print(f"\n✗ Commands failed in: {', '.join(failed)}")
+        sys.exit(1)
+
+    if args.baseline:
+        with open(args.baseline, 'r') as f:
+            baseline = json.load(f)
+        try:
+            regressions = compare_with_baseline(results, baseline, args.tolerance)
+        except ValueError as e:
+            print(f"\n✗ Cannot compare with {args.baseline}: {e}")
+            print("  Run with the baseline's settings, or record a new baseline with --save-baseline")
+            sys.exit(1)
+        if regressions:
+            print(f"\n✗ TRANSPORT REGRESSION against {args.baseline} (tolerance {args.tolerance:.0%}):")
+            for regression in regressions:
+                print(f"  - {regression}")
+            sys.exit(1)
+        print(f"\n✓ No regressions against {args.baseline}")
+
+
+if __name__ == "__main__":
+    main()
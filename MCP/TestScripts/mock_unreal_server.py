@@ -0,0 +1,1092 @@
+#!/usr/bin/env python3
+"""
+Pure-Python stand-in for the Unreal MCP server
+
+This script mimics FMCPTCPServer closely enough to test and benchmark the
+bridge without a running editor:
+
+- The server works in ticks (DEFAULT_TICK_INTERVAL_SECONDS). Each tick it
+  accepts new clients, services every connected client and then disconnects
+  clients idle for longer than DEFAULT_CLIENT_TIMEOUT_SECONDS.
+- New connections use raw framing: one recv of at most
+  DEFAULT_RECEIVE_BUFFER_SIZE bytes per client per tick is treated as one
+  complete JSON command, exactly like FMCPTCPServer::ProcessClientData.
+- A "set_protocol" command switches a connection to length-prefixed framing
+  (4-byte big-endian size + UTF-8 JSON) after the reply has been sent. Framed
+  connections are drained every tick and every complete frame is processed.
+- An "id" field on a command is echoed in its response.
+- The default handlers (scene, materials, blueprints, execute_python and
+  batch) work on an in-memory MockScene and answer in the same shape as the
+  C++ handlers. Handlers run on the server thread like they run on the game
+  thread, so injected latency holds up the whole tick.
+
+Pass supports_framing=False to behave like plugin builds from before framing
+negotiation and request ids.
+
+Run it directly to serve on the default port:
+
+    python mock_unreal_server.py --port 13377 --actors 1000
+
+or import MockUnrealServer and start it on a free port from a test.
+"""
+
+import argparse
+import array
+import base64
+import copy
+import fnmatch
+import json
+import math
+import os
+import re
+import select
+import socket
+import sys
+import threading
+import time
+import uuid
+
+# Add the MCP directory to sys.path so we can import the bridge utilities
+mcp_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if mcp_dir not in sys.path:
+    sys.path.insert(0, mcp_dir)
+
+from utils.protocol import (
+    DEFAULT_MAX_FRAME_SIZE, FRAMING_LENGTH_PREFIXED, FRAMING_RAW, SET_PROTOCOL_COMMAND,
+    LengthPrefixedDecoder, encode_message
+)
+
+# Mirrors of MCPConstants.h
+DEFAULT_PORT = 13377
+DEFAULT_RECEIVE_BUFFER_SIZE = 65536
+DEFAULT_CLIENT_TIMEOUT_SECONDS = 30.0
+DEFAULT_TICK_INTERVAL_SECONDS = 0.1
+MAX_ACTORS_IN_SCENE_INFO = 1000
+MAX_SCENE_INFO_PAGE_SIZE = 10000
+MAX_BATCH_COMMANDS = 10000
+MAX_REMOVED_ACTORS_IN_CHANGE_JOURNAL = 10000
+MAX_OBJECTS_PER_BULK_COMMAND = 100000
+ACTOR_INFO_FIELDS = ("name", "type", "label", "location", "rotation", "scale")
+DEFAULT_ACTOR_INFO_FIELDS = ("name", "type", "label", "location")
+SCENE_FORMAT_OBJECTS = "objects"
+SCENE_FORMAT_COLUMNAR = "columnar"
+
+# Parent classes of the actor types the mock spawns, for the query_actors 'class' filter
+ACTOR_CLASS_PARENTS = {
+    "StaticMeshActor": "Actor",
+    "Light": "Actor",
+    "PointLight": "Light",
+    "SpotLight": "Light",
+    "DirectionalLight": "Light",
+    "CameraActor": "Actor",
+    "PlayerStart": "Actor",
+    "Actor": "Object"
+}
+
+
+def success(result=None):
+    """Build a success response like FMCPCommandHandlerBase::CreateSuccessResponse."""
+    response = {"status": "success"}
+    if result is not None:
+        response["result"] = result
+    return response
+
+
+def error(message):
+    """Build an error response like FMCPCommandHandlerBase::CreateErrorResponse."""
+    return {"status": "error", "message": message}
+
+
+def _vector(value, size=3):
+    """Return value as a list of floats if it is a numeric array of the given size, else None."""
+    if not isinstance(value, list) or len(value) != size:
+        return None
+    try:
+        return [float(component) for component in value]
+    except (TypeError, ValueError):
+        return None
+
+
+def _vector_column(params, field):
+    """Read a per-actor vector parameter like ReadVectorColumn. Returns (vectors, error message)."""
+    value = params.get(field)
+    if value is None:
+        return [], None
+    typecode = "f"
+    if isinstance(value, dict):
+        # A packed column with a declared dtype: {"dtype": "float64", "data": <base64>}
+        typecode = {"float32": "f", "float64": "d"}.get(value.get("dtype"))
+        value = value.get("data")
+        if typecode is None or not isinstance(value, str):
+            return None, f"'{field}' must declare a dtype of float32 or float64 and base64 data"
+    if isinstance(value, str):
+        try:
+            packed = base64.b64decode(value, validate=True)
+        except ValueError:
+            packed = None
+        column = array.array(typecode)
+        if packed is None or len(packed) % (3 * column.itemsize):
+            return None, f"'{field}' must be base64 of packed [x, y, z] triples"
+        column.frombytes(packed)
+        if sys.byteorder != "little":
+            column.byteswap()
+        return [list(column[index:index + 3]) for index in range(0, len(column), 3)], None
+    vectors = [_vector(item) for item in value] if isinstance(value, list) else [None]
+    if None in vectors:
+        return None, f"'{field}' must be a list of [x, y, z] arrays or a packed vector column"
+    return vectors, None
+
+
+def _actor_info_fields(params):
+    """Read the 'fields' parameter like ParseActorInfoFields. Returns (fields, error message)."""
+    fields = params.get("fields")
+    if not isinstance(fields, list):
+        return DEFAULT_ACTOR_INFO_FIELDS, None
+    for field in fields:
+        if field not in ACTOR_INFO_FIELDS:
+            return None, f"Unknown field: '{field}'. Valid fields are name, type, label, location, rotation and scale"
+    return [field for field in ACTOR_INFO_FIELDS if field in fields], None
+
+
+def _actor_info(actor, fields=DEFAULT_ACTOR_INFO_FIELDS):
+    """Describe an actor like CreateActorInfo in MCPCommandHandlers.cpp."""
+    return {field: actor[field] for field in fields}
+
+
+def _vector_field(value, name):
+    return _vector(value.get(name)) if isinstance(value, dict) else None
+
+
+def _class_chain(actor_type):
+    """Yield a class name and its parent class names, like walking UClass::GetSuperClass."""
+    while actor_type:
+        yield actor_type
+        actor_type = ACTOR_CLASS_PARENTS.get(actor_type)
+
+
+def _actor_filter(filter_params):
+    """Build a predicate from a query_actors filter like FMCPActorFilter::Parse. Returns (predicate, error)."""
+    conditions = []
+    for key, value in (filter_params or {}).items():
+        if key in ("class", "name", "label", "label_regex", "tag"):
+            if not isinstance(value, str) or not value:
+                return None, f"Filter '{key}' must be a non-empty string"
+            if key == "class":
+                conditions.append(lambda actor, class_name=value: class_name in _class_chain(actor["type"]))
+            elif key in ("name", "label"):
+                pattern = value.lower()
+                conditions.append(lambda actor, field=key, pattern=pattern: fnmatch.fnmatchcase(actor[field].lower(), pattern))
+            elif key == "label_regex":
+                try:
+                    regex = re.compile(value)
+                except re.error as e:
+                    return None, f"Filter 'label_regex' is not a valid regular expression: {e}"
+                conditions.append(lambda actor, regex=regex: regex.search(actor["label"]) is not None)
+            else:
+                conditions.append(lambda actor, tag=value: tag in actor["tags"])
+        elif key == "names":
+            if not isinstance(value, list) or not value:
+                return None, "Filter 'names' must be a non-empty list of actor names or labels"
+            conditions.append(lambda actor, names=set(map(str, value)): actor["name"] in names or actor["label"] in names)
+        elif key == "box":
+            low, high = _vector_field(value, "min"), _vector_field(value, "max")
+            if low is None or high is None:
+                return None, 'Filter \'box\' must be {"min": [x, y, z], "max": [x, y, z]}'
+            low, high = [min(pair) for pair in zip(low, high)], [max(pair) for pair in zip(low, high)]
+            conditions.append(lambda actor, low=low, high=high: all(
+                low[axis] <= actor["location"][axis] <= high[axis] for axis in range(3)))
+        elif key == "near":
+            point = _vector_field(value, "point")
+            radius = value.get("radius") if isinstance(value, dict) else None
+            if point is None or not isinstance(radius, (int, float)) or radius < 0:
+                return None, 'Filter \'near\' must be {"point": [x, y, z], "radius": r} with r >= 0'
+            conditions.append(lambda actor, point=point, radius=radius: math.dist(actor["location"], point) <= radius)
+        else:
+            return None, (f"Unknown filter: '{key}'. Valid filters are class, name, names, label, label_regex, tag, "
+                          f"box and near")
+    return (lambda actor: all(condition(actor) for condition in conditions)), None
+
+
+def _encode_column(typecode, values):
+    """Base64 of the raw little-endian bytes of a packed array, like EncodeColumn."""
+    column = array.array(typecode, values)
+    if sys.byteorder != "little":
+        column.byteswap()
+    return base64.b64encode(column.tobytes()).decode("ascii")
+
+
+def _actor_columns(actors, fields):
+    """Describe actors in the columnar layout of FActorColumns."""
+    columns = {"count": len(actors)}
+    if "name" in fields:
+        columns["name"] = [actor["name"] for actor in actors]
+    if "type" in fields:
+        classes = list(dict.fromkeys(actor["type"] for actor in actors))
+        class_index = {name: index for index, name in enumerate(classes)}
+        columns["classes"] = classes
+        columns["type"] = _encode_column("i", [class_index[actor["type"]] for actor in actors])
+    if "label" in fields:
+        columns["label"] = [actor["label"] for actor in actors]
+    for field in ("location", "rotation", "scale"):
+        if field in fields:
+            columns[field] = _encode_column("f", [component for actor in actors for component in actor[field]])
+    return columns
+
+
+def _object_path(path):
+    """Accept both '/Game/Dir/Name' and '/Game/Dir/Name.Name' like LoadObject does."""
+    name = path.rsplit("/", 1)[-1]
+    return path if "." in name else f"{path}.{name}"
+
+
+class MockScene:
+    """In-memory model of the editor level and the assets the handlers touch.
+
+    Actors are stored by name in spawn order. Materials and blueprints are
+    stored by their object path ('/Game/Dir/Name.Name'). Like
+    FMCPChangeTracker, every asset change bumps the asset's change stamp;
+    change assets directly and then call touch_asset.
+
+    Like FMCPChangeTracker, every spawn, modification and removal bumps the
+    scene version. Change actors through spawn_actor, touch_actor and
+    remove_actor so get_scene_changes can report them and find_actor can
+    resolve them by label.
+    """
+
+    def __init__(self, level="MockLevel", max_actors_in_scene_info=MAX_ACTORS_IN_SCENE_INFO):
+        self.level = level
+        self.max_actors_in_scene_info = max_actors_in_scene_info
+        self.actors = {}
+        self.materials = {}
+        self.blueprints = {}
+        self.version = 0
+        self.min_version = 0
+        self._next_actor_index = {}
+        # name -> [added_version, version, removed]
+        self._journal = {}
+        # label -> names of the actors with that label, in spawn order
+        self._names_by_label = {}
+        # object path -> revision of the asset's latest change
+        self._asset_revisions = {}
+        self._asset_revision = 0
+        self._session_id = uuid.uuid4().hex[:22]
+
+    def spawn_actor(self, actor_type="StaticMeshActor", location=(0.0, 0.0, 0.0), label=None, mesh="", tags=()):
+        """Add an actor with a generated unique name, like UWorld::SpawnActor."""
+        index = self._next_actor_index.get(actor_type, 0)
+        self._next_actor_index[actor_type] = index + 1
+        name = f"{actor_type}_{index}"
+        self.actors[name] = {
+            "name": name,
+            "type": actor_type,
+            "label": label or name,
+            "location": [float(component) for component in location],
+            "rotation": [0.0, 0.0, 0.0],
+            "scale": [1.0, 1.0, 1.0],
+            "mesh": mesh,
+            "tags": list(tags)
+        }
+        self._names_by_label.setdefault(self.actors[name]["label"], []).append(name)
+        self.version += 1
+        self._journal[name] = [self.version, self.version, False]
+        return self.actors[name]
+
+    def touch_actor(self, name):
+        """Record that an actor changed."""
+        if name in self.actors:
+            self.version += 1
+            self._journal[name][1] = self.version
+
+    def remove_actor(self, name):
+        """Remove an actor and record the removal. Returns the actor or None."""
+        actor = self.actors.pop(name, None)
+        if actor is not None:
+            names = self._names_by_label[actor["label"]]
+            names.remove(name)
+            if not names:
+                del self._names_by_label[actor["label"]]
+            self.version += 1
+            self._journal[name][1:] = [self.version, True]
+            self._prune_journal()
+        return actor
+
+    def find_actor(self, name_or_label):
+        """Return the actor with a name, or else the first one with that label, like FMCPChangeTracker::FindActor."""
+        actor = self.actors.get(name_or_label)
+        if actor is None and name_or_label in self._names_by_label:
+            actor = self.actors[self._names_by_label[name_or_label][0]]
+        return actor
+
+    def touch_asset(self, path):
+        """Record that an asset changed, like FMCPChangeTracker::MarkAssetModified."""
+        self._asset_revision += 1
+        self._asset_revisions[_object_path(path)] = self._asset_revision
+
+    def asset_stamp(self, path):
+        """Return the change stamp of an asset, like FMCPChangeTracker::GetAssetStamp."""
+        return f"{self._session_id}-{self._asset_revisions.get(_object_path(path), 0)}"
+
+    def _prune_journal(self):
+        removed = sorted(entry[1] for entry in self._journal.values() if entry[2])
+        if len(removed) <= MAX_REMOVED_ACTORS_IN_CHANGE_JOURNAL:
+            return
+        # Forget the older half of the removals; deltas from before them are no longer possible
+        cutoff = removed[len(removed) // 2]
+        self._journal = {name: entry for name, entry in self._journal.items() if not (entry[2] and entry[1] <= cutoff)}
+        self.min_version = max(self.min_version, cutoff)
+
+    def get_changes_since(self, since_version):
+        """Return (full_resync, added, modified, removed) like FMCPChangeTracker::GetChangesSince."""
+        if since_version < self.min_version or since_version > self.version:
+            return True, [], [], []
+        added, modified, removed = [], [], []
+        for name, (added_version, version, is_removed) in self._journal.items():
+            if version <= since_version or (not is_removed and name not in self.actors):
+                continue
+            if is_removed:
+                if added_version <= since_version:
+                    removed.append(name)
+            elif added_version > since_version:
+                added.append(self.actors[name])
+            else:
+                modified.append(self.actors[name])
+        return False, added, modified, removed
+
+    def populate(self, count, spacing=200.0):
+        """Fill the level with a grid of static mesh actors."""
+        columns = max(int(count ** 0.5), 1)
+        for index in range(count):
+            location = ((index % columns) * spacing, (index // columns) * spacing, 0.0)
+            self.spawn_actor(location=location, label=f"Cube{index}", mesh="/Engine/BasicShapes/Cube.Cube")
+
+    def add_material(self, package_path, name):
+        """Create a material asset with UMaterial defaults, or return the existing one."""
+        path = _object_path(f"{package_path.rstrip('/')}/{name}")
+        return self.materials.setdefault(path, {
+            "name": name,
+            "path": path,
+            "shading_model": "DefaultLit",
+            "blend_mode": "Opaque",
+            "two_sided": False,
+            "dithered_lod_transition": False,
+            "cast_contact_shadow": False,
+            "base_color": [1.0, 1.0, 1.0, 1.0],
+            "metallic": 0.0,
+            "roughness": 0.5
+        })
+
+    def add_blueprint(self, package_path, name, parent_class="Actor"):
+        """Create a blueprint asset, or return the existing one."""
+        path = _object_path(f"{package_path.rstrip('/')}/{name}")
+        return self.blueprints.setdefault(path, {
+            "name": name,
+            "path": path,
+            "parent_class": parent_class,
+            "category": "",
+            "description": "",
+            "display_name": "",
+            "namespace": "",
+            "blueprint_type": "Normal",
+            "class_options": {
+                "abstract_class": False,
+                "const_class": False,
+                "deprecated": False,
+                "compile_mode": "Default",
+                "hide_categories": []
+            },
+            "functions": [],
+            "events": []
+        })
+
+
+class _Client:
+    """Per-connection state, the equivalent of FMCPClientConnection."""
+
+    def __init__(self, sock, address):
+        self.sock = sock
+        self.address = address
+        self.framing = FRAMING_RAW
+        self.decoder = None
+        self.time_since_last_activity = 0.0
+
+
+class MockUnrealServer:
+    """A socket server that behaves like FMCPTCPServer.
+
+    Handlers are plain callables taking the command params dict and
+    returning the response dict. The server ticks on a background thread
+    every tick_interval seconds; with tick_interval=0 it ticks as soon as a
+    socket is ready, which keeps functional tests fast.
+
+    latency adds a fixed delay to every command and command_latency maps
+    command types to additional per-type delays, both in seconds.
+    """
+
+    def __init__(self, host="127.0.0.1", port=0, buffer_size=DEFAULT_RECEIVE_BUFFER_SIZE,
+                 max_frame_size=DEFAULT_MAX_FRAME_SIZE, supports_framing=True,
+                 tick_interval=DEFAULT_TICK_INTERVAL_SECONDS, client_timeout=DEFAULT_CLIENT_TIMEOUT_SECONDS,
+                 latency=0.0, command_latency=None, scene=None):
+        self.host = host
+        self.requested_port = port
+        self.buffer_size = buffer_size
+        self.max_frame_size = max_frame_size
+        self.supports_framing = supports_framing
+        self.tick_interval = tick_interval
+        self.client_timeout = client_timeout
+        self.latency = latency
+        self.command_latency = dict(command_latency or {})
+        self.scene = scene or MockScene()
+        self.handlers = {}
+        self.commands_processed = 0
+        self.ticks = 0
+
+        self._clients = []
+        self._listener = None
+        self._thread = None
+        self._stopping = threading.Event()
+
+        self.register_handler("get_scene_info", self._get_scene_info)
+        self.register_handler("query_actors", self._query_actors)
+        self.register_handler("get_scene_changes", self._get_scene_changes)
+        self.register_handler("create_object", self._create_object)
+        self.register_handler("create_objects", self._create_objects)
+        self.register_handler("modify_object", self._modify_object)
+        self.register_handler("modify_objects", self._modify_objects)
+        self.register_handler("delete_object", self._delete_object)
+        self.register_handler("delete_objects", self._delete_objects)
+        self.register_handler("execute_python", self._execute_python)
+        self.register_handler("create_material", self._create_material)
+        self.register_handler("modify_material", self._modify_material)
+        self.register_handler("get_material_info", self._get_material_info)
+        self.register_handler("create_blueprint", self._create_blueprint)
+        self.register_handler("modify_blueprint", self._modify_blueprint)
+        self.register_handler("get_blueprint_info", self._get_blueprint_info)
+        self.register_handler("create_blueprint_event", self._create_blueprint_event)
+        self.register_handler("batch", self._batch)
+
+    @property
+    def port(self):
+        return self._listener.getsockname()[1] if self._listener else self.requested_port
+
+    @property
+    def client_count(self):
+        return len(self._clients)
+
+    def register_handler(self, command_type, handler):
+        """Register a handler callable for a command type."""
+        self.handlers[command_type] = handler
+
+    def start(self):
+        """Start listening and ticking on a background thread."""
+        self._listener = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self._listener.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self._listener.bind((self.host, self.requested_port))
+        self._listener.listen()
+        self._listener.setblocking(False)
+
+        self._stopping.clear()
+        self._thread = threading.Thread(target=self._serve, name="MockUnrealServer", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """Stop ticking and close every socket."""
+        self._stopping.set()
+        if self._thread:
+            self._thread.join()
+            self._thread = None
+        for client in list(self._clients):
+            self._disconnect(client)
+        if self._listener:
+            self._listener.close()
+            self._listener = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def _serve(self):
+        last_tick = time.monotonic()
+        while not self._stopping.is_set():
+            if self.tick_interval > 0:
+                self._stopping.wait(max(self.tick_interval - (time.monotonic() - last_tick), 0.0))
+            else:
+                select.select([self._listener] + [client.sock for client in self._clients], [], [], 0.05)
+            if self._stopping.is_set():
+                break
+            now = time.monotonic()
+            self.tick(now - last_tick)
+            last_tick = now
+
+    def tick(self, delta_time):
+        """One FMCPTCPServer::Tick: accept, process client data, check timeouts."""
+        self.ticks += 1
+        self._accept()
+        for client in list(self._clients):
+            if client.framing == FRAMING_LENGTH_PREFIXED:
+                self._process_framed_client_data(client)
+            else:
+                self._process_client_data(client)
+        self._check_client_timeouts(delta_time)
+
+    def _accept(self):
+        while True:
+            try:
+                sock, address = self._listener.accept()
+            except OSError:
+                return
+            sock.setblocking(False)
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            self._clients.append(_Client(sock, address))
+
+    def _disconnect(self, client):
+        if client in self._clients:
+            self._clients.remove(client)
+        client.sock.close()
+
+    def _check_client_timeouts(self, delta_time):
+        for client in list(self._clients):
+            client.time_since_last_activity += delta_time
+            if client.time_since_last_activity > self.client_timeout:
+                self._disconnect(client)
+
+    def _recv(self, client):
+        """Read once without blocking. Returns None if nothing is pending and b'' if the peer closed."""
+        try:
+            return client.sock.recv(self.buffer_size)
+        except BlockingIOError:
+            return None
+        except OSError:
+            return b''
+
+    def _process_client_data(self, client):
+        # Like FMCPTCPServer: one recv per tick, and whatever it returned is one command
+        data = self._recv(client)
+        if data is None:
+            return
+        if not data:
+            self._disconnect(client)
+            return
+        client.time_since_last_activity = 0.0
+        try:
+            command = json.loads(data.decode('utf-8', errors='replace'))
+        except json.JSONDecodeError:
+            self._send(client, error("Invalid JSON format"))
+            return
+        self._dispatch(client, command)
+
+    def _process_framed_client_data(self, client):
+        # Drain the socket and process every complete frame, like ProcessFramedClientData
+        commands = []
+        while True:
+            data = self._recv(client)
+            if data is None:
+                break
+            if not data:
+                self._disconnect(client)
+                return
+            client.time_since_last_activity = 0.0
+            try:
+                commands.extend(client.decoder.feed(data))
+            except ValueError as e:
+                self._send(client, error(str(e)))
+                self._disconnect(client)
+                return
+
+        for command in commands:
+            if client not in self._clients:
+                return
+            self._dispatch(client, command)
+
+    def _dispatch(self, client, command):
+        if not isinstance(command, dict):
+            self._send(client, error("Invalid JSON format"))
+            return
+        if "type" not in command:
+            self._send(client, error("Missing 'type' field"), command.get("id"))
+            return
+
+        command_type = command["type"]
+        params = command.get("params")
+        if not isinstance(params, dict):
+            params = {}
+
+        if command_type == SET_PROTOCOL_COMMAND and self.supports_framing:
+            self._set_protocol(client, params, command.get("id"))
+            return
+
+        # Handlers block the tick, like game thread work blocks FMCPTCPServer
+        delay = self.latency + self.command_latency.get(command_type, 0.0)
+        if delay > 0:
+            time.sleep(delay)
+
+        handler = self.handlers.get(command_type)
+        if handler is None:
+            response = error(f"Unknown command: {command_type}")
+        else:
+            try:
+                response = handler(params)
+            except Exception as e:
+                response = error(f"Handler for '{command_type}' failed: {e}")
+        self.commands_processed += 1
+        self._send(client, response, command.get("id"))
+
+    def _set_protocol(self, client, params, request_id=None):
+        framing = params.get("framing")
+        if framing not in (FRAMING_RAW, FRAMING_LENGTH_PREFIXED):
+            self._send(client, error(f"Unsupported framing: {framing}"), request_id)
+            return
+        # The reply uses the framing the request arrived in
+        self._send(client, success({"framing": framing, "max_frame_size": self.max_frame_size}), request_id)
+        client.framing = framing
+        client.decoder = LengthPrefixedDecoder(self.max_frame_size) if framing == FRAMING_LENGTH_PREFIXED else None
+
+    def _send(self, client, response, request_id=None):
+        if request_id is not None and self.supports_framing:
+            # Echo the correlation id like FMCPTCPServer::ProcessCommand
+            response = dict(response, id=request_id)
+        data = memoryview(encode_message(response, client.framing))
+        # Like FMCPTCPServer::SendAll: wait out a full send buffer, up to the client timeout
+        deadline = time.monotonic() + self.client_timeout
+        while data:
+            try:
+                data = data[client.sock.send(data):]
+            except BlockingIOError:
+                if time.monotonic() > deadline:
+                    self._disconnect(client)
+                    return
+                select.select([], [client.sock], [], 0.05)
+            except OSError:
+                self._disconnect(client)
+                return
+
+    # Scene handlers (FMCPGetSceneInfoHandler, FMCPCreateObjectHandler, ...)
+
+    def _get_scene_info(self, params, actors=None):
+        fields, message = _actor_info_fields(params)
+        if message:
+            return error(message)
+        scene_format = params.get("format", SCENE_FORMAT_OBJECTS)
+        if scene_format not in (SCENE_FORMAT_OBJECTS, SCENE_FORMAT_COLUMNAR):
+            return error(f"Unknown format: '{scene_format}'. Valid formats are '{SCENE_FORMAT_OBJECTS}' "
+                         f"and '{SCENE_FORMAT_COLUMNAR}'")
+        if actors is None:
+            actors = list(self.scene.actors.values())
+        offset = max(int(params.get("offset", 0)), 0)
+        if "limit" in params:
+            limit = min(max(int(params["limit"]), 1), MAX_SCENE_INFO_PAGE_SIZE)
+        else:
+            limit = self.scene.max_actors_in_scene_info
+        returned = actors[offset:offset + limit] if limit is not None else actors[offset:]
+        limit_reached = offset + len(returned) < len(actors)
+        result = {
+            "level": self.scene.level,
+            "version": self.scene.version,
+            "actor_count": len(actors),
+            "returned_actor_count": len(returned),
+            "limit_reached": limit_reached,
+            "offset": offset,
+            "next_offset": offset + len(returned) if limit_reached else None
+        }
+        if scene_format == SCENE_FORMAT_COLUMNAR:
+            result["columns"] = _actor_columns(returned, fields)
+        else:
+            result["actors"] = [_actor_info(actor, fields) for actor in returned]
+        return success(result)
+
+    def _query_actors(self, params):
+        filter_params = params.get("filter")
+        if filter_params is not None and not isinstance(filter_params, dict):
+            return error("'filter' must be an object")
+        predicate, message = _actor_filter(filter_params)
+        if message:
+            return error(message)
+        return self._get_scene_info(params, [actor for actor in self.scene.actors.values() if predicate(actor)])
+
+    def _get_scene_changes(self, params):
+        since_version = params.get("since_version")
+        if not isinstance(since_version, (int, float)) or isinstance(since_version, bool):
+            return error("Missing 'since_version' field")
+        since_version = int(since_version)
+        fields, message = _actor_info_fields(params)
+        if message:
+            return error(message)
+        full_resync, added, modified, removed = self.scene.get_changes_since(since_version)
+        # A delta as large as a page of the scene is no cheaper than paging through it
+        if len(added) + len(modified) > MAX_SCENE_INFO_PAGE_SIZE:
+            full_resync = True
+        if full_resync:
+            added, modified, removed = [], [], []
+        return success({
+            "version": self.scene.version,
+            "since_version": since_version,
+            "full_resync": full_resync,
+            "added": [_actor_info(actor, fields) for actor in added],
+            "modified": [_actor_info(actor, fields) for actor in modified],
+            "removed": removed
+        })
+
+    def _create_object(self, params):
+        actor_type = params.get("type")
+        if not isinstance(actor_type, str):
+            return error("Missing 'type' field")
+        location = _vector(params.get("location"))
+        if location is None:
+            return error("Invalid 'location' field")
+
+        if actor_type == "StaticMeshActor":
+            mesh = params.get("mesh", "")
+        elif actor_type.lower() == "cube":
+            mesh = "/Engine/BasicShapes/Cube.Cube"
+        else:
+            return error(f"Unsupported actor type: {actor_type}")
+        actor = self.scene.spawn_actor("StaticMeshActor", location, params.get("label"), mesh)
+        return success({"name": actor["name"], "label": actor["label"]})
+
+    def _create_objects(self, params):
+        actor_type = params.get("type")
+        if not isinstance(actor_type, str):
+            return error("Missing 'type' field")
+        if actor_type == "StaticMeshActor":
+            mesh = params.get("mesh", "")
+        elif actor_type.lower() == "cube":
+            mesh = "/Engine/BasicShapes/Cube.Cube"
+        else:
+            return error(f"Unsupported actor type: {actor_type}")
+
+        columns = {}
+        for field in ("locations", "rotations", "scales"):
+            columns[field], message = _vector_column(params, field)
+            if message:
+                return error(message)
+        locations = columns["locations"]
+        if not 0 < len(locations) <= MAX_OBJECTS_PER_BULK_COMMAND:
+            return error(f"'locations' must contain between 1 and {MAX_OBJECTS_PER_BULK_COMMAND} entries")
+        if any(columns[field] and len(columns[field]) != len(locations) for field in ("rotations", "scales")):
+            return error("'rotations' and 'scales' must have one entry per location")
+        labels = params.get("labels")
+        if labels is not None and (not isinstance(labels, list) or len(labels) != len(locations)):
+            return error("'labels' must have one entry per location")
+
+        names = []
+        for index, location in enumerate(locations):
+            actor = self.scene.spawn_actor("StaticMeshActor", location, labels[index] if labels else None, mesh)
+            if columns["rotations"]:
+                actor["rotation"] = columns["rotations"][index]
+            if columns["scales"]:
+                actor["scale"] = columns["scales"][index]
+            names.append(actor["name"])
+        return success({"created": len(names), "failed": 0, "names": names})
+
+    def _modify_object(self, params):
+        name = params.get("name")
+        if not isinstance(name, str):
+            return error("Missing 'name' field")
+        actor = self.scene.find_actor(name)
+        if actor is None:
+            return error(f"Actor not found: {name}")
+
+        modified = False
+        for field in ("location", "rotation", "scale"):
+            value = _vector(params.get(field))
+            if value is not None:
+                actor[field] = value
+                modified = True
+        if not modified:
+            return {"status": "warning", "message": "No modifications specified"}
+        self.scene.touch_actor(actor["name"])
+        return success({"name": actor["name"]})
+
+    def _modify_objects(self, params):
+        names = params.get("names")
+        if not isinstance(names, list):
+            return error("Missing 'names' field")
+        if not 0 < len(names) <= MAX_OBJECTS_PER_BULK_COMMAND:
+            return error(f"'names' must contain between 1 and {MAX_OBJECTS_PER_BULK_COMMAND} entries")
+
+        columns = {}
+        for field in ("location", "rotation", "scale"):
+            columns[field], message = _vector_column(params, field + "s")
+            if message:
+                return error(message)
+        if any(len(column) > 1 and len(column) != len(names) for column in columns.values()):
+            return error("'locations', 'rotations' and 'scales' must have one entry per name, or a single entry for all")
+        if not any(columns.values()):
+            return error("No modifications specified")
+        relative = params.get("relative") is True
+
+        modified, not_found = 0, []
+        for index, name in enumerate(names):
+            actor = self.scene.find_actor(str(name))
+            if actor is None:
+                not_found.append(name)
+                continue
+            for field, column in columns.items():
+                if not column:
+                    continue
+                value = column[0] if len(column) == 1 else column[index]
+                if relative and field == "scale":
+                    value = [current * factor for current, factor in zip(actor[field], value)]
+                elif relative:
+                    value = [current + offset for current, offset in zip(actor[field], value)]
+                actor[field] = value
+            self.scene.touch_actor(actor["name"])
+            modified += 1
+        return success({"modified": modified, "not_found": not_found})
+
+    def _delete_object(self, params):
+        name = params.get("name")
+        if not isinstance(name, str):
+            return error("Missing 'name' field")
+        actor = self.scene.find_actor(name)
+        if actor is None:
+            return error(f"Actor not found: {name}")
+        self.scene.remove_actor(actor["name"])
+        return success()
+
+    def _delete_objects(self, params):
+        names, filter_params = params.get("names"), params.get("filter")
+        if isinstance(names, list) == isinstance(filter_params, dict):
+            return error("Provide either a 'names' list or a 'filter' object")
+
+        targets, not_found = {}, []
+        if names is not None:
+            if len(names) > MAX_OBJECTS_PER_BULK_COMMAND:
+                return error(f"'names' must contain at most {MAX_OBJECTS_PER_BULK_COMMAND} entries")
+            for name in names:
+                actor = self.scene.find_actor(str(name))
+                if actor is None:
+                    not_found.append(name)
+                else:
+                    targets[actor["name"]] = actor
+        else:
+            predicate, message = _actor_filter(filter_params)
+            if message:
+                return error(message)
+            if not filter_params:
+                return error("The filter must have at least one condition")
+            targets = {name: actor for name, actor in self.scene.actors.items() if predicate(actor)}
+
+        result = {"dry_run": params.get("dry_run") is True, "matched": len(targets), "not_found": not_found,
+                  "skipped": []}
+        if result["dry_run"]:
+            result["names"] = list(targets)
+            return success(result)
+        for name in targets:
+            self.scene.remove_actor(name)
+        result["deleted"] = len(targets)
+        result["failed"] = []
+        return success(result)
+
+    def _execute_python(self, params):
+        code = params.get("code")
+        if code is None and params.get("file") is None:
+            return error("Missing 'code' or 'file' field. You must provide either Python code or a file path.")
+        if code is None:
+            return success({"output": f"Executed file {params['file']}\n"})
+        return success({"output": f"Executed {len(code)} characters of Python code\n"})
+
+    # Material handlers (FMCPCreateMaterialHandler, ...)
+
+    def _apply_material_properties(self, material, properties):
+        for field in ("shading_model", "blend_mode"):
+            if isinstance(properties.get(field), str):
+                material[field] = properties[field]
+        for field in ("two_sided", "dithered_lod_transition", "cast_contact_shadow"):
+            if isinstance(properties.get(field), bool):
+                material[field] = properties[field]
+        base_color = _vector(properties.get("base_color"), 4)
+        if base_color is not None:
+            material["base_color"] = base_color
+        for field in ("metallic", "roughness"):
+            if isinstance(properties.get(field), (int, float)):
+                material[field] = float(properties[field])
+
+    def _create_material(self, params):
+        package_path = params.get("package_path")
+        if not isinstance(package_path, str):
+            return error("Missing 'package_path' field")
+        name = params.get("name")
+        if not isinstance(name, str):
+            return error("Missing 'name' field")
+
+        material = self.scene.add_material(package_path, name)
+        if isinstance(params.get("properties"), dict):
+            self._apply_material_properties(material, params["properties"])
+        self.scene.touch_asset(material["path"])
+        return success({"name": material["name"], "path": material["path"]})
+
+    def _modify_material(self, params):
+        path = params.get("path")
+        if not isinstance(path, str):
+            return error("Missing 'path' field")
+        if not isinstance(params.get("properties"), dict):
+            return error("Missing 'properties' field")
+        material = self.scene.materials.get(_object_path(path))
+        if material is None:
+            return error(f"Failed to load material at path: {path}")
+        self._apply_material_properties(material, params["properties"])
+        self.scene.touch_asset(material["path"])
+        return success({"name": material["name"], "path": material["path"]})
+
+    def _get_material_info(self, params):
+        path = params.get("path")
+        if not isinstance(path, str):
+            return error("Missing 'path' field")
+        material = self.scene.materials.get(_object_path(path))
+        if material is None:
+            return error(f"Failed to load material at path: {path}")
+        stamp = self.scene.asset_stamp(path)
+        if params.get("if_none_match") == stamp:
+            return success({"not_modified": True, "stamp": stamp})
+        return success({**copy.deepcopy(material), "stamp": stamp})
+
+    # Blueprint handlers (FMCPCreateBlueprintHandler, ...)
+
+    def _create_blueprint(self, params):
+        package_path = params.get("package_path")
+        if not isinstance(package_path, str):
+            return error("Missing 'package_path' field")
+        name = params.get("name")
+        if not isinstance(name, str):
+            return error("Missing 'name' field")
+
+        properties = params.get("properties")
+        parent_class = properties.get("parent_class", "Actor") if isinstance(properties, dict) else "Actor"
+        # An existing blueprint is returned rather than replaced
+        blueprint = self.scene.add_blueprint(package_path, name, parent_class)
+        self.scene.touch_asset(blueprint["path"])
+        return success({"name": blueprint["name"], "path": blueprint["path"]})
+
+    def _modify_blueprint(self, params):
+        path = params.get("blueprint_path")
+        if not isinstance(path, str):
+            return error("Missing 'blueprint_path' field")
+        properties = params.get("properties")
+        if not isinstance(properties, dict):
+            return error("Missing 'properties' field")
+        blueprint = self.scene.blueprints.get(_object_path(path))
+        if blueprint is None:
+            return error(f"Failed to load blueprint at path: {path}")
+
+        for field in ("description", "category", "parent_class"):
+            if isinstance(properties.get(field), str):
+                blueprint[field] = properties[field]
+        options = properties.get("options")
+        if isinstance(options, dict):
+            class_options = blueprint["class_options"]
+            for field in ("namespace", "display_name"):
+                if isinstance(options.get(field), str):
+                    blueprint[field] = options[field]
+            if isinstance(options.get("compile_mode"), str):
+                class_options["compile_mode"] = options["compile_mode"]
+            if isinstance(options.get("hide_categories"), list):
+                class_options["hide_categories"] = list(options["hide_categories"])
+            for option, field in (("abstract_class", "abstract_class"), ("const_class", "const_class"),
+                                  ("deprecate", "deprecated")):
+                if isinstance(options.get(option), bool):
+                    class_options[field] = options[option]
+        self.scene.touch_asset(blueprint["path"])
+        return success()
+
+    def _get_blueprint_info(self, params):
+        path = params.get("blueprint_path")
+        if not isinstance(path, str):
+            return error("Missing 'blueprint_path' field")
+        blueprint = self.scene.blueprints.get(_object_path(path))
+        if blueprint is None:
+            return error(f"Failed to load blueprint at path: {path}")
+        stamp = self.scene.asset_stamp(path)
+        if params.get("if_none_match") == stamp:
+            return success({"not_modified": True, "stamp": stamp})
+        return success({**copy.deepcopy(blueprint), "stamp": stamp})
+
+    def _create_blueprint_event(self, params):
+        event_name = params.get("event_name")
+        if not isinstance(event_name, str):
+            return error("Missing 'event_name' field")
+        path = _object_path(params.get("blueprint_path") or f"/Game/GeneratedBlueprints/BP_MCP_{event_name}")
+
+        blueprint = self.scene.blueprints.get(path)
+        if blueprint is None:
+            package_path, name = path.rsplit(".", 1)[0].rsplit("/", 1)
+            blueprint = self.scene.add_blueprint(package_path, name)
+        blueprint["events"].append({"name": event_name})
+        self.scene.touch_asset(blueprint["path"])
+        return success({"blueprint": blueprint["name"], "event": event_name, "path": blueprint["path"]})
+
+    def _batch(self, params):
+        """Run sub-commands in order, like FMCPBatchHandler."""
+        commands = params.get("commands")
+        if not isinstance(commands, list):
+            return error("Missing 'commands' field")
+        if len(commands) > MAX_BATCH_COMMANDS:
+            return error(f"Too many commands in batch: {len(commands)} (limit {MAX_BATCH_COMMANDS})")
+        stop_on_error = bool(params.get("stop_on_error", False))
+
+        results = []
+        counts = {"success": 0, "error": 0, "skipped": 0}
+        for index, command in enumerate(commands):
+            command_type = command.get("type", "") if isinstance(command, dict) else ""
+            if stop_on_error and counts["error"]:
+                item = {"status": "skipped"}
+            elif not isinstance(command, dict):
+                item = error("Batch item is not an object")
+            elif not command_type:
+                item = error("Missing 'type' field")
+            elif command_type == "batch":
+                item = error("Nested batch commands are not supported")
+            elif command_type not in self.handlers:
+                item = error(f"Unknown command: {command_type}")
+            else:
+                sub_params = command.get("params")
+                try:
+                    item = self.handlers[command_type](sub_params if isinstance(sub_params, dict) else {})
+                except Exception as e:
+                    item = error(f"Handler for '{command_type}' failed: {e}")
+            item = dict(item, index=index)
+            if command_type:
+                item["type"] = command_type
+            counts[item["status"] if item["status"] in counts else "error"] += 1
+            results.append(item)
+
+        result = {
+            "count": len(commands),
+            "succeeded": counts["success"],
+            "failed": counts["error"],
+            "skipped": counts["skipped"],
+            "results": results
+        }
+        if not counts["error"]:
+            return success(result)
+        return dict(error(f"{counts['error']} of {len(commands)} batch commands failed"), result=result)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Pure-Python stand-in for the Unreal MCP server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--actors", type=int, default=0, help="Populate the level with this many actors")
+    parser.add_argument("--tick-interval", type=float, default=DEFAULT_TICK_INTERVAL_SECONDS,
+                        help="Seconds between ticks (0 ticks as soon as a socket is ready)")
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds of latency added to every command")
+    parser.add_argument("--no-framing", action="store_true", help="Reject set_protocol and ignore ids like older plugin builds")
+    args = parser.parse_args()
+
+    server = MockUnrealServer(args.host, args.port, supports_framing=not args.no_framing,
+                              tick_interval=args.tick_interval, latency=args.latency)
+    server.scene.populate(args.actors)
+    server.start()
+    print(f"Mock Unreal MCP server listening on {args.host}:{server.port} (Ctrl+C to stop)")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -3,6 +3,8 @@
 MCP Server Test Runner
 
 This script runs all the MCP Server test scripts in sequence.
+Pass --offline to run the tests that use mock_unreal_server.py instead of a
+running editor.
 """
 
 import subprocess
@@ -38,11 +40,36 @@ def run_test(test_script):
 def main():
     """Run all test scripts."""
     # List of test scripts to run
-    test_scripts = [
-        "1_basic_connection.py",
-        "2_python_execution.py",
-        "3_string_test.py"
-    ]
+    if "--offline" in sys.argv[1:]:
+        test_scripts = [
+            "test_mock_server_offline.py",
+            "test_framing_offline.py",
+            "test_async_offline.py",
+            "test_batch_offline.py",
+            "test_cache_offline.py",
+            "test_scene_paging_offline.py",
+            "test_scene_delta_offline.py",
+            "test_scene_fields_offline.py",
+            "test_scene_columnar_offline.py",
+            "test_spatial_offline.py",
+            "test_scene_query_offline.py",
+            "test_actor_lookup_offline.py",
+            "test_bulk_create_offline.py",
+            "test_bulk_modify_offline.py",
+            "test_bulk_delete_offline.py",
+            "test_layout_offline.py",
+            "test_material_cache_offline.py",
+            "test_blueprint_cache_offline.py",
+            "test_tool_manifest_offline.py",
+            "test_config_offline.py",
+            "test_startup_profile_offline.py"
+        ]
+    else:
+        test_scripts = [
+            "1_basic_connection.py",
+            "2_python_execution.py",
+            "3_string_test.py"
+        ]
     
     # Track results
     results = {}
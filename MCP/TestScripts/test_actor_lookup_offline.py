@@ -0,0 +1,125 @@
+"""Offline test for the indexed actor lookup of modify_object and delete_object.
+
+This script edits actors of mock_unreal_server.MockUnrealServer by name and
+by label, checks that the label index follows spawns and removals, and
+checks that the cost of an edit does not grow with the size of the level.
+No Unreal Engine instance is needed.
+"""
+
+import sys
+import os
+import time
+
+# Add the MCP directory to sys.path so we can import the bridge utilities
+mcp_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if mcp_dir not in sys.path:
+    sys.path.insert(0, mcp_dir)
+
+from mock_unreal_server import MockUnrealServer
+from utils.connection import ConnectionPool
+
+SMALL_LEVEL_ACTOR_COUNT = 1000
+LARGE_LEVEL_ACTOR_COUNT = 100000
+EDIT_COUNT = 500
+
+
+def test_lookup_by_label(server, pool):
+    """Actors can be addressed by label, and a name wins over a label."""
+    print("\n- Editing actors by label...")
+    try:
+        moved = pool.send_command("modify_object", {"name": "Cube42", "location": [1, 2, 3]})
+        # An actor labelled like another actor's name: the name is resolved first
+        decoy = server.scene.spawn_actor("PointLight", label="StaticMeshActor_7")
+        named = pool.send_command("modify_object", {"name": "StaticMeshActor_7", "location": [4, 5, 6]})
+        deleted = pool.send_command("delete_object", {"name": "Cube43"})
+        missing = pool.send_command("delete_object", {"name": "Cube43"})
+        return (moved["result"]["name"] == "StaticMeshActor_42"
+                and server.scene.actors["StaticMeshActor_42"]["location"] == [1.0, 2.0, 3.0]
+                and named["result"]["name"] == "StaticMeshActor_7" and decoy["location"] == [0.0, 0.0, 0.0]
+                and deleted["status"] == "success" and "StaticMeshActor_43" not in server.scene.actors
+                and missing["status"] == "error")
+    except Exception as e:
+        print(f"Error editing by label: {e}")
+        return False
+
+
+def test_label_index_follows_scene(server, pool):
+    """A label freed by a deletion resolves to the next actor carrying it."""
+    print("\n- Reusing a label...")
+    try:
+        crate = {"type": "cube", "location": [0, 0, 0], "label": "Crate"}
+        first = pool.send_command("create_object", crate)["result"]["name"]
+        second = pool.send_command("create_object", crate)["result"]["name"]
+        to_first = pool.send_command("modify_object", {"name": "Crate", "scale": [2, 2, 2]})["result"]["name"]
+        pool.send_command("delete_object", {"name": first})
+        to_second = pool.send_command("modify_object", {"name": "Crate", "scale": [3, 3, 3]})["result"]["name"]
+        pool.send_command("delete_object", {"name": "Crate"})
+        gone = pool.send_command("modify_object", {"name": "Crate", "scale": [1, 1, 1]})
+        return to_first == first and to_second == second and gone["status"] == "error"
+    except Exception as e:
+        print(f"Error reusing a label: {e}")
+        return False
+
+
+def _median_edit_seconds(actor_count):
+    with MockUnrealServer(tick_interval=0) as server:
+        server.scene.populate(actor_count)
+        pool = ConnectionPool("127.0.0.1", server.port)
+        timings = []
+        for index in range(EDIT_COUNT):
+            label = f"Cube{(index * 7919) % actor_count}"
+            start = time.perf_counter()
+            pool.send_command("modify_object", {"name": label, "location": [index, 0, 0]})
+            timings.append(time.perf_counter() - start)
+        pool.close()
+    return sorted(timings)[len(timings) // 2]
+
+
+def test_edit_cost_is_flat():
+    """Editing an actor of a large level costs about as much as in a small level."""
+    print("\n- Timing edits in a small and a large level...")
+    try:
+        small = _median_edit_seconds(SMALL_LEVEL_ACTOR_COUNT)
+        large = _median_edit_seconds(LARGE_LEVEL_ACTOR_COUNT)
+        print(f"{SMALL_LEVEL_ACTOR_COUNT} actors: {small * 1000:.3f} ms, "
+              f"{LARGE_LEVEL_ACTOR_COUNT} actors: {large * 1000:.3f} ms per edit")
+        return large < small * 3
+    except Exception as e:
+        print(f"Error timing edits: {e}")
+        return False
+
+
+def main():
+    """Run all offline actor lookup tests."""
+    print("Starting UnrealMCP offline actor lookup tests...")
+
+    try:
+        with MockUnrealServer(tick_interval=0) as server:
+            server.scene.populate(SMALL_LEVEL_ACTOR_COUNT)
+            pool = ConnectionPool("127.0.0.1", server.port)
+            results = {
+                "lookup by label": test_lookup_by_label(server, pool),
+                "label index follows scene": test_label_index_follows_scene(server, pool)
+            }
+            pool.close()
+        results["edit cost is flat"] = test_edit_cost_is_flat()
+
+        print("\nTest Results:")
+        print("-" * 40)
+        for test_name, success in results.items():
+            status = "✓ PASS" if success else "✗ FAIL"
+            print(f"{status} - {test_name}")
+        print("-" * 40)
+
+        if all(results.values()):
+            print("\nAll offline actor lookup tests passed successfully!")
+        else:
+            print("\nSome tests failed. Check the output above for details.")
+            sys.exit(1)
+
+    except Exception as e:
+        print(f"\nError during testing: {e}")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,169 @@
+"""Offline test for the asyncio bridge client.
+
+This script runs utils.async_connection.AsyncConnectionPool and
+AsyncCommandMultiplexer against mock_unreal_server.MockUnrealServer. It checks
+that concurrent commands each get their own response, that connections are
+reused or pipelined, that a timed out command does not poison later ones
+and that an idle connection the server closed is not reused.
+No Unreal Engine instance is needed.
+"""
+
+import asyncio
+import sys
+import os
+import time
+
+# Add the MCP directory to sys.path so we can import the bridge utilities
+mcp_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if mcp_dir not in sys.path:
+    sys.path.insert(0, mcp_dir)
+
+from mock_unreal_server import MockUnrealServer, success
+from utils.async_connection import AsyncCommandMultiplexer, AsyncConnectionPool, AsyncUnrealConnection
+from utils.protocol import FRAMING_AUTO, FRAMING_RAW
+
+CONCURRENT_COMMANDS = 16
+
+
+def get_material_info(params):
+    return success({"name": params["path"].rsplit("/", 1)[-1], "path": params["path"]})
+
+
+def slow_command(params):
+    time.sleep(params.get("seconds", 0.5))
+    return success({"slept": True})
+
+
+async def test_concurrent_commands(pool):
+    """Run parallel get_material_info calls and match every response to its request."""
+    print(f"\n- Running {CONCURRENT_COMMANDS} concurrent get_material_info commands (framing='{pool.framing}')...")
+    paths = [f"/Game/Materials/M_Test{i}" for i in range(CONCURRENT_COMMANDS)]
+    try:
+        for _ in range(2):
+            responses = await asyncio.gather(*(pool.send_command("get_material_info", {"path": path}) for path in paths))
+            if [response["result"]["path"] for response in responses] != paths:
+                print("Responses did not match their requests")
+                return False
+        print(f"Pool stats: {pool.stats}")
+        return pool.stats["reused"] > 0 and pool.stats["connections_opened"] <= CONCURRENT_COMMANDS + pool.max_idle
+    except Exception as e:
+        print(f"Error running concurrent commands: {e}")
+        return False
+
+
+async def test_timeout_recovery(pool):
+    """A timed out command must not leave its late response for the next caller."""
+    print("\n- Timing out a slow command...")
+    try:
+        await pool.send_command("slow_command", {"seconds": 0.5}, timeout=0.1)
+        print("Slow command did not time out")
+        return False
+    except asyncio.TimeoutError:
+        pass
+
+    try:
+        response = await pool.send_command("get_material_info", {"path": "/Game/Materials/M_After"})
+        return response["result"]["path"] == "/Game/Materials/M_After"
+    except Exception as e:
+        print(f"Error after timeout: {e}")
+        return False
+
+
+async def test_pipelining(multiplexer, expect_pipelining):
+    """Run parallel commands through the multiplexer and check how they were sent."""
+    print(f"\n- Multiplexing {CONCURRENT_COMMANDS} concurrent commands...")
+    paths = [f"/Game/Materials/M_Test{i}" for i in range(CONCURRENT_COMMANDS)]
+    try:
+        responses = await asyncio.gather(*(multiplexer.send_command("get_material_info", {"path": path}) for path in paths))
+        if [response["result"]["path"] for response in responses] != paths:
+            print("Responses did not match their requests")
+            return False
+        print(f"Multiplexer stats: {multiplexer.stats}, pipelining: {multiplexer.pipelining}")
+        if not expect_pipelining:
+            return multiplexer.pipelining is False
+        return (multiplexer.pipelining and multiplexer.stats["connections_opened"] == 1
+                and multiplexer.stats["max_in_flight"] > 1)
+    except Exception as e:
+        print(f"Error multiplexing commands: {e}")
+        return False
+
+
+async def test_closed_by_server():
+    """An idle connection is alive until the server closes it, then a command reconnects."""
+    print("\n- Checking an idle connection before and after the server closes it...")
+    server = MockUnrealServer(tick_interval=0).start()
+    connection = AsyncUnrealConnection("127.0.0.1", server.port)
+    try:
+        await connection.send_command("get_scene_info")
+        alive_while_idle = connection.is_alive()
+        for client in list(server._clients):
+            server._disconnect(client)
+        # Block the event loop so only the socket can tell, then let the stream see EOF
+        time.sleep(0.05)
+        closed_seen = not connection.is_alive()
+        await asyncio.sleep(0.05)
+        eof_seen = not connection.is_alive()
+        response = await connection.send_command("get_scene_info")
+        return (alive_while_idle and closed_seen and eof_seen
+                and response["status"] == "success" and connection.connect_count == 2)
+    except Exception as e:
+        print(f"Error checking connection: {e}")
+        return False
+    finally:
+        connection.close()
+        server.stop()
+
+
+async def run_tests(port, legacy_port):
+    results = {}
+    for framing in (FRAMING_AUTO, FRAMING_RAW):
+        pool = AsyncConnectionPool("127.0.0.1", port, framing=framing)
+        results[f"concurrent commands ({framing})"] = await test_concurrent_commands(pool)
+        results[f"timeout recovery ({framing})"] = await test_timeout_recovery(pool)
+        pool.close()
+
+    multiplexer = AsyncCommandMultiplexer("127.0.0.1", port)
+    results["pipelined commands"] = await test_pipelining(multiplexer, True)
+    results["pipelined timeout recovery"] = await test_timeout_recovery(multiplexer)
+    results["pipelined after timeout"] = await test_pipelining(multiplexer, True)
+    multiplexer.close()
+
+    legacy_multiplexer = AsyncCommandMultiplexer("127.0.0.1", legacy_port)
+    results["multiplexer falls back to pool"] = await test_pipelining(legacy_multiplexer, False)
+    legacy_multiplexer.close()
+
+    results["idle connection closed by server"] = await test_closed_by_server()
+    return results
+
+
+def main():
+    """Run all offline async client tests."""
+    print("Starting UnrealMCP offline async client tests...")
+
+    try:
+        with MockUnrealServer(tick_interval=0) as server, \
+                MockUnrealServer(supports_framing=False, tick_interval=0) as legacy_server:
+            for mock in (server, legacy_server):
+                mock.register_handler("get_material_info", get_material_info)
+                mock.register_handler("slow_command", slow_command)
+            results = asyncio.run(run_tests(server.port, legacy_server.port))
+
+        print("\nTest Results:")
+        print("-" * 40)
+        for test_name, success in results.items():
+            status = "✓ PASS" if success else "✗ FAIL"
+            print(f"{status} - {test_name}")
+        print("-" * 40)
+
+        if all(results.values()):
+            print("\nAll offline async client tests passed successfully!")
+        else:
+            print("\nSome tests failed. Check the output above for details.")
+            sys.exit(1)
+
+    except Exception as e:
+        print(f"\nError during testing: {e}")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
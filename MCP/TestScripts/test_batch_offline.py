@@ -0,0 +1,101 @@
+"""Offline test for the batch command.
+
+This script sends batch commands to mock_unreal_server.MockUnrealServer, which
+mirrors FMCPBatchHandler. It checks the per-item results, partial-failure
+reporting and stop_on_error. No Unreal Engine instance is needed.
+"""
+
+import sys
+import os
+
+# Add the MCP directory to sys.path so we can import the bridge utilities
+mcp_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if mcp_dir not in sys.path:
+    sys.path.insert(0, mcp_dir)
+
+from mock_unreal_server import MockUnrealServer
+from utils.connection import UnrealConnection
+
+LAYOUT_SIZE = 500
+
+
+def layout_commands(count):
+    return [
+        {"type": "create_object", "params": {"type": "CUBE", "location": [i * 100, 0, 0], "label": f"Piece{i}"}}
+        for i in range(count)
+    ]
+
+
+def test_full_layout(connection, server):
+    """Create a whole layout in one round trip."""
+    print(f"\n- Creating {LAYOUT_SIZE} objects in one batch...")
+    try:
+        processed = server.commands_processed
+        response = connection.send_command("batch", {"commands": layout_commands(LAYOUT_SIZE)})
+        result = response["result"]
+        print(f"Batch result: count={result['count']} succeeded={result['succeeded']} failed={result['failed']}")
+        return (response["status"] == "success" and result["succeeded"] == LAYOUT_SIZE
+                and [item["index"] for item in result["results"]] == list(range(LAYOUT_SIZE))
+                and result["results"][-1]["result"]["label"] == f"Piece{LAYOUT_SIZE - 1}"
+                and server.commands_processed == processed + 1
+                and len(server.scene.actors) == LAYOUT_SIZE)
+    except Exception as e:
+        print(f"Error running batch: {e}")
+        return False
+
+
+def test_partial_failure(connection, stop_on_error):
+    """A failing item is reported without hiding the others."""
+    print(f"\n- Running a batch with failing items (stop_on_error={stop_on_error})...")
+    commands = layout_commands(3)
+    commands[1] = {"type": "create_object", "params": {"type": "CUBE"}}
+    commands.append({"type": "batch", "params": {"commands": []}})
+    commands.append({"type": "no_such_command"})
+    try:
+        response = connection.send_command("batch", {"commands": commands, "stop_on_error": stop_on_error})
+        result = response["result"]
+        statuses = [item["status"] for item in result["results"]]
+        print(f"Batch message: {response.get('message')}, statuses: {statuses}")
+        if response["status"] != "error":
+            return False
+        if stop_on_error:
+            return statuses == ["success", "error", "skipped", "skipped", "skipped"] and result["skipped"] == 3
+        return statuses == ["success", "error", "success", "error", "error"] and result["failed"] == 3
+    except Exception as e:
+        print(f"Error running batch: {e}")
+        return False
+
+
+def main():
+    """Run all offline batch tests."""
+    print("Starting UnrealMCP offline batch tests...")
+
+    try:
+        with MockUnrealServer(tick_interval=0) as server:
+            connection = UnrealConnection("127.0.0.1", server.port)
+            results = {
+                "full layout in one round trip": test_full_layout(connection, server),
+                "partial failure": test_partial_failure(connection, False),
+                "stop on error": test_partial_failure(connection, True)
+            }
+            connection.close()
+
+        print("\nTest Results:")
+        print("-" * 40)
+        for test_name, passed in results.items():
+            status = "✓ PASS" if passed else "✗ FAIL"
+            print(f"{status} - {test_name}")
+        print("-" * 40)
+
+        if all(results.values()):
+            print("\nAll offline batch tests passed successfully!")
+        else:
+            print("\nSome tests failed. Check the output above for details.")
+            sys.exit(1)
+
+    except Exception as e:
+        print(f"\nError during testing: {e}")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
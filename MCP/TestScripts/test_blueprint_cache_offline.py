@@ -0,0 +1,159 @@
+"""Offline test for the bridge's blueprint info cache.
+
+This script reads blueprints of mock_unreal_server.MockUnrealServer through
+utils.cache.AssetInfoCache, as the get_blueprint_info tool does, and checks
+that repeat reads are answered with a short not_modified response, that
+modify_blueprint and create_blueprint_event are picked up, that the
+cached info of one blueprint survives changes to another and that
+execute_python sent through the bridge drops the attached cache. No Unreal
+Engine instance is needed.
+"""
+
+import asyncio
+import sys
+import os
+
+# Add the MCP directory to sys.path so we can import the bridge utilities
+mcp_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if mcp_dir not in sys.path:
+    sys.path.insert(0, mcp_dir)
+
+from mock_unreal_server import MockUnrealServer
+import utils
+from utils.async_connection import AsyncConnectionPool
+from utils.cache import AssetInfoCache
+from utils.connection import ConnectionPool
+
+DOOR_PATH = "/Game/Blueprints/BP_Door"
+LAMP_PATH = "/Game/Blueprints/BP_Lamp"
+
+
+def test_repeat_reads(server, pool, cache):
+    """Only the first read walks the blueprint; later reads are confirmed with its stamp."""
+    print("\n- Reading a blueprint three times...")
+    try:
+        infos = [cache.get(pool.send_command, DOOR_PATH)["result"] for _ in range(3)]
+        short = pool.send_command("get_blueprint_info", {"blueprint_path": DOOR_PATH, "if_none_match": infos[0]["stamp"]})
+        print(f"Cache stats: {cache.stats}")
+        return (infos[0] == infos[1] == infos[2] and infos[0]["parent_class"] == "Actor"
+                and short["result"] == {"not_modified": True, "stamp": infos[0]["stamp"]}
+                and cache.stats["misses"] == 1 and cache.stats["revalidated"] == 2)
+    except Exception as e:
+        print(f"Error reading blueprint: {e}")
+        return False
+
+
+def test_blueprint_edits(pool, cache):
+    """modify_blueprint and create_blueprint_event change the stamp, so the next read is fresh."""
+    print("\n- Editing the blueprint...")
+    try:
+        pool.send_command("modify_blueprint", {"blueprint_path": DOOR_PATH, "properties": {"category": "Doors"}})
+        cache.invalidate(DOOR_PATH)
+        after_modify = cache.get(pool.send_command, DOOR_PATH)["result"]
+
+        # Even without invalidating, the server's stamp tells the cache the blueprint changed
+        misses = cache.stats["misses"]
+        pool.send_command("create_blueprint_event", {"event_name": "OnOpened", "blueprint_path": DOOR_PATH})
+        after_event = cache.get(pool.send_command, DOOR_PATH)["result"]
+        return (after_modify["category"] == "Doors" and after_event["events"] == [{"name": "OnOpened"}]
+                and cache.stats["misses"] == misses + 1)
+    except Exception as e:
+        print(f"Error editing blueprint: {e}")
+        return False
+
+
+def test_independent_blueprints(pool, cache):
+    """Editing one blueprint keeps the cached info of another."""
+    print("\n- Editing a second blueprint...")
+    try:
+        cache.get(pool.send_command, LAMP_PATH)
+        pool.send_command("modify_blueprint", {"blueprint_path": DOOR_PATH, "properties": {"description": "Opens"}})
+        cache.invalidate(DOOR_PATH)
+        revalidated = cache.stats["revalidated"]
+        lamp = cache.get(pool.send_command, LAMP_PATH + ".BP_Lamp")["result"]
+        missing = cache.get(pool.send_command, "/Game/Blueprints/BP_Missing")
+        return lamp["name"] == "BP_Lamp" and cache.stats["revalidated"] == revalidated + 1 and missing["status"] == "error"
+    except Exception as e:
+        print(f"Error editing blueprints: {e}")
+        return False
+
+
+def test_python_edits(server):
+    """execute_python sent through the bridge drops a cache attached to the shared command cache."""
+    print("\n- Editing a blueprint from Python...")
+    utils._pool = ConnectionPool("127.0.0.1", server.port)
+    cache = AssetInfoCache("get_blueprint_info", path_param="blueprint_path").attach()
+    try:
+        cache.get(utils.send_command, LAMP_PATH)
+        utils.send_command("modify_object", {"name": "Missing", "location": [0, 0, 0]})
+        kept = cache.get(utils.send_command, LAMP_PATH)["result"]
+
+        # Python that sets a property directly does not bump the server's change stamp
+        server.scene.blueprints[LAMP_PATH + ".BP_Lamp"]["category"] = "Lights"
+        utils.send_command("execute_python", {"code": "pass"})
+        after_python = cache.get(utils.send_command, LAMP_PATH)["result"]
+        print(f"Cache stats: {cache.stats}")
+        return (kept.get("category") != "Lights" and after_python["category"] == "Lights"
+                and cache.stats == {"hits": 0, "revalidated": 1, "misses": 2})
+    except Exception as e:
+        print(f"Error editing blueprint from Python: {e}")
+        return False
+    finally:
+        cache.detach()
+        utils._pool.close()
+
+
+async def test_async_reads(server):
+    """aget caches the same way over an async connection."""
+    print("\n- Reading a blueprint asynchronously...")
+    pool = AsyncConnectionPool("127.0.0.1", server.port)
+    try:
+        cache = AssetInfoCache("get_blueprint_info", path_param="blueprint_path")
+        first = await cache.aget(pool.send_command, LAMP_PATH)
+        second = await cache.aget(pool.send_command, LAMP_PATH)
+        return first["result"] == second["result"] and cache.stats["revalidated"] == 1
+    except Exception as e:
+        print(f"Error reading blueprint asynchronously: {e}")
+        return False
+    finally:
+        pool.close()
+
+
+def main():
+    """Run all offline blueprint cache tests."""
+    print("Starting UnrealMCP offline blueprint cache tests...")
+
+    try:
+        with MockUnrealServer(tick_interval=0) as server:
+            pool = ConnectionPool("127.0.0.1", server.port)
+            for name in ("BP_Door", "BP_Lamp"):
+                pool.send_command("create_blueprint", {"package_path": "/Game/Blueprints", "name": name})
+            cache = AssetInfoCache("get_blueprint_info", path_param="blueprint_path")
+            results = {
+                "repeat reads": test_repeat_reads(server, pool, cache),
+                "blueprint edits": test_blueprint_edits(pool, cache),
+                "independent blueprints": test_independent_blueprints(pool, cache),
+                "python edits": test_python_edits(server),
+                "async reads": asyncio.run(test_async_reads(server))
+            }
+            pool.close()
+
+        print("\nTest Results:")
+        print("-" * 40)
+        for test_name, success in results.items():
+            status = "✓ PASS" if success else "✗ FAIL"
+            print(f"{status} - {test_name}")
+        print("-" * 40)
+
+        if all(results.values()):
+            print("\nAll offline blueprint cache tests passed successfully!")
+        else:
+            print("\nSome tests failed. Check the output above for details.")
+            sys.exit(1)
+
+    except Exception as e:
+        print(f"\nError during testing: {e}")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
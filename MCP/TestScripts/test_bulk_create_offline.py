@@ -0,0 +1,164 @@
+"""Offline test for the create_objects command.
+
+This script spawns actors on mock_unreal_server.MockUnrealServer through
+utils.bulk.create_objects, from lists and from NumPy arrays, and checks the
+spawned transforms and labels, that ten thousand actors take one request,
+that large requests are split into chunks and that invalid parameters are
+rejected. The NumPy checks are skipped when NumPy is not installed. No
+Unreal Engine instance is needed.
+"""
+
+import asyncio
+import sys
+import os
+import time
+
+# Add the MCP directory to sys.path so we can import the bridge utilities
+mcp_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if mcp_dir not in sys.path:
+    sys.path.insert(0, mcp_dir)
+
+from mock_unreal_server import MockUnrealServer
+from utils.async_connection import AsyncConnectionPool
+from utils.bulk import acreate_objects, create_objects, encode_vector_column
+from utils.connection import ConnectionPool
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+BULK_ACTOR_COUNT = 10000
+
+
+def test_create_from_lists(server, pool):
+    """Every actor gets its own location, rotation, scale and label."""
+    print("\n- Creating actors from lists...")
+    try:
+        result = create_objects(pool.send_command, "cube", [[0, 0, 0], [100, 0, 0], [200, 0, 0]],
+                                rotations=[[0, 0, 0], [0, 90, 0], [0, 180, 0]],
+                                scales=[[1, 1, 1], [2, 2, 2], [0.5, 0.5, 0.5]], labels=["A", "B", "C"])
+        actors = [server.scene.actors[name] for name in result["names"]]
+        return (result["created"] == 3 and result["failed"] == 0
+                and [actor["location"] for actor in actors] == [[0.0, 0.0, 0.0], [100.0, 0.0, 0.0], [200.0, 0.0, 0.0]]
+                and actors[1]["rotation"] == [0.0, 90.0, 0.0] and actors[2]["scale"] == [0.5, 0.5, 0.5]
+                and [actor["label"] for actor in actors] == ["A", "B", "C"]
+                and actors[0]["mesh"] == "/Engine/BasicShapes/Cube.Cube")
+    except Exception as e:
+        print(f"Error creating actors: {e}")
+        return False
+
+
+def test_create_from_numpy(server, pool):
+    """Ten thousand actors from a NumPy array take a single request."""
+    print(f"\n- Creating {BULK_ACTOR_COUNT} actors from a NumPy array...")
+    if numpy is None:
+        print("NumPy is not installed, skipping")
+        return True
+    try:
+        grid = numpy.stack(numpy.meshgrid(numpy.arange(100), numpy.arange(100), [0.0]), axis=-1).reshape(-1, 3) * 50.0
+        processed = server.commands_processed
+        start = time.perf_counter()
+        result = create_objects(pool.send_command, "cube", grid, scales=numpy.full((BULK_ACTOR_COUNT, 3), 0.25))
+        elapsed = time.perf_counter() - start
+        requests = server.commands_processed - processed
+        print(f"{result['created']} actors in {elapsed * 1000:.1f} ms and {requests} request(s)")
+        locations = numpy.array([server.scene.actors[name]["location"] for name in result["names"]])
+        return (requests == 1 and result["created"] == BULK_ACTOR_COUNT and len(set(result["names"])) == BULK_ACTOR_COUNT
+                and numpy.array_equal(locations, grid)
+                and encode_vector_column(grid[:5]) == encode_vector_column(grid[:5].tolist()))
+    except Exception as e:
+        print(f"Error creating actors: {e}")
+        return False
+
+
+def test_chunking(server, pool):
+    """Requests larger than the chunk size are split, and the results are joined in order."""
+    print("\n- Creating actors in chunks...")
+    try:
+        processed = server.commands_processed
+        locations = [[index, -1000, 0] for index in range(10)]
+        result = create_objects(pool.send_command, "cube", locations, labels=[f"Chunked{i}" for i in range(10)],
+                                chunk_size=4)
+        requests = server.commands_processed - processed
+        return (requests == 3 and result["created"] == 10
+                and [server.scene.actors[name]["label"] for name in result["names"]] == [f"Chunked{i}" for i in range(10)])
+    except Exception as e:
+        print(f"Error creating actors in chunks: {e}")
+        return False
+
+
+def test_invalid_parameters(pool):
+    """Mismatched arrays and malformed vectors are rejected."""
+    print("\n- Sending invalid parameters...")
+    try:
+        try:
+            create_objects(pool.send_command, "cube", [[0, 0, 0], [1, 1, 1]], labels=["Only one"])
+            return False
+        except ValueError as e:
+            print(f"Client: {e}")
+        responses = [
+            pool.send_command("create_objects", {"type": "cube", "locations": []}),
+            pool.send_command("create_objects", {"type": "cube", "locations": [[0, 0]]}),
+            pool.send_command("create_objects", {"type": "cube", "locations": "not base64!"}),
+            pool.send_command("create_objects", {"type": "cube", "locations": [[0, 0, 0]], "scales": [[1, 1, 1]] * 2}),
+            pool.send_command("create_objects", {"type": "Sphere", "locations": [[0, 0, 0]]})
+        ]
+        print(f"Server: {responses[1].get('message')}")
+        return all(response["status"] == "error" for response in responses)
+    except Exception as e:
+        print(f"Error sending invalid parameters: {e}")
+        return False
+
+
+async def test_async_create(server):
+    """acreate_objects spawns the same way over an async connection."""
+    print("\n- Creating actors asynchronously...")
+    pool = AsyncConnectionPool("127.0.0.1", server.port)
+    try:
+        result = await acreate_objects(pool.send_command, "StaticMeshActor", [[0, 0, 500], [0, 0, 600]],
+                                       mesh="/Engine/BasicShapes/Sphere.Sphere")
+        return (result["created"] == 2
+                and all(server.scene.actors[name]["mesh"] == "/Engine/BasicShapes/Sphere.Sphere" for name in result["names"]))
+    except Exception as e:
+        print(f"Error creating actors asynchronously: {e}")
+        return False
+    finally:
+        pool.close()
+
+
+def main():
+    """Run all offline bulk create tests."""
+    print("Starting UnrealMCP offline bulk create tests...")
+
+    try:
+        with MockUnrealServer(tick_interval=0) as server:
+            pool = ConnectionPool("127.0.0.1", server.port)
+            results = {
+                "create from lists": test_create_from_lists(server, pool),
+                "create from numpy": test_create_from_numpy(server, pool),
+                "chunking": test_chunking(server, pool),
+                "invalid parameters": test_invalid_parameters(pool),
+                "async create": asyncio.run(test_async_create(server))
+            }
+            pool.close()
+
+        print("\nTest Results:")
+        print("-" * 40)
+        for test_name, success in results.items():
+            status = "✓ PASS" if success else "✗ FAIL"
+            print(f"{status} - {test_name}")
+        print("-" * 40)
+
+        if all(results.values()):
+            print("\nAll offline bulk create tests passed successfully!")
+        else:
+            print("\nSome tests failed. Check the output above for details.")
+            sys.exit(1)
+
+    except Exception as e:
+        print(f"\nError during testing: {e}")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
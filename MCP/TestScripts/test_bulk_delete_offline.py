@@ -0,0 +1,156 @@
+"""Offline test for the delete_objects command.
+
+This script deletes actors of mock_unreal_server.MockUnrealServer through
+utils.bulk.delete_objects by name list and by filter, and checks that a dry
+run deletes nothing, that a generated layout is cleaned up with one
+request, that get_scene_changes reports the removals and that unsafe or
+invalid requests are rejected. No Unreal Engine instance is needed.
+"""
+
+import asyncio
+import sys
+import os
+
+# Add the MCP directory to sys.path so we can import the bridge utilities
+mcp_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if mcp_dir not in sys.path:
+    sys.path.insert(0, mcp_dir)
+
+from mock_unreal_server import MockUnrealServer
+from utils.async_connection import AsyncConnectionPool
+from utils.bulk import adelete_objects, delete_objects
+from utils.connection import ConnectionPool
+
+SCENE_ACTOR_COUNT = 2000
+GENERATED_ACTOR_COUNT = 5000
+
+
+def _generate_layout(server):
+    for index in range(GENERATED_ACTOR_COUNT):
+        server.scene.spawn_actor(location=(index * 10.0, 50000.0, 0.0), label=f"Gen_{index}", tags=["Generated"])
+
+
+def test_dry_run(server, pool):
+    """A dry run lists the matches and leaves the level untouched."""
+    print("\n- Dry-running a label prefix delete...")
+    try:
+        version = server.scene.version
+        result = delete_objects(pool.send_command, actor_filter={"label": "Gen_*"}, dry_run=True)
+        print(f"Would delete {result['matched']} actors")
+        return (result["dry_run"] is True and result["matched"] == GENERATED_ACTOR_COUNT
+                and len(result["names"]) == GENERATED_ACTOR_COUNT and "deleted" not in result
+                and server.scene.version == version and len(server.scene.actors) == SCENE_ACTOR_COUNT + GENERATED_ACTOR_COUNT)
+    except Exception as e:
+        print(f"Error in dry run: {e}")
+        return False
+
+
+def test_filter_delete(server, pool):
+    """Deleting by tag and region removes exactly the matches in one request."""
+    print("\n- Deleting a generated layout by filter...")
+    try:
+        version = server.scene.version
+        processed = server.commands_processed
+        region = delete_objects(pool.send_command, actor_filter={
+            "tag": "Generated", "box": {"min": [0, 49000, -1], "max": [9990, 51000, 1]}})
+        rest = delete_objects(pool.send_command, actor_filter={"tag": "Generated"})
+        requests = server.commands_processed - processed
+        changes = pool.send_command("get_scene_changes", {"since_version": version, "fields": []})["result"]
+        print(f"Deleted {region['deleted']} + {rest['deleted']} actors in {requests} requests")
+        return (requests == 2 and region["deleted"] == 1000 and rest["deleted"] == GENERATED_ACTOR_COUNT - 1000
+                and len(changes["removed"]) == GENERATED_ACTOR_COUNT and len(server.scene.actors) == SCENE_ACTOR_COUNT
+                and not any(actor["tags"] for actor in server.scene.actors.values()))
+    except Exception as e:
+        print(f"Error deleting by filter: {e}")
+        return False
+
+
+def test_name_delete(server, pool):
+    """Names and labels are resolved, missing names reported and large lists chunked."""
+    print("\n- Deleting by name...")
+    try:
+        result = delete_objects(pool.send_command, names=["StaticMeshActor_0", "Cube0", "Cube1", "NoSuchActor"])
+        processed = server.commands_processed
+        chunked = delete_objects(pool.send_command, names=[f"Cube{index}" for index in range(2, 102)], chunk_size=40)
+        requests = server.commands_processed - processed
+        return (result["matched"] == 2 and result["deleted"] == 2 and result["not_found"] == ["NoSuchActor"]
+                and chunked["deleted"] == 100 and requests == 3
+                and len(server.scene.actors) == SCENE_ACTOR_COUNT - 102)
+    except Exception as e:
+        print(f"Error deleting by name: {e}")
+        return False
+
+
+def test_rejected_requests(pool):
+    """Empty filters and ambiguous requests are refused rather than deleting the level."""
+    print("\n- Sending unsafe and invalid requests...")
+    try:
+        responses = [
+            pool.send_command("delete_objects", {"filter": {}}),
+            pool.send_command("delete_objects", {}),
+            pool.send_command("delete_objects", {"names": ["Cube500"], "filter": {"tag": "X"}}),
+            pool.send_command("delete_objects", {"filter": {"colour": "red"}})
+        ]
+        print(f"Server: {responses[0].get('message')}")
+        try:
+            delete_objects(pool.send_command)
+            return False
+        except ValueError:
+            pass
+        return all(response["status"] == "error" for response in responses)
+    except Exception as e:
+        print(f"Error sending invalid requests: {e}")
+        return False
+
+
+async def test_async_delete(server):
+    """adelete_objects works the same over an async connection."""
+    print("\n- Deleting actors asynchronously...")
+    pool = AsyncConnectionPool("127.0.0.1", server.port)
+    try:
+        result = await adelete_objects(pool.send_command, actor_filter={"label": "Cube19??"})
+        return result["deleted"] == 100 and "StaticMeshActor_1999" not in server.scene.actors
+    except Exception as e:
+        print(f"Error deleting actors asynchronously: {e}")
+        return False
+    finally:
+        pool.close()
+
+
+def main():
+    """Run all offline bulk delete tests."""
+    print("Starting UnrealMCP offline bulk delete tests...")
+
+    try:
+        with MockUnrealServer(tick_interval=0) as server:
+            server.scene.populate(SCENE_ACTOR_COUNT)
+            _generate_layout(server)
+            pool = ConnectionPool("127.0.0.1", server.port)
+            results = {
+                "dry run": test_dry_run(server, pool),
+                "filter delete": test_filter_delete(server, pool),
+                "name delete": test_name_delete(server, pool),
+                "rejected requests": test_rejected_requests(pool),
+                "async delete": asyncio.run(test_async_delete(server))
+            }
+            pool.close()
+
+        print("\nTest Results:")
+        print("-" * 40)
+        for test_name, success in results.items():
+            status = "✓ PASS" if success else "✗ FAIL"
+            print(f"{status} - {test_name}")
+        print("-" * 40)
+
+        if all(results.values()):
+            print("\nAll offline bulk delete tests passed successfully!")
+        else:
+            print("\nSome tests failed. Check the output above for details.")
+            sys.exit(1)
+
+    except Exception as e:
+        print(f"\nError during testing: {e}")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
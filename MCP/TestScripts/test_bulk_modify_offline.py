@@ -0,0 +1,204 @@
+"""Offline test for the modify_objects command.
+
+This script moves, rotates and scales actors of
+mock_unreal_server.MockUnrealServer through utils.bulk.modify_objects with
+absolute and relative transforms, per actor and shared by all actors
+(including a single flat [x, y, z]), and
+checks that a whole level is rearranged in one request, that missing actors
+are reported, that locations are sent at full precision and that invalid
+parameters are rejected. The NumPy check is skipped when NumPy is not
+installed. No Unreal Engine instance is needed.
+"""
+
+import asyncio
+import sys
+import os
+import time
+
+# Add the MCP directory to sys.path so we can import the bridge utilities
+mcp_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if mcp_dir not in sys.path:
+    sys.path.insert(0, mcp_dir)
+
+from mock_unreal_server import MockUnrealServer
+from utils.async_connection import AsyncConnectionPool
+from utils.bulk import amodify_objects, modify_objects
+from utils.connection import ConnectionPool
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+SCENE_ACTOR_COUNT = 10000
+
+
+def test_absolute_transforms(server, pool):
+    """Each actor gets its own location, rotation and scale, addressed by name or label."""
+    print("\n- Setting transforms per actor...")
+    try:
+        result = modify_objects(pool.send_command, ["StaticMeshActor_0", "Cube1"],
+                                locations=[[10, 20, 30], [40, 50, 60]], rotations=[[0, 45, 0], [0, 90, 0]],
+                                scales=[[2, 2, 2], [3, 3, 3]])
+        first, second = server.scene.actors["StaticMeshActor_0"], server.scene.actors["StaticMeshActor_1"]
+        return (result == {"modified": 2, "not_found": []}
+                and first["location"] == [10.0, 20.0, 30.0] and first["rotation"] == [0.0, 45.0, 0.0]
+                and second["location"] == [40.0, 50.0, 60.0] and second["scale"] == [3.0, 3.0, 3.0])
+    except Exception as e:
+        print(f"Error setting transforms: {e}")
+        return False
+
+
+def test_relative_offset(server, pool):
+    """A single relative offset moves every listed actor in one request."""
+    print(f"\n- Offsetting {SCENE_ACTOR_COUNT} actors...")
+    try:
+        names = [name for name in server.scene.actors if name.startswith("StaticMeshActor_")]
+        before = {name: list(server.scene.actors[name]["location"]) for name in names}
+        version = server.scene.version
+        processed = server.commands_processed
+        start = time.perf_counter()
+        result = modify_objects(pool.send_command, names, locations=[[0, 0, 100]], scales=[[1, 1, 2]], relative=True)
+        elapsed = time.perf_counter() - start
+        requests = server.commands_processed - processed
+        changes = pool.send_command("get_scene_changes", {"since_version": version, "fields": ["name"]})["result"]
+        print(f"{result['modified']} actors in {elapsed * 1000:.1f} ms and {requests} request(s)")
+        return (requests == 1 and result["modified"] == len(names)
+                and all(server.scene.actors[name]["location"] == [x, y, z + 100.0] for name, (x, y, z) in before.items())
+                and server.scene.actors["StaticMeshActor_0"]["scale"] == [2.0, 2.0, 4.0]
+                and len(changes["modified"]) == len(names))
+    except Exception as e:
+        print(f"Error offsetting actors: {e}")
+        return False
+
+
+def test_flat_vectors(server, pool):
+    """A single flat [x, y, z], as a list or a NumPy array, applies to every listed actor."""
+    print("\n- Moving actors with a flat [x, y, z]...")
+    try:
+        names = ["Cube10", "Cube11", "Cube12"]
+        actors = [server.scene.find_actor(name) for name in names]
+        before = [list(actor["location"]) for actor in actors]
+        two = modify_objects(pool.send_command, names[:2], locations=[100, 0, 0], relative=True)
+        three = modify_objects(pool.send_command, names, locations=[100, 0, 0], relative=True)
+        offsets_applied = all(actor["location"] == [x + (200.0 if index < 2 else 100.0), y, z]
+                              for index, (actor, (x, y, z)) in enumerate(zip(actors, before)))
+        absolute = modify_objects(pool.send_command, names, locations=[1, 2, 3], rotations=[0, 90, 0])
+        placed = all(actor["location"] == [1.0, 2.0, 3.0] and actor["rotation"] == [0.0, 90.0, 0.0] for actor in actors)
+        if numpy is not None:
+            modify_objects(pool.send_command, names, scales=numpy.array([2.0, 2.0, 2.0]))
+            placed = placed and all(actor["scale"] == [2.0, 2.0, 2.0] for actor in actors)
+        return (two["modified"] == 2 and three["modified"] == 3 and absolute["modified"] == 3
+                and offsets_applied and placed)
+    except Exception as e:
+        print(f"Error moving actors: {e}")
+        return False
+
+
+def test_full_precision(server, pool):
+    """Locations far from the origin arrive unrounded; bare float32 strings are still accepted."""
+    print("\n- Moving actors far from the origin...")
+    try:
+        far = [[100000.123, -99999.987, 0.1], [12345678.9, 0.3, -7.77]]
+        modify_objects(pool.send_command, ["StaticMeshActor_0", "StaticMeshActor_1"], locations=far)
+        legacy = pool.send_command("modify_objects", {"names": ["StaticMeshActor_2"],
+                                                      "locations": "AAAAAAAAgD8AAABA"})
+        return (server.scene.actors["StaticMeshActor_0"]["location"] == far[0]
+                and server.scene.actors["StaticMeshActor_1"]["location"] == far[1]
+                and legacy["status"] == "success"
+                and server.scene.actors["StaticMeshActor_2"]["location"] == [0.0, 1.0, 2.0])
+    except Exception as e:
+        print(f"Error moving actors: {e}")
+        return False
+
+
+def test_numpy_layout(server, pool):
+    """Per-actor locations from a NumPy array are applied in order, across chunks."""
+    print("\n- Laying out actors from a NumPy array...")
+    if numpy is None:
+        print("NumPy is not installed, skipping")
+        return True
+    try:
+        names = [f"Cube{index}" for index in range(1000)]
+        line = numpy.column_stack([numpy.arange(1000) * 10.0, numpy.zeros(1000), numpy.full(1000, 5.0)])
+        processed = server.commands_processed
+        result = modify_objects(pool.send_command, names, locations=line, chunk_size=400)
+        requests = server.commands_processed - processed
+        locations = numpy.array([server.scene.find_actor(name)["location"] for name in names])
+        return requests == 3 and result["modified"] == 1000 and numpy.array_equal(locations, line)
+    except Exception as e:
+        print(f"Error laying out actors: {e}")
+        return False
+
+
+def test_missing_and_invalid(pool):
+    """Missing actors are reported; mismatched columns are rejected."""
+    print("\n- Sending missing actors and invalid parameters...")
+    try:
+        result = modify_objects(pool.send_command, ["Cube2", "NoSuchActor"], locations=[[0, 0, 0]])
+        responses = [
+            pool.send_command("modify_objects", {"names": ["Cube2", "Cube3", "Cube4"], "locations": [[0, 0, 0]] * 2}),
+            pool.send_command("modify_objects", {"names": ["Cube2"]}),
+            pool.send_command("modify_objects", {"names": [], "locations": [[0, 0, 0]]}),
+            pool.send_command("modify_objects", {"locations": [[0, 0, 0]]})
+        ]
+        print(f"Server: {responses[0].get('message')}")
+        return (result == {"modified": 1, "not_found": ["NoSuchActor"]}
+                and all(response["status"] == "error" for response in responses))
+    except Exception as e:
+        print(f"Error sending invalid parameters: {e}")
+        return False
+
+
+async def test_async_modify(server):
+    """amodify_objects works the same over an async connection."""
+    print("\n- Modifying actors asynchronously...")
+    pool = AsyncConnectionPool("127.0.0.1", server.port)
+    try:
+        result = await amodify_objects(pool.send_command, ["Cube5"], rotations=[[0, 10, 0]], relative=True)
+        return result["modified"] == 1 and server.scene.actors["StaticMeshActor_5"]["rotation"] == [0.0, 10.0, 0.0]
+    except Exception as e:
+        print(f"Error modifying actors asynchronously: {e}")
+        return False
+    finally:
+        pool.close()
+
+
+def main():
+    """Run all offline bulk modify tests."""
+    print("Starting UnrealMCP offline bulk modify tests...")
+
+    try:
+        with MockUnrealServer(tick_interval=0) as server:
+            server.scene.populate(SCENE_ACTOR_COUNT)
+            pool = ConnectionPool("127.0.0.1", server.port)
+            results = {
+                "absolute transforms": test_absolute_transforms(server, pool),
+                "relative offset": test_relative_offset(server, pool),
+                "flat vectors": test_flat_vectors(server, pool),
+                "full precision": test_full_precision(server, pool),
+                "numpy layout": test_numpy_layout(server, pool),
+                "missing and invalid": test_missing_and_invalid(pool),
+                "async modify": asyncio.run(test_async_modify(server))
+            }
+            pool.close()
+
+        print("\nTest Results:")
+        print("-" * 40)
+        for test_name, success in results.items():
+            status = "✓ PASS" if success else "✗ FAIL"
+            print(f"{status} - {test_name}")
+        print("-" * 40)
+
+        if all(results.values()):
+            print("\nAll offline bulk modify tests passed successfully!")
+        else:
+            print("\nSome tests failed. Check the output above for details.")
+            sys.exit(1)
+
+    except Exception as e:
+        print(f"\nError during testing: {e}")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
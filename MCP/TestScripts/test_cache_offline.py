@@ -0,0 +1,179 @@
+"""Offline test for the bridge's read-only command cache.
+
+This script sends commands through utils.send_command and
+utils.async_send_command to mock_unreal_server.MockUnrealServer. It checks
+that repeated get_scene_info calls are served from the cache, that mutating
+commands invalidate it, that entries expire after the TTL and that hits and
+misses are counted. No Unreal Engine instance is needed.
+"""
+
+import asyncio
+import sys
+import os
+import time
+
+# Add the MCP directory to sys.path so we can import the bridge utilities
+mcp_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if mcp_dir not in sys.path:
+    sys.path.insert(0, mcp_dir)
+
+import utils
+from mock_unreal_server import MockUnrealServer
+from utils.async_connection import AsyncCommandMultiplexer, AsyncConnectionPool
+from utils.connection import ConnectionPool
+
+
+def test_repeated_reads(server, cache):
+    """A second identical read does not reach the server."""
+    print("\n- Reading the scene twice...")
+    try:
+        processed = server.commands_processed
+        hits = cache.stats["hits"]
+        first = utils.send_command("get_scene_info")
+        second = utils.send_command("get_scene_info")
+        print(f"Server commands: {server.commands_processed - processed}, cache stats: {cache.stats}")
+        return first == second and server.commands_processed == processed + 1 and cache.stats["hits"] == hits + 1
+    except Exception as e:
+        print(f"Error reading scene: {e}")
+        return False
+
+
+def test_write_invalidation(server, cache):
+    """Each mutating command makes the next read go to the server."""
+    print("\n- Reading the scene around mutating commands...")
+    try:
+        utils.send_command("get_scene_info")
+        name = utils.send_command("create_object", {"type": "CUBE", "location": [0, 0, 0]})["result"]["name"]
+        after_create = utils.send_command("get_scene_info")["result"]
+        utils.send_command("modify_object", {"name": name, "location": [0, 0, 500]})
+        after_modify = utils.send_command("get_scene_info")["result"]
+        utils.send_command("delete_object", {"name": name})
+        after_delete = utils.send_command("get_scene_info")["result"]
+        utils.send_command("execute_python", {"code": "pass"})
+        processed = server.commands_processed
+        utils.send_command("get_scene_info")
+        print(f"Actor counts: {after_create['actor_count']} -> {after_delete['actor_count']}, cache stats: {cache.stats}")
+        return (after_create["actors"][-1]["name"] == name
+                and after_modify["actors"][-1]["location"] == [0.0, 0.0, 500.0]
+                and after_delete["actor_count"] == after_create["actor_count"] - 1
+                and server.commands_processed == processed + 1)
+    except Exception as e:
+        print(f"Error around mutating commands: {e}")
+        return False
+
+
+def test_ttl_expiry(server, cache):
+    """Entries older than the TTL are fetched again."""
+    print("\n- Waiting for a cached read to expire...")
+    cache.ttl = 0.2
+    try:
+        utils.send_command("get_material_info", {"path": "/Game/Materials/M_Missing"})
+        utils.send_command("get_scene_info")
+        time.sleep(0.3)
+        processed = server.commands_processed
+        utils.send_command("get_scene_info")
+        return server.commands_processed == processed + 1
+    except Exception as e:
+        print(f"Error waiting for expiry: {e}")
+        return False
+    finally:
+        cache.ttl = utils.DEFAULT_CACHE_TTL
+
+
+def test_stale_read_not_stored(cache):
+    """A read requested before an invalidation is not cached when it completes."""
+    print("\n- Storing a read that was in flight across an invalidation...")
+    generation = cache.generation
+    cache.invalidate()
+    cache.store("get_scene_info", {"probe": True}, {"status": "success", "result": {}}, generation)
+    return cache.get("get_scene_info", {"probe": True}) is None
+
+
+def test_dry_runs_and_revalidations(server, cache):
+    """Dry runs keep the cache, and if_none_match revalidations are never stored."""
+    print("\n- Sending a dry-run delete and revalidating a material...")
+    try:
+        utils.send_command("get_scene_info")
+        generation = cache.generation
+        preview = utils.send_command("delete_objects", {"filter": {"class": "StaticMeshActor"}, "dry_run": True})
+        processed = server.commands_processed
+        utils.send_command("get_scene_info")
+        cached_after_dry_run = server.commands_processed == processed
+
+        path = server.scene.add_material("/Game/Materials", "M_Revalidated")["path"]
+        stamp = utils.send_command("get_material_info", {"path": path})["result"]["stamp"]
+        revalidation = {"path": path, "if_none_match": stamp}
+        not_modified = utils.send_command("get_material_info", revalidation)
+        processed = server.commands_processed
+        again = utils.send_command("get_material_info", revalidation)
+        return (preview["status"] == "success" and cache.generation == generation and cached_after_dry_run
+                and not_modified["result"].get("not_modified") is True
+                and again["result"].get("not_modified") is True
+                and server.commands_processed == processed + 1
+                and cache.get("get_material_info", revalidation) is None)
+    except Exception as e:
+        print(f"Error sending dry runs and revalidations: {e}")
+        return False
+
+
+async def test_async_reads(server, cache):
+    """async_send_command shares the cache with send_command."""
+    print("\n- Reading the scene concurrently through the async client...")
+    try:
+        utils.send_command("execute_python", {"code": "pass"})
+        await utils.async_send_command("get_scene_info")
+        processed = server.commands_processed
+        responses = await asyncio.gather(*(utils.async_send_command("get_scene_info") for _ in range(8)))
+        await utils.async_send_command("create_object", {"type": "CUBE", "location": [0, 0, 0]})
+        after_create = utils.send_command("get_scene_info")
+        print(f"Server commands: {server.commands_processed - processed}, cache stats: {cache.stats}")
+        return (all(response == responses[0] for response in responses)
+                and server.commands_processed == processed + 2
+                and after_create["result"]["actor_count"] == responses[0]["result"]["actor_count"] + 1)
+    except Exception as e:
+        print(f"Error reading scene asynchronously: {e}")
+        return False
+
+
+def main():
+    """Run all offline cache tests."""
+    print("Starting UnrealMCP offline cache tests...")
+
+    try:
+        with MockUnrealServer(tick_interval=0) as server:
+            # Point the bridge's shared clients at the mock server
+            utils._pool = ConnectionPool("127.0.0.1", server.port)
+            utils._multiplexer = AsyncCommandMultiplexer("127.0.0.1", server.port,
+                                                         fallback_pool=AsyncConnectionPool("127.0.0.1", server.port))
+            cache = utils.get_command_cache()
+            server.scene.populate(10)
+            results = {
+                "repeated reads hit the cache": test_repeated_reads(server, cache),
+                "mutating commands invalidate": test_write_invalidation(server, cache),
+                "entries expire after the TTL": test_ttl_expiry(server, cache),
+                "stale in-flight reads are dropped": test_stale_read_not_stored(cache),
+                "dry runs and revalidations": test_dry_runs_and_revalidations(server, cache),
+                "async client shares the cache": asyncio.run(test_async_reads(server, cache))
+            }
+            utils._pool.close()
+            utils._multiplexer.close()
+
+        print("\nTest Results:")
+        print("-" * 40)
+        for test_name, success in results.items():
+            status = "✓ PASS" if success else "✗ FAIL"
+            print(f"{status} - {test_name}")
+        print("-" * 40)
+
+        if all(results.values()):
+            print("\nAll offline cache tests passed successfully!")
+        else:
+            print("\nSome tests failed. Check the output above for details.")
+            sys.exit(1)
+
+    except Exception as e:
+        print(f"\nError during testing: {e}")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,168 @@
+"""Offline test for the bridge's connection settings.
+
+This script resolves utils.config settings from the plugin's MCPConstants.h
+and from temporary headers, and checks the precedence of header,
+environment and command line values, that a header is only read again
+after it changed, and that utils.configure points the shared sync and
+async connections at mock_unreal_server.MockUnrealServer. No Unreal Engine
+instance is needed.
+"""
+
+import argparse
+import asyncio
+import builtins
+import sys
+import os
+import tempfile
+
+# Add the MCP directory to sys.path so we can import the bridge utilities
+mcp_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if mcp_dir not in sys.path:
+    sys.path.insert(0, mcp_dir)
+
+from mock_unreal_server import MockUnrealServer
+import utils
+from utils import config
+
+HEADER = """
+namespace MCPConstants
+{
+    constexpr int32 DEFAULT_PORT = 20000;
+    constexpr int32 DEFAULT_RECEIVE_BUFFER_SIZE = 32768; // 32KB
+    constexpr float DEFAULT_CLIENT_TIMEOUT_SECONDS = 12.5f;
+}
+"""
+
+
+class OpenCounter:
+    """Count the files utils.config opens."""
+
+    def __init__(self):
+        self.opened = 0
+
+    def __call__(self, *args, **kwargs):
+        self.opened += 1
+        return builtins.open(*args, **kwargs)
+
+
+def write_header(path, content):
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(content)
+
+
+def test_plugin_header():
+    """The plugin's own header gives the port and buffer size the C++ server uses."""
+    print("\n- Reading MCPConstants.h...")
+    try:
+        constants = config.read_constants()
+        resolved = config.resolve_config(environ={})
+        print(f"Resolved: {resolved}")
+        return (constants["DEFAULT_PORT"] == 13377 and constants["DEFAULT_CLIENT_TIMEOUT_SECONDS"] == 30.0
+                and resolved.port == constants["DEFAULT_PORT"]
+                and resolved.buffer_size == constants["DEFAULT_RECEIVE_BUFFER_SIZE"]
+                and resolved.sources["port"] == "header" and resolved.host == "localhost")
+    except Exception as e:
+        print(f"Error reading header: {e}")
+        return False
+
+
+def test_precedence(header_path):
+    """Command line options win over environment variables, which win over the header."""
+    print("\n- Merging header, environment and command line settings...")
+    try:
+        environ = {"UNREAL_MCP_PORT": "21000", "UNREAL_MCP_HOST": "editor-box", "UNREAL_MCP_TIMEOUT": "soon"}
+        args = config.add_config_arguments(argparse.ArgumentParser()).parse_args(["--port", "22000", "--timeout", "3"])
+        header_only = config.resolve_config(environ={}, constants_path=header_path)
+        with_env = config.resolve_config(environ=environ, constants_path=header_path)
+        with_cli = config.resolve_config(config.config_overrides(args), environ=environ, constants_path=header_path)
+        missing = config.resolve_config(environ={}, constants_path=header_path + ".missing")
+        return (header_only.as_dict() == {"host": "localhost", "port": 20000, "timeout": 10, "buffer_size": 32768}
+                and with_env.port == 21000 and with_env.host == "editor-box" and with_env.timeout == 10
+                and with_cli.as_dict() == {"host": "editor-box", "port": 22000, "timeout": 3.0, "buffer_size": 32768}
+                and with_cli.sources == {"host": "env", "port": "cli", "timeout": "cli", "buffer_size": "header"}
+                and missing.port == config.DEFAULT_PORT and missing.sources["port"] == "default")
+    except Exception as e:
+        print(f"Error merging settings: {e}")
+        return False
+
+
+def test_header_cache(header_path):
+    """A header is read once and only read again after it changed."""
+    print("\n- Resolving settings repeatedly...")
+    counter = OpenCounter()
+    config.open = counter
+    try:
+        write_header(header_path, HEADER)
+        for _ in range(5):
+            config.resolve_config(environ={}, constants_path=header_path)
+        reads_unchanged = counter.opened
+        write_header(header_path, HEADER.replace("20000", "20001"))
+        stat = os.stat(header_path)
+        os.utime(header_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        changed = config.resolve_config(environ={}, constants_path=header_path)
+        print(f"Header reads: {reads_unchanged} for 5 resolves, {counter.opened} after a change")
+        return reads_unchanged == 1 and counter.opened == 2 and changed.port == 20001
+    except Exception as e:
+        print(f"Error resolving settings: {e}")
+        return False
+    finally:
+        del config.open
+
+
+def test_shared_transports(server):
+    """utils.configure points the sync and async transports at the configured server."""
+    print("\n- Sending commands with configured settings...")
+    try:
+        configured = utils.configure(host="127.0.0.1", port=server.port, timeout=5)
+        sync_response = utils.send_command("get_scene_info", {"limit": 1})
+        async_response = asyncio.run(utils.async_send_command("get_scene_info", {"limit": 1}))
+        return (utils.get_config() is configured and utils.DEFAULT_PORT == server.port
+                and utils.get_connection_pool().port == server.port
+                and utils.get_command_multiplexer().port == server.port
+                and sync_response["status"] == "success" and async_response["status"] == "success")
+    except Exception as e:
+        print(f"Error sending commands: {e}")
+        return False
+    finally:
+        if utils._pool is not None:
+            utils._pool.close()
+        if utils._multiplexer is not None:
+            utils._multiplexer.close()
+
+
+def main():
+    """Run all offline configuration tests."""
+    print("Starting UnrealMCP offline configuration tests...")
+
+    try:
+        with tempfile.TemporaryDirectory() as directory:
+            header_path = os.path.join(directory, "MCPConstants.h")
+            write_header(header_path, HEADER)
+            results = {
+                "plugin header": test_plugin_header(),
+                "precedence": test_precedence(header_path),
+                "header cache": test_header_cache(os.path.join(directory, "CachedConstants.h"))
+            }
+        with MockUnrealServer(tick_interval=0) as server:
+            server.scene.populate(3)
+            results["shared transports"] = test_shared_transports(server)
+
+        print("\nTest Results:")
+        print("-" * 40)
+        for test_name, success in results.items():
+            status = "✓ PASS" if success else "✗ FAIL"
+            print(f"{status} - {test_name}")
+        print("-" * 40)
+
+        if all(results.values()):
+            print("\nAll offline configuration tests passed successfully!")
+        else:
+            print("\nSome tests failed. Check the output above for details.")
+            sys.exit(1)
+
+    except Exception as e:
+        print(f"\nError during testing: {e}")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+"""Offline test for the bridge wire protocol.
+
+This script starts mock_unreal_server.MockUnrealServer on a free port and checks
+that large commands and responses round-trip in every framing mode, that the
+set_protocol reply echoes the request id, and that the bridge falls back to
+raw framing against a server without set_protocol.
+No Unreal Engine instance is needed.
+"""
+
+import socket
+import sys
+import os
+
+# Add the MCP directory to sys.path so we can import the bridge utilities
+mcp_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if mcp_dir not in sys.path:
+    sys.path.insert(0, mcp_dir)
+
+from mock_unreal_server import MockUnrealServer
+from utils.connection import UnrealConnection
+from utils.protocol import (
+    FRAMING_AUTO, FRAMING_LENGTH_PREFIXED, FRAMING_RAW, SET_PROTOCOL_COMMAND, encode_message, make_decoder
+)
+
+LARGE_CODE_SIZE = 2 * 1024 * 1024
+SCENE_ACTOR_COUNT = 20000
+
+
+def make_actors(scene, count):
+    """Spawn actors with labels that need escaping and return them as get_scene_info lists them."""
+    actors = [scene.spawn_actor(location=(i * 100.0, -i * 50.0, 0.0), label=f"Cube \"{i}\" {{copy}}") for i in range(count)]
+    return [{key: actor[key] for key in ("name", "type", "label", "location")} for actor in actors]
+
+
+def test_negotiation(port, framing, expected):
+    """Check which framing a connection ends up using."""
+    print(f"\n- Negotiating with framing='{framing}'...")
+    connection = UnrealConnection("127.0.0.1", port, framing=framing)
+    try:
+        response = connection.send_command("get_scene_info")
+        print(f"Negotiated framing: {connection.framing}")
+        return response["status"] == "success" and connection.framing == expected
+    except Exception as e:
+        print(f"Error negotiating framing: {e}")
+        return False
+    finally:
+        connection.close()
+
+
+def receive_message(sock, decoder):
+    """Read from a socket until the decoder yields a message."""
+    messages = []
+    while not messages:
+        chunk = sock.recv(65536)
+        if not chunk:
+            raise ConnectionError("Connection closed by server")
+        messages = decoder.feed(chunk)
+    return messages[0]
+
+
+def test_set_protocol_id(port):
+    """The set_protocol reply carries the request id, like every other reply."""
+    print("\n- Negotiating framing with a request id...")
+    try:
+        with socket.create_connection(("127.0.0.1", port), timeout=5) as sock:
+            request = {"type": SET_PROTOCOL_COMMAND, "params": {"framing": FRAMING_LENGTH_PREFIXED}, "id": 7}
+            sock.sendall(encode_message(request, FRAMING_RAW))
+            negotiated = receive_message(sock, make_decoder(FRAMING_RAW))
+            sock.sendall(encode_message({"type": "get_scene_info", "id": 8}, FRAMING_LENGTH_PREFIXED))
+            scene = receive_message(sock, make_decoder(FRAMING_LENGTH_PREFIXED))
+        print(f"Reply ids: {negotiated.get('id')}, {scene.get('id')}")
+        return negotiated["status"] == "success" and negotiated.get("id") == 7 and scene.get("id") == 8
+    except Exception as e:
+        print(f"Error negotiating framing: {e}")
+        return False
+
+
+def test_large_python(port, framing):
+    """Send an execute_python payload far larger than the server's receive buffer."""
+    print(f"\n- Sending {LARGE_CODE_SIZE} bytes of Python with framing='{framing}'...")
+    connection = UnrealConnection("127.0.0.1", port, framing=framing)
+    code = "# " + "x" * (LARGE_CODE_SIZE - 3) + "\n"
+    try:
+        response = connection.send_command("execute_python", {"code": code})
+        print(f"Response: {response.get('result', response)}")
+        return response["status"] == "success" and str(len(code)) in response["result"]["output"]
+    except Exception as e:
+        print(f"Error sending large Python payload: {e}")
+        return False
+    finally:
+        connection.close()
+
+
+def test_large_scene(port, framing, actors):
+    """Receive a multi-megabyte get_scene_info response, twice on one connection."""
+    print(f"\n- Fetching a {len(actors)} actor scene with framing='{framing}'...")
+    connection = UnrealConnection("127.0.0.1", port, framing=framing)
+    try:
+        for _ in range(2):
+            response = connection.send_command("get_scene_info")
+            if response["status"] != "success" or response["result"]["actors"] != actors:
+                print("Scene dump did not round-trip")
+                return False
+        return connection.connect_count == 1
+    except Exception as e:
+        print(f"Error fetching large scene: {e}")
+        return False
+    finally:
+        connection.close()
+
+
+def main():
+    """Run all offline framing tests."""
+    print("Starting UnrealMCP offline framing tests...")
+
+    try:
+        with MockUnrealServer(tick_interval=0) as server, \
+                MockUnrealServer(supports_framing=False, tick_interval=0) as legacy_server:
+            # Lift MAX_ACTORS_IN_SCENE_INFO so the whole scene is sent
+            server.scene.max_actors_in_scene_info = None
+            actors = make_actors(server.scene, SCENE_ACTOR_COUNT)
+            results = {
+                "auto negotiates length_prefixed": test_negotiation(server.port, FRAMING_AUTO, FRAMING_LENGTH_PREFIXED),
+                "auto falls back to raw": test_negotiation(legacy_server.port, FRAMING_AUTO, FRAMING_RAW),
+                "required framing refused": not test_negotiation(legacy_server.port, FRAMING_LENGTH_PREFIXED, FRAMING_LENGTH_PREFIXED),
+                "set_protocol echoes the id": test_set_protocol_id(server.port),
+                "large execute_python (length_prefixed)": test_large_python(server.port, FRAMING_LENGTH_PREFIXED),
+                "large scene (length_prefixed)": test_large_scene(server.port, FRAMING_LENGTH_PREFIXED, actors),
+                # Raw servers read one buffer per command, so only responses can be large
+                "large scene (raw)": test_large_scene(server.port, FRAMING_RAW, actors)
+            }
+
+        print("\nTest Results:")
+        print("-" * 40)
+        for test_name, success in results.items():
+            status = "✓ PASS" if success else "✗ FAIL"
+            print(f"{status} - {test_name}")
+        print("-" * 40)
+
+        if all(results.values()):
+            print("\nAll offline framing tests passed successfully!")
+        else:
+            print("\nSome tests failed. Check the output above for details.")
+            sys.exit(1)
+
+    except Exception as e:
+        print(f"\nError during testing: {e}")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
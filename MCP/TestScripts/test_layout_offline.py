@@ -0,0 +1,196 @@
+"""Offline test for the vectorized layout helpers.
+
+This script checks the grid, circle, path, scatter, align and distribute
+layouts of utils.layout, then arranges actors of
+mock_unreal_server.MockUnrealServer with them and checks that the selection
+is read with one query_actors snapshot, that the whole layout is applied
+with a single modify_objects request, without rounding the computed
+locations, and that the order of the given names is kept. The test is
+skipped when NumPy is not installed. No Unreal Engine instance is needed.
+"""
+
+import asyncio
+import sys
+import os
+import time
+
+# Add the MCP directory to sys.path so we can import the bridge utilities
+mcp_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if mcp_dir not in sys.path:
+    sys.path.insert(0, mcp_dir)
+
+from mock_unreal_server import MockUnrealServer
+from utils.async_connection import AsyncConnectionPool
+from utils.connection import ConnectionPool
+
+try:
+    import numpy
+    from utils.layout import (
+        aapply_layout, align_layout, apply_layout, aread_layout_selection, circle_layout, distribute_layout,
+        facing_rotations, grid_layout, path_layout, read_layout_selection, scatter_layout
+    )
+except ImportError:
+    numpy = None
+
+SCENE_ACTOR_COUNT = 5000
+CRATE_COUNT = 400
+
+
+class CommandCounter:
+    """Wrap a send function and record the commands sent through it."""
+
+    def __init__(self, send_command):
+        self.send_command_function = send_command
+        self.commands = []
+
+    def send_command(self, command_type, params=None):
+        self.commands.append(command_type)
+        return self.send_command_function(command_type, params)
+
+
+def _spawn_crates(server):
+    for index in range(CRATE_COUNT):
+        server.scene.spawn_actor(location=(index * 7.0, -index * 3.0, 50.0), label=f"Crate_{index}", tags=["Crate"])
+
+
+def test_layout_math():
+    """The layout functions return the expected positions."""
+    print("\n- Checking the layout math...")
+    try:
+        grid = grid_layout(5, columns=2, spacing=(10, 20), origin=(1, 1, 1))
+        circle = circle_layout(4, center=(0, 0, 5), radius=10)
+        line = path_layout(5, [[0, 0, 0], [100, 0, 0], [100, 100, 0]])
+        loop = path_layout(4, [[0, 0, 0], [10, 0, 0], [10, 10, 0], [0, 10, 0]], closed=True)
+        points = numpy.array([[3, 0, 0], [9, 5, 0], [1, 2, 0], [4, 7, 0]], dtype=float)
+        distributed = distribute_layout(points, "x")
+        yaw = facing_rotations([[0, 0, 0], [10, 10, 0]], [10, 0, 0])[:, 1]
+        return (numpy.allclose(grid, [[1, 1, 1], [11, 1, 1], [1, 21, 1], [11, 21, 1], [1, 41, 1]])
+                and numpy.allclose(circle, [[10, 0, 5], [0, 10, 5], [-10, 0, 5], [0, -10, 5]])
+                and numpy.allclose(line, [[0, 0, 0], [50, 0, 0], [100, 0, 0], [100, 50, 0], [100, 100, 0]])
+                and numpy.allclose(loop, [[0, 0, 0], [10, 0, 0], [10, 10, 0], [0, 10, 0]])
+                and numpy.allclose(align_layout(points, "y", "max")[:, 1], 7)
+                and numpy.allclose(align_layout(points, "x", "center")[:, 0], 5)
+                and numpy.allclose(distributed[:, 0], [11 / 3, 9, 1, 19 / 3])
+                and numpy.allclose(yaw, [0, -90]))
+    except Exception as e:
+        print(f"Error in layout math: {e}")
+        return False
+
+
+def test_scatter_spacing():
+    """Scattered positions stay in the box and keep the minimum distance."""
+    print("\n- Scattering points...")
+    try:
+        start = time.perf_counter()
+        points = scatter_layout(500, [0, 0, 0], [5000, 5000, 0], 150.0, seed=7)
+        elapsed = time.perf_counter() - start
+        difference = points[:, None, :2] - points[None, :, :2]
+        distances = numpy.sqrt((difference ** 2).sum(axis=-1)) + numpy.eye(len(points)) * 1e9
+        full = scatter_layout(1000, [0, 0, 0], [500, 500, 0], 150.0, seed=7)
+        print(f"{len(points)} points in {elapsed * 1000:.1f} ms; a full box holds {len(full)}")
+        return (len(points) == 500 and distances.min() >= 150.0
+                and points[:, :2].min() >= 0 and points[:, :2].max() <= 5000 and numpy.all(points[:, 2] == 0)
+                and 0 < len(full) < 1000
+                and numpy.array_equal(points, scatter_layout(500, [0, 0, 0], [5000, 5000, 0], 150.0, seed=7)))
+    except Exception as e:
+        print(f"Error scattering points: {e}")
+        return False
+
+
+def test_grid_apply(server, pool):
+    """A tag-selected group is read in one snapshot and laid out with one modify_objects request."""
+    print(f"\n- Arranging {CRATE_COUNT} crates in a grid...")
+    try:
+        counter = CommandCounter(pool.send_command)
+        start = time.perf_counter()
+        names, locations = read_layout_selection(counter.send_command, actor_filter={"tag": "Crate"})
+        result = apply_layout(counter.send_command, names, grid_layout(len(names), 20, 100.0, locations.min(axis=0)))
+        elapsed = time.perf_counter() - start
+        print(f"{result['modified']} actors in {elapsed * 1000:.1f} ms with {counter.commands}")
+        placed = numpy.array([server.scene.actors[name]["location"] for name in names])
+        return (counter.commands == ["query_actors", "modify_objects"] and result["modified"] == CRATE_COUNT
+                and numpy.allclose(placed[21], [100.0, -1097.0, 50.0]) and numpy.allclose(placed[:, 2], 50.0))
+    except Exception as e:
+        print(f"Error arranging crates: {e}")
+        return False
+
+
+def test_named_selection(server, pool):
+    """A names selection only reads those actors and keeps the given order."""
+    print("\n- Arranging named actors along a line...")
+    try:
+        counter = CommandCounter(pool.send_command)
+        requested = ["Crate_5", "StaticMeshActor_9", "Cube3", "NoSuchActor"]
+        names, _ = read_layout_selection(counter.send_command, names=requested)
+        result = apply_layout(counter.send_command, names, path_layout(len(names), [[0, 0, 0], [0, 200, 0]]))
+        return (names[1:] == ["StaticMeshActor_9", "StaticMeshActor_3"] and len(names) == 3
+                and counter.commands == ["query_actors", "modify_objects"]
+                and server.scene.find_actor("Crate_5")["location"] == [0.0, 0.0, 0.0]
+                and server.scene.actors["StaticMeshActor_3"]["location"] == [0.0, 200.0, 0.0]
+                and result["modified"] == 3)
+    except Exception as e:
+        print(f"Error arranging named actors: {e}")
+        return False
+
+
+async def test_async_layout(server):
+    """The async helpers arrange actors in a circle facing its center."""
+    print("\n- Arranging actors asynchronously...")
+    pool = AsyncConnectionPool("127.0.0.1", server.port)
+    try:
+        names, _ = await aread_layout_selection(pool.send_command, actor_filter={"label": "Crate_1?"})
+        positions = circle_layout(len(names), (0, 0, 0), 1000)
+        result = await aapply_layout(pool.send_command, names, positions, facing_rotations(positions, (0, 0, 0)))
+        first = server.scene.actors[names[0]]
+        # Circle points are not float32-exact, and must still land exactly where they were computed
+        exact = all(server.scene.actors[name]["location"] == position.tolist()
+                    for name, position in zip(names, positions))
+        return (len(names) == 10 and result["modified"] == 10 and exact
+                and numpy.allclose(first["location"], [1000, 0, 0]) and numpy.isclose(first["rotation"][1], 180))
+    except Exception as e:
+        print(f"Error arranging actors asynchronously: {e}")
+        return False
+    finally:
+        pool.close()
+
+
+def main():
+    """Run all offline layout tests."""
+    print("Starting UnrealMCP offline layout tests...")
+    if numpy is None:
+        print("NumPy is not installed, skipping the layout tests")
+        return
+
+    try:
+        with MockUnrealServer(tick_interval=0) as server:
+            server.scene.populate(SCENE_ACTOR_COUNT)
+            _spawn_crates(server)
+            pool = ConnectionPool("127.0.0.1", server.port)
+            results = {
+                "layout math": test_layout_math(),
+                "scatter spacing": test_scatter_spacing(),
+                "grid apply": test_grid_apply(server, pool),
+                "named selection": test_named_selection(server, pool),
+                "async layout": asyncio.run(test_async_layout(server))
+            }
+            pool.close()
+
+        print("\nTest Results:")
+        print("-" * 40)
+        for test_name, success in results.items():
+            status = "✓ PASS" if success else "✗ FAIL"
+            print(f"{status} - {test_name}")
+        print("-" * 40)
+
+        if all(results.values()):
+            print("\nAll offline layout tests passed successfully!")
+        else:
+            print("\nSome tests failed. Check the output above for details.")
+            sys.exit(1)
+
+    except Exception as e:
+        print(f"\nError during testing: {e}")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,195 @@
+"""Offline test for the bridge's material info cache.
+
+This script reads materials of mock_unreal_server.MockUnrealServer through
+utils.cache.AssetInfoCache, as the get_material_info tool does, and checks
+that repeat reads are answered with a short not_modified response, that
+level edits do not drop cached materials, that changes made through the
+bridge or in the editor are picked up, that batch and execute_python drop
+the attached cache and that responses from servers
+without change stamps expire after the TTL. No Unreal Engine instance is
+needed.
+"""
+
+import asyncio
+import sys
+import os
+import time
+
+# Add the MCP directory to sys.path so we can import the bridge utilities
+mcp_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if mcp_dir not in sys.path:
+    sys.path.insert(0, mcp_dir)
+
+from mock_unreal_server import MockUnrealServer, success
+from utils.async_connection import AsyncConnectionPool
+from utils.cache import AssetInfoCache, CommandCache
+from utils.connection import ConnectionPool
+
+MATERIAL_PATH = "/Game/Materials/M_Cached"
+
+
+class ResponseRecorder:
+    """Wrap a send function and record the results it returns."""
+
+    def __init__(self, send_command):
+        self.send_command_function = send_command
+        self.results = []
+
+    def send_command(self, command_type, params=None):
+        response = self.send_command_function(command_type, params)
+        self.results.append(response.get("result"))
+        return response
+
+
+def test_repeat_reads(pool, cache):
+    """Only the first read transfers the material; later reads are confirmed with its stamp."""
+    print("\n- Reading a material three times...")
+    try:
+        recorder = ResponseRecorder(pool.send_command)
+        infos = [cache.get(recorder.send_command, MATERIAL_PATH)["result"] for _ in range(3)]
+        print(f"Cache stats: {cache.stats}")
+        return (infos[0] == infos[1] == infos[2] and infos[0]["roughness"] == 0.5
+                and "roughness" in recorder.results[0]
+                and all(result.get("not_modified") for result in recorder.results[1:])
+                and cache.stats["misses"] == 1 and cache.stats["revalidated"] == 2)
+    except Exception as e:
+        print(f"Error reading material: {e}")
+        return False
+
+
+def test_level_edits(pool, cache):
+    """Changes to the level keep the cached material valid."""
+    print("\n- Reading a material around level edits...")
+    try:
+        misses = cache.stats["misses"]
+        pool.send_command("create_object", {"type": "cube", "location": [0, 0, 0]})
+        pool.send_command("modify_objects", {"names": ["Cube0"], "locations": [[0, 0, 100]]})
+        info = cache.get(pool.send_command, MATERIAL_PATH + ".M_Cached")["result"]
+        return info["name"] == "M_Cached" and cache.stats["misses"] == misses
+    except Exception as e:
+        print(f"Error reading material: {e}")
+        return False
+
+
+def test_material_changes(server, pool, cache):
+    """modify_material through the bridge and edits in the editor are both picked up."""
+    print("\n- Changing the material...")
+    try:
+        pool.send_command("modify_material", {"path": MATERIAL_PATH, "properties": {"roughness": 0.9}})
+        cache.invalidate(MATERIAL_PATH)
+        after_modify = cache.get(pool.send_command, MATERIAL_PATH)["result"]
+
+        # An edit in the editor is not seen by the bridge, only by the server's change stamps
+        server.scene.materials[MATERIAL_PATH + ".M_Cached"]["metallic"] = 1.0
+        server.scene.touch_asset(MATERIAL_PATH)
+        after_edit = cache.get(pool.send_command, MATERIAL_PATH)["result"]
+        missing = cache.get(pool.send_command, "/Game/Materials/M_Missing")
+        print(f"Cache stats: {cache.stats}")
+        return (after_modify["roughness"] == 0.9 and after_edit["metallic"] == 1.0
+                and after_edit["stamp"] != after_modify["stamp"] and missing["status"] == "error")
+    except Exception as e:
+        print(f"Error changing material: {e}")
+        return False
+
+
+def test_asset_editing_commands(server, pool, cache):
+    """Commands that can edit any asset drop the cache attached to the command cache; others do not."""
+    print("\n- Invalidating the command cache with level and Python edits...")
+    command_cache = CommandCache()
+    cache.attach(command_cache)
+    try:
+        cache.get(pool.send_command, MATERIAL_PATH)
+        misses = cache.stats["misses"]
+        command_cache.invalidate("modify_object")
+        kept = cache.get(pool.send_command, MATERIAL_PATH)["result"]
+
+        # Python that sets a property directly does not bump the server's change stamp
+        server.scene.materials[MATERIAL_PATH + ".M_Cached"]["roughness"] = 0.1
+        command_cache.invalidate("execute_python")
+        after_python = cache.get(pool.send_command, MATERIAL_PATH)["result"]
+        cache.detach(command_cache)
+        command_cache.invalidate("batch")
+        after_detach = cache.get(pool.send_command, MATERIAL_PATH)["result"]
+        return (kept["roughness"] == 0.9 and after_python["roughness"] == 0.1
+                and after_detach == after_python and cache.stats["misses"] == misses + 1)
+    except Exception as e:
+        print(f"Error invalidating the command cache: {e}")
+        return False
+    finally:
+        cache.detach(command_cache)
+
+
+def test_unstamped_server(server, pool):
+    """Without change stamps, cached info is served locally until the TTL runs out."""
+    print("\n- Reading a material from a server without change stamps...")
+    try:
+        server.register_handler("get_material_info", lambda params: success({"name": "M_Old", "path": params["path"]}))
+        cache = AssetInfoCache("get_material_info", unstamped_ttl=0.2)
+        processed = server.commands_processed
+        first = cache.get(pool.send_command, "/Game/M_Old")
+        second = cache.get(pool.send_command, "/Game/M_Old")
+        local_reads = server.commands_processed - processed
+        time.sleep(0.3)
+        cache.get(pool.send_command, "/Game/M_Old")
+        return (first == second and local_reads == 1 and server.commands_processed - processed == 2
+                and cache.stats == {"hits": 1, "revalidated": 0, "misses": 2})
+    except Exception as e:
+        print(f"Error reading material: {e}")
+        return False
+
+
+async def test_async_reads(server):
+    """aget caches the same way over an async connection."""
+    print("\n- Reading a material asynchronously...")
+    pool = AsyncConnectionPool("127.0.0.1", server.port)
+    try:
+        cache = AssetInfoCache("get_material_info")
+        first = await cache.aget(pool.send_command, MATERIAL_PATH)
+        second = await cache.aget(pool.send_command, MATERIAL_PATH)
+        return first["result"] == second["result"] and cache.stats["revalidated"] == 1
+    except Exception as e:
+        print(f"Error reading material asynchronously: {e}")
+        return False
+    finally:
+        pool.close()
+
+
+def main():
+    """Run all offline material cache tests."""
+    print("Starting UnrealMCP offline material cache tests...")
+
+    try:
+        with MockUnrealServer(tick_interval=0) as server:
+            server.scene.populate(10)
+            pool = ConnectionPool("127.0.0.1", server.port)
+            pool.send_command("create_material", {"package_path": "/Game/Materials", "name": "M_Cached"})
+            cache = AssetInfoCache("get_material_info")
+            results = {
+                "repeat reads": test_repeat_reads(pool, cache),
+                "level edits": test_level_edits(pool, cache),
+                "material changes": test_material_changes(server, pool, cache),
+                "asset editing commands": test_asset_editing_commands(server, pool, cache),
+                "async reads": asyncio.run(test_async_reads(server)),
+                "unstamped server": test_unstamped_server(server, pool)
+            }
+            pool.close()
+
+        print("\nTest Results:")
+        print("-" * 40)
+        for test_name, success in results.items():
+            status = "✓ PASS" if success else "✗ FAIL"
+            print(f"{status} - {test_name}")
+        print("-" * 40)
+
+        if all(results.values()):
+            print("\nAll offline material cache tests passed successfully!")
+        else:
+            print("\nSome tests failed. Check the output above for details.")
+            sys.exit(1)
+
+    except Exception as e:
+        print(f"\nError during testing: {e}")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
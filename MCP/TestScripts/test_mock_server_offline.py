@@ -0,0 +1,197 @@
+"""Offline test for the mock Unreal MCP server itself.
+
+This script checks that mock_unreal_server.MockUnrealServer behaves like
+FMCPTCPServer where the bridge can tell the difference: commands wait for the
+next tick, idle clients are dropped after the client timeout, latency injection
+delays responses, and the scene, material and blueprint handlers answer in the
+shapes the C++ handlers use. No Unreal Engine instance is needed.
+"""
+
+import sys
+import os
+import socket
+import time
+
+# Add the MCP directory to sys.path so we can import the bridge utilities
+mcp_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if mcp_dir not in sys.path:
+    sys.path.insert(0, mcp_dir)
+
+from mock_unreal_server import MockUnrealServer
+from utils.connection import UnrealConnection
+from utils.protocol import FRAMING_RAW
+
+TICK_INTERVAL = 0.05
+
+
+def test_tick_interval(server):
+    """Raw commands are answered on the next tick, not as soon as they arrive."""
+    print(f"\n- Timing commands against a {TICK_INTERVAL}s tick...")
+    connection = UnrealConnection("127.0.0.1", server.port, framing=FRAMING_RAW)
+    try:
+        connection.send_command("get_scene_info")
+        start = time.perf_counter()
+        ticks = server.ticks
+        for _ in range(5):
+            connection.send_command("get_scene_info")
+        elapsed = time.perf_counter() - start
+        print(f"5 commands took {elapsed:.3f}s over {server.ticks - ticks} ticks")
+        return elapsed >= 4 * TICK_INTERVAL and server.ticks - ticks >= 4
+    except Exception as e:
+        print(f"Error timing commands: {e}")
+        return False
+    finally:
+        connection.close()
+
+
+def test_client_timeout(server):
+    """Idle clients are disconnected once the client timeout passes."""
+    print(f"\n- Idling past the {server.client_timeout}s client timeout...")
+    sock = socket.create_connection(("127.0.0.1", server.port))
+    try:
+        sock.settimeout(server.client_timeout + 2)
+        time.sleep(TICK_INTERVAL * 2)
+        connected = server.client_count == 1
+        # The server closes the socket, so recv returns end of stream
+        closed = sock.recv(1) == b''
+        print(f"Connected: {connected}, closed by server: {closed}")
+        return connected and closed and server.client_count == 0
+    except Exception as e:
+        print(f"Error waiting for the client timeout: {e}")
+        return False
+    finally:
+        sock.close()
+
+
+def test_latency_injection(server):
+    """Per-command latency holds up the response."""
+    print("\n- Injecting 0.2s of latency into get_material_info...")
+    connection = UnrealConnection("127.0.0.1", server.port)
+    server.command_latency["get_material_info"] = 0.2
+    try:
+        start = time.perf_counter()
+        connection.send_command("get_material_info", {"path": "/Game/Missing/M_Missing"})
+        elapsed = time.perf_counter() - start
+        print(f"Response took {elapsed:.3f}s")
+        return elapsed >= 0.2
+    except Exception as e:
+        print(f"Error measuring latency: {e}")
+        return False
+    finally:
+        server.command_latency.clear()
+        connection.close()
+
+
+def test_scene_handlers(server):
+    """Create, modify, list and delete actors in the in-memory scene."""
+    print("\n- Running the scene handlers...")
+    connection = UnrealConnection("127.0.0.1", server.port)
+    try:
+        created = connection.send_command("create_object", {"type": "CUBE", "location": [0, 0, 100], "label": "Pillar"})
+        name = created["result"]["name"]
+        modified = connection.send_command("modify_object", {"name": name, "scale": [2, 2, 2]})
+        unchanged = connection.send_command("modify_object", {"name": name})
+        scene = connection.send_command("get_scene_info")["result"]
+        unsupported = connection.send_command("create_object", {"type": "Sphere", "location": [0, 0, 0]})
+        deleted = connection.send_command("delete_object", {"name": name})
+        missing = connection.send_command("delete_object", {"name": name})
+        print(f"Created {name}, scene has {scene['actor_count']} actors")
+        return (created["result"]["label"] == "Pillar"
+                and modified == {"status": "success", "result": {"name": name}}
+                and unchanged["status"] == "warning"
+                and scene["actors"][-1] == {"name": name, "type": "StaticMeshActor", "label": "Pillar", "location": [0.0, 0.0, 100.0]}
+                and unsupported["message"] == "Unsupported actor type: Sphere"
+                and deleted["status"] == "success"
+                and missing["message"] == f"Actor not found: {name}")
+    except Exception as e:
+        print(f"Error running scene handlers: {e}")
+        return False
+    finally:
+        connection.close()
+
+
+def test_scene_info_limit(server):
+    """get_scene_info stops at MAX_ACTORS_IN_SCENE_INFO actors."""
+    print("\n- Listing a scene larger than the actor limit...")
+    connection = UnrealConnection("127.0.0.1", server.port)
+    try:
+        server.scene.populate(1500)
+        result = connection.send_command("get_scene_info")["result"]
+        print(f"actor_count={result['actor_count']} returned={result['returned_actor_count']}")
+        return (result["actor_count"] == 1500 and result["returned_actor_count"] == 1000
+                and len(result["actors"]) == 1000 and result["limit_reached"])
+    except Exception as e:
+        print(f"Error listing scene: {e}")
+        return False
+    finally:
+        server.scene.actors.clear()
+        connection.close()
+
+
+def test_asset_handlers(server):
+    """Create and read back materials and blueprints."""
+    print("\n- Running the material and blueprint handlers...")
+    connection = UnrealConnection("127.0.0.1", server.port)
+    try:
+        material = connection.send_command("create_material", {
+            "package_path": "/Game/Materials", "name": "M_Red", "properties": {"base_color": [1, 0, 0, 1]}
+        })["result"]
+        connection.send_command("modify_material", {"path": material["path"], "properties": {"roughness": 0.2}})
+        material_info = connection.send_command("get_material_info", {"path": "/Game/Materials/M_Red"})["result"]
+
+        blueprint = connection.send_command("create_blueprint", {
+            "package_path": "/Game/Blueprints", "name": "BP_Door", "properties": {"parent_class": "Pawn"}
+        })["result"]
+        connection.send_command("modify_blueprint", {
+            "blueprint_path": blueprint["path"], "properties": {"description": "A door"}
+        })
+        event = connection.send_command("create_blueprint_event", {
+            "event_name": "OnOpen", "blueprint_path": blueprint["path"]
+        })["result"]
+        blueprint_info = connection.send_command("get_blueprint_info", {"blueprint_path": blueprint["path"]})["result"]
+        print(f"Material: {material_info['path']}, blueprint: {blueprint_info['path']}")
+        return (material["path"] == "/Game/Materials/M_Red.M_Red"
+                and material_info["base_color"] == [1.0, 0.0, 0.0, 1.0] and material_info["roughness"] == 0.2
+                and blueprint_info["parent_class"] == "Pawn" and blueprint_info["description"] == "A door"
+                and event["event"] == "OnOpen" and blueprint_info["events"] == [{"name": "OnOpen"}])
+    except Exception as e:
+        print(f"Error running asset handlers: {e}")
+        return False
+    finally:
+        connection.close()
+
+
+def main():
+    """Run all offline mock server tests."""
+    print("Starting UnrealMCP offline mock server tests...")
+
+    try:
+        with MockUnrealServer(tick_interval=TICK_INTERVAL, client_timeout=0.5) as server:
+            results = {
+                "commands wait for the tick": test_tick_interval(server),
+                "idle clients time out": test_client_timeout(server),
+                "latency injection": test_latency_injection(server),
+                "scene handlers": test_scene_handlers(server),
+                "scene info actor limit": test_scene_info_limit(server),
+                "material and blueprint handlers": test_asset_handlers(server)
+            }
+
+        print("\nTest Results:")
+        print("-" * 40)
+        for test_name, success in results.items():
+            status = "✓ PASS" if success else "✗ FAIL"
+            print(f"{status} - {test_name}")
+        print("-" * 40)
+
+        if all(results.values()):
+            print("\nAll offline mock server tests passed successfully!")
+        else:
+            print("\nSome tests failed. Check the output above for details.")
+            sys.exit(1)
+
+    except Exception as e:
+        print(f"\nError during testing: {e}")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,158 @@
+"""Offline test for the columnar get_scene_info format.
+
+This script reads a large level from mock_unreal_server.MockUnrealServer
+with format='columnar' and checks the packed buffers against the actors,
+compares the payload size with the object format and decodes the level
+into NumPy arrays with utils.scene.fetch_scene_columns. The NumPy checks
+are skipped when NumPy is not installed. No Unreal Engine instance is
+needed.
+"""
+
+import array
+import asyncio
+import base64
+import sys
+import os
+
+# Add the MCP directory to sys.path so we can import the bridge utilities
+mcp_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if mcp_dir not in sys.path:
+    sys.path.insert(0, mcp_dir)
+
+from mock_unreal_server import MockUnrealServer
+from utils.async_connection import AsyncConnectionPool
+from utils.connection import ConnectionPool
+from utils.protocol import encode_message
+from utils.scene import afetch_scene_columns, fetch_scene_columns
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+SCENE_ACTOR_COUNT = 12000
+ALL_FIELDS = ["name", "type", "label", "location", "rotation", "scale"]
+
+
+def unpack_floats(column):
+    values = array.array("f", base64.b64decode(column))
+    if sys.byteorder != "little":
+        values.byteswap()
+    return values
+
+
+def test_columnar_page(server, pool):
+    """A columnar page holds the same data as the object format in parallel arrays."""
+    print("\n- Requesting a columnar page...")
+    try:
+        params = {"offset": 10, "limit": 500, "fields": ALL_FIELDS}
+        objects = pool.send_command("get_scene_info", params)["result"]
+        columns = pool.send_command("get_scene_info", dict(params, format="columnar"))["result"]["columns"]
+        actors = objects["actors"]
+        locations = unpack_floats(columns["location"])
+        scales = unpack_floats(columns["scale"])
+        type_index = array.array("i", base64.b64decode(columns["type"]))
+        return (columns["count"] == len(actors) == 500
+                and columns["name"] == [actor["name"] for actor in actors]
+                and columns["label"] == [actor["label"] for actor in actors]
+                and [columns["classes"][index] for index in type_index] == [actor["type"] for actor in actors]
+                and list(locations) == [component for actor in actors for component in actor["location"]]
+                and list(scales) == [1.0] * 1500 and len(unpack_floats(columns["rotation"])) == 1500)
+    except Exception as e:
+        print(f"Error requesting columnar page: {e}")
+        return False
+
+
+def test_payload_size(pool):
+    """The columnar format is much smaller than one object per actor."""
+    print("\n- Comparing payload sizes for 10000 actors...")
+    try:
+        params = {"limit": 10000, "fields": ["name", "type", "location"]}
+        objects = pool.send_command("get_scene_info", params)
+        columns = pool.send_command("get_scene_info", dict(params, format="columnar"))
+        unknown = pool.send_command("get_scene_info", {"format": "xml"})
+        objects_size, columns_size = len(encode_message(objects)), len(encode_message(columns))
+        print(f"Objects: {objects_size} bytes, columnar: {columns_size} bytes")
+        return columns_size < objects_size * 0.6 and unknown["status"] == "error"
+    except Exception as e:
+        print(f"Error comparing sizes: {e}")
+        return False
+
+
+def test_fetch_columns(server, pool):
+    """fetch_scene_columns returns the whole level as NumPy arrays."""
+    print(f"\n- Decoding {SCENE_ACTOR_COUNT} actors into NumPy arrays...")
+    if numpy is None:
+        print("NumPy is not installed, skipping")
+        return True
+    try:
+        server.scene.spawn_actor("PointLight", (5.0, 6.0, 7.0))
+        processed = server.commands_processed
+        columns = fetch_scene_columns(pool.send_command, ALL_FIELDS)
+        requests = server.commands_processed - processed
+        expected = numpy.array([actor["location"] for actor in server.scene.actors.values()], dtype=numpy.float32)
+        lights = columns["type"] == "PointLight"
+        print(f"Decoded {columns['count']} actors in {requests} requests, classes={columns['classes']}")
+        return (requests == 2 and columns["count"] == SCENE_ACTOR_COUNT + 1
+                and columns["location"].shape == (SCENE_ACTOR_COUNT + 1, 3)
+                and columns["location"].dtype == numpy.float32
+                and numpy.array_equal(columns["location"], expected)
+                and lights.sum() == 1 and columns["location"][lights].tolist() == [[5.0, 6.0, 7.0]]
+                and columns["name"][-1] == "PointLight_0" and numpy.all(columns["scale"] == 1.0))
+    except Exception as e:
+        print(f"Error decoding columns: {e}")
+        return False
+
+
+async def test_async_fetch_columns(server):
+    """afetch_scene_columns decodes the same arrays as fetch_scene_columns."""
+    print("\n- Decoding the level with the async client...")
+    if numpy is None:
+        print("NumPy is not installed, skipping")
+        return True
+    pool = AsyncConnectionPool("127.0.0.1", server.port)
+    try:
+        columns = await afetch_scene_columns(pool.send_command, ["location"], page_size=5000)
+        return columns["location"].shape == (len(server.scene.actors), 3) and set(columns) == {"count", "location"}
+    except Exception as e:
+        print(f"Error decoding columns: {e}")
+        return False
+    finally:
+        pool.close()
+
+
+def main():
+    """Run all offline columnar scene tests."""
+    print("Starting UnrealMCP offline columnar scene tests...")
+
+    try:
+        with MockUnrealServer(tick_interval=0) as server:
+            server.scene.populate(SCENE_ACTOR_COUNT)
+            pool = ConnectionPool("127.0.0.1", server.port)
+            results = {
+                "columnar page": test_columnar_page(server, pool),
+                "payload size": test_payload_size(pool),
+                "fetch columns": test_fetch_columns(server, pool),
+                "async fetch columns": asyncio.run(test_async_fetch_columns(server))
+            }
+            pool.close()
+
+        print("\nTest Results:")
+        print("-" * 40)
+        for test_name, success in results.items():
+            status = "✓ PASS" if success else "✗ FAIL"
+            print(f"{status} - {test_name}")
+        print("-" * 40)
+
+        if all(results.values()):
+            print("\nAll offline columnar scene tests passed successfully!")
+        else:
+            print("\nSome tests failed. Check the output above for details.")
+            sys.exit(1)
+
+    except Exception as e:
+        print(f"\nError during testing: {e}")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
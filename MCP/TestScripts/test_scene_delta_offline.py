@@ -0,0 +1,188 @@
+"""Offline test for incremental scene sync with get_scene_changes.
+
+This script keeps utils.scene.SceneMirror and AsyncSceneMirror in sync with
+a level on mock_unreal_server.MockUnrealServer while actors are spawned,
+moved and deleted. It checks that each sync after the first is a single
+get_scene_changes request and that the mirror always matches the level.
+No Unreal Engine instance is needed.
+"""
+
+import asyncio
+import sys
+import os
+
+# Add the MCP directory to sys.path so we can import the bridge utilities
+mcp_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if mcp_dir not in sys.path:
+    sys.path.insert(0, mcp_dir)
+
+from mock_unreal_server import MockUnrealServer
+from utils.async_connection import AsyncConnectionPool
+from utils.connection import ConnectionPool
+from utils.scene import AsyncSceneMirror, SceneMirror
+
+SCENE_ACTOR_COUNT = 2500
+
+
+def matches_scene(mirror, server):
+    """Whether the mirror holds exactly the actors of the mock level."""
+    expected = {name: (actor["label"], actor["location"]) for name, actor in server.scene.actors.items()}
+    actual = {name: (actor["label"], actor["location"]) for name, actor in mirror.actors.items()}
+    return actual == expected and mirror.version == server.scene.version
+
+
+def change_scene(pool, version):
+    """Spawn, move and delete a few actors; return the names involved."""
+    created = pool.send_command("create_object", {"type": "cube", "location": [0, 0, 500], "label": f"New{version}"})
+    moved = f"StaticMeshActor_{version}"
+    pool.send_command("modify_object", {"name": moved, "location": [1, 2, 3]})
+    deleted = f"StaticMeshActor_{version + 1}"
+    pool.send_command("delete_object", {"name": deleted})
+    return created["result"]["name"], moved, deleted
+
+
+def test_changes_since(server, pool):
+    """get_scene_changes reports each kind of change once."""
+    print("\n- Requesting the changes since a version...")
+    try:
+        version = pool.send_command("get_scene_info", {"limit": 1})["result"]["version"]
+        created, moved, deleted = change_scene(pool, 10)
+        # Spawned and deleted inside the window: not reported at all
+        transient = pool.send_command("create_object", {"type": "cube", "location": [0, 0, 0]})["result"]["name"]
+        pool.send_command("delete_object", {"name": transient})
+
+        result = pool.send_command("get_scene_changes", {"since_version": version})["result"]
+        print(f"version {version} -> {result['version']}: added={len(result['added'])} "
+              f"modified={len(result['modified'])} removed={len(result['removed'])}")
+        return ([actor["name"] for actor in result["added"]] == [created]
+                and [actor["name"] for actor in result["modified"]] == [moved]
+                and result["modified"][0]["location"] == [1.0, 2.0, 3.0]
+                and result["removed"] == [deleted] and not result["full_resync"]
+                and result["version"] == server.scene.version)
+    except Exception as e:
+        print(f"Error requesting changes: {e}")
+        return False
+
+
+def test_mirror_sync(server, pool):
+    """The first sync pages through the level, later syncs are one delta request each."""
+    print(f"\n- Mirroring a level of {SCENE_ACTOR_COUNT} actors...")
+    try:
+        mirror = SceneMirror(pool.send_command)
+        processed = server.commands_processed
+        mirror.sync()
+        initial_requests = server.commands_processed - processed
+        if not matches_scene(mirror, server):
+            print("Mirror does not match the level after the first sync")
+            return False
+
+        for round_index in range(5):
+            change_scene(pool, 100 + round_index * 10)
+            processed = server.commands_processed
+            mirror.sync()
+            if server.commands_processed - processed != 1 or not matches_scene(mirror, server):
+                print(f"Round {round_index}: {server.commands_processed - processed} requests, mirror out of sync")
+                return False
+
+        processed = server.commands_processed
+        mirror.sync()
+        print(f"First sync: {initial_requests} requests, then 1 request per sync, {len(mirror.actors)} actors")
+        return (initial_requests == 3 and mirror.full_reloads == 1
+                and server.commands_processed - processed == 1 and matches_scene(mirror, server))
+    except Exception as e:
+        print(f"Error mirroring the level: {e}")
+        return False
+
+
+def test_full_resync(server, pool):
+    """A version the server cannot produce a delta for forces a full reload."""
+    print("\n- Syncing from an unknown version...")
+    try:
+        result = pool.send_command("get_scene_changes", {"since_version": server.scene.version + 100})["result"]
+        mirror = SceneMirror(pool.send_command)
+        mirror.sync()
+        mirror.version = -1
+        mirror.sync()
+        missing = pool.send_command("get_scene_changes", {})
+        return (result["full_resync"] and result["added"] == [] and mirror.full_reloads == 2
+                and matches_scene(mirror, server) and missing["status"] == "error")
+    except Exception as e:
+        print(f"Error during full resync: {e}")
+        return False
+
+
+async def test_async_mirror(server):
+    """AsyncSceneMirror applies the same deltas as SceneMirror."""
+    print("\n- Mirroring the level with the async client...")
+    pool = AsyncConnectionPool("127.0.0.1", server.port)
+    sync_pool = ConnectionPool("127.0.0.1", server.port)
+    try:
+        mirror = AsyncSceneMirror(pool.send_command)
+        await mirror.sync()
+        change_scene(sync_pool, 500)
+        await mirror.sync()
+        return mirror.full_reloads == 1 and matches_scene(mirror, server)
+    except Exception as e:
+        print(f"Error mirroring the level: {e}")
+        return False
+    finally:
+        pool.close()
+        sync_pool.close()
+
+
+def test_server_without_deltas():
+    """Servers without get_scene_changes are mirrored by reloading every time."""
+    print("\n- Mirroring a server without get_scene_changes...")
+    requests = []
+
+    def send_command(command_type, params=None):
+        requests.append(command_type)
+        if command_type != "get_scene_info":
+            return {"status": "error", "message": f"Unknown command: {command_type}"}
+        return {"status": "success", "result": {
+            "actor_count": 1, "returned_actor_count": 1, "limit_reached": False,
+            "actors": [{"name": "A"}]
+        }}
+
+    mirror = SceneMirror(send_command)
+    mirror.sync()
+    mirror.sync()
+    return list(mirror.actors) == ["A"] and mirror.full_reloads == 2 and "get_scene_changes" not in requests
+
+
+def main():
+    """Run all offline scene delta tests."""
+    print("Starting UnrealMCP offline scene delta tests...")
+
+    try:
+        with MockUnrealServer(tick_interval=0) as server:
+            server.scene.populate(SCENE_ACTOR_COUNT)
+            pool = ConnectionPool("127.0.0.1", server.port)
+            results = {
+                "changes since version": test_changes_since(server, pool),
+                "mirror sync": test_mirror_sync(server, pool),
+                "full resync": test_full_resync(server, pool),
+                "async mirror": asyncio.run(test_async_mirror(server)),
+                "server without deltas": test_server_without_deltas()
+            }
+            pool.close()
+
+        print("\nTest Results:")
+        print("-" * 40)
+        for test_name, success in results.items():
+            status = "✓ PASS" if success else "✗ FAIL"
+            print(f"{status} - {test_name}")
+        print("-" * 40)
+
+        if all(results.values()):
+            print("\nAll offline scene delta tests passed successfully!")
+        else:
+            print("\nSome tests failed. Check the output above for details.")
+            sys.exit(1)
+
+    except Exception as e:
+        print(f"\nError during testing: {e}")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
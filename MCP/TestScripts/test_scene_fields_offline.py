@@ -0,0 +1,114 @@
+"""Offline test for get_scene_info field projection.
+
+This script asks mock_unreal_server.MockUnrealServer for scene pages with
+the 'fields' parameter and checks that only the requested per-actor fields
+are sent, that unknown fields are rejected and that SceneMirror can mirror
+a subset of the fields. No Unreal Engine instance is needed.
+"""
+
+import sys
+import os
+
+# Add the MCP directory to sys.path so we can import the bridge utilities
+mcp_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if mcp_dir not in sys.path:
+    sys.path.insert(0, mcp_dir)
+
+from mock_unreal_server import MockUnrealServer
+from utils.connection import ConnectionPool
+from utils.protocol import encode_message
+from utils.scene import SceneMirror
+
+SCENE_ACTOR_COUNT = 1000
+
+
+def test_projection(pool):
+    """Only the requested fields are returned for each actor."""
+    print("\n- Requesting names only...")
+    try:
+        full = pool.send_command("get_scene_info", {})["result"]
+        names = pool.send_command("get_scene_info", {"fields": ["name"]})["result"]
+        types = pool.send_command("get_scene_info", {"fields": ["type", "name"]})["result"]
+        counts = pool.send_command("get_scene_info", {"fields": []})["result"]
+        full_size, names_size = len(encode_message(full)), len(encode_message(names))
+        print(f"All fields: {full_size} bytes, names only: {names_size} bytes")
+        return (all(list(actor) == ["name"] for actor in names["actors"])
+                and all(list(actor) == ["name", "type"] for actor in types["actors"])
+                and all(actor == {} for actor in counts["actors"])
+                and names["actor_count"] == SCENE_ACTOR_COUNT and names_size < full_size / 3)
+    except Exception as e:
+        print(f"Error requesting fields: {e}")
+        return False
+
+
+def test_unknown_field(pool):
+    """Unknown fields are rejected instead of silently ignored."""
+    print("\n- Requesting an unknown field...")
+    try:
+        response = pool.send_command("get_scene_info", {"fields": ["name", "mass"]})
+        changes = pool.send_command("get_scene_changes", {"since_version": 0, "fields": ["mass"]})
+        print(f"Response: {response.get('message')}")
+        return response["status"] == "error" and "mass" in response["message"] and changes["status"] == "error"
+    except Exception as e:
+        print(f"Error requesting fields: {e}")
+        return False
+
+
+def test_mirror_fields(server, pool):
+    """A mirror restricted to some fields still tracks every actor by name."""
+    print("\n- Mirroring labels only...")
+    try:
+        mirror = SceneMirror(pool.send_command, fields=["label"])
+        mirror.sync()
+        created = pool.send_command("create_object", {"type": "cube", "location": [0, 0, 0], "label": "Extra"})
+        mirror.sync()
+        return (len(mirror.actors) == SCENE_ACTOR_COUNT + 1
+                and mirror.actors[created["result"]["name"]] == {"name": created["result"]["name"], "label": "Extra"}
+                and all(set(actor) == {"name", "label"} for actor in mirror.actors.values()))
+    except Exception as e:
+        print(f"Error mirroring fields: {e}")
+        return False
+
+
+def test_compact_encoding():
+    """Commands are sent without whitespace between JSON tokens."""
+    print("\n- Encoding a command...")
+    payload = encode_message({"type": "get_scene_info", "params": {"fields": ["name", "type"]}})
+    return payload == b'{"type":"get_scene_info","params":{"fields":["name","type"]}}'
+
+
+def main():
+    """Run all offline scene field tests."""
+    print("Starting UnrealMCP offline scene field tests...")
+
+    try:
+        with MockUnrealServer(tick_interval=0) as server:
+            server.scene.populate(SCENE_ACTOR_COUNT)
+            pool = ConnectionPool("127.0.0.1", server.port)
+            results = {
+                "field projection": test_projection(pool),
+                "unknown field": test_unknown_field(pool),
+                "mirror fields": test_mirror_fields(server, pool),
+                "compact encoding": test_compact_encoding()
+            }
+            pool.close()
+
+        print("\nTest Results:")
+        print("-" * 40)
+        for test_name, success in results.items():
+            status = "✓ PASS" if success else "✗ FAIL"
+            print(f"{status} - {test_name}")
+        print("-" * 40)
+
+        if all(results.values()):
+            print("\nAll offline scene field tests passed successfully!")
+        else:
+            print("\nSome tests failed. Check the output above for details.")
+            sys.exit(1)
+
+    except Exception as e:
+        print(f"\nError during testing: {e}")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
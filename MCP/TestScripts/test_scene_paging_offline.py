@@ -0,0 +1,121 @@
+"""Offline test for get_scene_info paging.
+
+This script pages through a level larger than MAX_ACTORS_IN_SCENE_INFO on
+mock_unreal_server.MockUnrealServer with utils.scene.iter_scene_actors and
+aiter_scene_actors. It checks that every actor is seen exactly once, in
+order and one page per request. No Unreal Engine instance is needed.
+"""
+
+import asyncio
+import sys
+import os
+
+# Add the MCP directory to sys.path so we can import the bridge utilities
+mcp_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if mcp_dir not in sys.path:
+    sys.path.insert(0, mcp_dir)
+
+from mock_unreal_server import MockUnrealServer
+from utils.async_connection import AsyncConnectionPool
+from utils.connection import ConnectionPool
+from utils.scene import aiter_scene_actors, iter_scene_actors
+
+SCENE_ACTOR_COUNT = 2500
+
+
+def test_single_page(pool):
+    """One page stops at the limit and says where the next one starts."""
+    print("\n- Requesting the second page of 1000 actors...")
+    try:
+        result = pool.send_command("get_scene_info", {"offset": 1000, "limit": 1000})["result"]
+        last = pool.send_command("get_scene_info", {"offset": 2000, "limit": 1000})["result"]
+        print(f"offset={result['offset']} returned={result['returned_actor_count']} next_offset={result['next_offset']}")
+        return (result["actor_count"] == SCENE_ACTOR_COUNT and result["returned_actor_count"] == 1000
+                and result["actors"][0]["label"] == "Cube1000" and result["next_offset"] == 2000
+                and last["returned_actor_count"] == 500 and last["next_offset"] is None and not last["limit_reached"])
+    except Exception as e:
+        print(f"Error requesting page: {e}")
+        return False
+
+
+def test_iterate_all(server, pool, page_size):
+    """Stream the whole level, one get_scene_info per page."""
+    print(f"\n- Iterating over {SCENE_ACTOR_COUNT} actors in pages of {page_size}...")
+    try:
+        processed = server.commands_processed
+        labels = [actor["label"] for actor in iter_scene_actors(pool.send_command, page_size)]
+        requests = server.commands_processed - processed
+        print(f"Received {len(labels)} actors in {requests} requests")
+        return labels == [f"Cube{i}" for i in range(SCENE_ACTOR_COUNT)] and requests == -(-SCENE_ACTOR_COUNT // page_size)
+    except Exception as e:
+        print(f"Error iterating over actors: {e}")
+        return False
+
+
+async def test_async_iterate_all(port):
+    """aiter_scene_actors yields the same actors as iter_scene_actors."""
+    print("\n- Iterating over the level with async for...")
+    pool = AsyncConnectionPool("127.0.0.1", port)
+    try:
+        labels = [actor["label"] async for actor in aiter_scene_actors(pool.send_command, 1000)]
+        print(f"Received {len(labels)} actors")
+        return labels == [f"Cube{i}" for i in range(SCENE_ACTOR_COUNT)]
+    except Exception as e:
+        print(f"Error iterating over actors: {e}")
+        return False
+    finally:
+        pool.close()
+
+
+def test_server_without_paging():
+    """Servers that ignore offset/limit yield their one page and stop."""
+    print("\n- Iterating against a server without paging...")
+    requests = []
+
+    def send_command(command_type, params=None):
+        requests.append(params)
+        return {"status": "success", "result": {
+            "actor_count": 3, "returned_actor_count": 2, "limit_reached": True,
+            "actors": [{"name": "A"}, {"name": "B"}]
+        }}
+
+    names = [actor["name"] for actor in iter_scene_actors(send_command)]
+    return names == ["A", "B"] and len(requests) == 1
+
+
+def main():
+    """Run all offline scene paging tests."""
+    print("Starting UnrealMCP offline scene paging tests...")
+
+    try:
+        with MockUnrealServer(tick_interval=0) as server:
+            server.scene.populate(SCENE_ACTOR_COUNT)
+            pool = ConnectionPool("127.0.0.1", server.port)
+            results = {
+                "single page": test_single_page(pool),
+                "iterate in pages of 1000": test_iterate_all(server, pool, 1000),
+                "iterate in pages of 300": test_iterate_all(server, pool, 300),
+                "async iterate": asyncio.run(test_async_iterate_all(server.port)),
+                "server without paging": test_server_without_paging()
+            }
+            pool.close()
+
+        print("\nTest Results:")
+        print("-" * 40)
+        for test_name, success in results.items():
+            status = "✓ PASS" if success else "✗ FAIL"
+            print(f"{status} - {test_name}")
+        print("-" * 40)
+
+        if all(results.values()):
+            print("\nAll offline scene paging tests passed successfully!")
+        else:
+            print("\nSome tests failed. Check the output above for details.")
+            sys.exit(1)
+
+    except Exception as e:
+        print(f"\nError during testing: {e}")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+"""Offline test for the query_actors command.
+
+This script sends query_actors requests with each kind of filter to
+mock_unreal_server.MockUnrealServer and checks the matching actors against
+a scan of the whole level, that matches are paged like get_scene_info,
+that invalid filters are rejected and that a query sends far less data
+than a full dump. No Unreal Engine instance is needed.
+"""
+
+import math
+import sys
+import os
+
+# Add the MCP directory to sys.path so we can import the bridge utilities
+mcp_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if mcp_dir not in sys.path:
+    sys.path.insert(0, mcp_dir)
+
+from mock_unreal_server import MockUnrealServer
+from utils.connection import ConnectionPool
+from utils.protocol import encode_message
+from utils.scene import iter_scene_actors
+
+SCENE_ACTOR_COUNT = 10000
+
+
+def _query_names(pool, actor_filter):
+    response = pool.send_command("query_actors", {"filter": actor_filter, "fields": ["name"], "limit": 10000})
+    if response["status"] != "success":
+        raise Exception(response["message"])
+    return [actor["name"] for actor in response["result"]["actors"]]
+
+
+def test_filters(server, pool):
+    """Each filter returns exactly the actors a scan of the level finds."""
+    print("\n- Querying with each filter...")
+    try:
+        actors = list(server.scene.actors.values())
+        expected = {
+            "class": ({"class": "Light"}, [a for a in actors if a["type"] in ("PointLight", "SpotLight")]),
+            "name": ({"name": "pointlight_*"}, [a for a in actors if a["type"] == "PointLight"]),
+            "label": ({"label": "Cube12?"}, [a for a in actors if a["label"] in [f"Cube12{i}" for i in range(10)]]),
+            "label_regex": ({"label_regex": "^Cube9+$"}, [a for a in actors if a["label"].strip("9") == "Cube"]),
+            "tag": ({"tag": "Ceiling"}, [a for a in actors if "Ceiling" in a["tags"]]),
+            "box": ({"box": {"min": [1000, 1000, -1], "max": [0, 0, 1]}},
+                    [a for a in actors if 0 <= a["location"][0] <= 1000 and 0 <= a["location"][1] <= 1000
+                     and -1 <= a["location"][2] <= 1]),
+            "near": ({"near": {"point": [5000, 5000, 0], "radius": 450}},
+                     [a for a in actors if math.dist(a["location"], (5000, 5000, 0)) <= 450]),
+            "combined": ({"class": "PointLight", "tag": "Ceiling", "near": {"point": [0, 0, 300], "radius": 2000}},
+                         [a for a in actors if a["type"] == "PointLight" and "Ceiling" in a["tags"]
+                          and math.dist(a["location"], (0, 0, 300)) <= 2000])
+        }
+        for kind, (actor_filter, matching) in expected.items():
+            names = _query_names(pool, actor_filter)
+            if not matching or names != [actor["name"] for actor in matching]:
+                print(f"Filter '{kind}' returned {len(names)} actors, expected {len(matching)}")
+                return False
+        return True
+    except Exception as e:
+        print(f"Error querying actors: {e}")
+        return False
+
+
+def test_paging(pool):
+    """Matches are paged with offset/limit and iter_scene_actors can stream them."""
+    print("\n- Paging through the matches...")
+    try:
+        actor_filter = {"box": {"min": [0, 0, 0], "max": [3000, 3000, 0]}}
+        first = pool.send_command("query_actors", {"filter": actor_filter, "limit": 100})["result"]
+        streamed = list(iter_scene_actors(pool.send_command, page_size=100, params={"filter": actor_filter},
+                                          command="query_actors"))
+        print(f"{first['actor_count']} matches, {len(streamed)} streamed")
+        return (first["actor_count"] == 256 and first["returned_actor_count"] == 100 and first["next_offset"] == 100
+                and len(streamed) == 256 and len({actor["name"] for actor in streamed}) == 256)
+    except Exception as e:
+        print(f"Error paging matches: {e}")
+        return False
+
+
+def test_invalid_filters(pool):
+    """Unknown and malformed filters are rejected instead of matching everything."""
+    print("\n- Sending invalid filters...")
+    try:
+        responses = [
+            pool.send_command("query_actors", {"filter": {"colour": "red"}}),
+            pool.send_command("query_actors", {"filter": {"box": {"min": [0, 0]}}}),
+            pool.send_command("query_actors", {"filter": {"near": {"point": [0, 0, 0], "radius": -1}}}),
+            pool.send_command("query_actors", {"filter": {"class": ""}}),
+            pool.send_command("query_actors", {"filter": "Light"})
+        ]
+        print(f"Response: {responses[0].get('message')}")
+        return all(response["status"] == "error" for response in responses) and "colour" in responses[0]["message"]
+    except Exception as e:
+        print(f"Error sending invalid filters: {e}")
+        return False
+
+
+def test_response_size(pool):
+    """Finding the lights of a level sends a fraction of what a full dump does."""
+    print("\n- Comparing with a full dump...")
+    try:
+        dump = pool.send_command("get_scene_info", {"limit": 10000})["result"]
+        query = pool.send_command("query_actors", {"filter": {"class": "Light"}})["result"]
+        dump_size, query_size = len(encode_message(dump)), len(encode_message(query))
+        print(f"Full dump: {dump_size} bytes, lights only: {query_size} bytes")
+        return query["actor_count"] == 40 and query_size < dump_size / 50
+    except Exception as e:
+        print(f"Error comparing sizes: {e}")
+        return False
+
+
+def main():
+    """Run all offline actor query tests."""
+    print("Starting UnrealMCP offline actor query tests...")
+
+    try:
+        with MockUnrealServer(tick_interval=0) as server:
+            server.scene.populate(SCENE_ACTOR_COUNT)
+            for index in range(20):
+                server.scene.spawn_actor("PointLight", (index * 500.0, 0.0, 300.0),
+                                         tags=["Ceiling"] if index % 2 else ["Floor"])
+                server.scene.spawn_actor("SpotLight", (0.0, index * 500.0, 300.0), tags=["Ceiling"])
+            pool = ConnectionPool("127.0.0.1", server.port)
+            results = {
+                "filters": test_filters(server, pool),
+                "paging": test_paging(pool),
+                "invalid filters": test_invalid_filters(pool),
+                "response size": test_response_size(pool)
+            }
+            pool.close()
+
+        print("\nTest Results:")
+        print("-" * 40)
+        for test_name, success in results.items():
+            status = "✓ PASS" if success else "✗ FAIL"
+            print(f"{status} - {test_name}")
+        print("-" * 40)
+
+        if all(results.values()):
+            print("\nAll offline actor query tests passed successfully!")
+        else:
+            print("\nSome tests failed. Check the output above for details.")
+            sys.exit(1)
+
+    except Exception as e:
+        print(f"\nError during testing: {e}")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
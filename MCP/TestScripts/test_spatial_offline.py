@@ -0,0 +1,194 @@
+"""Offline test for the bridge-side spatial index.
+
+This script checks utils.spatial.SpatialGrid radius, box and k-nearest
+queries against a brute-force scan, then keeps a SceneSpatialIndex in sync
+with a level on mock_unreal_server.MockUnrealServer while commands go
+through utils.send_command. It checks that queries see every change, that
+a query after a change costs one get_scene_changes request and that a
+query on an up-to-date index does not reach the server. No Unreal Engine
+instance is needed.
+"""
+
+import asyncio
+import math
+import random
+import sys
+import os
+import time
+
+# Add the MCP directory to sys.path so we can import the bridge utilities
+mcp_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if mcp_dir not in sys.path:
+    sys.path.insert(0, mcp_dir)
+
+import utils
+from mock_unreal_server import MockUnrealServer
+from utils.async_connection import AsyncCommandMultiplexer, AsyncConnectionPool
+from utils.connection import ConnectionPool
+from utils.spatial import AsyncSceneSpatialIndex, SceneSpatialIndex, SpatialGrid
+
+SCENE_ACTOR_COUNT = 10000
+
+
+def test_grid_matches_brute_force():
+    """Grid queries return exactly what a scan of every point returns."""
+    print("\n- Comparing grid queries with a brute-force scan...")
+    rng = random.Random(7)
+    points = {f"P{i}": (rng.uniform(-20000, 20000), rng.uniform(-20000, 20000), rng.uniform(0, 2000))
+              for i in range(5000)}
+    grid = SpatialGrid(1000)
+    for name, point in points.items():
+        grid.insert(name, point)
+    for name in list(points)[:500]:
+        points[name] = (points[name][0] + 3000, points[name][1], points[name][2])
+        grid.insert(name, points[name])
+
+    for _ in range(50):
+        center = (rng.uniform(-30000, 30000), rng.uniform(-30000, 30000), rng.uniform(-500, 2500))
+        by_distance = sorted((math.dist(point, center), name) for name, point in points.items())
+        radius = rng.uniform(100, 5000)
+        k = rng.choice([1, 5, 25])
+        low = (center[0] - radius, center[1] - radius / 2, 0)
+        high = (center[0] + radius, center[1] + radius / 2, 1000)
+        in_box = {name for name, point in points.items() if all(low[a] <= point[a] <= high[a] for a in range(3))}
+        if ([name for _, name in grid.query_radius(center, radius)] != [name for d, name in by_distance if d <= radius]
+                or [name for _, name in grid.nearest(center, k)] != [name for _, name in by_distance[:k]]
+                or {name for _, name in grid.query_box(high, low)} != in_box):
+            print(f"Mismatch around {center}")
+            return False
+    return True
+
+
+def test_index_queries(server):
+    """The index answers region queries from the mirrored level."""
+    print(f"\n- Querying an index of {SCENE_ACTOR_COUNT} actors...")
+    try:
+        index = SceneSpatialIndex(utils.send_command, max_age=None).attach()
+        light = server.scene.spawn_actor("PointLight", (1000.0, 1000.0, 0.0))["name"]
+        near = index.find_in_radius((1000, 1000, 0), 250)
+        lights = index.find_in_radius((0, 0, 0), 5000, actor_type="PointLight")
+        box = index.find_in_box((-1, -1, -1), (401, 201, 1))
+        nearest = index.find_nearest((5.0, 5.0, 0.0), 3)
+        print(f"Near the light: {[actor['name'] for actor in near]}")
+        return (near[0]["name"] == light and near[0]["distance"] == 0.0 and len(near) == 6
+                and [actor["name"] for actor in lights] == [light]
+                and len(box) == 6 and nearest[0]["label"] == "Cube0"
+                and [actor["distance"] for actor in nearest] == sorted(actor["distance"] for actor in nearest))
+    except Exception as e:
+        print(f"Error querying index: {e}")
+        return False
+    finally:
+        index.detach()
+
+
+def test_index_follows_commands(server):
+    """Commands sent through the bridge are visible to the next query at the cost of one delta request."""
+    print("\n- Changing the level through the bridge...")
+    index = SceneSpatialIndex(utils.send_command, max_age=None).attach()
+    try:
+        index.find_nearest((0, 0, 0))
+        processed = server.commands_processed
+        timings = []
+        for _ in range(100):
+            start = time.perf_counter()
+            index.find_in_radius((5000, 5000, 0), 1000)
+            timings.append(time.perf_counter() - start)
+        idle_requests = server.commands_processed - processed
+
+        name = utils.send_command("create_object", {"type": "cube", "location": [-9000, -9000, 0]})["result"]["name"]
+        processed = server.commands_processed
+        created = index.find_nearest((-9000, -9000, 0))
+        create_requests = server.commands_processed - processed
+
+        utils.send_command("modify_object", {"name": name, "location": [90000, 0, 0]})
+        moved = index.find_in_radius((90000, 0, 0), 10)
+        gone_from_old_cell = index.find_in_radius((-9000, -9000, 0), 10)
+        utils.send_command("delete_object", {"name": name})
+        deleted = index.find_in_radius((90000, 0, 0), 10)
+
+        median_ms = sorted(timings)[len(timings) // 2] * 1000
+        print(f"Idle query: {median_ms:.3f} ms median, {idle_requests} requests; query after create: "
+              f"{create_requests} request(s)")
+        return (idle_requests == 0 and create_requests == 1 and created[0]["name"] == name
+                and [actor["name"] for actor in moved] == [name] and gone_from_old_cell == []
+                and deleted == [] and median_ms < 1.0)
+    except Exception as e:
+        print(f"Error following commands: {e}")
+        return False
+    finally:
+        index.detach()
+
+
+def test_max_age(server):
+    """Changes made in the editor itself are picked up once the index is older than max_age."""
+    print("\n- Changing the level behind the bridge's back...")
+    try:
+        index = SceneSpatialIndex(utils.send_command, max_age=0.5)
+        index.find_nearest((0, 0, 0))
+        index.find_nearest((0, 0, 0))
+        name = server.scene.spawn_actor("PointLight", (-50000.0, 0.0, 0.0))["name"]
+        before = index.find_in_radius((-50000, 0, 0), 1)
+        time.sleep(0.6)
+        after = index.find_in_radius((-50000, 0, 0), 1)
+        return before == [] and [actor["name"] for actor in after] == [name]
+    except Exception as e:
+        print(f"Error checking max_age: {e}")
+        return False
+
+
+async def test_async_index(server):
+    """AsyncSceneSpatialIndex follows async_send_command the same way."""
+    print("\n- Querying the async index...")
+    index = AsyncSceneSpatialIndex(utils.async_send_command, max_age=None).attach()
+    try:
+        await index.find_nearest((0, 0, 0))
+        response = await utils.async_send_command("create_object", {"type": "cube", "location": [0, 0, -7000]})
+        nearest = await index.find_nearest((0, 0, -7000), 1)
+        return nearest[0]["name"] == response["result"]["name"]
+    except Exception as e:
+        print(f"Error querying async index: {e}")
+        return False
+    finally:
+        index.detach()
+
+
+def main():
+    """Run all offline spatial index tests."""
+    print("Starting UnrealMCP offline spatial index tests...")
+
+    try:
+        with MockUnrealServer(tick_interval=0) as server:
+            # Point the bridge's shared clients at the mock server
+            utils._pool = ConnectionPool("127.0.0.1", server.port)
+            utils._multiplexer = AsyncCommandMultiplexer("127.0.0.1", server.port,
+                                                         fallback_pool=AsyncConnectionPool("127.0.0.1", server.port))
+            server.scene.populate(SCENE_ACTOR_COUNT)
+            results = {
+                "grid matches brute force": test_grid_matches_brute_force(),
+                "index queries": test_index_queries(server),
+                "index follows commands": test_index_follows_commands(server),
+                "max age": test_max_age(server),
+                "async index": asyncio.run(test_async_index(server))
+            }
+            utils._pool.close()
+            utils._multiplexer.close()
+
+        print("\nTest Results:")
+        print("-" * 40)
+        for test_name, success in results.items():
+            status = "✓ PASS" if success else "✗ FAIL"
+            print(f"{status} - {test_name}")
+        print("-" * 40)
+
+        if all(results.values()):
+            print("\nAll offline spatial index tests passed successfully!")
+        else:
+            print("\nSome tests failed. Check the output above for details.")
+            sys.exit(1)
+
+    except Exception as e:
+        print(f"\nError during testing: {e}")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
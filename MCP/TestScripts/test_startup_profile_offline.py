@@ -0,0 +1,164 @@
+"""Offline test for the bridge's startup profiler.
+
+This script times the import of small modules written to a temporary
+directory with utils.profiling.StartupProfiler, as the bridge does with
+--profile-startup, and checks that nested phases and imports are reported
+with their parents, that a slow module is reported first, that the report
+is written as JSON and that a disabled profiler leaves the import system
+alone. Neither Unreal Engine nor the mcp package is needed.
+"""
+
+import builtins
+import json
+import sys
+import os
+import tempfile
+import time
+
+# Add the MCP directory to sys.path so we can import the bridge utilities
+mcp_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if mcp_dir not in sys.path:
+    sys.path.insert(0, mcp_dir)
+
+from utils.profiling import StartupProfiler, format_summary, profile_output
+
+SLOW_TOOL_SOURCE = '''
+import time
+import profiled_helper
+
+time.sleep(0.05)
+
+def register_tools(mcp, utils):
+    pass
+'''
+
+HELPER_SOURCE = '''
+import time
+
+time.sleep(0.01)
+'''
+
+
+def write_module(directory, name, source):
+    with open(os.path.join(directory, f"{name}.py"), "w", encoding="utf-8") as f:
+        f.write(source)
+
+
+def test_requested_output():
+    """The command line wins over the environment, and both can name a file."""
+    print("\n- Parsing profiling requests...")
+    try:
+        cases = [
+            (([], {}), None),
+            ((["--profile-startup"], {}), "-"),
+            ((["--profile-startup", "--port", "1"], {}), "-"),
+            ((["--profile-startup", "out.json"], {}), "out.json"),
+            ((["--profile-startup=cli.json"], {"UNREAL_MCP_PROFILE_STARTUP": "env.json"}), "cli.json"),
+            (([], {"UNREAL_MCP_PROFILE_STARTUP": "1"}), "-"),
+            (([], {"UNREAL_MCP_PROFILE_STARTUP": "off"}), None),
+            (([], {"UNREAL_MCP_PROFILE_STARTUP": "env.json"}), "env.json")
+        ]
+        failed = [args for args, expected in cases if profile_output(*args) != expected]
+        if failed:
+            print(f"Unexpected output for: {failed}")
+        return not failed
+    except Exception as e:
+        print(f"Error parsing requests: {e}")
+        return False
+
+
+def test_disabled_profiler():
+    """A disabled profiler records nothing and keeps the original __import__."""
+    print("\n- Running a disabled profiler...")
+    try:
+        original_import = builtins.__import__
+        profiler = StartupProfiler.from_environment(argv=[], environ={})
+        profiler.install_import_hook()
+        with profiler.phase("load_commands") as details:
+            details["mode"] = "lazy"
+            import_hooked = builtins.__import__ is not original_import
+        return (not profiler.enabled and not import_hooked and profiler.phases == []
+                and profiler.report() is None and profiler.finish() is None)
+    except Exception as e:
+        print(f"Error running profiler: {e}")
+        return False
+
+
+def test_phases_and_imports(directory):
+    """Nested phases and imports are reported with their parents, slowest import first."""
+    print("\n- Profiling the import of a slow user tool...")
+    try:
+        write_module(directory, "profiled_tool", SLOW_TOOL_SOURCE)
+        write_module(directory, "profiled_helper", HELPER_SOURCE)
+        output = os.path.join(directory, "startup.json")
+        original_import = builtins.__import__
+        start = time.perf_counter()
+        profiler = StartupProfiler(output=output, start=start)
+        profiler.record("import bridge utilities", start, start + 0.002, modules_loaded=3)
+        profiler.install_import_hook()
+        try:
+            with profiler.phase("load_user_tools"):
+                with profiler.phase("UserTools.profiled_tool") as details:
+                    import profiled_tool
+                    details["mode"] = "eager"
+        finally:
+            hooked = builtins.__import__ is not original_import
+            profiler.finish()
+
+        with open(output, "r", encoding="utf-8") as f:
+            report = json.load(f)
+        phases = {phase["name"]: phase for phase in report["phases"]}
+        imports = {entry["module"]: entry for entry in report["imports"]}
+        tool, helper = imports["profiled_tool"], imports["profiled_helper"]
+        tool_phase = phases["UserTools.profiled_tool"]
+        print(format_summary(report, entries=3))
+        return (hooked and builtins.__import__ is original_import
+                and tool_phase["parent"] == "load_user_tools" and tool_phase["details"] == {"mode": "eager"}
+                and tool_phase["duration_ms"] >= 60 and phases["import bridge utilities"]["duration_ms"] == 2.0
+                and report["imports"][0]["module"] == "profiled_tool"
+                and helper["parent"] == "profiled_tool" and helper["cumulative_ms"] >= 10
+                and tool["cumulative_ms"] >= 60 and 50 <= tool["self_ms"] <= tool["cumulative_ms"] - 10
+                and report["total_ms"] >= tool_phase["duration_ms"])
+    except Exception as e:
+        print(f"Error profiling imports: {e}")
+        return False
+    finally:
+        for name in ("profiled_tool", "profiled_helper"):
+            sys.modules.pop(name, None)
+
+
+def main():
+    """Run all offline startup profiler tests."""
+    print("Starting UnrealMCP offline startup profiler tests...")
+
+    try:
+        with tempfile.TemporaryDirectory() as directory:
+            sys.path.insert(0, directory)
+            try:
+                results = {
+                    "requested output": test_requested_output(),
+                    "disabled profiler": test_disabled_profiler(),
+                    "phases and imports": test_phases_and_imports(directory)
+                }
+            finally:
+                sys.path.remove(directory)
+
+        print("\nTest Results:")
+        print("-" * 40)
+        for test_name, success in results.items():
+            status = "✓ PASS" if success else "✗ FAIL"
+            print(f"{status} - {test_name}")
+        print("-" * 40)
+
+        if all(results.values()):
+            print("\nAll offline startup profiler tests passed successfully!")
+        else:
+            print("\nSome tests failed. Check the output above for details.")
+            sys.exit(1)
+
+    except Exception as e:
+        print(f"\nError during testing: {e}")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,225 @@
+"""Offline test for the bridge's cached tool manifest.
+
+This script registers small tool modules written to a temporary directory
+through utils.manifest.ToolManifest, as load_commands and load_user_tools
+do, and checks that a second start registers stubs with the same
+signatures and docstrings without importing the modules, that a module is
+imported once on the first call of one of its tools, and that changed or
+undescribable modules are loaded eagerly. Neither Unreal Engine nor the
+mcp package is needed.
+"""
+
+import asyncio
+import importlib.util
+import inspect
+import sys
+import os
+import tempfile
+import time
+
+# Add the MCP directory to sys.path so we can import the bridge utilities
+mcp_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if mcp_dir not in sys.path:
+    sys.path.insert(0, mcp_dir)
+
+from utils.manifest import ToolManifest
+
+TOOLS_SOURCE = '''
+def register_all(mcp):
+    @mcp.tool()
+    async def spawn_crates(ctx: Context, count: int, spacing: float = 100.0, names: list = None) -> str:
+        """Spawn a row of crates."""
+        return f"{count} crates {spacing} apart"
+
+    @mcp.tool(name="crate_count")
+    def count_crates(ctx, label: str = "Crate") -> dict:
+        """Count the crates."""
+        return {"label": label, "count": 3}
+'''
+
+UNCACHEABLE_SOURCE = '''
+def register_all(mcp):
+    @mcp.tool()
+    async def tagged(ctx: Context, tags: tuple = ("a",)) -> str:
+        """Tuple defaults do not survive JSON."""
+        return "tagged"
+'''
+
+
+class Context:
+    """Stand-in for mcp.server.fastmcp.Context."""
+
+
+class FakeMCP:
+    """Collect the functions registered with mcp.tool()."""
+
+    def __init__(self):
+        self.tools = {}
+
+    def tool(self, name=None, description=None):
+        def decorator(fn):
+            self.tools[name or fn.__name__] = fn
+            return fn
+        return decorator
+
+
+class ModuleLoader:
+    """Import a tool module from a file and count the imports."""
+
+    def __init__(self, path):
+        self.path = path
+        self.imports = 0
+
+    def __call__(self):
+        self.imports += 1
+        spec = importlib.util.spec_from_file_location(os.path.basename(self.path)[:-3], self.path)
+        module = importlib.util.module_from_spec(spec)
+        module.Context = Context
+        spec.loader.exec_module(module)
+        return module.register_all
+
+
+def write_module(path, source):
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(source)
+
+
+def register(manifest_path, module_path, key="Commands.crates"):
+    """Register one module as a fresh bridge start would."""
+    manifest = ToolManifest(manifest_path, types={"Context": Context})
+    server = FakeMCP()
+    loader = ModuleLoader(module_path)
+    mode = manifest.register(server, key, [module_path], loader)
+    manifest.save()
+    return mode, server, loader
+
+
+def test_first_start(manifest_path, module_path):
+    """Without a manifest the module is imported and its real tools are registered."""
+    print("\n- Registering a module without a manifest...")
+    try:
+        mode, server, loader = register(manifest_path, module_path)
+        return (mode == "rebuilt" and loader.imports == 1 and os.path.exists(manifest_path)
+                and sorted(server.tools) == ["crate_count", "spawn_crates"])
+    except Exception as e:
+        print(f"Error registering module: {e}")
+        return False
+
+
+def test_lazy_start(manifest_path, module_path):
+    """An unchanged module gets stubs with the real signatures and is imported on first use."""
+    print("\n- Registering a module from the manifest...")
+    try:
+        real = FakeMCP()
+        ModuleLoader(module_path)()(real)
+        mode, server, loader = register(manifest_path, module_path)
+        imports_at_start = loader.imports
+
+        same_tools = all(
+            inspect.signature(server.tools[name]) == inspect.signature(fn)
+            and server.tools[name].__doc__ == fn.__doc__ and server.tools[name].__name__ == fn.__name__
+            and inspect.iscoroutinefunction(server.tools[name]) == inspect.iscoroutinefunction(fn)
+            for name, fn in real.tools.items())
+        spawned = asyncio.run(server.tools["spawn_crates"](ctx=None, count=4))
+        counted = server.tools["crate_count"](None, label="Box")
+        print(f"Imports at start: {imports_at_start}, after two calls: {loader.imports}")
+        return (mode == "lazy" and imports_at_start == 0 and same_tools and loader.imports == 1
+                and spawned == "4 crates 100.0 apart" and counted == {"label": "Box", "count": 3}
+                and server.tools["spawn_crates"].__annotations__["ctx"] is Context)
+    except Exception as e:
+        print(f"Error registering module: {e}")
+        return False
+
+
+def test_changed_module(manifest_path, module_path):
+    """Editing a module rebuilds its entry, and the next start is lazy again."""
+    print("\n- Registering a changed module...")
+    try:
+        write_module(module_path, TOOLS_SOURCE.replace("Spawn a row of crates.", "Spawn a row of boxes."))
+        stat = os.stat(module_path)
+        os.utime(module_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        changed_mode, changed_server, _ = register(manifest_path, module_path)
+        lazy_mode, lazy_server, loader = register(manifest_path, module_path)
+        return (changed_mode == "rebuilt" and lazy_mode == "lazy" and loader.imports == 0
+                and lazy_server.tools["spawn_crates"].__doc__ == "Spawn a row of boxes.")
+    except Exception as e:
+        print(f"Error registering module: {e}")
+        return False
+
+
+def test_uncacheable_module(manifest_path, directory):
+    """Tools the manifest cannot describe are always registered eagerly."""
+    print("\n- Registering a module with a tuple default...")
+    try:
+        module_path = os.path.join(directory, "tagged.py")
+        write_module(module_path, UNCACHEABLE_SOURCE)
+        modes = []
+        for _ in range(2):
+            mode, server, loader = register(manifest_path, module_path, key="Commands.tagged")
+            modes.append((mode, loader.imports, "tagged" in server.tools))
+        return modes == [("eager", 1, True), ("eager", 1, True)]
+    except Exception as e:
+        print(f"Error registering module: {e}")
+        return False
+
+
+def test_startup_time(manifest_path, directory):
+    """Registering stubs from the manifest is cheaper than importing a module."""
+    print("\n- Timing 20 modules with and without the manifest...")
+    try:
+        paths = []
+        for i in range(20):
+            path = os.path.join(directory, f"timed_{i}.py")
+            write_module(path, "import json, decimal, fractions, statistics\n" + TOOLS_SOURCE)
+            paths.append(path)
+        timings = []
+        for _ in range(2):
+            manifest = ToolManifest(manifest_path, types={"Context": Context})
+            start = time.perf_counter()
+            for i, path in enumerate(paths):
+                manifest.register(FakeMCP(), f"Commands.timed_{i}", [path], ModuleLoader(path))
+            timings.append(time.perf_counter() - start)
+            manifest.save()
+        print(f"Cold start: {timings[0] * 1000:.1f} ms, warm start: {timings[1] * 1000:.1f} ms")
+        return timings[1] < timings[0] and manifest.stats["lazy"] == 20
+    except Exception as e:
+        print(f"Error timing modules: {e}")
+        return False
+
+
+def main():
+    """Run all offline tool manifest tests."""
+    print("Starting UnrealMCP offline tool manifest tests...")
+
+    try:
+        with tempfile.TemporaryDirectory() as directory:
+            manifest_path = os.path.join(directory, ".tool_manifest.json")
+            module_path = os.path.join(directory, "crates.py")
+            write_module(module_path, TOOLS_SOURCE)
+            results = {
+                "first start": test_first_start(manifest_path, module_path),
+                "lazy start": test_lazy_start(manifest_path, module_path),
+                "changed module": test_changed_module(manifest_path, module_path),
+                "uncacheable module": test_uncacheable_module(manifest_path, directory),
+                "startup time": test_startup_time(os.path.join(directory, "timed.json"), directory)
+            }
+
+        print("\nTest Results:")
+        print("-" * 40)
+        for test_name, success in results.items():
+            status = "✓ PASS" if success else "✗ FAIL"
+            print(f"{status} - {test_name}")
+        print("-" * 40)
+
+        if all(results.values()):
+            print("\nAll offline tool manifest tests passed successfully!")
+        else:
+            print("\nSome tests failed. Check the output above for details.")
+            sys.exit(1)
+
+    except Exception as e:
+        print(f"\nError during testing: {e}")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
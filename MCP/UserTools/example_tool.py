@@ -9,21 +9,10 @@ def register_tools(mcp, utils):
     def get_actor_count(ctx) -> str:
         """Get the number of actors in the current Unreal Engine scene."""
         try:
-            response = send_command("get_scene_info")
-            print(f"Response: {response}")
+            # Only the count is needed, so ask for the smallest page of actors
+            response = send_command("get_scene_info", {"limit": 1})
             if response["status"] == "success":
-                result = response["result"]
-                total_actor_count = result["actor_count"]
-                returned_actor_count = result.get("returned_actor_count", len(result["actors"]))
-                limit_reached = result.get("limit_reached", False)
-                
-                response_text = f"Total number of actors: {total_actor_count}\n"
-                
-                if limit_reached:
-                    response_text += f"WARNING: Actor limit reached! Only {returned_actor_count} actors were returned in the response.\n"
-                    response_text += f"The remaining {total_actor_count - returned_actor_count} actors are not included in the response.\n"
-                
-                return response_text
+                return f"Total number of actors: {response['result']['actor_count']}\n"
             else:
                 return f"Error: {response['message']}"
         except Exception as e:
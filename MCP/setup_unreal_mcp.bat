@@ -117,9 +117,14 @@ REM Install MCP package in the virtual environment
 echo Installing MCP package...
 python -m pip install mcp>=0.1.0
 
+REM NumPy decodes columnar scene snapshots for the layout tools
+echo Installing NumPy...
+python -m pip install numpy
+
 REM Also install to modules directory as a backup
 echo Installing MCP package to modules directory as backup...
 python -m pip install mcp>=0.1.0 -t "%MODULES_DIR%"
+python -m pip install numpy -t "%MODULES_DIR%"
 
 REM Verify installation
 echo.
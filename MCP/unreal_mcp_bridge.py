@@ -15,210 +15,222 @@ and exposes MCP functionality to Claude for Desktop. This allows Claude to inter
 with Unreal Engine through natural language commands.
 """
 
-import json
-import socket
 import sys
+import time
+
+# Startup begins here for --profile-startup (see utils.profiling)
+_STARTUP_TIME = time.perf_counter()
+_STARTUP_MODULE_COUNT = len(sys.modules)
+
+import argparse
 import os
 import importlib.util
 import importlib
 
-# Try to get the port from MCPConstants
-DEFAULT_PORT = 13377
-DEFAULT_BUFFER_SIZE = 65536
-DEFAULT_TIMEOUT = 10  # 10 second timeout
+# Command modules import send_command from this module; when it runs as a
+# script, let them share it instead of executing the bridge a second time
+if __name__ == "__main__":
+    sys.modules.setdefault("unreal_mcp_bridge", sys.modules[__name__])
 
-try:
-    # Try to read the port from the C++ constants
-    plugin_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
-    constants_path = os.path.join(plugin_dir, "Source", "UnrealMCP", "Public", "MCPConstants.h")
-    
-    if os.path.exists(constants_path):
-        with open(constants_path, 'r') as f:
-            constants_content = f.read()
-            
-            # Extract port from MCPConstants
-            port_match = constants_content.find("DEFAULT_PORT = ")
-            if port_match != -1:
-                port_line = constants_content[port_match:].split(';')[0]
-                DEFAULT_PORT = int(port_line.split('=')[1].strip())
-                
-            # Extract buffer size from MCPConstants
-            buffer_match = constants_content.find("DEFAULT_RECEIVE_BUFFER_SIZE = ")
-            if buffer_match != -1:
-                buffer_line = constants_content[buffer_match:].split(';')[0]
-                DEFAULT_BUFFER_SIZE = int(buffer_line.split('=')[1].strip())
-except Exception as e:
-    # If anything goes wrong, use the defaults (which are already defined)
-    print(f"Warning: Could not read constants from MCPConstants.h: {e}", file=sys.stderr)
-    # No need to redefine DEFAULT_PORT and DEFAULT_BUFFER_SIZE here
-
-
-print(f"Using port: {DEFAULT_PORT}", file=sys.stderr)
-print(f"Using buffer size: {DEFAULT_BUFFER_SIZE}", file=sys.stderr)
+import utils
+from utils.config import add_config_arguments, config_overrides
+from utils.manifest import ToolManifest
+from utils.profiling import PROFILE_ARGUMENT, PROFILE_ENVIRONMENT_VARIABLE, StartupProfiler
+
+# Only a bridge started as a script profiles its startup
+if __name__ == "__main__":
+    profiler = StartupProfiler.from_environment(start=_STARTUP_TIME)
+else:
+    profiler = StartupProfiler(enabled=False)
+# Imports before the profiler could hook them are only counted
+profiler.record("import bridge utilities", _STARTUP_TIME, time.perf_counter(),
+                modules_loaded=len(sys.modules) - _STARTUP_MODULE_COUNT)
+profiler.install_import_hook()
 
 # Check for local python_modules directory first
-local_modules_path = os.path.join(os.path.dirname(__file__), "python_modules")
-if os.path.exists(local_modules_path):
-    print(f"Found local python_modules directory: {local_modules_path}", file=sys.stderr)
-    sys.path.insert(0, local_modules_path)
-    print(f"Added local python_modules to sys.path", file=sys.stderr)
+with profiler.phase("scan python_modules"):
+    local_modules_path = os.path.join(os.path.dirname(__file__), "python_modules")
+    if os.path.exists(local_modules_path):
+        print(f"Found local python_modules directory: {local_modules_path}", file=sys.stderr)
+        sys.path.insert(0, local_modules_path)
+        print(f"Added local python_modules to sys.path", file=sys.stderr)
 
 # Try to import MCP
-mcp_spec = importlib.util.find_spec("mcp")
-if mcp_spec is None:
-    print("Error: The 'mcp' package is not installed.", file=sys.stderr)
-    print("Please install it using one of the following methods:", file=sys.stderr)
-    print("1. Run setup_unreal_mcp.bat to install it globally", file=sys.stderr)
-    print("2. Run: pip install mcp", file=sys.stderr)
-    print("3. Run: pip install mcp -t ./python_modules", file=sys.stderr)
-    sys.exit(1)
-
-try:
-    from mcp.server.fastmcp import FastMCP, Context
-except ImportError as e:
-    print(f"Error importing from mcp package: {e}", file=sys.stderr)
-    print("The mcp package is installed but there was an error importing from it.", file=sys.stderr)
-    print("This could be due to a version mismatch or incomplete installation.", file=sys.stderr)
-    print("Please try reinstalling the package using: pip install --upgrade mcp", file=sys.stderr)
-    sys.exit(1)
+with profiler.phase("import mcp.server.fastmcp"):
+    mcp_spec = importlib.util.find_spec("mcp")
+    if mcp_spec is None:
+        print("Error: The 'mcp' package is not installed.", file=sys.stderr)
+        print("Please install it using one of the following methods:", file=sys.stderr)
+        print("1. Run setup_unreal_mcp.bat to install it globally", file=sys.stderr)
+        print("2. Run: pip install mcp", file=sys.stderr)
+        print("3. Run: pip install mcp -t ./python_modules", file=sys.stderr)
+        sys.exit(1)
+
+    try:
+        from mcp.server.fastmcp import FastMCP, Context
+    except ImportError as e:
+        print(f"Error importing from mcp package: {e}", file=sys.stderr)
+        print("The mcp package is installed but there was an error importing from it.", file=sys.stderr)
+        print("This could be due to a version mismatch or incomplete installation.", file=sys.stderr)
+        print("Please try reinstalling the package using: pip install --upgrade mcp", file=sys.stderr)
+        sys.exit(1)
 
 # Initialize the MCP server
-mcp = FastMCP(
-    "UnrealMCP",
-    description="Unreal Engine integration through the Model Context Protocol"
-)
+with profiler.phase("create FastMCP server"):
+    mcp = FastMCP(
+        "UnrealMCP",
+        description="Unreal Engine integration through the Model Context Protocol"
+    )
 
-def send_command(command_type, params=None, timeout=DEFAULT_TIMEOUT):
+def send_command(command_type, params=None, timeout=None):
     """Send a command to the C++ MCP server and return the response.
     
+    Commands reuse a pooled keep-alive connection (see utils.connection), so
+    repeated tool calls don't pay for a new TCP connect each time.
+    
     Args:
         command_type: The type of command to send
         params: Optional parameters for the command
-        timeout: Timeout in seconds (default: DEFAULT_TIMEOUT)
+        timeout: Timeout in seconds (default: the configured timeout, see utils.config)
     
     Returns:
         The JSON response from the server
     """
-    try:
-        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-            s.settimeout(timeout)  # Set a timeout
-            s.connect(("localhost", DEFAULT_PORT))  # Connect to Unreal C++ server
-            command = {
-                "type": command_type,
-                "params": params or {}
-            }
-            s.sendall(json.dumps(command).encode('utf-8'))
-            
-            # Read response with a buffer
-            chunks = []
-            response_data = b''
-            
-            # Wait for data with timeout
-            while True:
-                try:
-                    chunk = s.recv(DEFAULT_BUFFER_SIZE)
-                    if not chunk:  # Connection closed
-                        break
-                    chunks.append(chunk)
-                    
-                    # Try to parse what we have so far
-                    response_data = b''.join(chunks)
-                    try:
-                        # If we can parse it as JSON, we have a complete response
-                        json.loads(response_data.decode('utf-8'))
-                        break
-                    except json.JSONDecodeError:
-                        # Incomplete JSON, continue receiving
-                        continue
-                except socket.timeout:
-                    # If we have some data but timed out, try to use what we have
-                    if response_data:
-                        break
-                    raise
-            
-            if not response_data:
-                raise Exception("No data received from server")
-                
-            return json.loads(response_data.decode('utf-8'))
-    except ConnectionRefusedError:
-        print(f"Error: Could not connect to Unreal MCP server on localhost:{DEFAULT_PORT}.", file=sys.stderr)
-        print("Make sure your Unreal Engine with MCP plugin is running.", file=sys.stderr)
-        raise Exception("Failed to connect to Unreal MCP server: Connection refused")
-    except socket.timeout:
-        print("Error: Connection timed out while communicating with Unreal MCP server.", file=sys.stderr)
-        raise Exception("Failed to communicate with Unreal MCP server: Connection timed out")
-    except Exception as e:
-        print(f"Error communicating with Unreal MCP server: {str(e)}", file=sys.stderr)
-        raise Exception(f"Failed to communicate with Unreal MCP server: {str(e)}")
+    return utils.send_command(command_type, params, timeout)
+
+async def async_send_command(command_type, params=None, timeout=None):
+    """Send a command to the C++ MCP server without blocking the event loop.
+    
+    The awaitable counterpart of send_command for async tools. Concurrent
+    commands are pipelined over one connection and matched to their responses
+    by id (see utils.async_connection), so a slow command doesn't hold up
+    other tool calls.
+    
+    Args:
+        command_type: The type of command to send
+        params: Optional parameters for the command
+        timeout: Timeout in seconds (default: the configured timeout, see utils.config)
+    
+    Returns:
+        The JSON response from the server
+    """
+    return await utils.async_send_command(command_type, params, timeout)
 
 # All commands have been moved to separate modules in the Commands directory
 
-def load_commands():
-    """Load all commands from the Commands directory structure."""
+# Names, signatures and docstrings of the tools, so modules are only imported when first used
+TOOL_MANIFEST_PATH = os.path.join(os.path.dirname(__file__), ".tool_manifest.json")
+
+def _register_module(manifest, key, files, load):
+    """Register a tool module through the manifest, or eagerly without one."""
+    with profiler.phase(key) as details:
+        if manifest is None:
+            load()(mcp)
+            details["mode"] = "eager"
+        else:
+            details["mode"] = manifest.register(mcp, key, files, load)
+        return details["mode"]
+
+def _import_register_all(module_name):
+    """Return a loader that imports a command module and returns its register_all."""
+    def load():
+        module = importlib.import_module(module_name)
+        if not hasattr(module, 'register_all'):
+            raise AttributeError(f"{module_name} has no register_all function")
+        return module.register_all
+    return load
+
+def load_commands(manifest=None):
+    """Load all commands from the Commands directory structure.
+
+    With a ToolManifest, modules whose sources are unchanged since the
+    manifest was written are registered as stubs and imported on first use.
+    """
     commands_dir = os.path.join(os.path.dirname(__file__), 'Commands')
     if not os.path.exists(commands_dir):
         print(f"Commands directory not found at: {commands_dir}", file=sys.stderr)
         return
 
     # First, load Python files directly in the Commands directory
-    for filename in os.listdir(commands_dir):
+    for filename in sorted(os.listdir(commands_dir)):
         if filename.endswith('.py') and not filename.startswith('__'):
             try:
                 module_name = f"Commands.{filename[:-3]}"  # Remove .py extension
-                module = importlib.import_module(module_name)
-                if hasattr(module, 'register_all'):
-                    module.register_all(mcp)
-                    print(f"Registered commands from module: {filename}", file=sys.stderr)
-                else:
-                    print(f"Warning: {filename} has no register_all function", file=sys.stderr)
+                mode = _register_module(manifest, module_name, [os.path.join(commands_dir, filename)],
+                                        _import_register_all(module_name))
+                print(f"Registered commands from module: {filename} ({mode})", file=sys.stderr)
             except Exception as e:
                 print(f"Error loading module {filename}: {e}", file=sys.stderr)
 
     # Then, load command categories from subdirectories
-    for category in os.listdir(commands_dir):
+    for category in sorted(os.listdir(commands_dir)):
         category_path = os.path.join(commands_dir, category)
         if os.path.isdir(category_path) and not category.startswith('__'):
             try:
-                # Try to load the category's __init__.py which should have register_all
+                # The category's __init__.py should have register_all
                 module_name = f"Commands.{category}"
-                module = importlib.import_module(module_name)
-                if hasattr(module, 'register_all'):
-                    module.register_all(mcp)
-                    print(f"Registered commands from category: {category}", file=sys.stderr)
-                else:
-                    print(f"Warning: {category} has no register_all function", file=sys.stderr)
+                files = [os.path.join(root, name) for root, _, names in os.walk(category_path)
+                         for name in names if name.endswith('.py')]
+                mode = _register_module(manifest, module_name, files, _import_register_all(module_name))
+                print(f"Registered commands from category: {category} ({mode})", file=sys.stderr)
             except Exception as e:
                 print(f"Error loading category {category}: {e}", file=sys.stderr)
 
-def load_user_tools():
-    """Load user-defined tools from the UserTools directory."""
+def load_user_tools(manifest=None):
+    """Load user-defined tools from the UserTools directory.
+
+    With a ToolManifest, user tools are loaded lazily like the commands.
+    """
     user_tools_dir = os.path.join(os.path.dirname(__file__), 'UserTools')
     if not os.path.exists(user_tools_dir):
         print(f"User tools directory not found at: {user_tools_dir}", file=sys.stderr)
         return
 
-    for filename in os.listdir(user_tools_dir):
+    helpers = {
+        'send_command': utils.send_command,
+        'async_send_command': utils.async_send_command
+    }
+    for filename in sorted(os.listdir(user_tools_dir)):
         if filename.endswith('.py') and filename != '__init__.py':
             module_name = filename[:-3]
-            try:
-                spec = importlib.util.spec_from_file_location(module_name, os.path.join(user_tools_dir, filename))
+            path = os.path.join(user_tools_dir, filename)
+
+            def load(module_name=module_name, path=path, filename=filename):
+                spec = importlib.util.spec_from_file_location(module_name, path)
                 module = importlib.util.module_from_spec(spec)
                 spec.loader.exec_module(module)
-                if hasattr(module, 'register_tools'):
-                    from utils import send_command
-                    module.register_tools(mcp, {'send_command': send_command})
-                    print(f"Loaded user tool: {module_name}", file=sys.stderr)
-                else:
-                    print(f"Warning: {filename} has no register_tools function", file=sys.stderr)
+                if not hasattr(module, 'register_tools'):
+                    raise AttributeError(f"{filename} has no register_tools function")
+                return lambda server: module.register_tools(server, helpers)
+
+            try:
+                mode = _register_module(manifest, f"UserTools.{module_name}", [path], load)
+                print(f"Loaded user tool: {module_name} ({mode})", file=sys.stderr)
             except Exception as e:
                 print(f"Error loading user tool {filename}: {str(e)}", file=sys.stderr)
 
 def main():
     """Main entry point for the Unreal MCP bridge."""
     print("Starting Unreal MCP bridge...", file=sys.stderr)
+    with profiler.phase("resolve settings"):
+        parser = add_config_arguments(argparse.ArgumentParser(description="Unreal MCP bridge"))
+        parser.add_argument(PROFILE_ARGUMENT, nargs="?", const="-", metavar="PATH",
+                            help=f"Report startup timings to stderr or PATH (env: {PROFILE_ENVIRONMENT_VARIABLE})")
+        args, unknown = parser.parse_known_args()
+        if unknown:
+            print(f"Warning: Ignoring unknown arguments: {' '.join(unknown)}", file=sys.stderr)
+        config = utils.configure(**config_overrides(args))
+    print(f"Using {config.host}:{config.port} (buffer size: {config.buffer_size}, timeout: {config.timeout}s)",
+          file=sys.stderr)
     try:
-        load_commands()  # Load built-in commands
-        load_user_tools()  # Load user-defined tools
+        manifest = ToolManifest(TOOL_MANIFEST_PATH, types={"Context": Context})
+        with profiler.phase("load_commands"):
+            load_commands(manifest)  # Load built-in commands
+        with profiler.phase("load_user_tools"):
+            load_user_tools(manifest)  # Load user-defined tools
+        with profiler.phase("save tool manifest"):
+            manifest.save()
+        profiler.finish()
         mcp.run()  # Start the MCP bridge
     except Exception as e:
         print(f"Error starting MCP bridge: {str(e)}", file=sys.stderr)
@@ -1,84 +1,95 @@
 """Utility functions for the UnrealMCP bridge."""
 
-import json
+import asyncio
 import socket
 import sys
-import os
-
-# Try to get the port from MCPConstants
-DEFAULT_PORT = 13377
-DEFAULT_BUFFER_SIZE = 65536
-DEFAULT_TIMEOUT = 10  # 10 second timeout
-
-try:
-    # Try to read the port from the C++ constants
-    plugin_dir = os.path.abspath(os.path.join(os.path.dirname(os.path.dirname(__file__)), ".."))
-    constants_path = os.path.join(plugin_dir, "Source", "UnrealMCP", "Public", "MCPConstants.h")
-    
-    if os.path.exists(constants_path):
-        with open(constants_path, 'r') as f:
-            constants_content = f.read()
-            
-            # Extract port from MCPConstants
-            port_match = constants_content.find("DEFAULT_PORT = ")
-            if port_match != -1:
-                port_line = constants_content[port_match:].split(';')[0]
-                DEFAULT_PORT = int(port_line.split('=')[1].strip())
-                
-            # Extract buffer size from MCPConstants
-            buffer_match = constants_content.find("DEFAULT_RECEIVE_BUFFER_SIZE = ")
-            if buffer_match != -1:
-                buffer_line = constants_content[buffer_match:].split(';')[0]
-                DEFAULT_BUFFER_SIZE = int(buffer_line.split('=')[1].strip())
-except Exception as e:
-    # If anything goes wrong, use the defaults (which are already defined)
-    print(f"Warning: Could not read constants from MCPConstants.h: {e}", file=sys.stderr)
-
-def send_command(command_type, params=None):
-    """Send a command to the C++ MCP server and return the response."""
+
+from .connection import ConnectionPool
+from .async_connection import AsyncCommandMultiplexer, AsyncConnectionPool
+from .cache import CommandCache, DEFAULT_CACHE_TTL
+from .config import configure, get_config
+from .bulk import (
+    acreate_objects, adelete_objects, amodify_objects, create_objects, delete_objects, modify_objects
+)
+from .scene import (
+    AsyncSceneMirror, SceneMirror, afetch_scene_columns, aiter_scene_actors, fetch_scene_columns, iter_scene_actors
+)
+from .spatial import AsyncSceneSpatialIndex, SceneSpatialIndex, SpatialGrid
+
+# Module attributes that read the current connection settings
+_CONFIG_ATTRIBUTES = {"DEFAULT_HOST": "host", "DEFAULT_PORT": "port", "DEFAULT_BUFFER_SIZE": "buffer_size",
+                      "DEFAULT_TIMEOUT": "timeout"}
+
+
+def __getattr__(name):
+    if name in _CONFIG_ATTRIBUTES:
+        return getattr(get_config(), _CONFIG_ATTRIBUTES[name])
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+_pool = None
+_async_pool = None
+_multiplexer = None
+_cache = None
+
+
+def get_connection_pool():
+    """Return the process-wide pool of keep-alive connections to Unreal."""
+    global _pool
+    if _pool is None:
+        config = get_config()
+        _pool = ConnectionPool(config.host, config.port, config.buffer_size, config.timeout)
+    return _pool
+
+def get_async_connection_pool():
+    """Return the process-wide pool of asyncio connections to Unreal."""
+    global _async_pool
+    if _async_pool is None:
+        config = get_config()
+        _async_pool = AsyncConnectionPool(config.host, config.port, config.buffer_size, config.timeout)
+    return _async_pool
+
+def get_command_multiplexer():
+    """Return the process-wide multiplexer that pipelines async commands on one connection."""
+    global _multiplexer
+    if _multiplexer is None:
+        config = get_config()
+        _multiplexer = AsyncCommandMultiplexer(config.host, config.port, config.buffer_size, config.timeout,
+                                               fallback_pool=get_async_connection_pool())
+    return _multiplexer
+
+def get_command_cache():
+    """Return the process-wide cache of read-only command responses.
+
+    Set its ``ttl`` to change how long responses are kept (0 disables
+    caching); its ``stats`` count hits, misses and invalidations.
+    """
+    global _cache
+    if _cache is None:
+        _cache = CommandCache(DEFAULT_CACHE_TTL)
+    return _cache
+
+def send_command(command_type, params=None, timeout=None):
+    """Send a command to the C++ MCP server and return the response.
+
+    Commands are sent over a shared keep-alive connection instead of a new
+    socket per call. Read-only commands may be answered from the command
+    cache; every other command invalidates it.
+    """
+    cache = get_command_cache()
+    cached = cache.get(command_type, params)
+    if cached is not None:
+        return cached
+    if cache.invalidates(command_type, params):
+        cache.invalidate(command_type)
+    generation = cache.generation
     try:
-        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-            s.settimeout(DEFAULT_TIMEOUT)  # Set a timeout
-            s.connect(("localhost", DEFAULT_PORT))  # Connect to Unreal C++ server
-            command = {
-                "type": command_type,
-                "params": params or {}
-            }
-            s.sendall(json.dumps(command).encode('utf-8'))
-            
-            # Read response with a buffer
-            chunks = []
-            response_data = b''
-            
-            # Wait for data with timeout
-            while True:
-                try:
-                    chunk = s.recv(DEFAULT_BUFFER_SIZE)
-                    if not chunk:  # Connection closed
-                        break
-                    chunks.append(chunk)
-                    
-                    # Try to parse what we have so far
-                    response_data = b''.join(chunks)
-                    try:
-                        # If we can parse it as JSON, we have a complete response
-                        json.loads(response_data.decode('utf-8'))
-                        break
-                    except json.JSONDecodeError:
-                        # Incomplete JSON, continue receiving
-                        continue
-                except socket.timeout:
-                    # If we have some data but timed out, try to use what we have
-                    if response_data:
-                        break
-                    raise
-            
-            if not response_data:
-                raise Exception("No data received from server")
-                
-            return json.loads(response_data.decode('utf-8'))
+        response = get_connection_pool().send_command(command_type, params, timeout)
+        cache.store(command_type, params, response, generation)
+        return response
     except ConnectionRefusedError:
-        print(f"Error: Could not connect to Unreal MCP server on localhost:{DEFAULT_PORT}.", file=sys.stderr)
+        config = get_config()
+        print(f"Error: Could not connect to Unreal MCP server on {config.host}:{config.port}.", file=sys.stderr)
         print("Make sure your Unreal Engine with MCP plugin is running.", file=sys.stderr)
         raise Exception("Failed to connect to Unreal MCP server: Connection refused")
     except socket.timeout:
@@ -87,5 +98,51 @@ def send_command(command_type, params=None):
     except Exception as e:
         print(f"Error communicating with Unreal MCP server: {str(e)}", file=sys.stderr)
         raise Exception(f"Failed to communicate with Unreal MCP server: {str(e)}")
+    finally:
+        # Reads answered while the command was running may already be stale
+        if cache.invalidates(command_type, params):
+            cache.invalidate(command_type)
+
+async def async_send_command(command_type, params=None, timeout=None):
+    """Send a command to the C++ MCP server without blocking the event loop.
+
+    Same responses, errors and caching as send_command, so tools can switch
+    between the two freely. Concurrent calls are pipelined over a single
+    connection when the server supports it.
+    """
+    cache = get_command_cache()
+    cached = cache.get(command_type, params)
+    if cached is not None:
+        return cached
+    if cache.invalidates(command_type, params):
+        cache.invalidate(command_type)
+    generation = cache.generation
+    try:
+        response = await get_command_multiplexer().send_command(command_type, params, timeout)
+        cache.store(command_type, params, response, generation)
+        return response
+    except ConnectionRefusedError:
+        config = get_config()
+        print(f"Error: Could not connect to Unreal MCP server on {config.host}:{config.port}.", file=sys.stderr)
+        print("Make sure your Unreal Engine with MCP plugin is running.", file=sys.stderr)
+        raise Exception("Failed to connect to Unreal MCP server: Connection refused")
+    except asyncio.TimeoutError:
+        print("Error: Connection timed out while communicating with Unreal MCP server.", file=sys.stderr)
+        raise Exception("Failed to communicate with Unreal MCP server: Connection timed out")
+    except asyncio.CancelledError:
+        raise
+    except Exception as e:
+        print(f"Error communicating with Unreal MCP server: {str(e)}", file=sys.stderr)
+        raise Exception(f"Failed to communicate with Unreal MCP server: {str(e)}")
+    finally:
+        # Reads answered while the command was running may already be stale
+        if cache.invalidates(command_type, params):
+            cache.invalidate(command_type)
 
-__all__ = ['send_command'] 
\ No newline at end of file
+__all__ = [
+    'send_command', 'async_send_command', 'get_connection_pool', 'get_async_connection_pool',
+    'get_command_multiplexer', 'get_command_cache', 'get_config', 'configure',
+    'create_objects', 'modify_objects', 'delete_objects', 'acreate_objects', 'amodify_objects', 'adelete_objects',
+    'iter_scene_actors', 'aiter_scene_actors', 'SceneMirror', 'AsyncSceneMirror', 'fetch_scene_columns',
+    'afetch_scene_columns', 'SpatialGrid', 'SceneSpatialIndex', 'AsyncSceneSpatialIndex'
+] 
\ No newline at end of file
@@ -0,0 +1,415 @@
+"""asyncio connections to the Unreal MCP server.
+
+FastMCP runs tools on its event loop, so a tool that blocks on a socket
+stalls every other tool call until the server answers. The classes here talk
+to the server with asyncio streams instead, using the same framing
+negotiation and decoders as utils.connection, so independent commands can be
+in flight at the same time.
+
+AsyncCommandMultiplexer goes further and pipelines many commands over a
+single connection. Each command carries an "id" that the server echoes in
+its response, and replies are routed back to their callers by that id.
+"""
+
+import asyncio
+import collections
+import itertools
+import select
+
+from .protocol import (
+    FRAMING_AUTO, FRAMING_LENGTH_PREFIXED, FRAMING_RAW, SET_PROTOCOL_COMMAND,
+    encode_message, make_decoder
+)
+
+# Upper bound for a single read when the size of the incoming frame is known
+_MAX_READ_SIZE = 4 * 1024 * 1024
+
+
+class _StaleConnection(Exception):
+    """Raised when a connection is closed before any response bytes arrive."""
+
+
+class AsyncUnrealConnection:
+    """A single keep-alive asyncio connection to the Unreal MCP server.
+
+    The asyncio counterpart of utils.connection.UnrealConnection. A
+    connection carries one request/response exchange at a time; use
+    AsyncConnectionPool to run commands concurrently.
+    """
+
+    def __init__(self, host, port, buffer_size=65536, timeout=10, framing=FRAMING_AUTO):
+        self.host = host
+        self.port = port
+        self.buffer_size = buffer_size
+        self.timeout = timeout
+        self.requested_framing = framing
+        self.framing = FRAMING_RAW
+        self.connect_count = 0
+        self._reader = None
+        self._writer = None
+        self._decoder = make_decoder(FRAMING_RAW)
+        self._responses = collections.deque()
+
+    @property
+    def connected(self):
+        return self._writer is not None
+
+    async def connect(self):
+        """Open the underlying stream if it is not already open."""
+        if self._writer is not None:
+            return
+        self._reader, self._writer = await asyncio.open_connection(self.host, self.port)
+        self.connect_count += 1
+        if self.requested_framing != FRAMING_RAW:
+            await self._negotiate_framing()
+
+    async def _negotiate_framing(self):
+        """Ask the server to switch this connection to length-prefixed framing."""
+        request = {
+            "type": SET_PROTOCOL_COMMAND,
+            "params": {"framing": FRAMING_LENGTH_PREFIXED}
+        }
+        self._writer.write(encode_message(request, FRAMING_RAW))
+        try:
+            response = await self._receive()
+        except _StaleConnection:
+            self.close()
+            raise ConnectionError("Connection closed by server during protocol negotiation")
+
+        if response.get("status") == "success":
+            self.framing = FRAMING_LENGTH_PREFIXED
+            self._decoder = make_decoder(FRAMING_LENGTH_PREFIXED)
+            max_frame_size = response.get("result", {}).get("max_frame_size")
+            if max_frame_size:
+                self._decoder.max_frame_size = max_frame_size
+        elif self.requested_framing == FRAMING_LENGTH_PREFIXED:
+            self.close()
+            raise ConnectionError(f"Server does not support length-prefixed framing: {response.get('message')}")
+
+    def close(self):
+        """Close the underlying stream. The next command will reconnect."""
+        if self._writer is None:
+            return
+        try:
+            self._writer.close()
+        except (OSError, RuntimeError):
+            # RuntimeError: the event loop that owned the stream is gone
+            pass
+        self._reader = None
+        self._writer = None
+        self.framing = FRAMING_RAW
+        self._decoder = make_decoder(FRAMING_RAW)
+        self._responses.clear()
+
+    def is_alive(self):
+        """Check whether an idle connection can still be used.
+
+        As in UnrealConnection, an idle connection must have nothing to read:
+        EOF or stray bytes mean it is stale or out of step. EOF the event
+        loop has already seen shows up on the stream; anything still waiting
+        on the socket is found with a non-blocking select.
+        """
+        if self._writer is None or self._responses or self._decoder.pending:
+            return False
+        if self._writer.is_closing() or self._reader.at_eof():
+            return False
+        sock = self._writer.get_extra_info("socket")
+        if sock is None:
+            return False
+        try:
+            readable, _, _ = select.select([sock], [], [], 0)
+        except (OSError, ValueError):
+            return False
+        return not readable
+
+    async def send_command(self, command_type, params=None, timeout=None):
+        """Send a command and wait for its response.
+
+        A command is retried once on a fresh connection if the reused one turns
+        out to be dead before any part of the response arrived.
+
+        Raises:
+            ConnectionRefusedError: If the server is not listening.
+            asyncio.TimeoutError: If the server did not answer in time.
+            ConnectionError: If the connection was closed mid-response.
+        """
+        timeout = self.timeout if timeout is None else timeout
+        return await asyncio.wait_for(self._exchange(command_type, params), timeout)
+
+    async def _exchange(self, command_type, params):
+        command = {
+            "type": command_type,
+            "params": params or {}
+        }
+
+        if self._writer is not None and not self.is_alive():
+            self.close()
+
+        for attempt in range(2):
+            reused = self._writer is not None
+            try:
+                await self.connect()
+                self._writer.write(encode_message(command, self.framing))
+                await self._writer.drain()
+                return await self._receive()
+            except _StaleConnection:
+                self.close()
+                if not reused or attempt:
+                    raise ConnectionError("Connection closed by server before a response was received")
+            except BaseException:
+                # Includes cancellation by a timeout: a late response may still
+                # arrive, so never hand this stream to another command.
+                self.close()
+                raise
+
+    async def _receive(self):
+        """Read until the decoder yields the next complete response."""
+        received = False
+        while not self._responses:
+            try:
+                chunk = await self._reader.read(self._read_size())
+            except ConnectionResetError:
+                chunk = b''
+            if not chunk:  # Connection closed
+                if not received:
+                    raise _StaleConnection()
+                raise ConnectionError("Connection closed by server in the middle of a response")
+            received = True
+            self._responses.extend(self._decoder.feed(chunk))
+        return self._responses.popleft()
+
+    def _read_size(self):
+        if self.framing == FRAMING_LENGTH_PREFIXED:
+            return max(self.buffer_size, min(self._decoder.bytes_needed, _MAX_READ_SIZE))
+        return self.buffer_size
+
+
+class AsyncConnectionPool:
+    """A pool of keep-alive asyncio connections to the Unreal MCP server.
+
+    Each command borrows its own connection, so concurrent tool calls run as
+    separate exchanges instead of queueing behind each other. The server
+    services every connected client on each tick. Connections belong to the
+    event loop that opened them; the pool starts afresh if it is used from a
+    different loop.
+    """
+
+    def __init__(self, host, port, buffer_size=65536, timeout=10, max_idle=8, framing=FRAMING_AUTO):
+        self.host = host
+        self.port = port
+        self.buffer_size = buffer_size
+        self.timeout = timeout
+        self.max_idle = max_idle
+        self.framing = framing
+        self._idle = []
+        self._loop = None
+        self.stats = {"connections_opened": 0, "commands": 0, "reused": 0}
+
+    def _check_loop(self):
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            self.close()
+            self._loop = loop
+
+    def acquire(self):
+        """Take an idle connection from the pool or create a new one."""
+        self._check_loop()
+        while self._idle:
+            connection = self._idle.pop()
+            if connection.is_alive():
+                self.stats["reused"] += 1
+                return connection
+            connection.close()
+        return AsyncUnrealConnection(self.host, self.port, self.buffer_size, self.timeout, self.framing)
+
+    def release(self, connection):
+        """Return a connection to the pool, closing it if the pool is full."""
+        if not connection.connected:
+            return
+        if len(self._idle) < self.max_idle:
+            self._idle.append(connection)
+        else:
+            connection.close()
+
+    async def send_command(self, command_type, params=None, timeout=None):
+        """Send a command over a pooled connection and return the response."""
+        connection = self.acquire()
+        connect_count = connection.connect_count
+        try:
+            return await connection.send_command(command_type, params, timeout)
+        finally:
+            self.stats["commands"] += 1
+            self.stats["connections_opened"] += connection.connect_count - connect_count
+            self.release(connection)
+
+    def close(self):
+        """Close every idle connection."""
+        idle, self._idle = self._idle, []
+        for connection in idle:
+            connection.close()
+
+
+class AsyncCommandMultiplexer:
+    """Pipeline concurrent commands over one connection to the Unreal MCP server.
+
+    Every command is written as soon as it is issued, tagged with a unique
+    "id". A reader task matches each response to its waiting caller by the
+    echoed id. Responses without an id (e.g. "Invalid JSON format") go to the
+    oldest outstanding command, since the server answers in order.
+
+    Pipelining needs length-prefixed framing: in raw framing the server
+    treats each recv as one command, so back-to-back commands would be glued
+    together. If the server does not support length-prefixed framing, commands
+    are sent through ``fallback_pool`` instead, one connection per in-flight
+    command.
+    """
+
+    def __init__(self, host, port, buffer_size=65536, timeout=10, framing=FRAMING_AUTO, fallback_pool=None):
+        self.host = host
+        self.port = port
+        self.buffer_size = buffer_size
+        self.timeout = timeout
+        self.framing = framing
+        self.fallback_pool = fallback_pool or AsyncConnectionPool(host, port, buffer_size, timeout, framing=framing)
+        # None until the first connection tells us whether the server can pipeline
+        self.pipelining = None
+        self._connection = None
+        self._reader_task = None
+        self._pending = {}
+        self._ids = itertools.count(1)
+        self._loop = None
+        self._connect_lock = None
+        self._write_lock = None
+        self.stats = {"commands": 0, "connections_opened": 0, "max_in_flight": 0}
+
+    def _check_loop(self):
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            self._reset()
+            self._loop = loop
+            self._connect_lock = asyncio.Lock()
+            self._write_lock = asyncio.Lock()
+
+    def _reset(self):
+        if self._reader_task is not None and not self._reader_task.done():
+            try:
+                self._reader_task.cancel()
+            except RuntimeError:
+                # The event loop that owned the task is gone
+                pass
+        self._reader_task = None
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+        pending, self._pending = self._pending, {}
+        for future in pending.values():
+            if not future.done():
+                try:
+                    future.set_exception(ConnectionError("Connection closed"))
+                except RuntimeError:
+                    pass
+
+    async def _ensure_connected(self):
+        """Open the shared connection if needed. Returns False if the server cannot pipeline."""
+        async with self._connect_lock:
+            if self._connection is not None:
+                return True
+            if self.pipelining is False:
+                return False
+            connection = AsyncUnrealConnection(self.host, self.port, self.buffer_size, self.timeout, self.framing)
+            try:
+                await asyncio.wait_for(connection.connect(), self.timeout)
+            except BaseException:
+                connection.close()
+                raise
+            self.stats["connections_opened"] += 1
+            if connection.framing != FRAMING_LENGTH_PREFIXED:
+                connection.close()
+                self.pipelining = False
+                return False
+            self.pipelining = True
+            self._connection = connection
+            self._reader_task = asyncio.get_running_loop().create_task(self._read_responses(connection))
+            return True
+
+    async def send_command(self, command_type, params=None, timeout=None):
+        """Send a command and wait for its response.
+
+        A command is retried once on a fresh connection if the shared one was
+        closed cleanly before its response arrived, which happens when the
+        server drops an idle client just as a command is sent.
+
+        Raises:
+            ConnectionRefusedError: If the server is not listening.
+            asyncio.TimeoutError: If the server did not answer in time.
+            ConnectionError: If the connection was lost.
+        """
+        self._check_loop()
+        timeout = self.timeout if timeout is None else timeout
+
+        for attempt in range(2):
+            if self.pipelining is False or not await self._ensure_connected():
+                return await self.fallback_pool.send_command(command_type, params, timeout)
+            try:
+                return await self._send_pipelined(self._connection, command_type, params, timeout)
+            except _StaleConnection:
+                if attempt:
+                    raise ConnectionError("Connection closed by server before a response was received")
+
+    async def _send_pipelined(self, connection, command_type, params, timeout):
+        request_id = next(self._ids)
+        command = {
+            "type": command_type,
+            "params": params or {},
+            "id": request_id
+        }
+        future = asyncio.get_running_loop().create_future()
+        self._pending[request_id] = future
+        self.stats["commands"] += 1
+        self.stats["max_in_flight"] = max(self.stats["max_in_flight"], len(self._pending))
+        try:
+            async with self._write_lock:
+                connection._writer.write(encode_message(command, FRAMING_LENGTH_PREFIXED))
+                await connection._writer.drain()
+            # A late response to a timed out command is simply dropped by the reader
+            return await asyncio.wait_for(future, timeout)
+        finally:
+            self._pending.pop(request_id, None)
+
+    async def _read_responses(self, connection):
+        """Route responses from the shared connection to their callers."""
+        error = _StaleConnection()
+        try:
+            while True:
+                response = await connection._receive()
+                if "id" in response:
+                    future = self._pending.pop(response["id"], None)
+                elif self._pending:
+                    future = self._pending.pop(next(iter(self._pending)))
+                else:
+                    future = None
+                if future is not None and not future.done():
+                    future.set_result(response)
+        except _StaleConnection:
+            pass
+        except asyncio.CancelledError:
+            error = ConnectionError("Connection closed")
+            raise
+        except Exception as e:
+            error = e if isinstance(e, ConnectionError) else ConnectionError(str(e))
+        finally:
+            connection.close()
+            if self._connection is connection:
+                self._connection = None
+                pending, self._pending = self._pending, {}
+                for future in pending.values():
+                    if not future.done():
+                        future.set_exception(error)
+
+    def close(self):
+        """Close the shared connection and the fallback pool."""
+        self._reset()
+        self.fallback_pool.close()
+
+
+__all__ = ['AsyncUnrealConnection', 'AsyncConnectionPool', 'AsyncCommandMultiplexer']
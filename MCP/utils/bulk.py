@@ -0,0 +1,258 @@
+"""Helpers for changing many actors of an Unreal scene with one command.
+
+create_objects spawns one actor per location in a single request instead of
+one create_object request per actor, modify_objects sets or offsets the
+transforms of many actors at once and delete_objects deletes a list of
+actors or every actor matching a filter. Per-actor vectors can be lists of
+[x, y, z] or (N, 3) NumPy arrays. Either way they are sent as a column of
+base64 packed float64 triples, which keeps a request for ten thousand
+actors small without rounding transforms the way the float32 columns of
+get_scene_info snapshots do. Requests larger than
+MAX_OBJECTS_PER_BULK_COMMAND are split into several commands.
+"""
+
+import array
+import base64
+import numbers
+import sys
+
+# Mirror of MCPConstants::MAX_OBJECTS_PER_BULK_COMMAND
+MAX_OBJECTS_PER_BULK_COMMAND = 100000
+
+# Precision of packed vector columns sent by the bulk commands
+VECTOR_COLUMN_DTYPE = "float64"
+
+
+def encode_vector_column(vectors):
+    """Pack [x, y, z] vectors into a column of little-endian float64 triples.
+
+    Args:
+        vectors: An (N, 3) NumPy array or a sequence of [x, y, z] sequences
+
+    Returns:
+        The packed vectors as {"dtype": "float64", "data": <base64>}, as accepted by the bulk commands
+
+    Raises:
+        ValueError: If a vector does not have three components
+    """
+    if hasattr(vectors, "tobytes"):
+        # NumPy array: convert the whole array at once instead of element by element
+        if vectors.ndim != 2 or vectors.shape[1] != 3:
+            raise ValueError(f"Expected an (N, 3) array, got shape {vectors.shape}")
+        return _vector_column(vectors.astype("<f8").tobytes())
+
+    column = array.array("d")
+    for vector in vectors:
+        if len(vector) != 3:
+            raise ValueError(f"Expected [x, y, z], got {list(vector)}")
+        column.extend(float(component) for component in vector)
+    if sys.byteorder != "little":
+        column.byteswap()
+    return _vector_column(column.tobytes())
+
+
+def _vector_column(packed):
+    return {"dtype": VECTOR_COLUMN_DTYPE, "data": base64.b64encode(packed).decode("ascii")}
+
+
+def _single_vector_column(vectors):
+    """Wrap a lone [x, y, z] (a list or a NumPy array of shape (3,)) as a column with one entry."""
+    if vectors is None:
+        return None
+    if hasattr(vectors, "tobytes"):
+        return vectors.reshape(1, 3) if vectors.shape == (3,) else vectors
+    if len(vectors) == 3 and all(isinstance(component, numbers.Real) for component in vectors):
+        return [vectors]
+    return vectors
+
+
+def _chunked_params(params, count, vectors, lists, chunk_size):
+    """Yield the parameters of each command of at most chunk_size actors.
+
+    vectors holds the per-actor vector columns, which are packed; lists holds
+    the other per-actor columns. A vector column with a single entry applies
+    to every actor and is sent unchanged with every chunk.
+    """
+    for name, values in {**vectors, **lists}.items():
+        if values is not None and len(values) != count and not (name in vectors and len(values) == 1):
+            raise ValueError(f"Expected {count} {name}, got {len(values)}")
+
+    for start in range(0, count, chunk_size):
+        end = start + chunk_size
+        chunk = dict(params)
+        for name, values in vectors.items():
+            if values is not None:
+                chunk[name] = encode_vector_column(values if len(values) == 1 else values[start:end])
+        for name, values in lists.items():
+            if values is not None:
+                chunk[name] = list(values[start:end])
+        yield chunk
+
+
+def _create_objects_commands(actor_type, locations, rotations, scales, labels, mesh, chunk_size):
+    count = len(locations)
+    if count == 0:
+        raise ValueError("No locations given")
+    if any(values is not None and len(values) != count for values in (rotations, scales)):
+        raise ValueError("Expected one rotation and scale per location")
+    params = {"type": actor_type}
+    if mesh:
+        params["mesh"] = mesh
+    vectors = {"locations": locations, "rotations": rotations, "scales": scales}
+    return _chunked_params(params, count, vectors, {"labels": labels}, chunk_size)
+
+
+def _modify_objects_commands(names, locations, rotations, scales, relative, chunk_size):
+    if len(names) == 0:
+        raise ValueError("No names given")
+    if locations is None and rotations is None and scales is None:
+        raise ValueError("No modifications specified")
+    # A single [x, y, z] applies to every actor, like a column with one entry
+    vectors = {name: _single_vector_column(values)
+               for name, values in (("locations", locations), ("rotations", rotations), ("scales", scales))}
+    return _chunked_params({"relative": relative}, len(names), vectors, {"names": names}, chunk_size)
+
+
+def _delete_objects_commands(names, actor_filter, dry_run, chunk_size):
+    if (names is None) == (actor_filter is None):
+        raise ValueError("Provide either names or a filter")
+    if actor_filter is not None:
+        return [{"filter": actor_filter, "dry_run": dry_run}]
+    return _chunked_params({"dry_run": dry_run}, len(names), {}, {"names": names}, chunk_size)
+
+
+def _merge_result(command, total, response):
+    """Add the counts and lists of one command's result to the totals."""
+    if response["status"] != "success":
+        raise Exception(f"{command} failed: {response.get('message')}")
+    for key, value in response["result"].items():
+        if isinstance(value, bool):
+            total[key] = value
+        elif isinstance(value, list):
+            total.setdefault(key, []).extend(value)
+        else:
+            total[key] = total.get(key, 0) + value
+
+
+def create_objects(send_command=None, actor_type="cube", locations=(), rotations=None, scales=None, labels=None,
+                   mesh=None, chunk_size=MAX_OBJECTS_PER_BULK_COMMAND):
+    """Spawn one actor per location with create_objects.
+
+    Args:
+        send_command: Function used to send commands (default: utils.send_command)
+        actor_type: 'cube' or 'StaticMeshActor'
+        locations: (N, 3) NumPy array or sequence of [x, y, z]
+        rotations: Optional per-actor [pitch, yaw, roll], like locations
+        scales: Optional per-actor scales, like locations
+        labels: Optional per-actor labels
+        mesh: Static mesh path for 'StaticMeshActor'
+        chunk_size: Largest number of actors sent in one command
+
+    Returns:
+        dict with 'created' and 'failed' counts and 'names', the actor name for
+        each location (None where spawning failed)
+
+    Raises:
+        ValueError: If the per-actor arrays do not have one entry per location
+        Exception: If the server returns an error
+    """
+    if send_command is None:
+        from . import send_command
+    total = {"created": 0, "failed": 0, "names": []}
+    for params in _create_objects_commands(actor_type, locations, rotations, scales, labels, mesh, chunk_size):
+        _merge_result("create_objects", total, send_command("create_objects", params))
+    return total
+
+
+async def acreate_objects(async_send_command=None, actor_type="cube", locations=(), rotations=None, scales=None,
+                          labels=None, mesh=None, chunk_size=MAX_OBJECTS_PER_BULK_COMMAND):
+    """Async counterpart of create_objects."""
+    if async_send_command is None:
+        from . import async_send_command
+    total = {"created": 0, "failed": 0, "names": []}
+    for params in _create_objects_commands(actor_type, locations, rotations, scales, labels, mesh, chunk_size):
+        _merge_result("create_objects", total, await async_send_command("create_objects", params))
+    return total
+
+
+def modify_objects(send_command=None, names=(), locations=None, rotations=None, scales=None, relative=False,
+                   chunk_size=MAX_OBJECTS_PER_BULK_COMMAND):
+    """Set or offset the transforms of many actors with modify_objects.
+
+    Each command is applied in one pass and is undone in the editor as one step.
+
+    Args:
+        send_command: Function used to send commands (default: utils.send_command)
+        names: Names or labels of the actors
+        locations: (N, 3) NumPy array or sequence of [x, y, z], one per name, or a single [x, y, z] for all
+        rotations: [pitch, yaw, roll] per name or for all, like locations
+        scales: Scale per name or for all, like locations
+        relative: Add locations and rotations to the current ones and multiply the current scales
+        chunk_size: Largest number of actors sent in one command
+
+    Returns:
+        dict with the 'modified' count and the 'not_found' names
+
+    Raises:
+        ValueError: If no transform is given or a column does not match the names
+        Exception: If the server returns an error
+    """
+    if send_command is None:
+        from . import send_command
+    total = {"modified": 0, "not_found": []}
+    for params in _modify_objects_commands(names, locations, rotations, scales, relative, chunk_size):
+        _merge_result("modify_objects", total, send_command("modify_objects", params))
+    return total
+
+
+async def amodify_objects(async_send_command=None, names=(), locations=None, rotations=None, scales=None,
+                          relative=False, chunk_size=MAX_OBJECTS_PER_BULK_COMMAND):
+    """Async counterpart of modify_objects."""
+    if async_send_command is None:
+        from . import async_send_command
+    total = {"modified": 0, "not_found": []}
+    for params in _modify_objects_commands(names, locations, rotations, scales, relative, chunk_size):
+        _merge_result("modify_objects", total, await async_send_command("modify_objects", params))
+    return total
+
+
+def delete_objects(send_command=None, names=None, actor_filter=None, dry_run=False,
+                   chunk_size=MAX_OBJECTS_PER_BULK_COMMAND):
+    """Delete a list of actors, or every actor matching a filter, with delete_objects.
+
+    Args:
+        send_command: Function used to send commands (default: utils.send_command)
+        names: Names or labels of the actors to delete
+        actor_filter: A query_actors filter, e.g. {"label": "Gen_*", "tag": "Generated"}, instead of names
+        dry_run: Only report what would be deleted; the result then lists the matching 'names'
+        chunk_size: Largest number of names sent in one command
+
+    Returns:
+        dict with the 'matched' and (unless dry_run) 'deleted' counts and the
+        'not_found', 'skipped' and 'failed' names
+
+    Raises:
+        ValueError: If neither or both of names and actor_filter are given
+        Exception: If the server returns an error
+    """
+    if send_command is None:
+        from . import send_command
+    total = {"dry_run": dry_run, "matched": 0}
+    for params in _delete_objects_commands(names, actor_filter, dry_run, chunk_size):
+        _merge_result("delete_objects", total, send_command("delete_objects", params))
+    return total
+
+
+async def adelete_objects(async_send_command=None, names=None, actor_filter=None, dry_run=False,
+                          chunk_size=MAX_OBJECTS_PER_BULK_COMMAND):
+    """Async counterpart of delete_objects."""
+    if async_send_command is None:
+        from . import async_send_command
+    total = {"dry_run": dry_run, "matched": 0}
+    for params in _delete_objects_commands(names, actor_filter, dry_run, chunk_size):
+        _merge_result("delete_objects", total, await async_send_command("delete_objects", params))
+    return total
+
+
+__all__ = ['encode_vector_column', 'create_objects', 'acreate_objects', 'modify_objects', 'amodify_objects',
+           'delete_objects', 'adelete_objects', 'MAX_OBJECTS_PER_BULK_COMMAND', 'VECTOR_COLUMN_DTYPE']
@@ -0,0 +1,269 @@
+"""Caches for read-only commands sent to the Unreal MCP server.
+
+Agents tend to ask for the same scene information several times per step,
+and every get_scene_info walks the whole world on the game thread. This
+module keeps successful responses to read-only commands for a few seconds
+and drops them as soon as any other command (which may change the level or
+its assets) goes through the bridge.
+
+Asset information (get_material_info, ...) is also kept per asset path by
+AssetInfoCache, for as long as the server's change stamp says the asset has
+not changed, so scene edits in between do not throw it away. Commands that
+can edit any asset without the bridge knowing which (batch, execute_python)
+drop it all.
+"""
+
+import copy
+import json
+import threading
+import time
+
+DEFAULT_CACHE_TTL = 2.0
+
+# How long AssetInfoCache serves asset information from servers that do not send change stamps
+DEFAULT_ASSET_CACHE_TTL = 30.0
+
+# Commands whose responses only depend on their params and the editor state
+CACHEABLE_COMMANDS = frozenset({"get_scene_info", "query_actors", "get_material_info", "get_blueprint_info"})
+
+# Read-only commands that are never cached; get_scene_changes must always see the latest version
+UNCACHED_READ_COMMANDS = frozenset({"get_scene_changes"})
+
+# Commands that may change assets the bridge cannot name; they drop every AssetInfoCache attached to the command cache
+ASSET_EDITING_COMMANDS = frozenset({"batch", "execute_python"})
+
+
+class CommandCache:
+    """TTL cache of responses keyed by command type and params.
+
+    Every command that is not in ``cacheable_commands`` or ``uncached_reads``
+    (create_object, modify_object, delete_object, execute_python, batch, ...)
+    invalidates the whole cache when it is sent and again when its response
+    arrives, unless it is a ``dry_run`` that changes nothing. Revalidations
+    with ``if_none_match`` are left to AssetInfoCache and never cached. A read
+    that was in flight across an invalidation is not stored, so a response
+    from before a change can never be served after it. A ``ttl`` of 0
+    disables caching.
+
+    Callbacks added with add_listener are called on every invalidation, so
+    other bridge-side state derived from the scene (such as the spatial
+    index) can tell when it may be out of date. A listener added with
+    ``commands`` is only called for invalidations caused by those commands
+    and for explicit invalidate() calls.
+    """
+
+    def __init__(self, ttl=DEFAULT_CACHE_TTL, cacheable_commands=CACHEABLE_COMMANDS,
+                 uncached_reads=UNCACHED_READ_COMMANDS):
+        self.ttl = ttl
+        self.cacheable_commands = frozenset(cacheable_commands)
+        self.uncached_reads = frozenset(uncached_reads)
+        self.generation = 0
+        self._entries = {}
+        self._lock = threading.Lock()
+        # invalidations counts the times cached responses were actually dropped
+        self.stats = {"hits": 0, "misses": 0, "invalidations": 0}
+        self._listeners = []
+
+    def _key(self, command_type, params):
+        return command_type, json.dumps(params or {}, sort_keys=True)
+
+    def _caches(self, command_type, params):
+        if command_type not in self.cacheable_commands or self.ttl <= 0:
+            return False
+        # Stamped revalidations are answered per asset by AssetInfoCache
+        return not (params and "if_none_match" in params)
+
+    def get(self, command_type, params=None):
+        """Return a copy of the cached response, or None on a miss."""
+        if not self._caches(command_type, params):
+            return None
+        with self._lock:
+            entry = self._entries.get(self._key(command_type, params))
+            if entry is None or time.monotonic() - entry[0] > self.ttl:
+                self.stats["misses"] += 1
+                return None
+            self.stats["hits"] += 1
+            response = entry[1]
+        # Callers are free to modify what they get back
+        return copy.deepcopy(response)
+
+    def store(self, command_type, params, response, generation):
+        """Cache a successful response that was requested at ``generation``."""
+        if not self._caches(command_type, params):
+            return
+        if response.get("status") != "success":
+            return
+        result = response.get("result")
+        if isinstance(result, dict) and result.get("not_modified"):
+            return
+        with self._lock:
+            if generation != self.generation:
+                return
+            self._entries[self._key(command_type, params)] = (time.monotonic(), copy.deepcopy(response))
+
+    def invalidate(self, command_type=None):
+        """Drop every cached response and notify the listeners.
+
+        Args:
+            command_type: The command that caused the invalidation, if any
+        """
+        with self._lock:
+            self.generation += 1
+            if self._entries:
+                self._entries.clear()
+                self.stats["invalidations"] += 1
+            listeners = [callback for callback, commands in self._listeners
+                         if commands is None or command_type is None or command_type in commands]
+        for listener in listeners:
+            listener()
+
+    def add_listener(self, callback, commands=None):
+        """Call ``callback()`` whenever the cache is invalidated.
+
+        Args:
+            callback: Function called without arguments
+            commands: Only call it for invalidations caused by these commands (default: all)
+        """
+        with self._lock:
+            self._listeners.append((callback, None if commands is None else frozenset(commands)))
+
+    def remove_listener(self, callback):
+        """Stop calling a callback added with add_listener."""
+        with self._lock:
+            self._listeners = [entry for entry in self._listeners if entry[0] != callback]
+
+    def invalidates(self, command_type, params=None):
+        """Whether sending ``command_type`` with ``params`` must invalidate the cache."""
+        if params and params.get("dry_run"):
+            return False
+        return command_type not in self.cacheable_commands and command_type not in self.uncached_reads
+
+
+def asset_object_path(path):
+    """Return the object path of an asset ('/Game/Dir/Name' -> '/Game/Dir/Name.Name')."""
+    name = path.rsplit("/", 1)[-1]
+    return path if "." in name else f"{path}.{name}"
+
+
+class AssetInfoCache:
+    """Cache of the info command of one asset type, keyed by asset path.
+
+    ``info_command`` (e.g. get_material_info) takes the asset path in its
+    ``path_param`` parameter.
+
+    The server stamps every info response with the asset's change stamp. A
+    cached asset is read again with ``if_none_match`` set to its stamp, and
+    the server answers ``not_modified`` without loading the asset or dumping
+    its properties while the asset is unchanged, including across edits of
+    the level. Responses without a stamp (older servers) are served locally
+    for ``unstamped_ttl`` seconds.
+
+    Call invalidate(path) when a command changes an asset; invalidate() drops
+    everything. attach() does the latter whenever a batch or execute_python
+    command goes through the bridge's command cache. A read that was in flight across an invalidation is not
+    stored. ``stats`` counts 'hits' (answered locally), 'revalidated'
+    (confirmed unchanged by the server) and 'misses' (read in full).
+    """
+
+    def __init__(self, info_command, path_param="path", unstamped_ttl=DEFAULT_ASSET_CACHE_TTL):
+        self.info_command = info_command
+        self.path_param = path_param
+        self.unstamped_ttl = unstamped_ttl
+        self.generation = 0
+        # object path -> (time stored, stamp or None, result)
+        self._entries = {}
+        self._lock = threading.Lock()
+        self.stats = {"hits": 0, "revalidated": 0, "misses": 0}
+
+    def _lookup(self, path):
+        """Return (cached response, params of the request to send, generation); one of the first two is None."""
+        key = asset_object_path(path)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                stored, stamp, result = entry
+                if stamp is not None:
+                    return None, {self.path_param: key, "if_none_match": stamp}, self.generation
+                if time.monotonic() - stored <= self.unstamped_ttl:
+                    self.stats["hits"] += 1
+                    return {"status": "success", "result": copy.deepcopy(result)}, None, self.generation
+                del self._entries[key]
+            return None, {self.path_param: path}, self.generation
+
+    def _update(self, path, response, generation):
+        """Store a fresh response or answer a not_modified one from the cache."""
+        key = asset_object_path(path)
+        with self._lock:
+            if response.get("status") != "success":
+                self._entries.pop(key, None)
+                return response
+            result = response["result"]
+            entry = self._entries.get(key)
+            if result.get("not_modified"):
+                if entry is None or entry[1] != result.get("stamp"):
+                    return response
+                self.stats["revalidated"] += 1
+                return {"status": "success", "result": copy.deepcopy(entry[2])}
+            self.stats["misses"] += 1
+            if generation == self.generation:
+                self._entries[key] = (time.monotonic(), result.get("stamp"), copy.deepcopy(result))
+        return response
+
+    def get(self, send_command, path):
+        """Return the info response for an asset, asking the server only what it has to."""
+        cached, params, generation = self._lookup(path)
+        if cached is not None:
+            return cached
+        response = self._update(path, send_command(self.info_command, params), generation)
+        if response["status"] == "success" and response["result"].get("not_modified"):
+            # The entry was dropped while the request was in flight
+            response = self._update(path, send_command(self.info_command, {self.path_param: path}), generation)
+        return response
+
+    async def aget(self, async_send_command, path):
+        """Async counterpart of get."""
+        cached, params, generation = self._lookup(path)
+        if cached is not None:
+            return cached
+        response = self._update(path, await async_send_command(self.info_command, params), generation)
+        if response["status"] == "success" and response["result"].get("not_modified"):
+            # The entry was dropped while the request was in flight
+            response = self._update(path, await async_send_command(self.info_command, {self.path_param: path}), generation)
+        return response
+
+    def invalidate(self, path=None):
+        """Drop the cached info of one asset, or of every asset if path is None."""
+        with self._lock:
+            self.generation += 1
+            if path is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(asset_object_path(path), None)
+
+    def attach(self, cache=None, commands=ASSET_EDITING_COMMANDS):
+        """Drop every cached asset whenever one of ``commands`` invalidates the command cache.
+
+        Args:
+            cache: CommandCache to listen to (default: utils.get_command_cache())
+            commands: Commands that may change assets without saying which
+
+        Returns:
+            This cache, so it can be attached where it is created
+        """
+        if cache is None:
+            from . import get_command_cache
+            cache = get_command_cache()
+        cache.add_listener(self.invalidate, commands)
+        return self
+
+    def detach(self, cache=None):
+        """Stop listening to the command cache."""
+        if cache is None:
+            from . import get_command_cache
+            cache = get_command_cache()
+        cache.remove_listener(self.invalidate)
+
+
+__all__ = ['CommandCache', 'AssetInfoCache', 'asset_object_path', 'CACHEABLE_COMMANDS', 'UNCACHED_READ_COMMANDS',
+           'ASSET_EDITING_COMMANDS',
+           'DEFAULT_CACHE_TTL', 'DEFAULT_ASSET_CACHE_TTL']
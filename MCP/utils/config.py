@@ -0,0 +1,180 @@
+"""Connection settings of the bridge, resolved once for every transport.
+
+The port and buffer size default to the values in the plugin's
+Source/UnrealMCP/Public/MCPConstants.h, so the bridge follows the C++
+server when they change. Environment variables (UNREAL_MCP_HOST,
+UNREAL_MCP_PORT, UNREAL_MCP_TIMEOUT, UNREAL_MCP_BUFFER_SIZE) override the
+header, and command line options (--host, --port, --timeout,
+--buffer-size) override both.
+
+The header is parsed at most once per change: read_constants caches its
+values keyed by the file's modification time and size, and get_config
+resolves the settings on first use, so importing the bridge and its
+command modules does not touch the header at all.
+"""
+
+import os
+import re
+import sys
+import threading
+
+DEFAULT_HOST = "localhost"
+DEFAULT_PORT = 13377
+DEFAULT_BUFFER_SIZE = 65536
+DEFAULT_TIMEOUT = 10  # 10 second timeout
+
+# Plugin root is two levels above this package (MCP/utils -> MCP -> plugin)
+DEFAULT_CONSTANTS_PATH = os.path.abspath(os.path.join(
+    os.path.dirname(__file__), "..", "..", "Source", "UnrealMCP", "Public", "MCPConstants.h"))
+
+# Setting -> environment variable that overrides it
+ENVIRONMENT_VARIABLES = {
+    "host": "UNREAL_MCP_HOST",
+    "port": "UNREAL_MCP_PORT",
+    "timeout": "UNREAL_MCP_TIMEOUT",
+    "buffer_size": "UNREAL_MCP_BUFFER_SIZE"
+}
+
+# Setting -> MCPConstants.h constant it defaults to
+HEADER_CONSTANTS = {
+    "port": "DEFAULT_PORT",
+    "buffer_size": "DEFAULT_RECEIVE_BUFFER_SIZE"
+}
+
+_CONSTANT_PATTERN = re.compile(r"constexpr\s+[\w:]+\s+(\w+)\s*=\s*([-+]?[\d.]+)[fF]?\s*;")
+
+_SETTING_TYPES = {"host": str, "port": int, "timeout": float, "buffer_size": int}
+
+_header_cache = {}
+_config = None
+_lock = threading.Lock()
+
+
+class BridgeConfig:
+    """Resolved connection settings.
+
+    ``sources`` tells where each setting came from: 'default', 'header',
+    'env' or 'cli'.
+    """
+
+    __slots__ = ("host", "port", "timeout", "buffer_size", "sources")
+
+    def __init__(self, host=DEFAULT_HOST, port=DEFAULT_PORT, timeout=DEFAULT_TIMEOUT,
+                 buffer_size=DEFAULT_BUFFER_SIZE, sources=None):
+        self.host = host
+        self.port = port
+        self.timeout = timeout
+        self.buffer_size = buffer_size
+        self.sources = sources or {name: "default" for name in _SETTING_TYPES}
+
+    def as_dict(self):
+        return {name: getattr(self, name) for name in _SETTING_TYPES}
+
+    def __repr__(self):
+        settings = ", ".join(f"{name}={getattr(self, name)!r}" for name in _SETTING_TYPES)
+        return f"BridgeConfig({settings})"
+
+
+def read_constants(path=DEFAULT_CONSTANTS_PATH):
+    """Return the numeric constexpr constants of a C++ header as a name -> number dict.
+
+    Values are cached by the header's modification time and size, so a
+    header is only read again after it changed. A missing or unreadable
+    header gives an empty dict.
+    """
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return {}
+    key = (stat.st_mtime_ns, stat.st_size)
+    cached = _header_cache.get(path)
+    if cached is not None and cached[0] == key:
+        return dict(cached[1])
+    constants = {}
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            content = f.read()
+        for name, value in _CONSTANT_PATTERN.findall(content):
+            constants[name] = float(value) if "." in value else int(value)
+    except (OSError, ValueError) as e:
+        print(f"Warning: Could not read constants from {os.path.basename(path)}: {e}", file=sys.stderr)
+    _header_cache[path] = (key, constants)
+    return dict(constants)
+
+
+def resolve_config(overrides=None, environ=None, constants_path=DEFAULT_CONSTANTS_PATH):
+    """Merge defaults, header constants, environment variables and overrides.
+
+    Args:
+        overrides: Settings given on the command line; None values are ignored
+        environ: Environment to read (default: os.environ)
+        constants_path: Path of MCPConstants.h
+
+    Returns:
+        A BridgeConfig
+    """
+    environ = os.environ if environ is None else environ
+    config = BridgeConfig()
+    constants = read_constants(constants_path)
+    for name, constant in HEADER_CONSTANTS.items():
+        if constant in constants:
+            setattr(config, name, _SETTING_TYPES[name](constants[constant]))
+            config.sources[name] = "header"
+    for name, variable in ENVIRONMENT_VARIABLES.items():
+        value = environ.get(variable)
+        if value:
+            try:
+                setattr(config, name, _SETTING_TYPES[name](value))
+                config.sources[name] = "env"
+            except ValueError:
+                print(f"Warning: Ignoring {variable}={value!r}: not a valid {name}", file=sys.stderr)
+    for name, value in (overrides or {}).items():
+        if name not in _SETTING_TYPES:
+            raise ValueError(f"Unknown setting: '{name}'. Valid settings are {', '.join(_SETTING_TYPES)}")
+        if value is not None:
+            setattr(config, name, _SETTING_TYPES[name](value))
+            config.sources[name] = "cli"
+    return config
+
+
+def get_config():
+    """Return the process-wide connection settings, resolving them on first use."""
+    global _config
+    with _lock:
+        if _config is None:
+            _config = resolve_config()
+        return _config
+
+
+def configure(**overrides):
+    """Re-resolve the process-wide settings with command line overrides and return them.
+
+    Call this before the first command is sent; connections that are
+    already open keep their settings.
+    """
+    global _config
+    config = resolve_config(overrides)
+    with _lock:
+        _config = config
+    return config
+
+
+def add_config_arguments(parser):
+    """Add the --host, --port, --timeout and --buffer-size options to an argparse parser."""
+    parser.add_argument("--host", help=f"Host of the Unreal MCP server (env: {ENVIRONMENT_VARIABLES['host']})")
+    parser.add_argument("--port", type=int, help=f"Port of the Unreal MCP server (env: {ENVIRONMENT_VARIABLES['port']})")
+    parser.add_argument("--timeout", type=float,
+                        help=f"Command timeout in seconds (env: {ENVIRONMENT_VARIABLES['timeout']})")
+    parser.add_argument("--buffer-size", type=int, dest="buffer_size",
+                        help=f"Receive buffer size in bytes (env: {ENVIRONMENT_VARIABLES['buffer_size']})")
+    return parser
+
+
+def config_overrides(args):
+    """Return the settings given on the command line in parsed argparse ``args``."""
+    return {name: getattr(args, name, None) for name in _SETTING_TYPES}
+
+
+__all__ = ['BridgeConfig', 'get_config', 'configure', 'resolve_config', 'read_constants', 'add_config_arguments',
+           'config_overrides', 'DEFAULT_HOST', 'DEFAULT_PORT', 'DEFAULT_BUFFER_SIZE', 'DEFAULT_TIMEOUT',
+           'DEFAULT_CONSTANTS_PATH', 'ENVIRONMENT_VARIABLES']
@@ -0,0 +1,234 @@
+"""Persistent, pooled connections to the Unreal MCP server.
+
+The C++ server (FMCPTCPServer) keeps a client socket open after answering a
+command, so there is no need to pay for a new connect/accept cycle on every
+tool call. This module keeps warm connections around, checks them before
+reuse and transparently reconnects when the server has dropped them (for
+example after its client inactivity timeout).
+"""
+
+import collections
+import select
+import socket
+import threading
+
+from .protocol import (
+    FRAMING_AUTO, FRAMING_LENGTH_PREFIXED, FRAMING_RAW, SET_PROTOCOL_COMMAND,
+    encode_message, make_decoder
+)
+
+# Upper bound for a single recv when the size of the incoming frame is known
+_MAX_RECV_SIZE = 4 * 1024 * 1024
+
+
+class UnrealConnection:
+    """A single keep-alive TCP connection to the Unreal MCP server.
+
+    ``framing`` selects the wire format (see utils.protocol): ``"auto"``
+    negotiates length-prefixed framing on connect and falls back to raw JSON
+    if the server does not support it, ``"length_prefixed"`` requires it and
+    ``"raw"`` never asks.
+    """
+
+    def __init__(self, host, port, buffer_size=65536, timeout=10, framing=FRAMING_AUTO):
+        self.host = host
+        self.port = port
+        self.buffer_size = buffer_size
+        self.timeout = timeout
+        self.requested_framing = framing
+        self.framing = FRAMING_RAW
+        self.connect_count = 0
+        self._sock = None
+        self._decoder = make_decoder(FRAMING_RAW)
+        self._responses = collections.deque()
+
+    @property
+    def connected(self):
+        return self._sock is not None
+
+    def connect(self):
+        """Open the underlying socket if it is not already open."""
+        if self._sock is not None:
+            return
+        sock = socket.create_connection((self.host, self.port), timeout=self.timeout)
+        # Commands are small request/response messages, don't let Nagle delay them
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self._sock = sock
+        self.connect_count += 1
+        if self.requested_framing != FRAMING_RAW:
+            self._negotiate_framing()
+
+    def _negotiate_framing(self):
+        """Ask the server to switch this connection to length-prefixed framing."""
+        request = {
+            "type": SET_PROTOCOL_COMMAND,
+            "params": {"framing": FRAMING_LENGTH_PREFIXED}
+        }
+        self._sock.sendall(encode_message(request, FRAMING_RAW))
+        try:
+            response = self._receive()
+        except _StaleConnection:
+            self.close()
+            raise ConnectionError("Connection closed by server during protocol negotiation")
+
+        if response.get("status") == "success":
+            self.framing = FRAMING_LENGTH_PREFIXED
+            self._decoder = make_decoder(FRAMING_LENGTH_PREFIXED)
+            max_frame_size = response.get("result", {}).get("max_frame_size")
+            if max_frame_size:
+                self._decoder.max_frame_size = max_frame_size
+        elif self.requested_framing == FRAMING_LENGTH_PREFIXED:
+            self.close()
+            raise ConnectionError(f"Server does not support length-prefixed framing: {response.get('message')}")
+
+    def close(self):
+        """Close the underlying socket. The next command will reconnect."""
+        if self._sock is None:
+            return
+        try:
+            self._sock.close()
+        except OSError:
+            pass
+        self._sock = None
+        self.framing = FRAMING_RAW
+        self._decoder = make_decoder(FRAMING_RAW)
+        self._responses.clear()
+
+    def is_alive(self):
+        """Check whether an idle connection can still be used.
+
+        An idle connection should never be readable: the server only writes in
+        response to a command. If it is readable, either the peer closed the
+        connection (EOF) or there is stray data from an earlier, abandoned
+        command. Either way the connection must not be reused.
+        """
+        if self._sock is None or self._responses or self._decoder.pending:
+            return False
+        try:
+            readable, _, _ = select.select([self._sock], [], [], 0)
+        except (OSError, ValueError):
+            return False
+        return not readable
+
+    def send_command(self, command_type, params=None, timeout=None):
+        """Send a command and wait for its response.
+
+        A command is retried once on a fresh connection if the reused one turns
+        out to be dead before any part of the response arrived.
+
+        Raises:
+            ConnectionRefusedError: If the server is not listening.
+            socket.timeout: If the server did not answer in time.
+            ConnectionError: If the connection was closed mid-response.
+        """
+        command = {
+            "type": command_type,
+            "params": params or {}
+        }
+
+        if self._sock is not None and not self.is_alive():
+            self.close()
+
+        for attempt in range(2):
+            reused = self._sock is not None
+            try:
+                self.connect()
+                self._sock.settimeout(self.timeout if timeout is None else timeout)
+                self._sock.sendall(encode_message(command, self.framing))
+                return self._receive()
+            except _StaleConnection:
+                self.close()
+                if not reused or attempt:
+                    raise ConnectionError("Connection closed by server before a response was received")
+            except BaseException:
+                # The stream is in an unknown state (e.g. a late response may
+                # still arrive), so never hand this socket to another command.
+                self.close()
+                raise
+
+    def _receive(self):
+        """Read until the decoder yields the next complete response."""
+        received = False
+        while not self._responses:
+            chunk = self._sock.recv(self._recv_size())
+            if not chunk:  # Connection closed
+                if not received:
+                    raise _StaleConnection()
+                raise ConnectionError("Connection closed by server in the middle of a response")
+            received = True
+            self._responses.extend(self._decoder.feed(chunk))
+        return self._responses.popleft()
+
+    def _recv_size(self):
+        if self.framing == FRAMING_LENGTH_PREFIXED:
+            # The frame header tells us how much is coming, read it in large pieces
+            return max(self.buffer_size, min(self._decoder.bytes_needed, _MAX_RECV_SIZE))
+        return self.buffer_size
+
+
+class _StaleConnection(Exception):
+    """Raised when a connection is closed before any response bytes arrive."""
+
+
+class ConnectionPool:
+    """A small pool of keep-alive connections to the Unreal MCP server.
+
+    Each command borrows one connection for the duration of its
+    request/response exchange, so concurrent callers (threads) never
+    interleave bytes on the same socket. Idle connections are kept warm for
+    the next caller.
+    """
+
+    def __init__(self, host, port, buffer_size=65536, timeout=10, max_idle=4, framing=FRAMING_AUTO):
+        self.host = host
+        self.port = port
+        self.buffer_size = buffer_size
+        self.timeout = timeout
+        self.max_idle = max_idle
+        self.framing = framing
+        self._idle = []
+        self._lock = threading.Lock()
+        self.stats = {"connections_opened": 0, "commands": 0, "reused": 0}
+
+    def acquire(self):
+        """Take an idle connection from the pool or create a new one."""
+        with self._lock:
+            while self._idle:
+                connection = self._idle.pop()
+                if connection.is_alive():
+                    self.stats["reused"] += 1
+                    return connection
+                connection.close()
+        return UnrealConnection(self.host, self.port, self.buffer_size, self.timeout, self.framing)
+
+    def release(self, connection):
+        """Return a connection to the pool, closing it if the pool is full."""
+        if not connection.connected:
+            return
+        with self._lock:
+            if len(self._idle) < self.max_idle:
+                self._idle.append(connection)
+                return
+        connection.close()
+
+    def send_command(self, command_type, params=None, timeout=None):
+        """Send a command over a pooled connection and return the response."""
+        connection = self.acquire()
+        connect_count = connection.connect_count
+        try:
+            return connection.send_command(command_type, params, timeout)
+        finally:
+            with self._lock:
+                self.stats["commands"] += 1
+                self.stats["connections_opened"] += connection.connect_count - connect_count
+            self.release(connection)
+
+    def close(self):
+        """Close every idle connection."""
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for connection in idle:
+            connection.close()
+
+
+__all__ = ['UnrealConnection', 'ConnectionPool']
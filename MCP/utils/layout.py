@@ -0,0 +1,300 @@
+"""Vectorized layout operations for groups of actors.
+
+A layout reads the current transforms of the selected actors in one
+columnar query_actors snapshot, computes the new locations for all of them
+at once with NumPy and applies them with a single modify_objects command,
+so arranging 200 crates costs a few requests instead of 200 modify_object
+calls with hand-computed numbers.
+
+The layout functions (grid_layout, circle_layout, path_layout,
+scatter_layout, align_layout and distribute_layout) are pure: they take
+counts or (N, 3) location arrays and return (N, 3) float64 arrays, so they
+can also be combined with arbitrary NumPy code before calling
+apply_layout. Bounds are computed from actor locations (pivots), not from
+mesh bounds. NumPy is required for this module.
+"""
+
+import math
+
+from .bulk import amodify_objects, modify_objects
+from .scene import _import_numpy, afetch_scene_columns, fetch_scene_columns
+
+AXES = {"x": 0, "y": 1, "z": 2}
+ALIGN_MODES = ("min", "center", "max")
+
+# Candidates tried around a sample before scatter_layout gives up on it (Bridson's k)
+DEFAULT_SCATTER_ATTEMPTS = 30
+
+
+def _axis_index(axis):
+    if axis not in AXES:
+        raise ValueError(f"Unknown axis: '{axis}'. Valid axes are x, y and z")
+    return AXES[axis]
+
+
+def grid_layout(count, columns=None, spacing=(100.0, 100.0), origin=(0.0, 0.0, 0.0)):
+    """Place count items on a grid in the XY plane, row by row.
+
+    Args:
+        count: Number of positions
+        columns: Items per row (default: a square grid)
+        spacing: Distance between columns and rows, as one number or (x, y)
+        origin: Position of the first item
+
+    Returns:
+        (count, 3) array of positions
+    """
+    np = _import_numpy()
+    columns = int(columns or math.ceil(math.sqrt(count)) or 1)
+    step_x, step_y = (spacing, spacing) if isinstance(spacing, (int, float)) else spacing
+    index = np.arange(count)
+    offsets = np.column_stack([(index % columns) * float(step_x), (index // columns) * float(step_y), np.zeros(count)])
+    return np.asarray(origin, dtype=float) + offsets
+
+
+def circle_layout(count, center=(0.0, 0.0, 0.0), radius=500.0, start_angle=0.0):
+    """Place count items evenly on a circle in the XY plane.
+
+    Args:
+        count: Number of positions
+        center: Center of the circle
+        radius: Radius of the circle
+        start_angle: Angle of the first item in degrees, counter-clockwise from +X
+
+    Returns:
+        (count, 3) array of positions
+    """
+    np = _import_numpy()
+    angles = np.radians(start_angle) + 2.0 * np.pi * np.arange(count) / max(count, 1)
+    offsets = np.column_stack([np.cos(angles) * radius, np.sin(angles) * radius, np.zeros(count)])
+    return np.asarray(center, dtype=float) + offsets
+
+
+def path_layout(count, points, closed=False):
+    """Distribute count items at equal distances along a polyline.
+
+    A straight line is a path of two points; sample a spline into points to
+    distribute along it.
+
+    Args:
+        count: Number of positions
+        points: Path vertices as a sequence of [x, y, z] (at least two)
+        closed: Also walk from the last point back to the first; items are then spaced around the loop
+
+    Returns:
+        (count, 3) array of positions, the first at the first point and, for an open path, the last at the last point
+    """
+    np = _import_numpy()
+    vertices = np.asarray(points, dtype=float)
+    if vertices.ndim != 2 or vertices.shape[1] != 3 or len(vertices) < 2:
+        raise ValueError("A path needs at least two [x, y, z] points")
+    if closed:
+        vertices = np.vstack([vertices, vertices[:1]])
+    distance = np.concatenate([[0.0], np.cumsum(np.linalg.norm(np.diff(vertices, axis=0), axis=1))])
+    if closed:
+        targets = np.arange(count) * distance[-1] / max(count, 1)
+    else:
+        targets = np.linspace(0.0, distance[-1], count)
+    return np.column_stack([np.interp(targets, distance, vertices[:, axis]) for axis in range(3)])
+
+
+def scatter_layout(count, box_min, box_max, min_distance, seed=None, attempts=DEFAULT_SCATTER_ATTEMPTS):
+    """Scatter up to count items in a box, no two closer than min_distance in the XY plane.
+
+    Uses Bridson's Poisson-disk sampling with a background grid, testing all
+    candidates around a sample against its neighbours in one array operation. Z is drawn uniformly between the box's
+    Z bounds (use equal Z bounds to scatter on a plane).
+
+    Args:
+        count: Number of positions wanted
+        box_min: Minimum corner of the box
+        box_max: Maximum corner of the box
+        min_distance: Minimum distance between two items
+        seed: Seed for reproducible results
+        attempts: Candidates tried around a sample before it is retired
+
+    Returns:
+        (n, 3) array of positions; n is less than count if the box is full
+    """
+    np = _import_numpy()
+    if min_distance <= 0:
+        raise ValueError("min_distance must be positive")
+    rng = np.random.default_rng(seed)
+    low = np.minimum(np.asarray(box_min, dtype=float), np.asarray(box_max, dtype=float))
+    high = np.maximum(np.asarray(box_min, dtype=float), np.asarray(box_max, dtype=float))
+    size = high[:2] - low[:2]
+
+    # A grid cell holds at most one sample
+    cell = min_distance / math.sqrt(2.0)
+    grid_shape = np.maximum(np.ceil(size / cell).astype(int), 1)
+    grid = np.full(grid_shape, -1, dtype=np.int64)
+    samples = np.empty((max(count, 0), 2))
+    min_distance_squared = min_distance * min_distance
+
+    def cell_of(point):
+        return tuple(np.minimum(((point - low[:2]) / cell).astype(int), grid_shape - 1))
+
+    placed = 0
+    active = []
+    if count > 0:
+        samples[0] = low[:2] + rng.random(2) * size
+        grid[cell_of(samples[0])] = 0
+        placed, active = 1, [0]
+    while active and placed < count:
+        slot = int(rng.integers(len(active)))
+        angles = rng.random(attempts) * 2.0 * np.pi
+        radii = min_distance * (1.0 + rng.random(attempts))
+        candidates = samples[active[slot]] + np.column_stack([np.cos(angles) * radii, np.sin(angles) * radii])
+        candidates = candidates[np.all((candidates >= low[:2]) & (candidates <= high[:2]), axis=1)]
+
+        # Candidates lie within 2 * min_distance of the sample, so their conflicts are all within 5 cells of it
+        x, y = cell_of(samples[active[slot]])
+        neighbours = grid[max(x - 5, 0):x + 6, max(y - 5, 0):y + 6]
+        neighbours = neighbours[neighbours >= 0]
+        distances = np.sum((candidates[:, None, :] - samples[neighbours][None, :, :]) ** 2, axis=2)
+        valid = np.flatnonzero(np.all(distances >= min_distance_squared, axis=1))
+        if valid.size:
+            samples[placed] = candidates[valid[0]]
+            grid[cell_of(samples[placed])] = placed
+            active.append(placed)
+            placed += 1
+        else:
+            active[slot] = active[-1]
+            active.pop()
+
+    heights = low[2] + rng.random(placed) * (high[2] - low[2])
+    return np.column_stack([samples[:placed], heights])
+
+
+def align_layout(locations, axis="x", mode="min"):
+    """Move locations onto one plane at the minimum, center or maximum of their bounds along an axis.
+
+    Args:
+        locations: (N, 3) array of current locations
+        axis: 'x', 'y' or 'z'
+        mode: 'min', 'center' or 'max'
+
+    Returns:
+        (N, 3) array of aligned locations
+    """
+    np = _import_numpy()
+    if mode not in ALIGN_MODES:
+        raise ValueError(f"Unknown align mode: '{mode}'. Valid modes are min, center and max")
+    aligned = np.array(locations, dtype=float)
+    index = _axis_index(axis)
+    values = aligned[:, index]
+    if len(values):
+        target = {"min": values.min, "max": values.max, "center": lambda: (values.min() + values.max()) / 2.0}[mode]()
+        aligned[:, index] = target
+    return aligned
+
+
+def distribute_layout(locations, axis="x"):
+    """Space locations evenly between the two outermost ones along an axis, keeping their order.
+
+    Args:
+        locations: (N, 3) array of current locations
+        axis: 'x', 'y' or 'z'
+
+    Returns:
+        (N, 3) array of distributed locations
+    """
+    np = _import_numpy()
+    distributed = np.array(locations, dtype=float)
+    index = _axis_index(axis)
+    if len(distributed) > 2:
+        order = np.argsort(distributed[:, index], kind="stable")
+        values = distributed[order, index]
+        distributed[order, index] = np.linspace(values[0], values[-1], len(values))
+    return distributed
+
+
+def facing_rotations(locations, target):
+    """Yaw rotations that turn each location's +X axis towards a target point.
+
+    Args:
+        locations: (N, 3) array of locations
+        target: [x, y, z] point to face
+
+    Returns:
+        (N, 3) array of [pitch, yaw, roll] in degrees
+    """
+    np = _import_numpy()
+    delta = np.asarray(target, dtype=float)[:2] - np.asarray(locations, dtype=float)[:, :2]
+    yaw = np.degrees(np.arctan2(delta[:, 1], delta[:, 0]))
+    return np.column_stack([np.zeros(len(yaw)), yaw, np.zeros(len(yaw))])
+
+
+def _selection_params(names, actor_filter):
+    conditions = dict(actor_filter or {})
+    if names:
+        conditions["names"] = list(names)
+    if not conditions:
+        raise ValueError("Select actors with names or a filter")
+    return {"filter": conditions}
+
+
+def _ordered_selection(columns, names):
+    """Return (names, locations) of a snapshot, in the order of the requested names if any."""
+    np = _import_numpy()
+    selected, locations = list(columns["name"]), columns["location"].astype(float)
+    if names:
+        rank = {name: position for position, name in enumerate(names)}
+        order = sorted(range(len(selected)),
+                       key=lambda index: rank.get(selected[index], rank.get(columns["label"][index], len(rank))))
+        selected = [selected[index] for index in order]
+        locations = locations[np.asarray(order, dtype=int)] if order else locations
+    return selected, locations
+
+
+def read_layout_selection(send_command=None, names=None, actor_filter=None):
+    """Read the names and locations of the actors a layout applies to.
+
+    Args:
+        send_command: Function used to send commands (default: utils.send_command)
+        names: Names or labels of the actors; the result keeps their order
+        actor_filter: A query_actors filter selecting the actors (combined with names if both are given)
+
+    Returns:
+        (names, locations): actor names and an (N, 3) array of their current locations
+    """
+    if send_command is None:
+        from . import send_command
+    columns = fetch_scene_columns(send_command, ("name", "label", "location"),
+                                  params=_selection_params(names, actor_filter), command="query_actors")
+    return _ordered_selection(columns, names)
+
+
+async def aread_layout_selection(async_send_command=None, names=None, actor_filter=None):
+    """Async counterpart of read_layout_selection."""
+    if async_send_command is None:
+        from . import async_send_command
+    columns = await afetch_scene_columns(async_send_command, ("name", "label", "location"),
+                                         params=_selection_params(names, actor_filter), command="query_actors")
+    return _ordered_selection(columns, names)
+
+
+def apply_layout(send_command=None, names=(), locations=None, rotations=None):
+    """Move actors to computed locations (and rotations) with one modify_objects command per chunk.
+
+    The arrays are sent as float64, so actors land exactly on the computed positions.
+
+    Args:
+        send_command: Function used to send commands (default: utils.send_command)
+        names: Actor names, one per location
+        locations: (N, 3) array of new locations
+        rotations: Optional (N, 3) array of new [pitch, yaw, roll]
+
+    Returns:
+        The modify_objects result: the 'modified' count and the 'not_found' names
+    """
+    return modify_objects(send_command, list(names), locations=locations, rotations=rotations)
+
+
+async def aapply_layout(async_send_command=None, names=(), locations=None, rotations=None):
+    """Async counterpart of apply_layout."""
+    return await amodify_objects(async_send_command, list(names), locations=locations, rotations=rotations)
+
+
+__all__ = ['grid_layout', 'circle_layout', 'path_layout', 'scatter_layout', 'align_layout', 'distribute_layout',
+           'facing_rotations', 'read_layout_selection', 'aread_layout_selection', 'apply_layout', 'aapply_layout']
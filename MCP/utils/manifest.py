@@ -0,0 +1,254 @@
+"""Cached tool manifest for lazy loading of bridge tool modules.
+
+Importing every module in Commands/ and UserTools/ at startup pulls in all
+of their dependencies (NumPy for the layout tools, ...) before the bridge
+can answer its first request, although most sessions only use a handful of
+tools. ToolManifest keeps the name, signature, docstring and decorator
+arguments of every tool in a JSON file next to the bridge, keyed by the
+modification time and size of the module's source files. While they are
+unchanged, the bridge registers lightweight stubs with the same signature
+and docstring (so clients see the same tool list), and a module is only
+imported when one of its tools is first called.
+
+A module whose sources changed is imported and registered as usual, and
+its manifest entry is rebuilt. Modules that register anything other than
+plain ``mcp.tool()`` functions, or whose tools use annotations or defaults
+that cannot be stored in JSON, are always loaded eagerly.
+"""
+
+import inspect
+import json
+import os
+import sys
+import threading
+
+MANIFEST_VERSION = 1
+
+# Annotations a tool signature may use to be stored in the manifest
+DEFAULT_MANIFEST_TYPES = {
+    "str": str, "int": int, "float": float, "bool": bool, "list": list, "dict": dict, "None": None
+}
+
+_JSON_TYPES = (type(None), bool, int, float, str, list, dict)
+
+
+class _NotCacheable(Exception):
+    """A module registers something the manifest cannot describe."""
+
+
+def source_stamp(files):
+    """Return the [path, mtime_ns, size] of every file, sorted by path."""
+    stamp = []
+    for path in sorted(files):
+        stat = os.stat(path)
+        stamp.append([os.path.abspath(path), stat.st_mtime_ns, stat.st_size])
+    return stamp
+
+
+class _ToolRecorder:
+    """Stand-in for the MCP server that collects the tools a module registers."""
+
+    def __init__(self):
+        # (function, decorator args, decorator kwargs) in registration order
+        self.tools = []
+        self.cacheable = True
+
+    def tool(self, *args, **kwargs):
+        def decorator(fn):
+            self.tools.append((fn, args, kwargs))
+            return fn
+        return decorator
+
+    def __getattr__(self, name):
+        # Resources, prompts and anything else are not described by the manifest
+        self.cacheable = False
+        raise _NotCacheable(name)
+
+
+class _LazyModule:
+    """Imports a module on first use and hands out the tools it registers."""
+
+    def __init__(self, load):
+        self._load = load
+        self._tools = None
+        self._lock = threading.Lock()
+
+    def resolve(self, tool_name):
+        with self._lock:
+            if self._tools is None:
+                recorder = _ToolRecorder()
+                self._load()(recorder)
+                self._tools = {kwargs.get("name") or fn.__name__: fn for fn, _, kwargs in recorder.tools}
+        if tool_name not in self._tools:
+            raise RuntimeError(f"Tool '{tool_name}' is no longer registered by its module; restart the bridge")
+        return self._tools[tool_name]
+
+
+class ToolManifest:
+    """Manifest of the tools registered by each module, stored as JSON at ``path``.
+
+    ``types`` maps annotation names to the types they stand for; pass the
+    MCP ``Context`` class here so tools taking a context can be described.
+
+    Call register(mcp, key, files, load) for every module, then save().
+    ``stats`` counts the modules registered 'lazy' from the manifest,
+    'rebuilt' after a change and loaded 'eager' because they cannot be
+    described.
+    """
+
+    def __init__(self, path, types=None):
+        self.path = path
+        self.types = dict(DEFAULT_MANIFEST_TYPES)
+        self.types.update(types or {})
+        self._type_names = {id(value): name for name, value in self.types.items()}
+        self._modules = self._read()
+        self._seen = set()
+        self._dirty = False
+        self.stats = {"lazy": 0, "rebuilt": 0, "eager": 0}
+
+    def _read(self):
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("version") == MANIFEST_VERSION:
+                return data.get("modules", {})
+        except (OSError, ValueError, AttributeError):
+            pass
+        return {}
+
+    def save(self):
+        """Write the manifest if it changed, dropping modules that were not registered this run."""
+        if not self._dirty and set(self._modules) == self._seen:
+            return
+        modules = {key: entry for key, entry in self._modules.items() if key in self._seen}
+        try:
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump({"version": MANIFEST_VERSION, "modules": modules}, f, indent=1)
+            os.replace(tmp_path, self.path)
+            self._modules = modules
+            self._dirty = False
+        except OSError as e:
+            print(f"Warning: Could not write tool manifest {self.path}: {e}", file=sys.stderr)
+
+    def register(self, mcp, key, files, load):
+        """Register the tools of one module with ``mcp``.
+
+        Args:
+            mcp: The MCP server
+            key: Unique name of the module (e.g. 'Commands.commands_scene')
+            files: Source files of the module; any change to them rebuilds its entry
+            load: Callable that imports the module and returns its register function,
+                  which is called with the MCP server (e.g. ``lambda: module.register_all``)
+
+        Returns:
+            'lazy' if stubs were registered from the manifest, 'rebuilt' if the module
+            was imported and its entry rebuilt, 'eager' if it cannot be loaded lazily
+        """
+        self._seen.add(key)
+        stamp = source_stamp(files)
+        entry = self._modules.get(key)
+        if entry is not None and entry["stamp"] == stamp:
+            if entry["tools"] is not None:
+                lazy_module = _LazyModule(load)
+                for tool in entry["tools"]:
+                    self._register_stub(mcp, lazy_module, tool)
+                self.stats["lazy"] += 1
+                return "lazy"
+            load()(mcp)
+            self.stats["eager"] += 1
+            return "eager"
+
+        register_tools = load()
+        recorder = _ToolRecorder()
+        tools = None
+        try:
+            register_tools(recorder)
+            tools = [self._describe(fn, args, kwargs) for fn, args, kwargs in recorder.tools]
+        except _NotCacheable:
+            pass
+        if not recorder.cacheable:
+            tools = None
+        self._modules[key] = {"stamp": stamp, "tools": tools}
+        self._dirty = True
+        if tools is None:
+            register_tools(mcp)
+            self.stats["eager"] += 1
+            return "eager"
+        for fn, args, kwargs in recorder.tools:
+            mcp.tool(*args, **kwargs)(fn)
+        self.stats["rebuilt"] += 1
+        return "rebuilt"
+
+    def _type_name(self, annotation):
+        if annotation is inspect.Parameter.empty:
+            return None
+        name = self._type_names.get(id(annotation))
+        if name is None:
+            raise _NotCacheable(repr(annotation))
+        return name
+
+    def _describe(self, fn, args, kwargs):
+        """Return the manifest entry of a tool function."""
+        if args or not _is_json(kwargs):
+            raise _NotCacheable(fn.__name__)
+        parameters = []
+        for parameter in inspect.signature(fn).parameters.values():
+            described = {"name": parameter.name, "kind": parameter.kind.name,
+                         "annotation": self._type_name(parameter.annotation)}
+            if parameter.default is not inspect.Parameter.empty:
+                if not _is_json(parameter.default):
+                    raise _NotCacheable(fn.__name__)
+                described["default"] = parameter.default
+            parameters.append(described)
+        return {
+            "name": kwargs.get("name") or fn.__name__,
+            "function": fn.__name__,
+            "doc": fn.__doc__,
+            "is_async": inspect.iscoroutinefunction(fn),
+            "parameters": parameters,
+            "returns": self._type_name(inspect.signature(fn).return_annotation),
+            "decorator": kwargs
+        }
+
+    def _register_stub(self, mcp, lazy_module, tool):
+        """Register a stub with the recorded signature that defers to the real tool."""
+        name = tool["name"]
+        if tool["is_async"]:
+            async def stub(*args, **kwargs):
+                return await lazy_module.resolve(name)(*args, **kwargs)
+        else:
+            def stub(*args, **kwargs):
+                return lazy_module.resolve(name)(*args, **kwargs)
+
+        parameters = []
+        annotations = {}
+        for described in tool["parameters"]:
+            annotation = inspect.Parameter.empty
+            if described["annotation"] is not None:
+                annotation = annotations[described["name"]] = self.types[described["annotation"]]
+            parameters.append(inspect.Parameter(
+                described["name"], getattr(inspect.Parameter, described["kind"]),
+                default=described.get("default", inspect.Parameter.empty), annotation=annotation))
+        returns = inspect.Signature.empty
+        if tool["returns"] is not None:
+            returns = annotations["return"] = self.types[tool["returns"]]
+        stub.__name__ = stub.__qualname__ = tool["function"]
+        stub.__doc__ = tool["doc"]
+        stub.__annotations__ = annotations
+        stub.__signature__ = inspect.Signature(parameters, return_annotation=returns)
+        mcp.tool(**tool["decorator"])(stub)
+
+
+def _is_json(value):
+    """Whether value survives a JSON round trip unchanged."""
+    if not isinstance(value, _JSON_TYPES):
+        return False
+    try:
+        return json.loads(json.dumps(value)) == value
+    except (TypeError, ValueError):
+        return False
+
+
+__all__ = ['ToolManifest', 'source_stamp', 'MANIFEST_VERSION', 'DEFAULT_MANIFEST_TYPES']
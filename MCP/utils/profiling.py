@@ -0,0 +1,231 @@
+"""Startup profiling for the bridge.
+
+Start the bridge with ``--profile-startup`` (or set UNREAL_MCP_PROFILE_STARTUP=1)
+to time each startup phase (importing the mcp package, scanning
+python_modules, loading every command module and user tool, ...) and
+every module imported on the way. The report is written to stderr as JSON,
+or to a file with ``--profile-startup PATH`` (or
+UNREAL_MCP_PROFILE_STARTUP=PATH), so slow user tools and heavy imports can
+be found and startup regressions compared between runs.
+
+Report layout::
+
+    {
+        "python": "3.11.4",
+        "total_ms": 812.4,
+        "phases": [{"name": "load_commands", "parent": null, "start_ms": 402.1,
+                    "duration_ms": 35.2, "details": {}}, ...],
+        "imports": [{"module": "numpy", "parent": "utils.layout", "cumulative_ms": 95.3,
+                     "self_ms": 41.0}, ...]
+    }
+
+Phases are listed in the order they started; ``parent`` is the phase they
+ran in. Imports are sorted slowest first; ``cumulative_ms`` includes the
+modules they imported in turn and ``self_ms`` does not. Only modules that
+were not imported yet are timed. Modules the tool manifest defers until a
+tool is first called (see utils.manifest) do not appear.
+
+Without the flag, StartupProfiler does nothing and costs nothing.
+"""
+
+import builtins
+import contextlib
+import importlib.util
+import json
+import os
+import sys
+import threading
+import time
+
+PROFILE_ARGUMENT = "--profile-startup"
+PROFILE_ENVIRONMENT_VARIABLE = "UNREAL_MCP_PROFILE_STARTUP"
+
+# Write the report to stderr; stdout carries the MCP protocol
+STDERR_OUTPUT = "-"
+
+# Phases and imports listed in the summary printed with the report
+DEFAULT_SUMMARY_ENTRIES = 10
+
+
+def profile_output(argv, environ):
+    """Return where a startup profile was requested to go ('-' for stderr), or None.
+
+    The command line (``--profile-startup``, ``--profile-startup PATH`` or
+    ``--profile-startup=PATH``) wins over the environment variable, whose
+    value is '1' for stderr or a path.
+    """
+    for index, argument in enumerate(argv):
+        if argument.startswith(PROFILE_ARGUMENT + "="):
+            return argument.split("=", 1)[1] or STDERR_OUTPUT
+        if argument == PROFILE_ARGUMENT:
+            following = argv[index + 1] if index + 1 < len(argv) else None
+            if following and not following.startswith("-"):
+                return following
+            return STDERR_OUTPUT
+    value = environ.get(PROFILE_ENVIRONMENT_VARIABLE, "").strip()
+    if not value or value.lower() in ("0", "false", "no", "off"):
+        return None
+    if value.lower() in ("1", "true", "yes", "on"):
+        return STDERR_OUTPUT
+    return value
+
+
+class StartupProfiler:
+    """Records the duration of startup phases and imports.
+
+    ``start`` is the perf_counter() value startup began at, for work done
+    before the profiler could be imported. A disabled profiler records
+    nothing and does not touch the import system.
+    """
+
+    def __init__(self, enabled=True, output=STDERR_OUTPUT, start=None):
+        self.enabled = enabled
+        self.output = output
+        self.start = time.perf_counter() if start is None else start
+        self.phases = []
+        self.imports = []
+        self._phase_stack = []
+        self._import_state = threading.local()
+        self._original_import = None
+        self._report = None
+
+    @classmethod
+    def from_environment(cls, argv=None, environ=None, start=None):
+        """Create a profiler that is enabled if the command line or environment ask for it."""
+        output = profile_output(sys.argv[1:] if argv is None else argv, os.environ if environ is None else environ)
+        return cls(enabled=output is not None, output=output or STDERR_OUTPUT, start=start)
+
+    def _ms(self, seconds):
+        return round(seconds * 1000, 3)
+
+    def record(self, name, start, end, **details):
+        """Record a phase that ran from perf_counter() value start to end."""
+        if not self.enabled:
+            return
+        self.phases.append({
+            "name": name,
+            "parent": self._phase_stack[-1] if self._phase_stack else None,
+            "start_ms": self._ms(start - self.start),
+            "duration_ms": self._ms(end - start),
+            "details": details
+        })
+
+    @contextlib.contextmanager
+    def phase(self, name, **details):
+        """Time the body of a with block as a phase.
+
+        Yields the phase's details dict, so results known only at the end
+        (e.g. how a module was loaded) can be added to it.
+        """
+        if not self.enabled:
+            yield details
+            return
+        entry = {"name": name, "parent": self._phase_stack[-1] if self._phase_stack else None,
+                 "start_ms": None, "duration_ms": None, "details": details}
+        self.phases.append(entry)
+        self._phase_stack.append(name)
+        start = time.perf_counter()
+        try:
+            yield details
+        finally:
+            end = time.perf_counter()
+            self._phase_stack.pop()
+            entry["start_ms"] = self._ms(start - self.start)
+            entry["duration_ms"] = self._ms(end - start)
+
+    def install_import_hook(self):
+        """Start timing every import of a module that is not loaded yet."""
+        if not self.enabled or self._original_import is not None:
+            return
+        self._original_import = builtins.__import__
+        builtins.__import__ = self._timed_import
+
+    def remove_import_hook(self):
+        """Stop timing imports."""
+        if self._original_import is not None:
+            builtins.__import__ = self._original_import
+            self._original_import = None
+
+    def _timed_import(self, name, globals=None, locals=None, fromlist=(), level=0):
+        original = self._original_import or builtins.__import__
+        module_name = name
+        if level:
+            try:
+                module_name = importlib.util.resolve_name("." * level + name, (globals or {}).get("__package__"))
+            except (ImportError, ValueError):
+                return original(name, globals, locals, fromlist, level)
+        if module_name in sys.modules:
+            return original(name, globals, locals, fromlist, level)
+
+        stack = getattr(self._import_state, "stack", None)
+        if stack is None:
+            stack = self._import_state.stack = []
+        parent = (globals or {}).get("__name__")
+        stack.append(0.0)
+        start = time.perf_counter()
+        try:
+            return original(name, globals, locals, fromlist, level)
+        finally:
+            elapsed = time.perf_counter() - start
+            children = stack.pop()
+            if stack:
+                stack[-1] += elapsed
+            self.imports.append({
+                "module": module_name,
+                "parent": parent,
+                "cumulative_ms": self._ms(elapsed),
+                "self_ms": self._ms(elapsed - children)
+            })
+
+    def report(self):
+        """Return the report as a JSON-serializable dict, or None if profiling is disabled."""
+        if not self.enabled:
+            return None
+        return {
+            "python": sys.version.split()[0],
+            "total_ms": self._ms(time.perf_counter() - self.start),
+            "phases": list(self.phases),
+            "imports": sorted(self.imports, key=lambda entry: entry["cumulative_ms"], reverse=True)
+        }
+
+    def finish(self):
+        """Stop timing imports and write the report to the requested output.
+
+        Returns:
+            The report, or None if profiling is disabled
+        """
+        if not self.enabled:
+            return None
+        self.remove_import_hook()
+        if self._report is not None:
+            return self._report
+        self._report = self.report()
+        print(format_summary(self._report), file=sys.stderr)
+        if self.output == STDERR_OUTPUT:
+            print(json.dumps(self._report), file=sys.stderr)
+        else:
+            try:
+                with open(self.output, "w", encoding="utf-8") as f:
+                    json.dump(self._report, f, indent=1)
+                print(f"Startup profile written to: {self.output}", file=sys.stderr)
+            except OSError as e:
+                print(f"Warning: Could not write startup profile to {self.output}: {e}", file=sys.stderr)
+        return self._report
+
+
+def format_summary(report, entries=DEFAULT_SUMMARY_ENTRIES):
+    """Return a short human-readable summary of a startup report."""
+    lines = [f"Startup took {report['total_ms']:.1f} ms"]
+    slowest = sorted((phase for phase in report["phases"] if phase["duration_ms"] is not None),
+                     key=lambda phase: phase["duration_ms"], reverse=True)[:entries]
+    if slowest:
+        lines.append("Slowest phases:")
+        lines.extend(f"  {phase['duration_ms']:9.1f} ms  {phase['name']}" for phase in slowest)
+    if report["imports"]:
+        lines.append("Slowest imports:")
+        lines.extend(f"  {entry['cumulative_ms']:9.1f} ms  {entry['module']} (self {entry['self_ms']:.1f} ms)"
+                     for entry in report["imports"][:entries])
+    return "\n".join(lines)
+
+
+__all__ = ['StartupProfiler', 'profile_output', 'format_summary', 'PROFILE_ARGUMENT', 'PROFILE_ENVIRONMENT_VARIABLE']
@@ -0,0 +1,235 @@
+"""Wire protocol helpers for talking to the Unreal MCP server.
+
+Two framings are supported on the wire:
+
+- ``raw``: bare JSON objects with no delimiter, so the receiver has to find
+  where a message ends by tracking JSON structure. Every connection starts
+  in this mode.
+- ``length_prefixed``: each message is a 4-byte big-endian payload length
+  followed by that many bytes of UTF-8 JSON. A client switches a connection
+  to it by sending a ``set_protocol`` command; the reply still uses the old
+  framing and everything after it uses the new one. Servers that predate
+  the command answer with an "Unknown command" error and stay in raw mode.
+"""
+
+import json
+import re
+import struct
+
+FRAMING_RAW = "raw"
+FRAMING_LENGTH_PREFIXED = "length_prefixed"
+# Client-side only: try length-prefixed framing and fall back to raw
+FRAMING_AUTO = "auto"
+SET_PROTOCOL_COMMAND = "set_protocol"
+
+FRAME_HEADER = struct.Struct('>I')
+DEFAULT_MAX_FRAME_SIZE = 256 * 1024 * 1024  # Matches MCPConstants::DEFAULT_MAX_FRAME_SIZE
+
+# Bytes that can change the scanner state
+_STRUCTURAL = re.compile(rb'[{}\[\]"\\]')
+# A backslash escape inside a string (backslashes never occur outside one)
+_ESCAPE = re.compile(rb'\\.', re.S)
+_OPENER = re.compile(rb'[{\[]')
+# A closing bracket directly followed by an opening one can only be the
+# boundary between two top-level values in a valid JSON stream
+_BOUNDARY = re.compile(rb'[}\]]\s*[{\[]')
+
+_decoder = json.JSONDecoder()
+
+
+class JsonStreamDecoder:
+    """Incrementally split a byte stream into top-level JSON values.
+
+    Bytes are fed as they arrive from the socket. The decoder tracks nesting
+    depth and string/escape state across chunk boundaries so that it knows
+    when a value is complete without re-parsing, then decodes each complete
+    value exactly once. The total cost is linear in the size of the stream,
+    and several back-to-back messages on the same stream are returned in
+    order.
+
+    Most chunks are accounted for at C speed (escape pairs are removed with a
+    regex, strings are dropped by splitting on quotes and brackets are
+    counted). Only a chunk that contains the boundary between two messages is
+    walked token by token.
+
+    Only objects and arrays are recognised as top-level values; whitespace
+    (or any other stray bytes) between them is ignored.
+    """
+
+    def __init__(self):
+        self._buffer = bytearray()
+        # Offset of the first byte not yet accounted for. It can be one past
+        # the end of the buffer when the last byte was an escaping backslash.
+        self._scan_pos = 0
+        self._depth = 0
+        self._in_string = False
+
+    @property
+    def pending(self):
+        """True if a partially received value is buffered."""
+        return self._depth > 0
+
+    def feed(self, data):
+        """Add received bytes and return the list of completed values.
+
+        Raises:
+            json.JSONDecodeError: If a complete frame is not valid JSON.
+        """
+        self._buffer += data
+        if self._depth == 0 and not self._skip_to_value():
+            return []
+
+        region = bytes(self._buffer[self._scan_pos:])
+        clean = _ESCAPE.sub(b'', region)
+        trailing_escape = clean.endswith(b'\\')
+        if trailing_escape:
+            clean = clean[:-1]
+        parts = clean.split(b'"')
+        outside = b''.join(parts[1::2] if self._in_string else parts[0::2])
+        depth = (self._depth
+                 + outside.count(b'{') + outside.count(b'[')
+                 - outside.count(b'}') - outside.count(b']'))
+
+        if depth < 0 or _BOUNDARY.search(outside):
+            return self._scan_exact()
+
+        self._depth = depth
+        if len(parts) % 2 == 0:
+            self._in_string = not self._in_string
+        self._scan_pos = len(self._buffer) + (1 if trailing_escape else 0)
+        if depth:
+            return []
+
+        message, _ = _decoder.raw_decode(self._buffer.decode('utf-8'))
+        self.reset()
+        return [message]
+
+    def reset(self):
+        """Discard any buffered partial value."""
+        self._buffer.clear()
+        self._scan_pos = 0
+        self._depth = 0
+        self._in_string = False
+
+    def _skip_to_value(self):
+        """Drop bytes before the start of the next value, if it has arrived."""
+        match = _OPENER.search(self._buffer)
+        if match is None:
+            self.reset()
+            return False
+        del self._buffer[:match.start()]
+        self._scan_pos = 0
+        return True
+
+    def _scan_exact(self):
+        """Walk the unscanned bytes token by token, splitting every value."""
+        buffer = self._buffer
+        messages = []
+        start = 0
+        skip_until = self._scan_pos
+
+        for match in _STRUCTURAL.finditer(buffer, self._scan_pos):
+            index = match.start()
+            if index < skip_until:
+                # Byte escaped by a preceding backslash
+                continue
+            char = buffer[index]
+            if self._in_string:
+                if char == 0x5C:  # backslash
+                    skip_until = index + 2
+                elif char == 0x22:  # quote
+                    self._in_string = False
+            elif char == 0x22:
+                if self._depth:
+                    self._in_string = True
+            elif char in (0x7B, 0x5B):  # { [
+                if self._depth == 0:
+                    start = index
+                self._depth += 1
+            elif char in (0x7D, 0x5D) and self._depth:  # } ]
+                self._depth -= 1
+                if self._depth == 0:
+                    end = index + 1
+                    messages.append(json.loads(bytes(buffer[start:end])))
+
+        if self._depth == 0:
+            self.reset()
+        else:
+            # Keep only the value still being received
+            del buffer[:start]
+            self._scan_pos = max(len(buffer), skip_until - start)
+        return messages
+
+
+class LengthPrefixedDecoder:
+    """Split a length-prefixed byte stream into decoded JSON messages.
+
+    Has the same ``feed``/``pending``/``reset`` interface as
+    JsonStreamDecoder so a connection can switch between the two.
+    """
+
+    def __init__(self, max_frame_size=DEFAULT_MAX_FRAME_SIZE):
+        self.max_frame_size = max_frame_size
+        self._buffer = bytearray()
+
+    @property
+    def pending(self):
+        """True if a partially received frame is buffered."""
+        return bool(self._buffer)
+
+    @property
+    def bytes_needed(self):
+        """Number of bytes still missing from the frame being received."""
+        if len(self._buffer) < FRAME_HEADER.size:
+            return FRAME_HEADER.size - len(self._buffer)
+        size, = FRAME_HEADER.unpack_from(self._buffer)
+        return max(FRAME_HEADER.size + size - len(self._buffer), 0)
+
+    def feed(self, data):
+        """Add received bytes and return the list of completed messages.
+
+        Raises:
+            ValueError: If a frame header announces more than max_frame_size bytes.
+            json.JSONDecodeError: If a frame payload is not valid JSON.
+        """
+        buffer = self._buffer
+        buffer += data
+        messages = []
+        offset = 0
+        while len(buffer) - offset >= FRAME_HEADER.size:
+            size, = FRAME_HEADER.unpack_from(buffer, offset)
+            if size > self.max_frame_size:
+                raise ValueError(f"Frame of {size} bytes exceeds the {self.max_frame_size} byte limit")
+            end = offset + FRAME_HEADER.size + size
+            if len(buffer) < end:
+                break
+            messages.append(json.loads(bytes(buffer[offset + FRAME_HEADER.size:end])))
+            offset = end
+        if offset:
+            del buffer[:offset]
+        return messages
+
+    def reset(self):
+        """Discard any buffered partial frame."""
+        self._buffer.clear()
+
+
+def encode_message(message, framing=FRAMING_RAW):
+    """Serialize a message for the wire using the given framing."""
+    payload = json.dumps(message, separators=(',', ':')).encode('utf-8')
+    if framing == FRAMING_LENGTH_PREFIXED:
+        return FRAME_HEADER.pack(len(payload)) + payload
+    return payload
+
+
+def make_decoder(framing=FRAMING_RAW):
+    """Create the stream decoder matching a framing."""
+    if framing == FRAMING_LENGTH_PREFIXED:
+        return LengthPrefixedDecoder()
+    return JsonStreamDecoder()
+
+
+__all__ = [
+    'FRAMING_RAW', 'FRAMING_LENGTH_PREFIXED', 'FRAMING_AUTO', 'SET_PROTOCOL_COMMAND',
+    'JsonStreamDecoder', 'LengthPrefixedDecoder', 'encode_message', 'make_decoder'
+]
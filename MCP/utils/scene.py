@@ -0,0 +1,370 @@
+"""Helpers for reading large Unreal scenes through the MCP server.
+
+get_scene_info returns at most one page of actors per call (1000 by
+default). The generators in this module follow ``next_offset`` from page to
+page, so callers can stream every actor in a level of any size while only
+one page is held in memory at a time.
+
+SceneMirror and AsyncSceneMirror keep a local copy of the level up to date.
+They page through the level once and afterwards only ask get_scene_changes
+for the actors added, modified or removed since the scene version they
+last saw.
+
+fetch_scene_columns and afetch_scene_columns read the level in the
+columnar format and decode it into NumPy arrays (one (N, 3) float32 array
+per transform field) for vectorized analysis. NumPy is only needed for
+these two functions.
+"""
+
+import base64
+import sys
+
+DEFAULT_PAGE_SIZE = 1000
+
+# Columnar pages are compact enough to request the largest page the server allows
+DEFAULT_COLUMNAR_PAGE_SIZE = 10000
+
+# Per-actor fields of get_scene_info and get_scene_changes, selectable with the 'fields' parameter
+ACTOR_INFO_FIELDS = ("name", "type", "label", "location", "rotation", "scale")
+
+# Fields returned when 'fields' is not given
+DEFAULT_ACTOR_INFO_FIELDS = ("name", "type", "label", "location")
+
+# Fields sent as packed float32 triples in the columnar format
+TRANSFORM_FIELDS = ("location", "rotation", "scale")
+
+
+def _page_params(params, offset, page_size):
+    page = dict(params or {})
+    page["offset"] = offset
+    page["limit"] = page_size
+    return page
+
+
+def _next_offset(result, offset):
+    """Return the offset of the next page, or None after the last one."""
+    if "next_offset" not in result:
+        # Servers without paging ignore offset/limit and always send the first page
+        if result.get("limit_reached"):
+            print(f"Warning: server does not support get_scene_info paging, only "
+                  f"{result.get('returned_actor_count')} of {result.get('actor_count')} actors are available",
+                  file=sys.stderr)
+        return None
+    next_offset = result["next_offset"]
+    if next_offset is None or next_offset <= offset:
+        return None
+    return next_offset
+
+
+def iter_scene_actors(send_command=None, page_size=DEFAULT_PAGE_SIZE, params=None, command="get_scene_info"):
+    """Yield every actor in the current level, fetching one page at a time.
+
+    Args:
+        send_command: Function used to send commands (default: utils.send_command)
+        page_size: Number of actors requested per get_scene_info call
+        params: Extra get_scene_info parameters sent with every page
+        command: Paged command to send; use "query_actors" with params={"filter": {...}}
+                 to only stream the matching actors
+
+    Actors spawned or deleted while paging can shift later pages, so an actor
+    may be skipped or seen twice if the level changes during iteration.
+
+    Raises:
+        Exception: If the server returns an error for any page
+    """
+    if send_command is None:
+        from . import send_command
+    offset = 0
+    while offset is not None:
+        response = send_command(command, _page_params(params, offset, page_size))
+        if response["status"] != "success":
+            raise Exception(f"{command} failed at offset {offset}: {response.get('message')}")
+        result = response["result"]
+        yield from result["actors"]
+        offset = _next_offset(result, offset)
+
+
+async def aiter_scene_actors(async_send_command=None, page_size=DEFAULT_PAGE_SIZE, params=None,
+                             command="get_scene_info"):
+    """Async counterpart of iter_scene_actors for use with ``async for``.
+
+    Args:
+        async_send_command: Coroutine function used to send commands (default: utils.async_send_command)
+        page_size: Number of actors requested per get_scene_info call
+        params: Extra get_scene_info parameters sent with every page
+        command: Paged command to send ("get_scene_info" or "query_actors")
+    """
+    if async_send_command is None:
+        from . import async_send_command
+    offset = 0
+    while offset is not None:
+        response = await async_send_command(command, _page_params(params, offset, page_size))
+        if response["status"] != "success":
+            raise Exception(f"{command} failed at offset {offset}: {response.get('message')}")
+        result = response["result"]
+        for actor in result["actors"]:
+            yield actor
+        offset = _next_offset(result, offset)
+
+
+class SceneMirror:
+    """Local copy of the actors in the current level, kept in sync with deltas.
+
+    The first sync() pages through the whole level. Later calls send one
+    get_scene_changes request and apply the actors added, modified and
+    removed since the last version seen. The mirror falls back to a full
+    reload when the server asks for one (e.g. after a map change) or does
+    not support get_scene_changes.
+
+    Attributes:
+        actors: Actor info dicts by actor name
+        version: Scene version the mirror reflects, or None before the first sync
+        full_reloads: Number of times the whole level has been fetched
+    """
+
+    def __init__(self, send_command=None, page_size=DEFAULT_PAGE_SIZE, fields=None):
+        """
+        Args:
+            send_command: Function used to send commands (default: utils.send_command)
+            page_size: Number of actors requested per get_scene_info call
+            fields: Actor fields to mirror (default: DEFAULT_ACTOR_INFO_FIELDS); 'name' is always included
+        """
+        if send_command is None:
+            from . import send_command
+        self.send_command = send_command
+        self.page_size = page_size
+        self.params = {"fields": ["name"] + [field for field in fields if field != "name"]} if fields else {}
+        self.actors = {}
+        self.version = None
+        self.full_reloads = 0
+
+    def _start_reload(self):
+        self.actors = {}
+        self.version = None
+        self.full_reloads += 1
+
+    def _store_actor(self, actor):
+        """Add or replace an actor; subclasses extend this to maintain derived data."""
+        self.actors[actor["name"]] = actor
+
+    def _remove_actor(self, name):
+        """Forget an actor; subclasses extend this to maintain derived data."""
+        self.actors.pop(name, None)
+
+    def _add_page(self, result):
+        # Remember the version of the first page; changes made while paging are picked up by the next delta
+        if self.version is None:
+            self.version = result.get("version")
+        for actor in result["actors"]:
+            self._store_actor(actor)
+
+    def _apply_changes(self, response):
+        """Apply a get_scene_changes response. Returns False if a full reload is needed."""
+        if response["status"] != "success":
+            # Servers from before delta sync answer with "Unknown command"
+            return False
+        result = response["result"]
+        if result.get("full_resync"):
+            return False
+        for actor in result["added"] + result["modified"]:
+            self._store_actor(actor)
+        for name in result["removed"]:
+            self._remove_actor(name)
+        self.version = result["version"]
+        return True
+
+    def reload(self):
+        """Fetch the whole level again."""
+        self._start_reload()
+        offset = 0
+        while offset is not None:
+            response = self.send_command("get_scene_info", _page_params(self.params, offset, self.page_size))
+            if response["status"] != "success":
+                raise Exception(f"get_scene_info failed at offset {offset}: {response.get('message')}")
+            self._add_page(response["result"])
+            offset = _next_offset(response["result"], offset)
+
+    def sync(self):
+        """Bring the mirror up to date with the editor.
+
+        Raises:
+            Exception: If the server returns an error while fetching the whole level
+        """
+        if self.version is None:
+            self.reload()
+            return self.actors
+        response = self.send_command("get_scene_changes", dict(self.params, since_version=self.version))
+        if not self._apply_changes(response):
+            self.reload()
+        return self.actors
+
+
+class AsyncSceneMirror(SceneMirror):
+    """Async counterpart of SceneMirror; await sync() and reload()."""
+
+    def __init__(self, async_send_command=None, page_size=DEFAULT_PAGE_SIZE, fields=None):
+        """
+        Args:
+            async_send_command: Coroutine function used to send commands (default: utils.async_send_command)
+            page_size: Number of actors requested per get_scene_info call
+            fields: Actor fields to mirror (default: DEFAULT_ACTOR_INFO_FIELDS); 'name' is always included
+        """
+        if async_send_command is None:
+            from . import async_send_command
+        super().__init__(async_send_command, page_size, fields)
+
+    async def reload(self):
+        """Fetch the whole level again."""
+        self._start_reload()
+        offset = 0
+        while offset is not None:
+            response = await self.send_command("get_scene_info", _page_params(self.params, offset, self.page_size))
+            if response["status"] != "success":
+                raise Exception(f"get_scene_info failed at offset {offset}: {response.get('message')}")
+            self._add_page(response["result"])
+            offset = _next_offset(response["result"], offset)
+
+    async def sync(self):
+        """Bring the mirror up to date with the editor."""
+        if self.version is None:
+            await self.reload()
+            return self.actors
+        response = await self.send_command("get_scene_changes", dict(self.params, since_version=self.version))
+        if not self._apply_changes(response):
+            await self.reload()
+        return self.actors
+
+
+def _import_numpy():
+    try:
+        import numpy
+    except ImportError:
+        raise ImportError("NumPy is required to decode columnar scene data (pip install numpy)") from None
+    return numpy
+
+
+def decode_actor_columns(columns):
+    """Decode the 'columns' of a columnar get_scene_info page into NumPy arrays.
+
+    Args:
+        columns: The 'columns' object of a get_scene_info result requested with format='columnar'
+
+    Returns:
+        dict with 'count' and, for each field present in the page: 'name' and
+        'label' as lists of str, 'classes' (the distinct class names),
+        'type_index' (int32 index into 'classes'), 'type' (array of class
+        names) and 'location', 'rotation' and 'scale' as (N, 3) float32 arrays
+
+    Raises:
+        ImportError: If NumPy is not installed
+    """
+    np = _import_numpy()
+    count = columns["count"]
+    decoded = {"count": count}
+    for field in ("name", "label"):
+        if field in columns:
+            decoded[field] = columns[field]
+    if "type" in columns:
+        decoded["classes"] = list(columns["classes"])
+        decoded["type_index"] = np.frombuffer(base64.b64decode(columns["type"]), dtype="<i4").astype(np.int32)
+        decoded["type"] = np.asarray(decoded["classes"] or [""])[decoded["type_index"]]
+    for field in TRANSFORM_FIELDS:
+        if field in columns:
+            values = np.frombuffer(base64.b64decode(columns[field]), dtype="<f4").astype(np.float32)
+            decoded[field] = values.reshape(count, 3)
+    return decoded
+
+
+def _concatenate_columns(pages):
+    """Join decoded pages into one set of columns, remapping per-page class indices."""
+    np = _import_numpy()
+    if len(pages) == 1:
+        return pages[0]
+    joined = {"count": sum(page["count"] for page in pages)}
+    first = pages[0]
+    for field in ("name", "label"):
+        if field in first:
+            joined[field] = [value for page in pages for value in page[field]]
+    if "type_index" in first:
+        classes = list(dict.fromkeys(name for page in pages for name in page["classes"]))
+        class_index = {name: index for index, name in enumerate(classes)}
+        indices = []
+        for page in pages:
+            remap = np.array([class_index[name] for name in page["classes"]] or [0], dtype=np.int32)
+            indices.append(remap[page["type_index"]])
+        joined["classes"] = classes
+        joined["type_index"] = np.concatenate(indices)
+        joined["type"] = np.asarray(classes or [""])[joined["type_index"]]
+    for field in TRANSFORM_FIELDS:
+        if field in first:
+            joined[field] = np.concatenate([page[field] for page in pages])
+    return joined
+
+
+def _columnar_params(params, fields, offset, page_size):
+    page = _page_params(params, offset, page_size)
+    page["format"] = "columnar"
+    page["fields"] = list(fields)
+    return page
+
+
+def _columnar_page(command, response, offset):
+    if response["status"] != "success":
+        raise Exception(f"{command} failed at offset {offset}: {response.get('message')}")
+    result = response["result"]
+    if "columns" not in result:
+        raise Exception(f"Server does not support the columnar {command} format")
+    return result
+
+
+def fetch_scene_columns(send_command=None, fields=("name", "type", "location"), page_size=DEFAULT_COLUMNAR_PAGE_SIZE,
+                        params=None, command="get_scene_info"):
+    """Read every actor in the current level into NumPy arrays.
+
+    Args:
+        send_command: Function used to send commands (default: utils.send_command)
+        fields: Actor fields to read, any of ACTOR_INFO_FIELDS
+        page_size: Number of actors requested per get_scene_info call
+        params: Extra parameters sent with every page
+        command: Paged command to send; use "query_actors" with params={"filter": {...}}
+                 to only read the matching actors
+
+    Returns:
+        The columns of the whole level, as returned by decode_actor_columns
+
+    Raises:
+        ImportError: If NumPy is not installed
+        Exception: If the server returns an error or does not support the columnar format
+    """
+    _import_numpy()
+    if send_command is None:
+        from . import send_command
+    pages = []
+    offset = 0
+    while offset is not None:
+        response = send_command(command, _columnar_params(params, fields, offset, page_size))
+        result = _columnar_page(command, response, offset)
+        pages.append(decode_actor_columns(result["columns"]))
+        offset = _next_offset(result, offset)
+    return _concatenate_columns(pages)
+
+
+async def afetch_scene_columns(async_send_command=None, fields=("name", "type", "location"),
+                               page_size=DEFAULT_COLUMNAR_PAGE_SIZE, params=None, command="get_scene_info"):
+    """Async counterpart of fetch_scene_columns."""
+    _import_numpy()
+    if async_send_command is None:
+        from . import async_send_command
+    pages = []
+    offset = 0
+    while offset is not None:
+        response = await async_send_command(command, _columnar_params(params, fields, offset, page_size))
+        result = _columnar_page(command, response, offset)
+        pages.append(decode_actor_columns(result["columns"]))
+        offset = _next_offset(result, offset)
+    return _concatenate_columns(pages)
+
+
+__all__ = ['iter_scene_actors', 'aiter_scene_actors', 'SceneMirror', 'AsyncSceneMirror',
+           'decode_actor_columns', 'fetch_scene_columns', 'afetch_scene_columns',
+           'ACTOR_INFO_FIELDS', 'DEFAULT_ACTOR_INFO_FIELDS', 'DEFAULT_PAGE_SIZE', 'DEFAULT_COLUMNAR_PAGE_SIZE']
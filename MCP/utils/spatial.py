@@ -0,0 +1,361 @@
+"""Bridge-side spatial index over the actors of the current level.
+
+Region questions ("which lights are within 500 units of the player start")
+would otherwise need a full get_scene_info download and a scan of every
+actor. SpatialGrid buckets actor locations into a uniform grid of cubic
+cells so radius, box and k-nearest queries only look at nearby cells.
+
+SceneSpatialIndex and AsyncSceneSpatialIndex are SceneMirror variants that
+keep such a grid in sync with the editor. They are marked stale whenever a
+command that may change the level goes through the bridge (any command
+that invalidates the command cache) and after ``max_age`` seconds, and
+catch up with a single get_scene_changes request before the next query.
+"""
+
+import heapq
+import math
+import time
+
+from .scene import DEFAULT_PAGE_SIZE, AsyncSceneMirror, SceneMirror
+
+DEFAULT_CELL_SIZE = 1000.0
+DEFAULT_MAX_AGE = 2.0
+
+# Fields the index mirrors for every actor
+SPATIAL_INDEX_FIELDS = ("name", "type", "label", "location")
+
+
+class SpatialGrid:
+    """Uniform grid of points keyed by name.
+
+    Points are (x, y, z) tuples in Unreal units. Each query returns
+    ``(distance, name)`` pairs sorted by distance (box queries measure from
+    the box center).
+    """
+
+    def __init__(self, cell_size=DEFAULT_CELL_SIZE):
+        if cell_size <= 0:
+            raise ValueError("cell_size must be positive")
+        self.cell_size = float(cell_size)
+        self.points = {}
+        self._cells = {}
+
+    def __len__(self):
+        return len(self.points)
+
+    def _cell(self, point):
+        size = self.cell_size
+        return (math.floor(point[0] / size), math.floor(point[1] / size), math.floor(point[2] / size))
+
+    def clear(self):
+        """Remove every point."""
+        self.points.clear()
+        self._cells.clear()
+
+    def insert(self, name, point):
+        """Add a point, or move it if the name is already indexed."""
+        point = (float(point[0]), float(point[1]), float(point[2]))
+        old = self.points.get(name)
+        if old is not None:
+            if self._cell(old) == self._cell(point):
+                self.points[name] = point
+                return
+            self.remove(name)
+        self.points[name] = point
+        self._cells.setdefault(self._cell(point), set()).add(name)
+
+    def remove(self, name):
+        """Remove a point if it is indexed."""
+        point = self.points.pop(name, None)
+        if point is None:
+            return
+        cell = self._cell(point)
+        names = self._cells[cell]
+        names.discard(name)
+        if not names:
+            del self._cells[cell]
+
+    def _cells_in_box(self, low, high):
+        """Yield the names in every occupied cell overlapping the box."""
+        low_cell, high_cell = self._cell(low), self._cell(high)
+        span = [high_cell[axis] - low_cell[axis] + 1 for axis in range(3)]
+        if span[0] * span[1] * span[2] > len(self._cells):
+            # Fewer occupied cells than cells in range: walk the occupied ones instead
+            for cell, names in self._cells.items():
+                if all(low_cell[axis] <= cell[axis] <= high_cell[axis] for axis in range(3)):
+                    yield names
+            return
+        for x in range(low_cell[0], high_cell[0] + 1):
+            for y in range(low_cell[1], high_cell[1] + 1):
+                for z in range(low_cell[2], high_cell[2] + 1):
+                    names = self._cells.get((x, y, z))
+                    if names:
+                        yield names
+
+    def query_radius(self, center, radius, predicate=None):
+        """Return the points within ``radius`` of ``center``.
+
+        Args:
+            center: (x, y, z) point
+            radius: Search radius in Unreal units
+            predicate: Optional callable taking a name; points for which it returns False are skipped
+        """
+        low = [center[axis] - radius for axis in range(3)]
+        high = [center[axis] + radius for axis in range(3)]
+        radius_squared = radius * radius
+        found = []
+        for names in self._cells_in_box(low, high):
+            for name in names:
+                point = self.points[name]
+                distance_squared = sum((point[axis] - center[axis]) ** 2 for axis in range(3))
+                if distance_squared <= radius_squared and (predicate is None or predicate(name)):
+                    found.append((math.sqrt(distance_squared), name))
+        found.sort()
+        return found
+
+    def query_box(self, low, high, predicate=None):
+        """Return the points inside the axis-aligned box [low, high].
+
+        Args:
+            low: (x, y, z) minimum corner
+            high: (x, y, z) maximum corner
+            predicate: Optional callable taking a name; points for which it returns False are skipped
+        """
+        low, high = ([min(low[axis], high[axis]) for axis in range(3)],
+                     [max(low[axis], high[axis]) for axis in range(3)])
+        center = [(low[axis] + high[axis]) / 2 for axis in range(3)]
+        found = []
+        for names in self._cells_in_box(low, high):
+            for name in names:
+                point = self.points[name]
+                if all(low[axis] <= point[axis] <= high[axis] for axis in range(3)) and (
+                        predicate is None or predicate(name)):
+                    found.append((math.dist(point, center), name))
+        found.sort()
+        return found
+
+    def nearest(self, point, k=1, predicate=None):
+        """Return the ``k`` points closest to ``point``.
+
+        Cells are visited in shells of growing Chebyshev distance around the
+        cell of ``point``; the search stops once the k-th best candidate is
+        closer than any unvisited cell can be. Once a shell has more cells
+        than the grid has occupied cells, the remaining occupied cells are
+        visited in order of their shell instead.
+
+        Args:
+            point: (x, y, z) point
+            k: Number of points to return
+            predicate: Optional callable taking a name; points for which it returns False are skipped
+        """
+        if k <= 0 or not self.points:
+            return []
+        origin = self._cell(point)
+        best = []  # max-heap of (-distance, name)
+
+        def consider(names):
+            for name in names:
+                if predicate is not None and not predicate(name):
+                    continue
+                distance = math.dist(self.points[name], point)
+                if len(best) < k:
+                    heapq.heappush(best, (-distance, name))
+                elif distance < -best[0][0]:
+                    heapq.heapreplace(best, (-distance, name))
+
+        def done(ring):
+            # Any point in a farther shell is at least ring * cell_size away
+            return len(best) == k and -best[0][0] <= ring * self.cell_size
+
+        ring = 0
+        while (2 * ring + 1) ** 3 - max(2 * ring - 1, 0) ** 3 <= len(self._cells):
+            for names in self._ring_cells(origin, ring):
+                consider(names)
+            if done(ring):
+                return sorted((-distance, name) for distance, name in best)
+            ring += 1
+
+        remaining = sorted(
+            (max(abs(cell[axis] - origin[axis]) for axis in range(3)), cell) for cell in self._cells
+        )
+        for index, (cell_ring, cell) in enumerate(remaining):
+            if cell_ring < ring:
+                continue
+            consider(self._cells[cell])
+            next_ring = remaining[index + 1][0] if index + 1 < len(remaining) else None
+            if next_ring != cell_ring and done(cell_ring):
+                break
+        return sorted((-distance, name) for distance, name in best)
+
+    def _ring_cells(self, origin, ring):
+        """Yield the names in the occupied cells at Chebyshev distance ``ring`` from ``origin``."""
+        ox, oy, oz = origin
+        for x in range(ox - ring, ox + ring + 1):
+            for y in range(oy - ring, oy + ring + 1):
+                on_face = abs(x - ox) == ring or abs(y - oy) == ring
+                # Inside the shell only the top and bottom cells of each column belong to it
+                z_range = range(oz - ring, oz + ring + 1) if on_face else (oz - ring, oz + ring)
+                for z in z_range:
+                    names = self._cells.get((x, y, z))
+                    if names:
+                        yield names
+
+
+class _SpatialIndexMixin:
+    """Grid maintenance and queries shared by the sync and async indexes."""
+
+    def _init_index(self, cell_size, max_age):
+        self.grid = SpatialGrid(cell_size)
+        self.max_age = max_age
+        self._stale = True
+        self._synced_at = None
+
+    def mark_stale(self):
+        """Make the next query catch up with the editor first."""
+        self._stale = True
+
+    def attach(self, cache=None):
+        """Mark the index stale whenever a command invalidates the bridge's command cache.
+
+        Args:
+            cache: CommandCache to listen to (default: utils.get_command_cache())
+        """
+        if cache is None:
+            from . import get_command_cache
+            cache = get_command_cache()
+        cache.add_listener(self.mark_stale)
+        return self
+
+    def detach(self, cache=None):
+        """Stop listening to the command cache."""
+        if cache is None:
+            from . import get_command_cache
+            cache = get_command_cache()
+        cache.remove_listener(self.mark_stale)
+
+    def _needs_refresh(self):
+        return (self._stale or self._synced_at is None
+                or (self.max_age is not None and time.monotonic() - self._synced_at > self.max_age))
+
+    def _begin_refresh(self):
+        # Cleared before syncing so a change reported while the sync is running is not lost
+        self._stale = False
+        self._synced_at = time.monotonic()
+
+    def _start_reload(self):
+        super()._start_reload()
+        self.grid.clear()
+
+    def _store_actor(self, actor):
+        super()._store_actor(actor)
+        location = actor.get("location")
+        if location:
+            self.grid.insert(actor["name"], location)
+        else:
+            self.grid.remove(actor["name"])
+
+    def _remove_actor(self, name):
+        super()._remove_actor(name)
+        self.grid.remove(name)
+
+    def _predicate(self, actor_type):
+        if not actor_type:
+            return None
+        return lambda name: self.actors[name].get("type") == actor_type
+
+    def _results(self, found, limit=None):
+        if limit is not None:
+            found = found[:limit]
+        return [dict(self.actors[name], distance=distance) for distance, name in found]
+
+    def _find_in_radius(self, center, radius, actor_type=None, limit=None):
+        return self._results(self.grid.query_radius(center, radius, self._predicate(actor_type)), limit)
+
+    def _find_in_box(self, low, high, actor_type=None, limit=None):
+        return self._results(self.grid.query_box(low, high, self._predicate(actor_type)), limit)
+
+    def _find_nearest(self, point, k=1, actor_type=None):
+        return self._results(self.grid.nearest(point, k, self._predicate(actor_type)))
+
+
+class SceneSpatialIndex(_SpatialIndexMixin, SceneMirror):
+    """Spatial index over the level that refreshes itself before answering queries.
+
+    Query results are actor info dicts (name, type, label, location) with an
+    added ``distance`` field, sorted by distance.
+    """
+
+    def __init__(self, send_command=None, cell_size=DEFAULT_CELL_SIZE, max_age=DEFAULT_MAX_AGE,
+                 page_size=DEFAULT_PAGE_SIZE):
+        """
+        Args:
+            send_command: Function used to send commands (default: utils.send_command)
+            cell_size: Edge length of a grid cell in Unreal units
+            max_age: Seconds after which the index catches up even without a command going through
+                     the bridge (None to rely on the command cache alone)
+            page_size: Number of actors requested per get_scene_info call
+        """
+        super().__init__(send_command, page_size, SPATIAL_INDEX_FIELDS)
+        self._init_index(cell_size, max_age)
+
+    def refresh(self):
+        """Catch up with the editor if the index may be stale."""
+        if self._needs_refresh():
+            self._begin_refresh()
+            try:
+                self.sync()
+            except Exception:
+                self._stale = True
+                raise
+
+    def find_in_radius(self, center, radius, actor_type=None, limit=None):
+        """Return the actors within ``radius`` of ``center``, optionally only of one class."""
+        self.refresh()
+        return self._find_in_radius(center, radius, actor_type, limit)
+
+    def find_in_box(self, low, high, actor_type=None, limit=None):
+        """Return the actors inside the box [low, high], optionally only of one class."""
+        self.refresh()
+        return self._find_in_box(low, high, actor_type, limit)
+
+    def find_nearest(self, point, k=1, actor_type=None):
+        """Return the ``k`` actors closest to ``point``, optionally only of one class."""
+        self.refresh()
+        return self._find_nearest(point, k, actor_type)
+
+
+class AsyncSceneSpatialIndex(_SpatialIndexMixin, AsyncSceneMirror):
+    """Async counterpart of SceneSpatialIndex; await refresh() and the queries."""
+
+    def __init__(self, async_send_command=None, cell_size=DEFAULT_CELL_SIZE, max_age=DEFAULT_MAX_AGE,
+                 page_size=DEFAULT_PAGE_SIZE):
+        super().__init__(async_send_command, page_size, SPATIAL_INDEX_FIELDS)
+        self._init_index(cell_size, max_age)
+
+    async def refresh(self):
+        """Catch up with the editor if the index may be stale."""
+        if self._needs_refresh():
+            self._begin_refresh()
+            try:
+                await self.sync()
+            except BaseException:
+                self._stale = True
+                raise
+
+    async def find_in_radius(self, center, radius, actor_type=None, limit=None):
+        """Return the actors within ``radius`` of ``center``, optionally only of one class."""
+        await self.refresh()
+        return self._find_in_radius(center, radius, actor_type, limit)
+
+    async def find_in_box(self, low, high, actor_type=None, limit=None):
+        """Return the actors inside the box [low, high], optionally only of one class."""
+        await self.refresh()
+        return self._find_in_box(low, high, actor_type, limit)
+
+    async def find_nearest(self, point, k=1, actor_type=None):
+        """Return the ``k`` actors closest to ``point``, optionally only of one class."""
+        await self.refresh()
+        return self._find_nearest(point, k, actor_type)
+
+
+__all__ = ['SpatialGrid', 'SceneSpatialIndex', 'AsyncSceneSpatialIndex', 'DEFAULT_CELL_SIZE', 'DEFAULT_MAX_AGE']
@@ -0,0 +1,183 @@
+#include "MCPActorFilter.h"
+#include "GameFramework/Actor.h"
+
+namespace
+{
+    /** Read a 3-component numeric array field */
+    bool TryGetVectorField(const TSharedPtr<FJsonObject>& Object, const TCHAR* FieldName, FVector& OutVector)
+    {
+        const TArray<TSharedPtr<FJsonValue>>* ArrayPtr = nullptr;
+        if (!Object->TryGetArrayField(FStringView(FieldName), ArrayPtr) || !ArrayPtr || ArrayPtr->Num() != 3)
+        {
+            return false;
+        }
+        OutVector.X = (*ArrayPtr)[0]->AsNumber();
+        OutVector.Y = (*ArrayPtr)[1]->AsNumber();
+        OutVector.Z = (*ArrayPtr)[2]->AsNumber();
+        return true;
+    }
+}
+
+bool FMCPActorFilter::Parse(const TSharedPtr<FJsonObject>& FilterJson, FString& OutError)
+{
+    if (!FilterJson.IsValid())
+    {
+        return true;
+    }
+
+    for (const TPair<FString, TSharedPtr<FJsonValue>>& Condition : FilterJson->Values)
+    {
+        const FString& Key = Condition.Key;
+        if (Key == TEXT("class") || Key == TEXT("name") || Key == TEXT("label") || Key == TEXT("label_regex") || Key == TEXT("tag"))
+        {
+            FString Value;
+            if (!Condition.Value->TryGetString(Value) || Value.IsEmpty())
+            {
+                OutError = FString::Printf(TEXT("Filter '%s' must be a non-empty string"), *Key);
+                return false;
+            }
+            if (Key == TEXT("class"))
+            {
+                ClassName = Value;
+            }
+            else if (Key == TEXT("name"))
+            {
+                NamePattern = Value;
+            }
+            else if (Key == TEXT("label"))
+            {
+                LabelPattern = Value;
+            }
+            else if (Key == TEXT("label_regex"))
+            {
+                // Compiled once here rather than for every actor
+                LabelRegex.Emplace(Value);
+            }
+            else
+            {
+                Tag = FName(*Value);
+            }
+        }
+        else if (Key == TEXT("names"))
+        {
+            const TArray<TSharedPtr<FJsonValue>>* NamesArray = nullptr;
+            if (!Condition.Value->TryGetArray(NamesArray) || !NamesArray || NamesArray->Num() == 0)
+            {
+                OutError = TEXT("Filter 'names' must be a non-empty list of actor names or labels");
+                return false;
+            }
+            for (const TSharedPtr<FJsonValue>& NameValue : *NamesArray)
+            {
+                Names.Add(NameValue->AsString());
+            }
+        }
+        else if (Key == TEXT("box"))
+        {
+            const TSharedPtr<FJsonObject>* BoxObject = nullptr;
+            FVector Min, Max;
+            if (!Condition.Value->TryGetObject(BoxObject) || !BoxObject
+                || !TryGetVectorField(*BoxObject, TEXT("min"), Min) || !TryGetVectorField(*BoxObject, TEXT("max"), Max))
+            {
+                OutError = TEXT("Filter 'box' must be {\"min\": [x, y, z], \"max\": [x, y, z]}");
+                return false;
+            }
+            Box = FBox(Min.ComponentMin(Max), Min.ComponentMax(Max));
+            bHasBox = true;
+        }
+        else if (Key == TEXT("near"))
+        {
+            const TSharedPtr<FJsonObject>* NearObject = nullptr;
+            double Radius = 0.0;
+            if (!Condition.Value->TryGetObject(NearObject) || !NearObject
+                || !TryGetVectorField(*NearObject, TEXT("point"), NearPoint)
+                || !(*NearObject)->TryGetNumberField(FStringView(TEXT("radius")), Radius) || Radius < 0.0)
+            {
+                OutError = TEXT("Filter 'near' must be {\"point\": [x, y, z], \"radius\": r} with r >= 0");
+                return false;
+            }
+            NearRadiusSquared = Radius * Radius;
+            bHasNear = true;
+        }
+        else
+        {
+            OutError = FString::Printf(TEXT("Unknown filter: '%s'. Valid filters are class, name, names, label, label_regex, tag, box and near"), *Key);
+            return false;
+        }
+    }
+    return true;
+}
+
+bool FMCPActorFilter::IsEmpty() const
+{
+    return ClassName.IsEmpty() && NamePattern.IsEmpty() && Names.IsEmpty() && LabelPattern.IsEmpty() && !LabelRegex.IsSet()
+        && Tag.IsNone() && !bHasBox && !bHasNear;
+}
+
+bool FMCPActorFilter::Matches(const AActor* Actor) const
+{
+    if (!Actor)
+    {
+        return false;
+    }
+
+    // Cheapest conditions first: location tests before string matching
+    if (bHasBox || bHasNear)
+    {
+        const FVector Location = Actor->GetActorLocation();
+        if (bHasBox && !Box.IsInsideOrOn(Location))
+        {
+            return false;
+        }
+        if (bHasNear && FVector::DistSquared(Location, NearPoint) > NearRadiusSquared)
+        {
+            return false;
+        }
+    }
+
+    if (!Tag.IsNone() && !Actor->ActorHasTag(Tag))
+    {
+        return false;
+    }
+
+    if (!ClassName.IsEmpty())
+    {
+        bool bClassMatches = false;
+        for (const UClass* Class = Actor->GetClass(); Class && !bClassMatches; Class = Class->GetSuperClass())
+        {
+            bClassMatches = Class->GetName() == ClassName;
+        }
+        if (!bClassMatches)
+        {
+            return false;
+        }
+    }
+
+    if (!NamePattern.IsEmpty() && !Actor->GetName().MatchesWildcard(NamePattern))
+    {
+        return false;
+    }
+
+    if (!Names.IsEmpty() && !Names.Contains(Actor->GetName()) && !Names.Contains(Actor->GetActorLabel()))
+    {
+        return false;
+    }
+
+    if (!LabelPattern.IsEmpty() || LabelRegex.IsSet())
+    {
+        const FString Label = Actor->GetActorLabel();
+        if (!LabelPattern.IsEmpty() && !Label.MatchesWildcard(LabelPattern))
+        {
+            return false;
+        }
+        if (LabelRegex.IsSet())
+        {
+            FRegexMatcher Matcher(LabelRegex.GetValue(), Label);
+            if (!Matcher.FindNext())
+            {
+                return false;
+            }
+        }
+    }
+
+    return true;
+}
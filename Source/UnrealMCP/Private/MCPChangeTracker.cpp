@@ -0,0 +1,445 @@
+#include "MCPChangeTracker.h"
+#include "Editor.h"
+#include "EngineUtils.h"
+#include "GameFramework/Actor.h"
+#include "Engine/Blueprint.h"
+#include "Components/ActorComponent.h"
+#include "UObject/UObjectGlobals.h"
+#include "UObject/UObjectHash.h"
+#include "UObject/PackageReload.h"
+#include "UObject/UnrealType.h"
+#include "Misc/Guid.h"
+#include "MCPFileLogger.h"
+#include "MCPConstants.h"
+
+FMCPChangeTracker::FMCPChangeTracker()
+    : RemovedCount(0)
+    , Version(0)
+    , MinVersion(0)
+    , AssetRevision(0)
+    , SessionId(FGuid::NewGuid().ToString(EGuidFormats::Short))
+    , bStarted(false)
+{
+}
+
+FMCPChangeTracker::~FMCPChangeTracker()
+{
+    Stop();
+}
+
+void FMCPChangeTracker::Start()
+{
+    if (bStarted || !GEngine)
+    {
+        return;
+    }
+
+    ActorAddedHandle = GEngine->OnLevelActorAdded().AddRaw(this, &FMCPChangeTracker::HandleActorAdded);
+    ActorDeletedHandle = GEngine->OnLevelActorDeleted().AddRaw(this, &FMCPChangeTracker::HandleActorDeleted);
+    ActorMovedHandle = GEngine->OnActorMoved().AddRaw(this, &FMCPChangeTracker::HandleActorMoved);
+    PropertyChangedHandle = FCoreUObjectDelegates::OnObjectPropertyChanged.AddRaw(this, &FMCPChangeTracker::HandleObjectPropertyChanged);
+    MapChangeHandle = FEditorDelegates::MapChange.AddRaw(this, &FMCPChangeTracker::HandleMapChange);
+    PackageReloadedHandle = FCoreUObjectDelegates::OnPackageReloaded.AddRaw(this, &FMCPChangeTracker::HandlePackageReloaded);
+    if (GEditor)
+    {
+        BlueprintPreCompileHandle = GEditor->OnBlueprintPreCompile().AddRaw(this, &FMCPChangeTracker::HandleBlueprintPreCompile);
+    }
+    bStarted = true;
+
+    Reset();
+}
+
+void FMCPChangeTracker::Stop()
+{
+    if (!bStarted)
+    {
+        return;
+    }
+
+    if (GEngine)
+    {
+        GEngine->OnLevelActorAdded().Remove(ActorAddedHandle);
+        GEngine->OnLevelActorDeleted().Remove(ActorDeletedHandle);
+        GEngine->OnActorMoved().Remove(ActorMovedHandle);
+    }
+    if (GEditor)
+    {
+        GEditor->OnBlueprintPreCompile().Remove(BlueprintPreCompileHandle);
+    }
+    FCoreUObjectDelegates::OnObjectPropertyChanged.Remove(PropertyChangedHandle);
+    FEditorDelegates::MapChange.Remove(MapChangeHandle);
+    FCoreUObjectDelegates::OnPackageReloaded.Remove(PackageReloadedHandle);
+    bStarted = false;
+}
+
+UWorld* FMCPChangeTracker::GetEditorWorld() const
+{
+    return GEditor ? GEditor->GetEditorWorldContext().World() : nullptr;
+}
+
+bool FMCPChangeTracker::IsTracked(AActor* Actor) const
+{
+    return Actor && Actor->GetWorld() && Actor->GetWorld() == GetEditorWorld();
+}
+
+void FMCPChangeTracker::Reset()
+{
+    Entries.Reset();
+    NamesByLabel.Reset();
+    RemovedCount = 0;
+
+    // Clients holding an older version must fetch the whole scene again
+    MinVersion = ++Version;
+
+    if (UWorld* World = GetEditorWorld())
+    {
+        for (TActorIterator<AActor> It(World); It; ++It)
+        {
+            const FString Name = It->GetName();
+            FActorEntry& Entry = Entries.Add(Name);
+            Entry.Actor = *It;
+            Entry.AddedVersion = MinVersion;
+            Entry.Version = MinVersion;
+            CaptureState(Name, Entry, *It);
+        }
+    }
+
+    MCP_LOG_VERBOSE("Change tracker reset at version %lld with %d actors", Version, Entries.Num());
+}
+
+void FMCPChangeTracker::CaptureState(const FString& Name, FActorEntry& Entry, AActor* Actor)
+{
+    Entry.Transform = Actor->GetActorTransform();
+
+    const FString Label = Actor->GetActorLabel();
+    if (Entry.Label != Label)
+    {
+        NamesByLabel.RemoveSingle(Entry.Label, Name);
+        Entry.Label = Label;
+    }
+    NamesByLabel.AddUnique(Label, Name);
+}
+
+void FMCPChangeTracker::MarkEntryRemoved(const FString& Name, FActorEntry& Entry)
+{
+    NamesByLabel.RemoveSingle(Entry.Label, Name);
+    Entry.bRemoved = true;
+    Entry.Actor = nullptr;
+    Entry.Version = ++Version;
+    RemovedCount++;
+}
+
+void FMCPChangeTracker::MarkAdded(AActor* Actor)
+{
+    if (!IsTracked(Actor))
+    {
+        return;
+    }
+
+    const FString Name = Actor->GetName();
+    FActorEntry& Entry = Entries.FindOrAdd(Name);
+    if (!Entry.bRemoved && Entry.Actor == Actor)
+    {
+        // Already known, e.g. reported by both the engine and a command handler
+        CaptureState(Name, Entry, Actor);
+        return;
+    }
+
+    if (Entry.bRemoved)
+    {
+        RemovedCount--;
+    }
+    Entry.Actor = Actor;
+    Entry.bRemoved = false;
+    Entry.AddedVersion = ++Version;
+    Entry.Version = Version;
+    CaptureState(Name, Entry, Actor);
+}
+
+void FMCPChangeTracker::MarkModified(AActor* Actor)
+{
+    if (!IsTracked(Actor))
+    {
+        return;
+    }
+
+    const FString Name = Actor->GetName();
+    FActorEntry* Entry = Entries.Find(Name);
+    if (!Entry || Entry->bRemoved || Entry->Actor != Actor)
+    {
+        MarkAdded(Actor);
+        return;
+    }
+
+    Entry->Version = ++Version;
+    CaptureState(Name, *Entry, Actor);
+}
+
+void FMCPChangeTracker::MarkRemoved(AActor* Actor)
+{
+    if (!Actor)
+    {
+        return;
+    }
+
+    const FString Name = Actor->GetName();
+    FActorEntry* Entry = Entries.Find(Name);
+    if (!Entry || Entry->bRemoved || Entry->Actor != Actor)
+    {
+        return;
+    }
+
+    MarkEntryRemoved(Name, *Entry);
+    PruneRemovedEntries();
+}
+
+void FMCPChangeTracker::Rescan()
+{
+    UWorld* World = GetEditorWorld();
+    if (!World)
+    {
+        return;
+    }
+
+    const int64 StartVersion = Version;
+    TSet<FString> SeenNames;
+    for (TActorIterator<AActor> It(World); It; ++It)
+    {
+        AActor* Actor = *It;
+        const FString Name = Actor->GetName();
+        SeenNames.Add(Name);
+
+        FActorEntry* Entry = Entries.Find(Name);
+        if (!Entry || Entry->bRemoved || Entry->Actor != Actor)
+        {
+            MarkAdded(Actor);
+        }
+        else if (!Entry->Transform.Equals(Actor->GetActorTransform()) || Entry->Label != Actor->GetActorLabel())
+        {
+            MarkModified(Actor);
+        }
+    }
+
+    // Anything we still think is alive but was not in the world has been removed
+    for (TPair<FString, FActorEntry>& Pair : Entries)
+    {
+        if (!Pair.Value.bRemoved && !SeenNames.Contains(Pair.Key))
+        {
+            MarkEntryRemoved(Pair.Key, Pair.Value);
+        }
+    }
+    PruneRemovedEntries();
+
+    MCP_LOG_VERBOSE("Change tracker rescan recorded %lld changes", Version - StartVersion);
+}
+
+void FMCPChangeTracker::PruneRemovedEntries()
+{
+    if (RemovedCount <= MCPConstants::MAX_REMOVED_ACTORS_IN_CHANGE_JOURNAL)
+    {
+        return;
+    }
+
+    // Forget the older half of the removals; deltas from before them are no longer possible
+    TArray<int64> RemovedVersions;
+    for (const TPair<FString, FActorEntry>& Pair : Entries)
+    {
+        if (Pair.Value.bRemoved)
+        {
+            RemovedVersions.Add(Pair.Value.Version);
+        }
+    }
+    RemovedVersions.Sort();
+    const int64 Cutoff = RemovedVersions[RemovedVersions.Num() / 2];
+
+    for (auto It = Entries.CreateIterator(); It; ++It)
+    {
+        if (It->Value.bRemoved && It->Value.Version <= Cutoff)
+        {
+            It.RemoveCurrent();
+            RemovedCount--;
+        }
+    }
+    MinVersion = FMath::Max(MinVersion, Cutoff);
+}
+
+void FMCPChangeTracker::GetChangesSince(int64 SinceVersion, FMCPSceneChanges& OutChanges)
+{
+    // Actors can disappear without a notification (e.g. undoing a spawn)
+    for (TPair<FString, FActorEntry>& Pair : Entries)
+    {
+        FActorEntry& Entry = Pair.Value;
+        if (!Entry.bRemoved && (!Entry.Actor.IsValid() || Entry.Actor->IsActorBeingDestroyed()))
+        {
+            MarkEntryRemoved(Pair.Key, Entry);
+        }
+    }
+    PruneRemovedEntries();
+
+    OutChanges.Version = Version;
+    OutChanges.bFullResync = SinceVersion < MinVersion || SinceVersion > Version;
+    if (OutChanges.bFullResync)
+    {
+        return;
+    }
+
+    for (const TPair<FString, FActorEntry>& Pair : Entries)
+    {
+        const FActorEntry& Entry = Pair.Value;
+        if (Entry.Version <= SinceVersion)
+        {
+            continue;
+        }
+
+        if (Entry.bRemoved)
+        {
+            // Spawned and removed again since the client last looked: nothing to report
+            if (Entry.AddedVersion <= SinceVersion)
+            {
+                OutChanges.Removed.Add(Pair.Key);
+            }
+        }
+        else if (Entry.AddedVersion > SinceVersion)
+        {
+            OutChanges.Added.Add(Entry.Actor.Get());
+        }
+        else
+        {
+            OutChanges.Modified.Add(Entry.Actor.Get());
+        }
+    }
+}
+
+AActor* FMCPChangeTracker::FindTrackedActor(const FString& Name) const
+{
+    const FActorEntry* Entry = Entries.Find(Name);
+    if (!Entry || Entry->bRemoved)
+    {
+        return nullptr;
+    }
+
+    // The actor may have been destroyed or renamed without a notification
+    AActor* Actor = Entry->Actor.Get();
+    return Actor && !Actor->IsActorBeingDestroyed() && Actor->GetName() == Name ? Actor : nullptr;
+}
+
+AActor* FMCPChangeTracker::FindActor(const FString& NameOrLabel) const
+{
+    if (AActor* Actor = FindTrackedActor(NameOrLabel))
+    {
+        return Actor;
+    }
+
+    TArray<FString> Names;
+    NamesByLabel.MultiFind(NameOrLabel, Names, true);
+    for (const FString& Name : Names)
+    {
+        AActor* Actor = FindTrackedActor(Name);
+        if (Actor && Actor->GetActorLabel() == NameOrLabel)
+        {
+            return Actor;
+        }
+    }
+
+    // Not in the index: the tracker is stopped, or the actor appeared or was renamed without a notification
+    UWorld* World = GetEditorWorld();
+    if (!World)
+    {
+        return nullptr;
+    }
+
+    AActor* LabelMatch = nullptr;
+    for (TActorIterator<AActor> It(World); It; ++It)
+    {
+        if (It->GetName() == NameOrLabel)
+        {
+            return *It;
+        }
+        if (!LabelMatch && It->GetActorLabel() == NameOrLabel)
+        {
+            LabelMatch = *It;
+        }
+    }
+    return LabelMatch;
+}
+
+void FMCPChangeTracker::MarkAssetModified(const UObject* Asset)
+{
+    if (Asset)
+    {
+        AssetRevisions.Add(Asset->GetPathName(), ++AssetRevision);
+    }
+}
+
+FString FMCPChangeTracker::GetAssetStamp(const UObject* Asset) const
+{
+    const int64 Revision = Asset ? AssetRevisions.FindRef(Asset->GetPathName()) : 0;
+    return FString::Printf(TEXT("%s-%lld"), *SessionId, Revision);
+}
+
+void FMCPChangeTracker::HandleActorAdded(AActor* Actor)
+{
+    MarkAdded(Actor);
+}
+
+void FMCPChangeTracker::HandleActorDeleted(AActor* Actor)
+{
+    MarkRemoved(Actor);
+}
+
+void FMCPChangeTracker::HandleActorMoved(AActor* Actor)
+{
+    MarkModified(Actor);
+}
+
+void FMCPChangeTracker::HandleObjectPropertyChanged(UObject* Object, FPropertyChangedEvent& Event)
+{
+    if (AActor* Actor = Cast<AActor>(Object))
+    {
+        MarkModified(Actor);
+    }
+    else if (UActorComponent* Component = Cast<UActorComponent>(Object))
+    {
+        MarkModified(Component->GetOwner());
+    }
+    else
+    {
+        // Edits to material expressions, blueprint nodes and the like change the asset they belong to
+        for (const UObject* Outer = Object; Outer; Outer = Outer->GetOuter())
+        {
+            if (Outer->IsAsset())
+            {
+                MarkAssetModified(Outer);
+                break;
+            }
+        }
+    }
+}
+
+void FMCPChangeTracker::HandleMapChange(uint32 MapChangeFlags)
+{
+    Reset();
+}
+
+void FMCPChangeTracker::HandleBlueprintPreCompile(UBlueprint* Blueprint)
+{
+    MarkAssetModified(Blueprint);
+}
+
+void FMCPChangeTracker::HandlePackageReloaded(EPackageReloadPhase Phase, FPackageReloadedEvent* Event)
+{
+    // Reloading (e.g. after a source control sync or a revert) replaces the assets of a package without any property notification
+    if (Phase != EPackageReloadPhase::PostPackageFixup || !Event || !Event->GetNewPackage())
+    {
+        return;
+    }
+
+    ForEachObjectWithPackage(Event->GetNewPackage(), [this](UObject* Object)
+    {
+        if (Object->IsAsset())
+        {
+            MarkAssetModified(Object);
+        }
+        return true;
+    }, false);
+}
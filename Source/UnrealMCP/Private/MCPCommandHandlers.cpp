@@ -8,13 +8,469 @@
 #include "Misc/FileHelper.h"
 #include "Misc/Paths.h"
 #include "Misc/Guid.h"
+#include "Misc/Base64.h"
+#include "ScopedTransaction.h"
 #include "MCPConstants.h"
+#include "MCPChangeTracker.h"
+#include "MCPActorFilter.h"
 #include "Kismet/GameplayStatics.h"
 #include "Kismet/KismetSystemLibrary.h"
 #include "Engine/Blueprint.h"
 #include "Engine/BlueprintGeneratedClass.h"
+#include "GameFramework/DefaultPhysicsVolume.h"
+#include "GameFramework/WorldSettings.h"
 
 
+namespace
+{
+    /** Per-actor fields that scene queries can be restricted to with a 'fields' parameter */
+    enum EActorInfoField : uint32
+    {
+        ActorInfoName = 1 << 0,
+        ActorInfoType = 1 << 1,
+        ActorInfoLabel = 1 << 2,
+        ActorInfoLocation = 1 << 3,
+        ActorInfoRotation = 1 << 4,
+        ActorInfoScale = 1 << 5,
+
+        // Fields returned when the 'fields' parameter is missing; rotation and scale must be asked for
+        ActorInfoDefault = ActorInfoName | ActorInfoType | ActorInfoLabel | ActorInfoLocation
+    };
+
+    /**
+     * Read the optional 'fields' parameter of a scene query
+     * @param Params - The command parameters
+     * @param OutFields - Receives the requested EActorInfoField flags (ActorInfoDefault if the parameter is missing)
+     * @param OutError - Receives a message naming an unknown field
+     * @return True if the parameter is missing or valid
+     */
+    bool ParseActorInfoFields(const TSharedPtr<FJsonObject> &Params, uint32 &OutFields, FString &OutError)
+    {
+        OutFields = ActorInfoDefault;
+        const TArray<TSharedPtr<FJsonValue>> *FieldsArray = nullptr;
+        if (!Params->TryGetArrayField(FStringView(TEXT("fields")), FieldsArray) || !FieldsArray)
+        {
+            return true;
+        }
+
+        OutFields = 0;
+        for (const TSharedPtr<FJsonValue> &FieldValue : *FieldsArray)
+        {
+            const FString Field = FieldValue->AsString();
+            if (Field == TEXT("name"))
+            {
+                OutFields |= ActorInfoName;
+            }
+            else if (Field == TEXT("type"))
+            {
+                OutFields |= ActorInfoType;
+            }
+            else if (Field == TEXT("label"))
+            {
+                OutFields |= ActorInfoLabel;
+            }
+            else if (Field == TEXT("location"))
+            {
+                OutFields |= ActorInfoLocation;
+            }
+            else if (Field == TEXT("rotation"))
+            {
+                OutFields |= ActorInfoRotation;
+            }
+            else if (Field == TEXT("scale"))
+            {
+                OutFields |= ActorInfoScale;
+            }
+            else
+            {
+                OutError = FString::Printf(TEXT("Unknown field: '%s'. Valid fields are name, type, label, location, rotation and scale"), *Field);
+                return false;
+            }
+        }
+        return true;
+    }
+
+    /** Describe an actor the way get_scene_info and get_scene_changes report it, limited to the requested fields */
+    TSharedPtr<FJsonObject> CreateActorInfo(AActor *Actor, uint32 Fields = ActorInfoDefault)
+    {
+        TSharedPtr<FJsonObject> ActorInfo = MakeShared<FJsonObject>();
+        if (Fields & ActorInfoName)
+        {
+            ActorInfo->SetStringField("name", Actor->GetName());
+        }
+        if (Fields & ActorInfoType)
+        {
+            ActorInfo->SetStringField("type", Actor->GetClass()->GetName());
+        }
+
+        // Add the actor label (user-facing friendly name)
+        if (Fields & ActorInfoLabel)
+        {
+            ActorInfo->SetStringField("label", Actor->GetActorLabel());
+        }
+
+        // Add location
+        if (Fields & ActorInfoLocation)
+        {
+            FVector Location = Actor->GetActorLocation();
+            TArray<TSharedPtr<FJsonValue>> LocationArray;
+            LocationArray.Add(MakeShared<FJsonValueNumber>(Location.X));
+            LocationArray.Add(MakeShared<FJsonValueNumber>(Location.Y));
+            LocationArray.Add(MakeShared<FJsonValueNumber>(Location.Z));
+            ActorInfo->SetArrayField("location", LocationArray);
+        }
+        if (Fields & ActorInfoRotation)
+        {
+            FRotator Rotation = Actor->GetActorRotation();
+            TArray<TSharedPtr<FJsonValue>> RotationArray;
+            RotationArray.Add(MakeShared<FJsonValueNumber>(Rotation.Pitch));
+            RotationArray.Add(MakeShared<FJsonValueNumber>(Rotation.Yaw));
+            RotationArray.Add(MakeShared<FJsonValueNumber>(Rotation.Roll));
+            ActorInfo->SetArrayField("rotation", RotationArray);
+        }
+        if (Fields & ActorInfoScale)
+        {
+            FVector Scale = Actor->GetActorScale3D();
+            TArray<TSharedPtr<FJsonValue>> ScaleArray;
+            ScaleArray.Add(MakeShared<FJsonValueNumber>(Scale.X));
+            ScaleArray.Add(MakeShared<FJsonValueNumber>(Scale.Y));
+            ScaleArray.Add(MakeShared<FJsonValueNumber>(Scale.Z));
+            ActorInfo->SetArrayField("scale", ScaleArray);
+        }
+        return ActorInfo;
+    }
+
+    /** Encode an array as base64 of its raw (little-endian) bytes */
+    template <typename T>
+    FString EncodeColumn(const TArray<T> &Values)
+    {
+        return FBase64::Encode(reinterpret_cast<const uint8 *>(Values.GetData()), Values.Num() * sizeof(T));
+    }
+
+    /**
+     * Decode base64 packed little-endian [x, y, z] triples of ComponentType (float or double)
+     * @param Packed - The base64 string
+     * @param OutVectors - Receives the vectors
+     * @return True if the string decoded to whole triples
+     */
+    template <typename ComponentType>
+    bool DecodeVectorTriples(const FString &Packed, TArray<FVector> &OutVectors)
+    {
+        TArray<uint8> Bytes;
+        const int32 TripleSize = 3 * sizeof(ComponentType);
+        if (!FBase64::Decode(Packed, Bytes) || Bytes.Num() % TripleSize != 0)
+        {
+            return false;
+        }
+        const int32 Count = Bytes.Num() / TripleSize;
+        OutVectors.Reserve(Count);
+        for (int32 Index = 0; Index < Count; ++Index)
+        {
+            ComponentType Components[3];
+            FMemory::Memcpy(Components, Bytes.GetData() + Index * TripleSize, TripleSize);
+            OutVectors.Emplace(Components[0], Components[1], Components[2]);
+        }
+        return true;
+    }
+
+    /**
+     * Read an optional per-actor vector parameter of a bulk command
+     * Accepts a list of [x, y, z] arrays, a packed column {"dtype": "float64" or "float32", "data": base64}
+     * or, like the columnar scene format, a bare base64 string of packed little-endian float32 triples.
+     * @param Params - The command parameters
+     * @param FieldName - Name of the parameter
+     * @param OutVectors - Receives the vectors, left empty if the parameter is missing
+     * @param OutError - Receives a description of an invalid parameter
+     * @return True if the parameter is missing or valid
+     */
+    bool ReadVectorColumn(const TSharedPtr<FJsonObject> &Params, const TCHAR *FieldName, TArray<FVector> &OutVectors, FString &OutError)
+    {
+        const TSharedPtr<FJsonValue> Value = Params->TryGetField(FStringView(FieldName));
+        if (!Value.IsValid() || Value->IsNull())
+        {
+            return true;
+        }
+
+        const TSharedPtr<FJsonObject> *Column = nullptr;
+        if (Value->TryGetObject(Column) && Column)
+        {
+            FString DType;
+            FString Packed;
+            (*Column)->TryGetStringField(FStringView(TEXT("dtype")), DType);
+            const bool bHasData = (*Column)->TryGetStringField(FStringView(TEXT("data")), Packed);
+            bool bDecoded = false;
+            if (bHasData && DType == TEXT("float64"))
+            {
+                bDecoded = DecodeVectorTriples<double>(Packed, OutVectors);
+            }
+            else if (bHasData && DType == TEXT("float32"))
+            {
+                bDecoded = DecodeVectorTriples<float>(Packed, OutVectors);
+            }
+            if (!bDecoded)
+            {
+                OutVectors.Reset();
+                OutError = FString::Printf(TEXT("'%s' must declare a dtype of float32 or float64 and base64 data of packed [x, y, z] triples"), FieldName);
+            }
+            return bDecoded;
+        }
+
+        FString Packed;
+        if (Value->TryGetString(Packed))
+        {
+            if (!DecodeVectorTriples<float>(Packed, OutVectors))
+            {
+                OutError = FString::Printf(TEXT("'%s' must be base64 of packed float32 [x, y, z] triples"), FieldName);
+                return false;
+            }
+            return true;
+        }
+
+        const TArray<TSharedPtr<FJsonValue>> *Items = nullptr;
+        if (Value->TryGetArray(Items) && Items)
+        {
+            OutVectors.Reserve(Items->Num());
+            for (const TSharedPtr<FJsonValue> &Item : *Items)
+            {
+                const TArray<TSharedPtr<FJsonValue>> *Components = nullptr;
+                if (!Item->TryGetArray(Components) || !Components || Components->Num() != 3)
+                {
+                    OutVectors.Reset();
+                    break;
+                }
+                OutVectors.Emplace((*Components)[0]->AsNumber(), (*Components)[1]->AsNumber(), (*Components)[2]->AsNumber());
+            }
+            if (OutVectors.Num() == Items->Num())
+            {
+                return true;
+            }
+        }
+
+        OutError = FString::Printf(TEXT("'%s' must be a list of [x, y, z] arrays or a packed vector column"), FieldName);
+        return false;
+    }
+
+    /**
+     * Actors of a scene page in columnar layout
+     * Names, labels and class names are parallel string arrays (classes are stored once and
+     * referenced by index); location, rotation and scale are packed float32 triples.
+     */
+    struct FActorColumns
+    {
+        explicit FActorColumns(uint32 InFields)
+            : Fields(InFields)
+        {
+        }
+
+        void Add(AActor *Actor)
+        {
+            Count++;
+            if (Fields & ActorInfoName)
+            {
+                Names.Add(MakeShared<FJsonValueString>(Actor->GetName()));
+            }
+            if (Fields & ActorInfoType)
+            {
+                const FString ClassName = Actor->GetClass()->GetName();
+                int32 *ClassIndex = ClassIndices.Find(ClassName);
+                if (!ClassIndex)
+                {
+                    ClassIndex = &ClassIndices.Add(ClassName, Classes.Add(MakeShared<FJsonValueString>(ClassName)));
+                }
+                TypeIndices.Add(*ClassIndex);
+            }
+            if (Fields & ActorInfoLabel)
+            {
+                Labels.Add(MakeShared<FJsonValueString>(Actor->GetActorLabel()));
+            }
+            if (Fields & ActorInfoLocation)
+            {
+                const FVector Location = Actor->GetActorLocation();
+                Locations.Append({static_cast<float>(Location.X), static_cast<float>(Location.Y), static_cast<float>(Location.Z)});
+            }
+            if (Fields & ActorInfoRotation)
+            {
+                const FRotator Rotation = Actor->GetActorRotation();
+                Rotations.Append({static_cast<float>(Rotation.Pitch), static_cast<float>(Rotation.Yaw), static_cast<float>(Rotation.Roll)});
+            }
+            if (Fields & ActorInfoScale)
+            {
+                const FVector Scale = Actor->GetActorScale3D();
+                Scales.Append({static_cast<float>(Scale.X), static_cast<float>(Scale.Y), static_cast<float>(Scale.Z)});
+            }
+        }
+
+        TSharedPtr<FJsonObject> ToJson() const
+        {
+            TSharedPtr<FJsonObject> Columns = MakeShared<FJsonObject>();
+            Columns->SetNumberField("count", Count);
+            if (Fields & ActorInfoName)
+            {
+                Columns->SetArrayField("name", Names);
+            }
+            if (Fields & ActorInfoType)
+            {
+                Columns->SetArrayField("classes", Classes);
+                Columns->SetStringField("type", EncodeColumn(TypeIndices));
+            }
+            if (Fields & ActorInfoLabel)
+            {
+                Columns->SetArrayField("label", Labels);
+            }
+            if (Fields & ActorInfoLocation)
+            {
+                Columns->SetStringField("location", EncodeColumn(Locations));
+            }
+            if (Fields & ActorInfoRotation)
+            {
+                Columns->SetStringField("rotation", EncodeColumn(Rotations));
+            }
+            if (Fields & ActorInfoScale)
+            {
+                Columns->SetStringField("scale", EncodeColumn(Scales));
+            }
+            return Columns;
+        }
+
+        uint32 Fields;
+        int32 Count = 0;
+        TArray<TSharedPtr<FJsonValue>> Names;
+        TArray<TSharedPtr<FJsonValue>> Labels;
+        TArray<TSharedPtr<FJsonValue>> Classes;
+        TMap<FString, int32> ClassIndices;
+        TArray<int32> TypeIndices;
+        TArray<float> Locations;
+        TArray<float> Rotations;
+        TArray<float> Scales;
+    };
+
+    /**
+     * Collect one page of the actors matching a filter, in iteration order
+     * Shared by get_scene_info and query_actors; reads the offset, limit, fields and format parameters.
+     * @param Params - The command parameters
+     * @param Filter - Only actors matching this filter are counted and returned
+     * @param Version - Current scene version, reported with the page
+     * @param OutError - Receives a description of an invalid parameter
+     * @return The result object, or nullptr if a parameter is invalid
+     */
+    TSharedPtr<FJsonObject> BuildScenePage(const TSharedPtr<FJsonObject> &Params, const FMCPActorFilter &Filter, int64 Version, FString &OutError)
+    {
+        // Optional paging: return actors [Offset, Offset + Limit) in iteration order
+        int32 Offset = 0;
+        int32 Limit = MCPConstants::MAX_ACTORS_IN_SCENE_INFO;
+        double NumberValue = 0.0;
+        if (Params->TryGetNumberField(FStringView(TEXT("offset")), NumberValue))
+        {
+            Offset = FMath::Max(0, static_cast<int32>(NumberValue));
+        }
+        if (Params->TryGetNumberField(FStringView(TEXT("limit")), NumberValue))
+        {
+            Limit = FMath::Clamp(static_cast<int32>(NumberValue), 1, MCPConstants::MAX_SCENE_INFO_PAGE_SIZE);
+        }
+
+        uint32 Fields = 0;
+        if (!ParseActorInfoFields(Params, Fields, OutError))
+        {
+            return nullptr;
+        }
+
+        // Optional columnar layout for bulk reads: parallel arrays instead of one object per actor
+        FString Format = MCPConstants::SCENE_FORMAT_OBJECTS;
+        Params->TryGetStringField(FStringView(TEXT("format")), Format);
+        const bool bColumnar = Format == MCPConstants::SCENE_FORMAT_COLUMNAR;
+        if (!bColumnar && Format != MCPConstants::SCENE_FORMAT_OBJECTS)
+        {
+            OutError = FString::Printf(TEXT("Unknown format: '%s'. Valid formats are '%s' and '%s'"),
+                                       *Format, MCPConstants::SCENE_FORMAT_OBJECTS, MCPConstants::SCENE_FORMAT_COLUMNAR);
+            return nullptr;
+        }
+        FActorColumns Columns(Fields);
+
+        UWorld *World = GEditor->GetEditorWorldContext().World();
+        TSharedPtr<FJsonObject> Result = MakeShared<FJsonObject>();
+        TArray<TSharedPtr<FJsonValue>> ActorsArray;
+
+        int32 ActorCount = 0;
+        int32 TotalActorCount = 0;
+
+        // Count every matching actor and collect the requested page in a single pass
+        for (TActorIterator<AActor> It(World); It; ++It)
+        {
+            if (!Filter.Matches(*It))
+            {
+                continue;
+            }
+
+            const int32 ActorIndex = TotalActorCount++;
+            if (ActorIndex < Offset || ActorCount >= Limit)
+            {
+                continue;
+            }
+
+            if (bColumnar)
+            {
+                Columns.Add(*It);
+            }
+            else
+            {
+                ActorsArray.Add(MakeShared<FJsonValueObject>(CreateActorInfo(*It, Fields)));
+            }
+            ActorCount++;
+        }
+
+        // More actors remain after this page; the client can continue from next_offset
+        const bool bLimitReached = Offset + ActorCount < TotalActorCount;
+        if (bLimitReached)
+        {
+            MCP_LOG_VERBOSE("Page limit reached (%d). %d of %d actors remain after this page.",
+                            Limit, TotalActorCount - Offset - ActorCount, TotalActorCount);
+        }
+
+        Result->SetStringField("level", World->GetName());
+        // Scene version the page reflects; pass it to get_scene_changes to catch up later
+        Result->SetNumberField("version", Version);
+        Result->SetNumberField("actor_count", TotalActorCount);
+        Result->SetNumberField("returned_actor_count", ActorCount);
+        Result->SetBoolField("limit_reached", bLimitReached);
+        Result->SetNumberField("offset", Offset);
+        if (bLimitReached)
+        {
+            Result->SetNumberField("next_offset", Offset + ActorCount);
+        }
+        else
+        {
+            Result->SetField("next_offset", MakeShared<FJsonValueNull>());
+        }
+        if (bColumnar)
+        {
+            Result->SetObjectField("columns", Columns.ToJson());
+        }
+        else
+        {
+            Result->SetArrayField("actors", ActorsArray);
+        }
+        return Result;
+    }
+
+    /**
+     * Whether the editor would let the user delete an actor
+     * Builder brushes, world settings, the default physics volume and actors that are not user managed
+     * (e.g. owned by World Partition) must not be removed by a bulk delete
+     * @param Actor - The actor to check
+     * @return True if the actor may be deleted
+     */
+    bool IsUserDeletableActor(AActor *Actor)
+    {
+        if (!IsValid(Actor) || FActorEditorUtils::IsABuilderBrush(Actor) || Actor->IsA<AWorldSettings>()
+            || Actor->IsA<ADefaultPhysicsVolume>() || !Actor->IsUserManaged())
+        {
+            return false;
+        }
+        FText Reason;
+        return Actor->CanDeleteSelectedActor(Reason);
+    }
+}
+
 //
 // FMCPGetSceneInfoHandler
 //
@@ -22,57 +478,117 @@ TSharedPtr<FJsonObject> FMCPGetSceneInfoHandler::Execute(const TSharedPtr<FJsonO
 {
     MCP_LOG_INFO("Handling get_scene_info command");
 
-    UWorld *World = GEditor->GetEditorWorldContext().World();
-    TSharedPtr<FJsonObject> Result = MakeShared<FJsonObject>();
-    TArray<TSharedPtr<FJsonValue>> ActorsArray;
+    FString Error;
+    TSharedPtr<FJsonObject> Result = BuildScenePage(Params, FMCPActorFilter(), ChangeTracker->GetVersion(), Error);
+    if (!Result.IsValid())
+    {
+        MCP_LOG_WARNING("Invalid get_scene_info parameters: %s", *Error);
+        return CreateErrorResponse(Error);
+    }
+
+    MCP_LOG_INFO("Sending get_scene_info response with %d/%d actors (offset %d)",
+                 static_cast<int32>(Result->GetNumberField(TEXT("returned_actor_count"))),
+                 static_cast<int32>(Result->GetNumberField(TEXT("actor_count"))),
+                 static_cast<int32>(Result->GetNumberField(TEXT("offset"))));
+
+    return CreateSuccessResponse(Result);
+}
 
-    int32 ActorCount = 0;
-    int32 TotalActorCount = 0;
-    bool bLimitReached = false;
+//
+// FMCPQueryActorsHandler
+//
+TSharedPtr<FJsonObject> FMCPQueryActorsHandler::Execute(const TSharedPtr<FJsonObject> &Params, FSocket *ClientSocket)
+{
+    MCP_LOG_INFO("Handling query_actors command");
 
-    // First count the total number of actors
-    for (TActorIterator<AActor> CountIt(World); CountIt; ++CountIt)
+    const TSharedPtr<FJsonObject> *FilterObject = nullptr;
+    if (Params->HasField(TEXT("filter")) && !Params->TryGetObjectField(FStringView(TEXT("filter")), FilterObject))
     {
-        TotalActorCount++;
+        MCP_LOG_WARNING("'filter' field in query_actors command is not an object");
+        return CreateErrorResponse("'filter' must be an object");
     }
 
-    // Then collect actor info up to the limit
-    for (TActorIterator<AActor> It(World); It; ++It)
+    FMCPActorFilter Filter;
+    FString Error;
+    if (!Filter.Parse(FilterObject ? *FilterObject : TSharedPtr<FJsonObject>(), Error))
     {
-        AActor *Actor = *It;
-        TSharedPtr<FJsonObject> ActorInfo = MakeShared<FJsonObject>();
-        ActorInfo->SetStringField("name", Actor->GetName());
-        ActorInfo->SetStringField("type", Actor->GetClass()->GetName());
+        MCP_LOG_WARNING("Invalid query_actors filter: %s", *Error);
+        return CreateErrorResponse(Error);
+    }
 
-        // Add the actor label (user-facing friendly name)
-        ActorInfo->SetStringField("label", Actor->GetActorLabel());
+    TSharedPtr<FJsonObject> Result = BuildScenePage(Params, Filter, ChangeTracker->GetVersion(), Error);
+    if (!Result.IsValid())
+    {
+        MCP_LOG_WARNING("Invalid query_actors parameters: %s", *Error);
+        return CreateErrorResponse(Error);
+    }
 
-        // Add location
-        FVector Location = Actor->GetActorLocation();
-        TArray<TSharedPtr<FJsonValue>> LocationArray;
-        LocationArray.Add(MakeShared<FJsonValueNumber>(Location.X));
-        LocationArray.Add(MakeShared<FJsonValueNumber>(Location.Y));
-        LocationArray.Add(MakeShared<FJsonValueNumber>(Location.Z));
-        ActorInfo->SetArrayField("location", LocationArray);
+    MCP_LOG_INFO("Sending query_actors response with %d of %d matching actors (offset %d)",
+                 static_cast<int32>(Result->GetNumberField(TEXT("returned_actor_count"))),
+                 static_cast<int32>(Result->GetNumberField(TEXT("actor_count"))),
+                 static_cast<int32>(Result->GetNumberField(TEXT("offset"))));
+
+    return CreateSuccessResponse(Result);
+}
+
+//
+// FMCPGetSceneChangesHandler
+//
+TSharedPtr<FJsonObject> FMCPGetSceneChangesHandler::Execute(const TSharedPtr<FJsonObject> &Params, FSocket *ClientSocket)
+{
+    double SinceVersionValue = 0.0;
+    if (!Params->TryGetNumberField(FStringView(TEXT("since_version")), SinceVersionValue))
+    {
+        MCP_LOG_WARNING("Missing 'since_version' field in get_scene_changes command");
+        return CreateErrorResponse("Missing 'since_version' field");
+    }
+    const int64 SinceVersion = static_cast<int64>(SinceVersionValue);
 
-        ActorsArray.Add(MakeShared<FJsonValueObject>(ActorInfo));
-        ActorCount++;
-        if (ActorCount >= MCPConstants::MAX_ACTORS_IN_SCENE_INFO)
+    uint32 Fields = 0;
+    FString FieldsError;
+    if (!ParseActorInfoFields(Params, Fields, FieldsError))
+    {
+        MCP_LOG_WARNING("%s", *FieldsError);
+        return CreateErrorResponse(FieldsError);
+    }
+
+    FMCPSceneChanges Changes;
+    ChangeTracker->GetChangesSince(SinceVersion, Changes);
+
+    // A delta as large as a page of the scene is no cheaper than paging through it
+    const bool bFullResync = Changes.bFullResync
+        || Changes.Added.Num() + Changes.Modified.Num() > MCPConstants::MAX_SCENE_INFO_PAGE_SIZE;
+
+    TSharedPtr<FJsonObject> Result = MakeShared<FJsonObject>();
+    Result->SetNumberField("version", Changes.Version);
+    Result->SetNumberField("since_version", SinceVersion);
+    Result->SetBoolField("full_resync", bFullResync);
+
+    TArray<TSharedPtr<FJsonValue>> AddedArray;
+    TArray<TSharedPtr<FJsonValue>> ModifiedArray;
+    TArray<TSharedPtr<FJsonValue>> RemovedArray;
+    if (!bFullResync)
+    {
+        for (AActor *Actor : Changes.Added)
         {
-            bLimitReached = true;
-            MCP_LOG_WARNING("Actor limit reached (%d). Only returning %d of %d actors.",
-                            MCPConstants::MAX_ACTORS_IN_SCENE_INFO, ActorCount, TotalActorCount);
-            break; // Limit for performance
+            AddedArray.Add(MakeShared<FJsonValueObject>(CreateActorInfo(Actor, Fields)));
+        }
+        for (AActor *Actor : Changes.Modified)
+        {
+            ModifiedArray.Add(MakeShared<FJsonValueObject>(CreateActorInfo(Actor, Fields)));
+        }
+        for (const FString &Name : Changes.Removed)
+        {
+            RemovedArray.Add(MakeShared<FJsonValueString>(Name));
         }
     }
+    Result->SetArrayField("added", AddedArray);
+    Result->SetArrayField("modified", ModifiedArray);
+    Result->SetArrayField("removed", RemovedArray);
 
-    Result->SetStringField("level", World->GetName());
-    Result->SetNumberField("actor_count", TotalActorCount);
-    Result->SetNumberField("returned_actor_count", ActorCount);
-    Result->SetBoolField("limit_reached", bLimitReached);
-    Result->SetArrayField("actors", ActorsArray);
-
-    MCP_LOG_INFO("Sending get_scene_info response with %d/%d actors", ActorCount, TotalActorCount);
+    MCP_LOG_INFO("Sending get_scene_changes response since version %lld: %d added, %d modified, %d removed%s",
+                 SinceVersion, AddedArray.Num(), ModifiedArray.Num(), RemovedArray.Num(),
+                 bFullResync ? TEXT(" (full resync required)") : TEXT(""));
 
     return CreateSuccessResponse(Result);
 }
@@ -122,6 +638,7 @@ TSharedPtr<FJsonObject> FMCPCreateObjectHandler::Execute(const TSharedPtr<FJsonO
 
         if (Result.Value)
         {
+            ChangeTracker->MarkAdded(Result.Key);
             TSharedPtr<FJsonObject> ResultObj = MakeShared<FJsonObject>();
             ResultObj->SetStringField("name", Result.Key->GetName());
             ResultObj->SetStringField("label", Result.Key->GetActorLabel());
@@ -141,6 +658,7 @@ TSharedPtr<FJsonObject> FMCPCreateObjectHandler::Execute(const TSharedPtr<FJsonO
 
         if (Result.Value)
         {
+            ChangeTracker->MarkAdded(Result.Key);
             TSharedPtr<FJsonObject> ResultObj = MakeShared<FJsonObject>();
             ResultObj->SetStringField("name", Result.Key->GetName());
             ResultObj->SetStringField("label", Result.Key->GetActorLabel());
@@ -262,29 +780,152 @@ TPair<AStaticMeshActor *, bool> FMCPCreateObjectHandler::CreateCubeActor(UWorld
 }
 
 //
-// FMCPModifyObjectHandler
+// FMCPCreateObjectsHandler
 //
-TSharedPtr<FJsonObject> FMCPModifyObjectHandler::Execute(const TSharedPtr<FJsonObject> &Params, FSocket *ClientSocket)
+TSharedPtr<FJsonObject> FMCPCreateObjectsHandler::Execute(const TSharedPtr<FJsonObject> &Params, FSocket *ClientSocket)
 {
+    MCP_LOG_INFO("Handling create_objects command");
+
     UWorld *World = GEditor->GetEditorWorldContext().World();
 
-    FString ActorName;
-    if (!Params->TryGetStringField(FStringView(TEXT("name")), ActorName))
+    FString Type;
+    if (!Params->TryGetStringField(FStringView(TEXT("type")), Type))
     {
-        MCP_LOG_WARNING("Missing 'name' field in modify_object command");
-        return CreateErrorResponse("Missing 'name' field");
+        MCP_LOG_WARNING("Missing 'type' field in create_objects command");
+        return CreateErrorResponse("Missing 'type' field");
+    }
+
+    // Same types as create_object: a static mesh actor with an optional mesh, or a cube
+    FString MeshPath;
+    if (Type == "StaticMeshActor")
+    {
+        Params->TryGetStringField(FStringView(TEXT("mesh")), MeshPath);
+    }
+    else if (Type.ToLower() == "cube")
+    {
+        MeshPath = TEXT("/Engine/BasicShapes/Cube.Cube");
+    }
+    else
+    {
+        MCP_LOG_WARNING("Unsupported actor type: %s", *Type);
+        return CreateErrorResponse(FString::Printf(TEXT("Unsupported actor type: %s"), *Type));
+    }
+
+    TArray<FVector> Locations;
+    TArray<FVector> Rotations;
+    TArray<FVector> Scales;
+    FString Error;
+    if (!ReadVectorColumn(Params, TEXT("locations"), Locations, Error)
+        || !ReadVectorColumn(Params, TEXT("rotations"), Rotations, Error)
+        || !ReadVectorColumn(Params, TEXT("scales"), Scales, Error))
+    {
+        MCP_LOG_WARNING("Invalid create_objects parameters: %s", *Error);
+        return CreateErrorResponse(Error);
+    }
+
+    const int32 Count = Locations.Num();
+    if (Count == 0 || Count > MCPConstants::MAX_OBJECTS_PER_BULK_COMMAND)
+    {
+        MCP_LOG_WARNING("create_objects command with %d locations", Count);
+        return CreateErrorResponse(FString::Printf(TEXT("'locations' must contain between 1 and %d entries"),
+                                                   MCPConstants::MAX_OBJECTS_PER_BULK_COMMAND));
+    }
+    if ((Rotations.Num() > 0 && Rotations.Num() != Count) || (Scales.Num() > 0 && Scales.Num() != Count))
+    {
+        MCP_LOG_WARNING("create_objects rotations or scales do not match the %d locations", Count);
+        return CreateErrorResponse("'rotations' and 'scales' must have one entry per location");
+    }
+
+    TArray<FString> Labels;
+    const TArray<TSharedPtr<FJsonValue>> *LabelsArrayPtr = nullptr;
+    if (Params->TryGetArrayField(FStringView(TEXT("labels")), LabelsArrayPtr) && LabelsArrayPtr)
+    {
+        if (LabelsArrayPtr->Num() != Count)
+        {
+            MCP_LOG_WARNING("create_objects labels do not match the %d locations", Count);
+            return CreateErrorResponse("'labels' must have one entry per location");
+        }
+        Labels.Reserve(Count);
+        for (const TSharedPtr<FJsonValue> &LabelValue : *LabelsArrayPtr)
+        {
+            Labels.Add(LabelValue->AsString());
+        }
     }
 
-    AActor *Actor = nullptr;
-    for (TActorIterator<AActor> It(World); It; ++It)
+    // Load the mesh once rather than for every actor
+    UStaticMesh *Mesh = nullptr;
+    if (!MeshPath.IsEmpty())
     {
-        if (It->GetName() == ActorName)
+        Mesh = LoadObject<UStaticMesh>(nullptr, *MeshPath);
+        if (!Mesh)
         {
-            Actor = *It;
-            break;
+            MCP_LOG_WARNING("Failed to load mesh %s", *MeshPath);
+            return CreateErrorResponse(FString::Printf(TEXT("Failed to load mesh: %s"), *MeshPath));
         }
     }
 
+    // Skip the per-actor collision checks of create_object; bulk placements are usually meant to overlap or touch
+    FActorSpawnParameters SpawnParams;
+    SpawnParams.SpawnCollisionHandlingOverride = ESpawnActorCollisionHandlingMethod::AlwaysSpawn;
+
+    // One entry per location: the actor name, or null if that actor could not be spawned
+    TArray<TSharedPtr<FJsonValue>> Names;
+    Names.Reserve(Count);
+    int32 CreatedCount = 0;
+    for (int32 Index = 0; Index < Count; ++Index)
+    {
+        const FRotator Rotation = Rotations.Num() > 0
+            ? FRotator(Rotations[Index].X, Rotations[Index].Y, Rotations[Index].Z)
+            : FRotator::ZeroRotator;
+        AStaticMeshActor *NewActor = World->SpawnActor<AStaticMeshActor>(Locations[Index], Rotation, SpawnParams);
+        if (!NewActor)
+        {
+            Names.Add(MakeShared<FJsonValueNull>());
+            continue;
+        }
+
+        if (Mesh)
+        {
+            NewActor->GetStaticMeshComponent()->SetStaticMesh(Mesh);
+        }
+        if (Scales.Num() > 0)
+        {
+            NewActor->SetActorScale3D(Scales[Index]);
+        }
+        if (Labels.Num() > 0 && !Labels[Index].IsEmpty())
+        {
+            NewActor->SetActorLabel(Labels[Index]);
+        }
+
+        ChangeTracker->MarkAdded(NewActor);
+        Names.Add(MakeShared<FJsonValueString>(NewActor->GetName()));
+        CreatedCount++;
+    }
+
+    MCP_LOG_INFO("Created %d of %d %s actors", CreatedCount, Count, *Type);
+
+    TSharedPtr<FJsonObject> Result = MakeShared<FJsonObject>();
+    Result->SetNumberField("created", CreatedCount);
+    Result->SetNumberField("failed", Count - CreatedCount);
+    Result->SetArrayField("names", Names);
+    return CreateSuccessResponse(Result);
+}
+
+//
+// FMCPModifyObjectHandler
+//
+TSharedPtr<FJsonObject> FMCPModifyObjectHandler::Execute(const TSharedPtr<FJsonObject> &Params, FSocket *ClientSocket)
+{
+    FString ActorName;
+    if (!Params->TryGetStringField(FStringView(TEXT("name")), ActorName))
+    {
+        MCP_LOG_WARNING("Missing 'name' field in modify_object command");
+        return CreateErrorResponse("Missing 'name' field");
+    }
+
+    // Indexed lookup by name or label instead of iterating every actor of the world
+    AActor *Actor = ChangeTracker->FindActor(ActorName);
+
     if (!Actor)
     {
         MCP_LOG_WARNING("Actor not found: %s", *ActorName);
@@ -337,6 +978,9 @@ TSharedPtr<FJsonObject> FMCPModifyObjectHandler::Execute(const TSharedPtr<FJsonO
 
     if (bModified)
     {
+        // SetActorLocation and friends don't notify the editor, so report the change ourselves
+        ChangeTracker->MarkModified(Actor);
+
         // Create a result object with the actor name
         TSharedPtr<FJsonObject> Result = MakeShared<FJsonObject>();
         Result->SetStringField("name", Actor->GetName());
@@ -354,6 +998,110 @@ TSharedPtr<FJsonObject> FMCPModifyObjectHandler::Execute(const TSharedPtr<FJsonO
     }
 }
 
+//
+// FMCPModifyObjectsHandler
+//
+TSharedPtr<FJsonObject> FMCPModifyObjectsHandler::Execute(const TSharedPtr<FJsonObject> &Params, FSocket *ClientSocket)
+{
+    MCP_LOG_INFO("Handling modify_objects command");
+
+    const TArray<TSharedPtr<FJsonValue>> *NamesArrayPtr = nullptr;
+    if (!Params->TryGetArrayField(FStringView(TEXT("names")), NamesArrayPtr) || !NamesArrayPtr)
+    {
+        MCP_LOG_WARNING("Missing 'names' field in modify_objects command");
+        return CreateErrorResponse("Missing 'names' field");
+    }
+
+    const int32 Count = NamesArrayPtr->Num();
+    if (Count == 0 || Count > MCPConstants::MAX_OBJECTS_PER_BULK_COMMAND)
+    {
+        MCP_LOG_WARNING("modify_objects command with %d names", Count);
+        return CreateErrorResponse(FString::Printf(TEXT("'names' must contain between 1 and %d entries"),
+                                                   MCPConstants::MAX_OBJECTS_PER_BULK_COMMAND));
+    }
+
+    TArray<FVector> Locations;
+    TArray<FVector> Rotations;
+    TArray<FVector> Scales;
+    FString Error;
+    if (!ReadVectorColumn(Params, TEXT("locations"), Locations, Error)
+        || !ReadVectorColumn(Params, TEXT("rotations"), Rotations, Error)
+        || !ReadVectorColumn(Params, TEXT("scales"), Scales, Error))
+    {
+        MCP_LOG_WARNING("Invalid modify_objects parameters: %s", *Error);
+        return CreateErrorResponse(Error);
+    }
+
+    // Each column has one entry per name, or a single entry that applies to every actor
+    for (const TArray<FVector> *Column : {&Locations, &Rotations, &Scales})
+    {
+        if (Column->Num() > 1 && Column->Num() != Count)
+        {
+            MCP_LOG_WARNING("modify_objects transforms do not match the %d names", Count);
+            return CreateErrorResponse("'locations', 'rotations' and 'scales' must have one entry per name, or a single entry for all");
+        }
+    }
+    if (Locations.Num() == 0 && Rotations.Num() == 0 && Scales.Num() == 0)
+    {
+        MCP_LOG_WARNING("No modifications specified in modify_objects command");
+        return CreateErrorResponse("No modifications specified");
+    }
+
+    // Relative mode adds locations and rotations to the current ones and multiplies the current scales
+    bool bRelative = false;
+    Params->TryGetBoolField(FStringView(TEXT("relative")), bRelative);
+
+    // Every change below is undone in one step
+    FScopedTransaction Transaction(NSLOCTEXT("UnrealMCP", "ModifyObjects", "MCP Modify Objects"));
+
+    TArray<TSharedPtr<FJsonValue>> NotFound;
+    int32 ModifiedCount = 0;
+    for (int32 Index = 0; Index < Count; ++Index)
+    {
+        const FString ActorName = (*NamesArrayPtr)[Index]->AsString();
+        AActor *Actor = ChangeTracker->FindActor(ActorName);
+        if (!Actor)
+        {
+            NotFound.Add(MakeShared<FJsonValueString>(ActorName));
+            continue;
+        }
+
+        Actor->Modify();
+        if (Locations.Num() > 0)
+        {
+            const FVector &Location = Locations[Locations.Num() == 1 ? 0 : Index];
+            Actor->SetActorLocation(bRelative ? Actor->GetActorLocation() + Location : Location);
+        }
+        if (Rotations.Num() > 0)
+        {
+            const FVector &RotationValues = Rotations[Rotations.Num() == 1 ? 0 : Index];
+            const FRotator Rotation(RotationValues.X, RotationValues.Y, RotationValues.Z);
+            Actor->SetActorRotation(bRelative ? Actor->GetActorRotation() + Rotation : Rotation);
+        }
+        if (Scales.Num() > 0)
+        {
+            const FVector &Scale = Scales[Scales.Num() == 1 ? 0 : Index];
+            Actor->SetActorScale3D(bRelative ? Actor->GetActorScale3D() * Scale : Scale);
+        }
+
+        // SetActorLocation and friends don't notify the editor, so report the change ourselves
+        ChangeTracker->MarkModified(Actor);
+        ModifiedCount++;
+    }
+
+    if (ModifiedCount == 0)
+    {
+        Transaction.Cancel();
+    }
+
+    MCP_LOG_INFO("Modified %d of %d actors", ModifiedCount, Count);
+
+    TSharedPtr<FJsonObject> Result = MakeShared<FJsonObject>();
+    Result->SetNumberField("modified", ModifiedCount);
+    Result->SetArrayField("not_found", NotFound);
+    return CreateSuccessResponse(Result);
+}
+
 //
 // FMCPDeleteObjectHandler
 //
@@ -368,15 +1116,8 @@ TSharedPtr<FJsonObject> FMCPDeleteObjectHandler::Execute(const TSharedPtr<FJsonO
         return CreateErrorResponse("Missing 'name' field");
     }
 
-    AActor *Actor = nullptr;
-    for (TActorIterator<AActor> It(World); It; ++It)
-    {
-        if (It->GetName() == ActorName)
-        {
-            Actor = *It;
-            break;
-        }
-    }
+    // Indexed lookup by name or label instead of iterating every actor of the world
+    AActor *Actor = ChangeTracker->FindActor(ActorName);
 
     if (!Actor)
     {
@@ -387,6 +1128,7 @@ TSharedPtr<FJsonObject> FMCPDeleteObjectHandler::Execute(const TSharedPtr<FJsonO
     // Check if the actor can be deleted
     if (!FActorEditorUtils::IsABuilderBrush(Actor))
     {
+        ChangeTracker->MarkRemoved(Actor);
         bool bDestroyed = World->DestroyActor(Actor);
         if (bDestroyed)
         {
@@ -395,6 +1137,7 @@ TSharedPtr<FJsonObject> FMCPDeleteObjectHandler::Execute(const TSharedPtr<FJsonO
         }
         else
         {
+            ChangeTracker->MarkAdded(Actor);
             MCP_LOG_ERROR("Failed to delete actor: %s", *ActorName);
             return CreateErrorResponse(FString::Printf(TEXT("Failed to delete actor: %s"), *ActorName));
         }
@@ -406,6 +1149,137 @@ TSharedPtr<FJsonObject> FMCPDeleteObjectHandler::Execute(const TSharedPtr<FJsonO
     }
 }
 
+//
+// FMCPDeleteObjectsHandler
+//
+TSharedPtr<FJsonObject> FMCPDeleteObjectsHandler::Execute(const TSharedPtr<FJsonObject> &Params, FSocket *ClientSocket)
+{
+    MCP_LOG_INFO("Handling delete_objects command");
+
+    UWorld *World = GEditor->GetEditorWorldContext().World();
+
+    const TArray<TSharedPtr<FJsonValue>> *NamesArrayPtr = nullptr;
+    const TSharedPtr<FJsonObject> *FilterObject = nullptr;
+    const bool bHasNames = Params->TryGetArrayField(FStringView(TEXT("names")), NamesArrayPtr) && NamesArrayPtr;
+    const bool bHasFilter = Params->TryGetObjectField(FStringView(TEXT("filter")), FilterObject) && FilterObject;
+    if (bHasNames == bHasFilter)
+    {
+        MCP_LOG_WARNING("delete_objects command needs either 'names' or 'filter'");
+        return CreateErrorResponse("Provide either a 'names' list or a 'filter' object");
+    }
+
+    bool bDryRun = false;
+    Params->TryGetBoolField(FStringView(TEXT("dry_run")), bDryRun);
+
+    // Collect every target before deleting anything, so deletions don't disturb the world iteration
+    TArray<AActor *> Targets;
+    TArray<TSharedPtr<FJsonValue>> NotFound;
+    if (bHasNames)
+    {
+        if (NamesArrayPtr->Num() > MCPConstants::MAX_OBJECTS_PER_BULK_COMMAND)
+        {
+            MCP_LOG_WARNING("delete_objects command with %d names", NamesArrayPtr->Num());
+            return CreateErrorResponse(FString::Printf(TEXT("'names' must contain at most %d entries"),
+                                                       MCPConstants::MAX_OBJECTS_PER_BULK_COMMAND));
+        }
+        for (const TSharedPtr<FJsonValue> &NameValue : *NamesArrayPtr)
+        {
+            const FString ActorName = NameValue->AsString();
+            AActor *Actor = ChangeTracker->FindActor(ActorName);
+            if (Actor)
+            {
+                Targets.AddUnique(Actor);
+            }
+            else
+            {
+                NotFound.Add(MakeShared<FJsonValueString>(ActorName));
+            }
+        }
+    }
+    else
+    {
+        FMCPActorFilter Filter;
+        FString Error;
+        if (!Filter.Parse(*FilterObject, Error))
+        {
+            MCP_LOG_WARNING("Invalid delete_objects filter: %s", *Error);
+            return CreateErrorResponse(Error);
+        }
+        // An empty filter would match the whole level
+        if (Filter.IsEmpty())
+        {
+            MCP_LOG_WARNING("Empty filter in delete_objects command");
+            return CreateErrorResponse("The filter must have at least one condition");
+        }
+        for (TActorIterator<AActor> It(World); It; ++It)
+        {
+            if (Filter.Matches(*It))
+            {
+                Targets.Add(*It);
+            }
+        }
+    }
+
+    // Leave out whatever the editor would not let the user delete (builder brushes, world settings, ...)
+    TArray<TSharedPtr<FJsonValue>> Skipped;
+    Targets.RemoveAll([&Skipped](AActor *Actor)
+    {
+        if (!IsUserDeletableActor(Actor))
+        {
+            Skipped.Add(MakeShared<FJsonValueString>(Actor->GetName()));
+            return true;
+        }
+        return false;
+    });
+
+    TSharedPtr<FJsonObject> Result = MakeShared<FJsonObject>();
+    Result->SetBoolField("dry_run", bDryRun);
+    Result->SetNumberField("matched", Targets.Num());
+    Result->SetArrayField("not_found", NotFound);
+    Result->SetArrayField("skipped", Skipped);
+
+    if (bDryRun)
+    {
+        TArray<TSharedPtr<FJsonValue>> Names;
+        Names.Reserve(Targets.Num());
+        for (AActor *Actor : Targets)
+        {
+            Names.Add(MakeShared<FJsonValueString>(Actor->GetName()));
+        }
+        Result->SetArrayField("names", Names);
+        MCP_LOG_INFO("delete_objects dry run matched %d actors", Targets.Num());
+        return CreateSuccessResponse(Result);
+    }
+
+    int32 DeletedCount = 0;
+    TArray<TSharedPtr<FJsonValue>> Failed;
+    if (Targets.Num() > 0)
+    {
+        // One undo step for the whole deletion
+        FScopedTransaction Transaction(NSLOCTEXT("UnrealMCP", "DeleteObjects", "MCP Delete Objects"));
+        for (AActor *Actor : Targets)
+        {
+            const FString ActorName = Actor->GetName();
+            Actor->Modify();
+            if (World->EditorDestroyActor(Actor, true))
+            {
+                ChangeTracker->MarkRemoved(Actor);
+                DeletedCount++;
+            }
+            else
+            {
+                Failed.Add(MakeShared<FJsonValueString>(ActorName));
+            }
+        }
+    }
+
+    MCP_LOG_INFO("Deleted %d of %d matching actors", DeletedCount, Targets.Num());
+
+    Result->SetNumberField("deleted", DeletedCount);
+    Result->SetArrayField("failed", Failed);
+    return CreateSuccessResponse(Result);
+}
+
 //
 // FMCPExecutePythonHandler
 //
@@ -560,6 +1434,9 @@ TSharedPtr<FJsonObject> FMCPExecutePythonHandler::Execute(const TSharedPtr<FJson
         }
     }
 
+    // The script may have changed actors without any engine notification
+    ChangeTracker->Rescan();
+
     // Create the response
     TSharedPtr<FJsonObject> ResultObj = MakeShared<FJsonObject>();
     ResultObj->SetStringField("output", Result);
@@ -582,4 +1459,133 @@ TSharedPtr<FJsonObject> FMCPExecutePythonHandler::Execute(const TSharedPtr<FJson
         Response->SetObjectField("result", ResultObj);
         return Response;
     }
-}
\ No newline at end of file
+}
+
+//
+// FMCPBatchHandler
+//
+TSharedPtr<FJsonObject> FMCPBatchHandler::Execute(const TSharedPtr<FJsonObject> &Params, FSocket *ClientSocket)
+{
+    const TArray<TSharedPtr<FJsonValue>> *CommandsArray = nullptr;
+    if (!Params->TryGetArrayField(FStringView(TEXT("commands")), CommandsArray) || !CommandsArray)
+    {
+        MCP_LOG_WARNING("Missing 'commands' field in batch command");
+        return CreateErrorResponse("Missing 'commands' field");
+    }
+
+    if (CommandsArray->Num() > MCPConstants::MAX_BATCH_COMMANDS)
+    {
+        MCP_LOG_WARNING("Batch of %d commands exceeds the limit of %d", CommandsArray->Num(), MCPConstants::MAX_BATCH_COMMANDS);
+        return CreateErrorResponse(FString::Printf(TEXT("Too many commands in batch: %d (limit %d)"),
+                                                   CommandsArray->Num(), MCPConstants::MAX_BATCH_COMMANDS));
+    }
+
+    bool bStopOnError = false;
+    Params->TryGetBoolField(FStringView(TEXT("stop_on_error")), bStopOnError);
+
+    MCP_LOG_INFO("Handling batch command with %d sub-commands", CommandsArray->Num());
+
+    const TMap<FString, TSharedPtr<IMCPCommandHandler>> &Handlers = Server->GetCommandHandlers();
+    TArray<TSharedPtr<FJsonValue>> ResultsArray;
+    ResultsArray.Reserve(CommandsArray->Num());
+    int32 SucceededCount = 0;
+    int32 FailedCount = 0;
+    int32 SkippedCount = 0;
+
+    for (int32 Index = 0; Index < CommandsArray->Num(); ++Index)
+    {
+        TSharedPtr<FJsonObject> ItemResponse;
+        FString Type;
+
+        const TSharedPtr<FJsonObject> *CommandPtr = nullptr;
+        const bool bIsObject = (*CommandsArray)[Index]->TryGetObject(CommandPtr) && CommandPtr && CommandPtr->IsValid();
+        if (bIsObject)
+        {
+            (*CommandPtr)->TryGetStringField(FStringView(TEXT("type")), Type);
+        }
+
+        if (bStopOnError && FailedCount > 0)
+        {
+            ItemResponse = MakeShared<FJsonObject>();
+            ItemResponse->SetStringField("status", "skipped");
+        }
+        else if (!bIsObject)
+        {
+            ItemResponse = CreateErrorResponse("Batch item is not an object");
+        }
+        else if (Type.IsEmpty())
+        {
+            ItemResponse = CreateErrorResponse("Missing 'type' field");
+        }
+        else if (Type == GetCommandName())
+        {
+            ItemResponse = CreateErrorResponse("Nested batch commands are not supported");
+        }
+        else
+        {
+            const TSharedPtr<IMCPCommandHandler> *Handler = Handlers.Find(Type);
+            if (!Handler || !Handler->IsValid())
+            {
+                ItemResponse = CreateErrorResponse(FString::Printf(TEXT("Unknown command: %s"), *Type));
+            }
+            else
+            {
+                const TSharedPtr<FJsonObject> *SubParamsPtr = nullptr;
+                TSharedPtr<FJsonObject> SubParams = MakeShared<FJsonObject>();
+                if ((*CommandPtr)->TryGetObjectField(FStringView(TEXT("params")), SubParamsPtr) && SubParamsPtr != nullptr)
+                {
+                    SubParams = *SubParamsPtr;
+                }
+
+                ItemResponse = (*Handler)->Execute(SubParams, ClientSocket);
+                if (!ItemResponse.IsValid())
+                {
+                    ItemResponse = CreateErrorResponse(FString::Printf(TEXT("Command %s returned no response"), *Type));
+                }
+            }
+        }
+
+        FString ItemStatus;
+        ItemResponse->TryGetStringField(FStringView(TEXT("status")), ItemStatus);
+        if (ItemStatus == TEXT("success"))
+        {
+            SucceededCount++;
+        }
+        else if (ItemStatus == TEXT("skipped"))
+        {
+            SkippedCount++;
+        }
+        else
+        {
+            FailedCount++;
+            MCP_LOG_WARNING("Batch item %d (%s) failed", Index, *Type);
+        }
+
+        ItemResponse->SetNumberField("index", Index);
+        if (!Type.IsEmpty())
+        {
+            ItemResponse->SetStringField("type", Type);
+        }
+        ResultsArray.Add(MakeShared<FJsonValueObject>(ItemResponse));
+    }
+
+    TSharedPtr<FJsonObject> Result = MakeShared<FJsonObject>();
+    Result->SetNumberField("count", CommandsArray->Num());
+    Result->SetNumberField("succeeded", SucceededCount);
+    Result->SetNumberField("failed", FailedCount);
+    Result->SetNumberField("skipped", SkippedCount);
+    Result->SetArrayField("results", ResultsArray);
+
+    MCP_LOG_INFO("Batch finished: %d succeeded, %d failed, %d skipped", SucceededCount, FailedCount, SkippedCount);
+
+    if (FailedCount == 0)
+    {
+        return CreateSuccessResponse(Result);
+    }
+
+    // Like execute_python, report the failure but keep the per-item results
+    TSharedPtr<FJsonObject> Response = CreateErrorResponse(
+        FString::Printf(TEXT("%d of %d batch commands failed"), FailedCount, CommandsArray->Num()));
+    Response->SetObjectField("result", Result);
+    return Response;
+}
@@ -227,6 +227,8 @@ TSharedPtr<FJsonObject> FMCPCreateBlueprintHandler::Execute(const TSharedPtr<FJs
 
     if (Result.Value)
     {
+        ChangeTracker->MarkAssetModified(Result.Key);
+
         TSharedPtr<FJsonObject> ResultObj = MakeShared<FJsonObject>();
         ResultObj->SetStringField("name", Result.Key->GetName());
         ResultObj->SetStringField("path", Result.Key->GetPathName());
@@ -339,6 +341,7 @@ TSharedPtr<FJsonObject> FMCPModifyBlueprintHandler::Execute(const TSharedPtr<FJs
 
     if (ModifyBlueprint(Blueprint, *Properties))
     {
+        ChangeTracker->MarkAssetModified(Blueprint);
         return CreateSuccessResponse();
     }
     else
@@ -529,13 +532,30 @@ TSharedPtr<FJsonObject> FMCPGetBlueprintInfoHandler::Execute(const TSharedPtr<FJ
         return CreateErrorResponse("Missing 'blueprint_path' field");
     }
 
+    // A client holding the info of an unchanged blueprint gets a short answer instead of a reflection walk.
+    // Only a blueprint that is already loaded can be unchanged, so FindObject is enough and never loads anything.
+    FString IfNoneMatch;
+    if (Params->TryGetStringField(TEXT("if_none_match"), IfNoneMatch))
+    {
+        UBlueprint* LoadedBlueprint = FindObject<UBlueprint>(nullptr, *BlueprintPath);
+        if (LoadedBlueprint && ChangeTracker->GetAssetStamp(LoadedBlueprint) == IfNoneMatch)
+        {
+            TSharedPtr<FJsonObject> ResultObj = MakeShared<FJsonObject>();
+            ResultObj->SetBoolField("not_modified", true);
+            ResultObj->SetStringField("stamp", IfNoneMatch);
+            return CreateSuccessResponse(ResultObj);
+        }
+    }
+
     UBlueprint* Blueprint = LoadObject<UBlueprint>(nullptr, *BlueprintPath);
     if (!Blueprint)
     {
         return CreateErrorResponse(FString::Printf(TEXT("Failed to load blueprint at path: %s"), *BlueprintPath));
     }
 
-    return CreateSuccessResponse(GetBlueprintInfo(Blueprint));
+    TSharedPtr<FJsonObject> ResultObj = GetBlueprintInfo(Blueprint);
+    ResultObj->SetStringField("stamp", ChangeTracker->GetAssetStamp(Blueprint));
+    return CreateSuccessResponse(ResultObj);
 }
 
 TSharedPtr<FJsonObject> FMCPGetBlueprintInfoHandler::GetBlueprintInfo(UBlueprint* Blueprint)
@@ -746,6 +766,7 @@ TPair<bool, TSharedPtr<FJsonObject>> FMCPCreateBlueprintEventHandler::CreateBlue
 
     // Compile and save the blueprint
     FKismetEditorUtilities::CompileBlueprint(Blueprint);
+    ChangeTracker->MarkAssetModified(Blueprint);
     
     Result->SetStringField("blueprint", Blueprint->GetName());
     Result->SetStringField("event", EventName);
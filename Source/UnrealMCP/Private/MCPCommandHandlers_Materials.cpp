@@ -42,6 +42,8 @@ TSharedPtr<FJsonObject> FMCPCreateMaterialHandler::Execute(const TSharedPtr<FJso
 
     if (Result.Value)
     {
+        ChangeTracker->MarkAssetModified(Result.Key);
+
         TSharedPtr<FJsonObject> ResultObj = MakeShared<FJsonObject>();
         ResultObj->SetStringField("name", Result.Key->GetName());
         ResultObj->SetStringField("path", Result.Key->GetPathName());
@@ -294,6 +296,7 @@ TSharedPtr<FJsonObject> FMCPModifyMaterialHandler::Execute(const TSharedPtr<FJso
 
         // Trigger material compilation
         Material->PostEditChange();
+        ChangeTracker->MarkAssetModified(Material);
 
         TSharedPtr<FJsonObject> ResultObj = MakeShared<FJsonObject>();
         ResultObj->SetStringField("name", Material->GetName());
@@ -446,6 +449,21 @@ TSharedPtr<FJsonObject> FMCPGetMaterialInfoHandler::Execute(const TSharedPtr<FJs
         return CreateErrorResponse("Missing 'path' field");
     }
 
+    // A client holding the info of an unchanged material gets a short answer instead of a property dump.
+    // Only a material that is already loaded can be unchanged, so FindObject is enough and never loads anything.
+    FString IfNoneMatch;
+    if (Params->TryGetStringField(FStringView(TEXT("if_none_match")), IfNoneMatch))
+    {
+        UMaterial* LoadedMaterial = FindObject<UMaterial>(nullptr, *MaterialPath);
+        if (LoadedMaterial && ChangeTracker->GetAssetStamp(LoadedMaterial) == IfNoneMatch)
+        {
+            TSharedPtr<FJsonObject> ResultObj = MakeShared<FJsonObject>();
+            ResultObj->SetBoolField("not_modified", true);
+            ResultObj->SetStringField("stamp", IfNoneMatch);
+            return CreateSuccessResponse(ResultObj);
+        }
+    }
+
     // Load the material
     UMaterial* Material = LoadObject<UMaterial>(nullptr, *MaterialPath);
     if (!Material)
@@ -456,6 +474,7 @@ TSharedPtr<FJsonObject> FMCPGetMaterialInfoHandler::Execute(const TSharedPtr<FJs
 
     // Get material info
     TSharedPtr<FJsonObject> ResultObj = GetMaterialInfo(Material);
+    ResultObj->SetStringField("stamp", ChangeTracker->GetAssetStamp(Material));
     return CreateSuccessResponse(ResultObj);
 }
 
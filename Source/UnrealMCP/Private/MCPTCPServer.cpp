@@ -16,6 +16,7 @@
 #include "UnrealMCP.h"
 #include "MCPFileLogger.h"
 #include "MCPCommandHandlers.h"
+#include "MCPChangeTracker.h"
 #include "MCPCommandHandlers_Blueprints.h"
 #include "MCPCommandHandlers_Materials.h"
 #include "HAL/PlatformFilemanager.h"
@@ -29,24 +30,31 @@ FMCPTCPServer::FMCPTCPServer(const FMCPTCPServerConfig& InConfig)
     : Config(InConfig)
     , Listener(nullptr)
     , bRunning(false)
+    , ChangeTracker(MakeShared<FMCPChangeTracker>())
 {
     // Register default command handlers
-    RegisterCommandHandler(MakeShared<FMCPGetSceneInfoHandler>());
-    RegisterCommandHandler(MakeShared<FMCPCreateObjectHandler>());
-    RegisterCommandHandler(MakeShared<FMCPModifyObjectHandler>());
-    RegisterCommandHandler(MakeShared<FMCPDeleteObjectHandler>());
-    RegisterCommandHandler(MakeShared<FMCPExecutePythonHandler>());
+    RegisterCommandHandler(MakeShared<FMCPGetSceneInfoHandler>(ChangeTracker));
+    RegisterCommandHandler(MakeShared<FMCPQueryActorsHandler>(ChangeTracker));
+    RegisterCommandHandler(MakeShared<FMCPGetSceneChangesHandler>(ChangeTracker));
+    RegisterCommandHandler(MakeShared<FMCPCreateObjectHandler>(ChangeTracker));
+    RegisterCommandHandler(MakeShared<FMCPCreateObjectsHandler>(ChangeTracker));
+    RegisterCommandHandler(MakeShared<FMCPModifyObjectHandler>(ChangeTracker));
+    RegisterCommandHandler(MakeShared<FMCPModifyObjectsHandler>(ChangeTracker));
+    RegisterCommandHandler(MakeShared<FMCPDeleteObjectHandler>(ChangeTracker));
+    RegisterCommandHandler(MakeShared<FMCPDeleteObjectsHandler>(ChangeTracker));
+    RegisterCommandHandler(MakeShared<FMCPExecutePythonHandler>(ChangeTracker));
+    RegisterCommandHandler(MakeShared<FMCPBatchHandler>(this));
 
     // Material command handlers
-    RegisterCommandHandler(MakeShared<FMCPCreateMaterialHandler>());
-    RegisterCommandHandler(MakeShared<FMCPModifyMaterialHandler>());
-    RegisterCommandHandler(MakeShared<FMCPGetMaterialInfoHandler>());
+    RegisterCommandHandler(MakeShared<FMCPCreateMaterialHandler>(ChangeTracker));
+    RegisterCommandHandler(MakeShared<FMCPModifyMaterialHandler>(ChangeTracker));
+    RegisterCommandHandler(MakeShared<FMCPGetMaterialInfoHandler>(ChangeTracker));
 
     // Blueprint command handlers
-    RegisterCommandHandler(MakeShared<FMCPCreateBlueprintHandler>());
-    RegisterCommandHandler(MakeShared<FMCPModifyBlueprintHandler>());
-    RegisterCommandHandler(MakeShared<FMCPGetBlueprintInfoHandler>());
-    RegisterCommandHandler(MakeShared<FMCPCreateBlueprintEventHandler>());
+    RegisterCommandHandler(MakeShared<FMCPCreateBlueprintHandler>(ChangeTracker));
+    RegisterCommandHandler(MakeShared<FMCPModifyBlueprintHandler>(ChangeTracker));
+    RegisterCommandHandler(MakeShared<FMCPGetBlueprintInfoHandler>(ChangeTracker));
+    RegisterCommandHandler(MakeShared<FMCPCreateBlueprintEventHandler>(ChangeTracker));
 }
 
 FMCPTCPServer::~FMCPTCPServer()
@@ -156,6 +164,8 @@ bool FMCPTCPServer::Start()
     // Clear any existing client connections
     ClientConnections.Empty();
 
+    ChangeTracker->Start();
+
     TickerHandle = FTSTicker::GetCoreTicker().AddTicker(FTickerDelegate::CreateRaw(this, &FMCPTCPServer::Tick), Config.TickIntervalSeconds);
     bRunning = true;
     MCP_LOG_INFO("MCP Server started on port %d", Config.Port);
@@ -179,6 +189,8 @@ void FMCPTCPServer::Stop()
         TickerHandle.Reset();
     }
     
+    ChangeTracker->Stop();
+    
     bRunning = false;
     MCP_LOG_INFO("MCP Server stopped");
 }
@@ -227,12 +239,18 @@ bool FMCPTCPServer::HandleConnectionAccepted(FSocket* InSocket, const FIPv4Endpo
 
 void FMCPTCPServer::ProcessClientData()
 {
-    // Make a copy of the array since we might modify it during iteration
-    TArray<FMCPClientConnection> ConnectionsCopy = ClientConnections;
+    // Snapshot the sockets since we might modify the connection list during iteration
+    TArray<FSocket*> ClientSockets;
+    for (const FMCPClientConnection& Connection : ClientConnections)
+    {
+        ClientSockets.Add(Connection.Socket);
+    }
     
-    for (FMCPClientConnection& ClientConnection : ConnectionsCopy)
+    for (FSocket* ClientSocket : ClientSockets)
     {
-        if (!ClientConnection.Socket) continue;
+        FMCPClientConnection* ClientConnectionPtr = FindClientConnection(ClientSocket);
+        if (!ClientConnectionPtr || !ClientConnectionPtr->Socket) continue;
+        FMCPClientConnection& ClientConnection = *ClientConnectionPtr;
         
         // Check if the client is still connected
         uint32 PendingDataSize = 0;
@@ -273,6 +291,12 @@ void FMCPTCPServer::ProcessClientData()
             }
         }
         
+        if (ClientConnection.Framing == EMCPFraming::LengthPrefixed)
+        {
+            ProcessFramedClientData(ClientSocket);
+            continue;
+        }
+        
         // Reset PendingDataSize and check again to ensure we have the latest value
         PendingDataSize = 0;
         if (ClientConnection.Socket->HasPendingData(PendingDataSize))
@@ -318,24 +342,118 @@ void FMCPTCPServer::ProcessClientData()
     }
 }
 
+void FMCPTCPServer::ProcessFramedClientData(FSocket* ClientSocket)
+{
+    FMCPClientConnection* ClientConnection = FindClientConnection(ClientSocket);
+    if (!ClientConnection) return;
+    
+    // Drain everything that has arrived so large frames are received at full socket speed
+    uint32 PendingDataSize = 0;
+    while (ClientSocket->HasPendingData(PendingDataSize) && PendingDataSize > 0)
+    {
+        int32 BytesRead = 0;
+        if (!ClientSocket->Recv(ClientConnection->ReceiveBuffer.GetData(), ClientConnection->ReceiveBuffer.Num(), BytesRead))
+        {
+            int32 ErrorCode = ISocketSubsystem::Get(PLATFORM_SOCKETSUBSYSTEM)->GetLastErrorCode();
+            if (ErrorCode != SE_EWOULDBLOCK)
+            {
+                MCP_LOG_WARNING("Socket error %d for client %s, closing connection", 
+                    ErrorCode, *ClientConnection->Endpoint.ToString());
+                CleanupClientConnection(*ClientConnection);
+                return;
+            }
+            break;
+        }
+        
+        if (BytesRead <= 0) break;
+        
+        ClientConnection->PendingData.Append(ClientConnection->ReceiveBuffer.GetData(), BytesRead);
+        ClientConnection->TimeSinceLastActivity = 0.0f;
+        
+        if (Config.bEnableVerboseLogging)
+        {
+            MCP_LOG_VERBOSE("Read %d bytes from client %s (%d bytes buffered)", 
+                BytesRead, *ClientConnection->Endpoint.ToString(), ClientConnection->PendingData.Num());
+        }
+    }
+    
+    // Process every complete frame, several commands may arrive in one tick
+    int32 Offset = 0;
+    while (ClientConnection->Framing == EMCPFraming::LengthPrefixed
+        && ClientConnection->PendingData.Num() - Offset >= MCPConstants::FRAME_HEADER_SIZE)
+    {
+        const uint8* Header = ClientConnection->PendingData.GetData() + Offset;
+        const uint32 FrameSize = (uint32(Header[0]) << 24) | (uint32(Header[1]) << 16) | (uint32(Header[2]) << 8) | uint32(Header[3]);
+        
+        if (FrameSize > uint32(Config.MaxFrameSize))
+        {
+            MCP_LOG_WARNING("Frame of %u bytes from client %s exceeds the %d byte limit, closing connection", 
+                FrameSize, *ClientConnection->Endpoint.ToString(), Config.MaxFrameSize);
+            
+            TSharedPtr<FJsonObject> Response = MakeShared<FJsonObject>();
+            Response->SetStringField("status", "error");
+            Response->SetStringField("message", FString::Printf(TEXT("Frame too large: %u bytes (limit %d)"), FrameSize, Config.MaxFrameSize));
+            SendResponse(ClientSocket, Response);
+            CleanupClientConnection(ClientSocket);
+            return;
+        }
+        
+        if (int64(ClientConnection->PendingData.Num() - Offset - MCPConstants::FRAME_HEADER_SIZE) < int64(FrameSize))
+        {
+            // Wait for the rest of the frame
+            break;
+        }
+        
+        FUTF8ToTCHAR Converter(reinterpret_cast<const ANSICHAR*>(Header + MCPConstants::FRAME_HEADER_SIZE), FrameSize);
+        FString CommandJson(Converter.Length(), Converter.Get());
+        Offset += MCPConstants::FRAME_HEADER_SIZE + FrameSize;
+        
+        ProcessCommand(CommandJson, ClientSocket);
+        
+        // Processing a command may have dropped the client
+        ClientConnection = FindClientConnection(ClientSocket);
+        if (!ClientConnection) return;
+    }
+    
+    if (Offset > 0)
+    {
+        ClientConnection->PendingData.RemoveAt(0, Offset, false);
+    }
+}
+
+FMCPClientConnection* FMCPTCPServer::FindClientConnection(FSocket* ClientSocket)
+{
+    if (!ClientSocket) return nullptr;
+    
+    return ClientConnections.FindByPredicate([ClientSocket](const FMCPClientConnection& Connection) {
+        return Connection.Socket == ClientSocket;
+    });
+}
+
 void FMCPTCPServer::CheckClientTimeouts(float DeltaTime)
 {
-    // Make a copy of the array since we might modify it during iteration
-    TArray<FMCPClientConnection> ConnectionsCopy = ClientConnections;
+    // Snapshot the sockets since we might modify the connection list during iteration.
+    // The idle time must be updated on the stored connection, not on a copy.
+    TArray<FSocket*> ClientSockets;
+    for (const FMCPClientConnection& Connection : ClientConnections)
+    {
+        ClientSockets.Add(Connection.Socket);
+    }
     
-    for (FMCPClientConnection& ClientConnection : ConnectionsCopy)
+    for (FSocket* ClientSocket : ClientSockets)
     {
-        if (!ClientConnection.Socket) continue;
+        FMCPClientConnection* ClientConnection = FindClientConnection(ClientSocket);
+        if (!ClientConnection || !ClientConnection->Socket) continue;
         
         // Increment time since last activity
-        ClientConnection.TimeSinceLastActivity += DeltaTime;
+        ClientConnection->TimeSinceLastActivity += DeltaTime;
         
         // Check if client has timed out
-        if (ClientConnection.TimeSinceLastActivity > Config.ClientTimeoutSeconds)
+        if (ClientConnection->TimeSinceLastActivity > Config.ClientTimeoutSeconds)
         {
             MCP_LOG_WARNING("Client from %s timed out after %.1f seconds of inactivity, disconnecting", 
-                *ClientConnection.Endpoint.ToString(), ClientConnection.TimeSinceLastActivity);
-            CleanupClientConnection(ClientConnection);
+                *ClientConnection->Endpoint.ToString(), ClientConnection->TimeSinceLastActivity);
+            CleanupClientConnection(*ClientConnection);
         }
     }
 }
@@ -411,14 +529,28 @@ void FMCPTCPServer::CleanupClientConnection(FMCPClientConnection& ClientConnecti
         MCP_LOG_ERROR("Unknown exception while cleaning up client connection");
     }
     
-    // Remove from our list of connections
-    ClientConnections.RemoveAll([&ClientConnection](const FMCPClientConnection& Connection) {
-        return Connection.Socket == ClientConnection.Socket;
+    // Remove from our list of connections. ClientConnection may refer to an element of
+    // ClientConnections itself, so compare against a copy of its socket pointer.
+    FSocket* ClosedSocket = ClientConnection.Socket;
+    ClientConnections.RemoveAll([ClosedSocket](const FMCPClientConnection& Connection) {
+        return Connection.Socket == ClosedSocket;
     });
     
     MCP_LOG_INFO("MCP Client disconnected (Remaining clients: %d)", ClientConnections.Num());
 }
 
+namespace
+{
+    /** Echo a command's correlation id in its response */
+    void SetRequestId(const TSharedPtr<FJsonObject>& Response, const TSharedPtr<FJsonValue>& RequestId)
+    {
+        if (Response.IsValid() && RequestId.IsValid())
+        {
+            Response->SetField(TEXT("id"), RequestId);
+        }
+    }
+}
+
 void FMCPTCPServer::ProcessCommand(const FString& CommandJson, FSocket* ClientSocket)
 {
     if (Config.bEnableVerboseLogging)
@@ -430,9 +562,25 @@ void FMCPTCPServer::ProcessCommand(const FString& CommandJson, FSocket* ClientSo
     TSharedRef<TJsonReader<>> Reader = TJsonReaderFactory<>::Create(CommandJson);
     if (FJsonSerializer::Deserialize(Reader, Command) && Command.IsValid())
     {
+        // Optional correlation id, echoed back so clients can pipeline requests on one connection
+        const TSharedPtr<FJsonValue> RequestId = Command->TryGetField(FStringView(TEXT("id")));
+        
         FString Type;
         if (Command->TryGetStringField(FStringView(TEXT("type")), Type))
         {
+            if (Type == MCPConstants::SET_PROTOCOL_COMMAND)
+            {
+                const TSharedPtr<FJsonObject>* ProtocolParamsPtr = nullptr;
+                TSharedPtr<FJsonObject> ProtocolParams = MakeShared<FJsonObject>();
+                if (Command->TryGetObjectField(FStringView(TEXT("params")), ProtocolParamsPtr) && ProtocolParamsPtr != nullptr)
+                {
+                    ProtocolParams = *ProtocolParamsPtr;
+                }
+                
+                HandleSetProtocol(ProtocolParams, ClientSocket, RequestId);
+                return;
+            }
+            
             TSharedPtr<IMCPCommandHandler> Handler = CommandHandlers.FindRef(Type);
             if (Handler.IsValid())
             {
@@ -450,6 +598,7 @@ void FMCPTCPServer::ProcessCommand(const FString& CommandJson, FSocket* ClientSo
                 TSharedPtr<FJsonObject> Response = Handler->Execute(Params, ClientSocket);
                 
                 // Send the response
+                SetRequestId(Response, RequestId);
                 SendResponse(ClientSocket, Response);
             }
             else
@@ -459,6 +608,7 @@ void FMCPTCPServer::ProcessCommand(const FString& CommandJson, FSocket* ClientSo
                 TSharedPtr<FJsonObject> Response = MakeShared<FJsonObject>();
                 Response->SetStringField("status", "error");
                 Response->SetStringField("message", FString::Printf(TEXT("Unknown command: %s"), *Type));
+                SetRequestId(Response, RequestId);
                 SendResponse(ClientSocket, Response);
             }
         }
@@ -469,6 +619,7 @@ void FMCPTCPServer::ProcessCommand(const FString& CommandJson, FSocket* ClientSo
             TSharedPtr<FJsonObject> Response = MakeShared<FJsonObject>();
             Response->SetStringField("status", "error");
             Response->SetStringField("message", TEXT("Missing 'type' field"));
+            SetRequestId(Response, RequestId);
             SendResponse(ClientSocket, Response);
         }
     }
@@ -486,12 +637,59 @@ void FMCPTCPServer::ProcessCommand(const FString& CommandJson, FSocket* ClientSo
     // Do not close the socket here
 }
 
+void FMCPTCPServer::HandleSetProtocol(const TSharedPtr<FJsonObject>& Params, FSocket* ClientSocket, const TSharedPtr<FJsonValue>& RequestId)
+{
+    FString FramingName;
+    Params->TryGetStringField(FStringView(TEXT("framing")), FramingName);
+    
+    EMCPFraming NewFraming;
+    if (FramingName == MCPConstants::FRAMING_LENGTH_PREFIXED)
+    {
+        NewFraming = EMCPFraming::LengthPrefixed;
+    }
+    else if (FramingName == MCPConstants::FRAMING_RAW)
+    {
+        NewFraming = EMCPFraming::Raw;
+    }
+    else
+    {
+        MCP_LOG_WARNING("Unsupported framing requested: %s", *FramingName);
+        
+        TSharedPtr<FJsonObject> Response = MakeShared<FJsonObject>();
+        Response->SetStringField("status", "error");
+        Response->SetStringField("message", FString::Printf(TEXT("Unsupported framing: %s"), *FramingName));
+        SetRequestId(Response, RequestId);
+        SendResponse(ClientSocket, Response);
+        return;
+    }
+    
+    TSharedPtr<FJsonObject> Result = MakeShared<FJsonObject>();
+    Result->SetStringField("framing", FramingName);
+    Result->SetNumberField("max_frame_size", Config.MaxFrameSize);
+    
+    TSharedPtr<FJsonObject> Response = MakeShared<FJsonObject>();
+    Response->SetStringField("status", "success");
+    Response->SetObjectField("result", Result);
+    
+    // The reply uses the framing the request arrived in, the switch applies to the next message
+    SetRequestId(Response, RequestId);
+    SendResponse(ClientSocket, Response);
+    
+    if (FMCPClientConnection* ClientConnection = FindClientConnection(ClientSocket))
+    {
+        ClientConnection->Framing = NewFraming;
+        MCP_LOG_INFO("Client %s switched to %s framing", *ClientConnection->Endpoint.ToString(), *FramingName);
+    }
+}
+
 void FMCPTCPServer::SendResponse(FSocket* Client, const TSharedPtr<FJsonObject>& Response)
 {
     if (!Client) return;
     
+    // Condensed output: pretty printing indents every actor of a scene listing and roughly doubles its size
     FString ResponseStr;
-    TSharedRef<TJsonWriter<>> Writer = TJsonWriterFactory<>::Create(&ResponseStr);
+    TSharedRef<TJsonWriter<TCHAR, TCondensedJsonPrintPolicy<TCHAR>>> Writer =
+        TJsonWriterFactory<TCHAR, TCondensedJsonPrintPolicy<TCHAR>>::Create(&ResponseStr);
     FJsonSerializer::Serialize(Response.ToSharedRef(), Writer);
     
     if (Config.bEnableVerboseLogging)
@@ -500,43 +698,78 @@ void FMCPTCPServer::SendResponse(FSocket* Client, const TSharedPtr<FJsonObject>&
     }
     
     FTCHARToUTF8 Converter(*ResponseStr);
-    int32 BytesSent = 0;
     int32 TotalBytes = Converter.Length();
     const uint8* Data = (const uint8*)Converter.Get();
     
+    // Length-prefixed clients get a 4-byte big-endian size in front of the payload
+    TArray<uint8> Frame;
+    const FMCPClientConnection* ClientConnection = FindClientConnection(Client);
+    if (ClientConnection && ClientConnection->Framing == EMCPFraming::LengthPrefixed)
+    {
+        const uint32 PayloadSize = uint32(TotalBytes);
+        Frame.Reserve(MCPConstants::FRAME_HEADER_SIZE + TotalBytes);
+        Frame.Add(uint8(PayloadSize >> 24));
+        Frame.Add(uint8(PayloadSize >> 16));
+        Frame.Add(uint8(PayloadSize >> 8));
+        Frame.Add(uint8(PayloadSize));
+        Frame.Append(Data, TotalBytes);
+        
+        Data = Frame.GetData();
+        TotalBytes = Frame.Num();
+    }
+    
     // Ensure all data is sent
-    while (BytesSent < TotalBytes)
+    int32 BytesSent = SendAll(Client, Data, TotalBytes);
+    
+    if (BytesSent == TotalBytes)
+    {
+        MCP_LOG_INFO("Successfully sent complete response (%d bytes)", TotalBytes);
+    }
+    else
+    {
+        MCP_LOG_WARNING("Only sent %d/%d bytes of response", BytesSent, TotalBytes);
+    }
+}
+
+int32 FMCPTCPServer::SendAll(FSocket* Client, const uint8* Data, int32 NumBytes)
+{
+    int32 BytesSent = 0;
+    const double Deadline = FPlatformTime::Seconds() + Config.ClientTimeoutSeconds;
+    
+    while (BytesSent < NumBytes)
     {
         int32 SentThisTime = 0;
-        if (!Client->Send(Data + BytesSent, TotalBytes - BytesSent, SentThisTime))
+        if (Client->Send(Data + BytesSent, NumBytes - BytesSent, SentThisTime) && SentThisTime > 0)
         {
-            MCP_LOG_WARNING("Failed to send response");
-            break;
+            BytesSent += SentThisTime;
+            
+            if (Config.bEnableVerboseLogging)
+            {
+                MCP_LOG_VERBOSE("Sent %d/%d bytes", BytesSent, NumBytes);
+            }
+            continue;
         }
         
-        if (SentThisTime <= 0)
+        // Client sockets are non-blocking, so a full send buffer shows up as "would block".
+        // Wait for the client to drain it instead of dropping the rest of the response.
+        int32 ErrorCode = ISocketSubsystem::Get(PLATFORM_SOCKETSUBSYSTEM)->GetLastErrorCode();
+        if (ErrorCode != SE_EWOULDBLOCK && ErrorCode != SE_NO_ERROR)
         {
-            // Would block, try again next tick
-            MCP_LOG_VERBOSE("Socket would block, will try again next tick");
+            MCP_LOG_WARNING("Failed to send response (error code %d)", ErrorCode);
             break;
         }
         
-        BytesSent += SentThisTime;
-        
-        if (Config.bEnableVerboseLogging)
+        if (FPlatformTime::Seconds() > Deadline)
         {
-            MCP_LOG_VERBOSE("Sent %d/%d bytes", BytesSent, TotalBytes);
+            MCP_LOG_WARNING("Timed out waiting for the client to accept the rest of the response");
+            break;
         }
+        
+        MCP_LOG_VERBOSE("Socket would block, waiting until it is writable");
+        Client->Wait(ESocketWaitConditions::WaitForWrite, FTimespan::FromMilliseconds(10));
     }
     
-    if (BytesSent == TotalBytes)
-    {
-        MCP_LOG_INFO("Successfully sent complete response (%d bytes)", TotalBytes);
-    }
-    else
-    {
-        MCP_LOG_WARNING("Only sent %d/%d bytes of response", BytesSent, TotalBytes);
-    }
+    return BytesSent;
 }
 
 FString FMCPTCPServer::GetSafeSocketDescription(FSocket* Socket)
@@ -0,0 +1,60 @@
+#pragma once
+
+#include "CoreMinimal.h"
+#include "Dom/JsonObject.h"
+#include "Internationalization/Regex.h"
+
+class AActor;
+
+/**
+ * Actor filter parsed from the 'filter' object of scene query commands
+ *
+ * Every condition that is set must hold for an actor to match:
+ *   class       - Class name of the actor or one of its parent classes (e.g. "Light" matches PointLight)
+ *   name        - Wildcard pattern (* and ?) matched against the actor name, case-insensitive
+ *   names       - List of exact actor names or labels, the actor must have one of them
+ *   label       - Wildcard pattern matched against the actor label, case-insensitive
+ *   label_regex - Regular expression the actor label must contain a match for
+ *   tag         - Actor tag the actor must have
+ *   box         - {"min": [x, y, z], "max": [x, y, z]}: the actor location must be inside the box
+ *   near        - {"point": [x, y, z], "radius": r}: the actor location must be within r of the point
+ */
+class UNREALMCP_API FMCPActorFilter
+{
+public:
+    /**
+     * Read a filter from JSON
+     * @param FilterJson - The filter object, may be null for a filter that matches every actor
+     * @param OutError - Receives a description of the first invalid condition
+     * @return True if the filter is valid
+     */
+    bool Parse(const TSharedPtr<FJsonObject>& FilterJson, FString& OutError);
+
+    /**
+     * Check an actor against every condition of the filter
+     * @param Actor - The actor to check
+     * @return True if the actor matches
+     */
+    bool Matches(const AActor* Actor) const;
+
+    /**
+     * Check whether the filter has no conditions
+     * @return True if every actor matches
+     */
+    bool IsEmpty() const;
+
+private:
+    FString ClassName;
+    FString NamePattern;
+    TSet<FString> Names;
+    FString LabelPattern;
+    TOptional<FRegexPattern> LabelRegex;
+    FName Tag;
+
+    bool bHasBox = false;
+    FBox Box = FBox(ForceInit);
+
+    bool bHasNear = false;
+    FVector NearPoint = FVector::ZeroVector;
+    double NearRadiusSquared = 0.0;
+};
@@ -0,0 +1,204 @@
+#pragma once
+
+#include "CoreMinimal.h"
+#include "UObject/WeakObjectPtr.h"
+
+class AActor;
+class UBlueprint;
+class UObject;
+class UWorld;
+class FPackageReloadedEvent;
+struct FPropertyChangedEvent;
+enum class EPackageReloadPhase : uint8;
+
+/**
+ * Actors added, modified and removed since a scene version
+ */
+struct FMCPSceneChanges
+{
+    /** Scene version the changes lead up to */
+    int64 Version = 0;
+
+    /** True if the requested version is too old for a delta and the client must fetch the whole scene */
+    bool bFullResync = false;
+
+    /** Actors spawned since the requested version */
+    TArray<AActor*> Added;
+
+    /** Actors that existed at the requested version and have changed since */
+    TArray<AActor*> Modified;
+
+    /** Names of actors that existed at the requested version and have been removed since */
+    TArray<FString> Removed;
+};
+
+/**
+ * Tracks changes to the actors of the editor world
+ *
+ * Every recorded change bumps a monotonically increasing scene version, so
+ * clients can ask for the actors that changed since the version they last
+ * saw instead of downloading the whole scene again. Spawns, deletions and
+ * editor moves and property edits are picked up from engine delegates;
+ * command handlers report changes the engine does not broadcast (for example
+ * SetActorLocation) through MarkModified, or call Rescan after running
+ * arbitrary code.
+ *
+ * The tracked actors are indexed by name and label, so command handlers can
+ * resolve the actor a command targets without iterating the world.
+ *
+ * Assets (materials, blueprints, ...) get a change stamp that is bumped
+ * whenever the asset or one of its subobjects is edited, a blueprint is
+ * compiled or its package is reloaded from disk, so clients can cache asset
+ * information and cheaply ask whether it is still current.
+ */
+class UNREALMCP_API FMCPChangeTracker
+{
+public:
+    FMCPChangeTracker();
+    ~FMCPChangeTracker();
+
+    /**
+     * Snapshot the editor world and start listening for changes
+     */
+    void Start();
+
+    /**
+     * Stop listening for changes
+     */
+    void Stop();
+
+    /**
+     * Get the current scene version
+     * @return The version of the most recent change
+     */
+    int64 GetVersion() const { return Version; }
+
+    /**
+     * Record that an actor was spawned
+     * @param Actor - The new actor
+     */
+    void MarkAdded(AActor* Actor);
+
+    /**
+     * Record that an actor changed
+     * @param Actor - The changed actor
+     */
+    void MarkModified(AActor* Actor);
+
+    /**
+     * Record that an actor is being removed
+     * @param Actor - The removed actor
+     */
+    void MarkRemoved(AActor* Actor);
+
+    /**
+     * Compare the editor world with the last known state of every actor and record the differences
+     * Use after running code that may have changed actors without any notification (e.g. Python).
+     */
+    void Rescan();
+
+    /**
+     * Get the changes since a scene version
+     * @param SinceVersion - The version the client last saw
+     * @param OutChanges - Receives the changes
+     */
+    void GetChangesSince(int64 SinceVersion, FMCPSceneChanges& OutChanges);
+
+    /**
+     * Find an actor of the editor world by name, or by label if no actor has that name
+     * Looks the actor up in the index and only scans the world if the index does not know it.
+     * @param NameOrLabel - The actor name or label
+     * @return The actor, or nullptr if there is none
+     */
+    AActor* FindActor(const FString& NameOrLabel) const;
+
+    /**
+     * Record that an asset changed
+     * @param Asset - The changed asset
+     */
+    void MarkAssetModified(const UObject* Asset);
+
+    /**
+     * Get the change stamp of an asset
+     * The stamp changes whenever the asset is edited and differs between editor sessions.
+     * @param Asset - The asset
+     * @return An opaque stamp to compare with the one a client sent
+     */
+    FString GetAssetStamp(const UObject* Asset) const;
+
+private:
+    /** Last known state of an actor and the versions it changed at */
+    struct FActorEntry
+    {
+        TWeakObjectPtr<AActor> Actor;
+        int64 AddedVersion = 0;
+        int64 Version = 0;
+        bool bRemoved = false;
+        FTransform Transform;
+        FString Label;
+    };
+
+    /** Get the world being tracked */
+    UWorld* GetEditorWorld() const;
+
+    /** Whether an actor belongs to the tracked world */
+    bool IsTracked(AActor* Actor) const;
+
+    /** Forget everything and snapshot the current editor world; older versions require a full resync */
+    void Reset();
+
+    /** Remember the current transform and label of an actor and keep the label index up to date */
+    void CaptureState(const FString& Name, FActorEntry& Entry, AActor* Actor);
+
+    /** Record the removal of a tracked actor */
+    void MarkEntryRemoved(const FString& Name, FActorEntry& Entry);
+
+    /** Get the live actor tracked under a name, or nullptr if it is gone or was renamed */
+    AActor* FindTrackedActor(const FString& Name) const;
+
+    /** Drop the oldest removal records once there are too many of them */
+    void PruneRemovedEntries();
+
+    void HandleActorAdded(AActor* Actor);
+    void HandleActorDeleted(AActor* Actor);
+    void HandleActorMoved(AActor* Actor);
+    void HandleObjectPropertyChanged(UObject* Object, FPropertyChangedEvent& Event);
+    void HandleMapChange(uint32 MapChangeFlags);
+    void HandleBlueprintPreCompile(UBlueprint* Blueprint);
+    void HandlePackageReloaded(EPackageReloadPhase Phase, FPackageReloadedEvent* Event);
+
+    /** Entries by actor name, including removed actors */
+    TMap<FString, FActorEntry> Entries;
+
+    /** Names of the live actors by label; labels need not be unique */
+    TMultiMap<FString, FString> NamesByLabel;
+
+    /** Number of removed entries in Entries */
+    int32 RemovedCount;
+
+    /** Version of the most recent change */
+    int64 Version;
+
+    /** Oldest version a delta can be computed from */
+    int64 MinVersion;
+
+    /** Revision of the most recent change by asset path; assets never changed have revision 0 */
+    TMap<FString, int64> AssetRevisions;
+
+    /** Revision of the most recent asset change */
+    int64 AssetRevision;
+
+    /** Identifies this editor session in asset stamps, so stamps from an earlier session never match */
+    FString SessionId;
+
+    /** Whether the engine delegates are bound */
+    bool bStarted;
+
+    FDelegateHandle ActorAddedHandle;
+    FDelegateHandle ActorDeletedHandle;
+    FDelegateHandle ActorMovedHandle;
+    FDelegateHandle PropertyChangedHandle;
+    FDelegateHandle MapChangeHandle;
+    FDelegateHandle BlueprintPreCompileHandle;
+    FDelegateHandle PackageReloadedHandle;
+};
@@ -2,6 +2,7 @@
 
 #include "CoreMinimal.h"
 #include "MCPTCPServer.h"
+#include "MCPChangeTracker.h"
 #include "Engine/World.h"
 #include "Engine/StaticMeshActor.h"
 #include "Components/StaticMeshComponent.h"
@@ -70,8 +71,13 @@ protected:
 class FMCPGetSceneInfoHandler : public FMCPCommandHandlerBase
 {
 public:
-    FMCPGetSceneInfoHandler()
+    /**
+     * Constructor
+     * @param InChangeTracker - The tracker that versions changes to the editor world
+     */
+    explicit FMCPGetSceneInfoHandler(TSharedPtr<FMCPChangeTracker> InChangeTracker)
         : FMCPCommandHandlerBase("get_scene_info")
+        , ChangeTracker(InChangeTracker)
     {
     }
 
@@ -82,6 +88,74 @@ public:
      * @return JSON response object
      */
     virtual TSharedPtr<FJsonObject> Execute(const TSharedPtr<FJsonObject>& Params, FSocket* ClientSocket) override;
+
+private:
+    /** Tracker that versions changes to the editor world */
+    TSharedPtr<FMCPChangeTracker> ChangeTracker;
+};
+
+/**
+ * Handler for the query_actors command
+ *
+ * Pages through the actors matching an FMCPActorFilter ('filter' parameter),
+ * with the same paging, fields and format parameters as get_scene_info.
+ */
+class FMCPQueryActorsHandler : public FMCPCommandHandlerBase
+{
+public:
+    /**
+     * Constructor
+     * @param InChangeTracker - The tracker that versions changes to the editor world
+     */
+    explicit FMCPQueryActorsHandler(TSharedPtr<FMCPChangeTracker> InChangeTracker)
+        : FMCPCommandHandlerBase("query_actors")
+        , ChangeTracker(InChangeTracker)
+    {
+    }
+
+    /**
+     * Execute the query_actors command
+     * @param Params - The command parameters
+     * @param ClientSocket - The client socket
+     * @return JSON response object
+     */
+    virtual TSharedPtr<FJsonObject> Execute(const TSharedPtr<FJsonObject>& Params, FSocket* ClientSocket) override;
+
+private:
+    /** Tracker that versions changes to the editor world */
+    TSharedPtr<FMCPChangeTracker> ChangeTracker;
+};
+
+/**
+ * Handler for the get_scene_changes command
+ *
+ * Returns the actors added, modified and removed since a scene version, so
+ * clients can keep a copy of the scene up to date without downloading it again.
+ */
+class FMCPGetSceneChangesHandler : public FMCPCommandHandlerBase
+{
+public:
+    /**
+     * Constructor
+     * @param InChangeTracker - The tracker that versions changes to the editor world
+     */
+    explicit FMCPGetSceneChangesHandler(TSharedPtr<FMCPChangeTracker> InChangeTracker)
+        : FMCPCommandHandlerBase("get_scene_changes")
+        , ChangeTracker(InChangeTracker)
+    {
+    }
+
+    /**
+     * Execute the get_scene_changes command
+     * @param Params - The command parameters
+     * @param ClientSocket - The client socket
+     * @return JSON response object
+     */
+    virtual TSharedPtr<FJsonObject> Execute(const TSharedPtr<FJsonObject>& Params, FSocket* ClientSocket) override;
+
+private:
+    /** Tracker that versions changes to the editor world */
+    TSharedPtr<FMCPChangeTracker> ChangeTracker;
 };
 
 /**
@@ -90,8 +164,13 @@ public:
 class FMCPCreateObjectHandler : public FMCPCommandHandlerBase
 {
 public:
-    FMCPCreateObjectHandler()
+    /**
+     * Constructor
+     * @param InChangeTracker - The tracker that versions changes to the editor world
+     */
+    explicit FMCPCreateObjectHandler(TSharedPtr<FMCPChangeTracker> InChangeTracker)
         : FMCPCommandHandlerBase("create_object")
+        , ChangeTracker(InChangeTracker)
     {
     }
 
@@ -122,6 +201,43 @@ protected:
      * @return The created actor and a success flag
      */
     TPair<AStaticMeshActor*, bool> CreateCubeActor(UWorld* World, const FVector& Location, const FString& Label = "");
+
+private:
+    /** Tracker that versions changes to the editor world */
+    TSharedPtr<FMCPChangeTracker> ChangeTracker;
+};
+
+/**
+ * Handler for the create_objects command
+ *
+ * Spawns one actor of a type per entry of 'locations' in a single pass, with
+ * optional per-actor 'rotations', 'scales' and 'labels'. Vectors may be sent
+ * as lists of [x, y, z] or as base64 packed float32 triples.
+ */
+class FMCPCreateObjectsHandler : public FMCPCommandHandlerBase
+{
+public:
+    /**
+     * Constructor
+     * @param InChangeTracker - The tracker that versions changes to the editor world
+     */
+    explicit FMCPCreateObjectsHandler(TSharedPtr<FMCPChangeTracker> InChangeTracker)
+        : FMCPCommandHandlerBase("create_objects")
+        , ChangeTracker(InChangeTracker)
+    {
+    }
+
+    /**
+     * Execute the create_objects command
+     * @param Params - The command parameters
+     * @param ClientSocket - The client socket
+     * @return JSON response object
+     */
+    virtual TSharedPtr<FJsonObject> Execute(const TSharedPtr<FJsonObject>& Params, FSocket* ClientSocket) override;
+
+private:
+    /** Tracker that versions changes to the editor world */
+    TSharedPtr<FMCPChangeTracker> ChangeTracker;
 };
 
 /**
@@ -130,8 +246,13 @@ protected:
 class FMCPModifyObjectHandler : public FMCPCommandHandlerBase
 {
 public:
-    FMCPModifyObjectHandler()
+    /**
+     * Constructor
+     * @param InChangeTracker - The tracker that versions changes to the editor world
+     */
+    explicit FMCPModifyObjectHandler(TSharedPtr<FMCPChangeTracker> InChangeTracker)
         : FMCPCommandHandlerBase("modify_object")
+        , ChangeTracker(InChangeTracker)
     {
     }
 
@@ -142,6 +263,43 @@ public:
      * @return JSON response object
      */
     virtual TSharedPtr<FJsonObject> Execute(const TSharedPtr<FJsonObject>& Params, FSocket* ClientSocket) override;
+
+private:
+    /** Tracker that versions changes to the editor world */
+    TSharedPtr<FMCPChangeTracker> ChangeTracker;
+};
+
+/**
+ * Handler for the modify_objects command
+ *
+ * Sets or, with 'relative', offsets the transforms of many actors in one pass
+ * and one undo transaction. 'locations', 'rotations' and 'scales' hold one
+ * entry per name in 'names', or a single entry that applies to every actor.
+ */
+class FMCPModifyObjectsHandler : public FMCPCommandHandlerBase
+{
+public:
+    /**
+     * Constructor
+     * @param InChangeTracker - The tracker that versions changes to the editor world
+     */
+    explicit FMCPModifyObjectsHandler(TSharedPtr<FMCPChangeTracker> InChangeTracker)
+        : FMCPCommandHandlerBase("modify_objects")
+        , ChangeTracker(InChangeTracker)
+    {
+    }
+
+    /**
+     * Execute the modify_objects command
+     * @param Params - The command parameters
+     * @param ClientSocket - The client socket
+     * @return JSON response object
+     */
+    virtual TSharedPtr<FJsonObject> Execute(const TSharedPtr<FJsonObject>& Params, FSocket* ClientSocket) override;
+
+private:
+    /** Tracker that versions changes to the editor world */
+    TSharedPtr<FMCPChangeTracker> ChangeTracker;
 };
 
 /**
@@ -150,8 +308,13 @@ public:
 class FMCPDeleteObjectHandler : public FMCPCommandHandlerBase
 {
 public:
-    FMCPDeleteObjectHandler()
+    /**
+     * Constructor
+     * @param InChangeTracker - The tracker that versions changes to the editor world
+     */
+    explicit FMCPDeleteObjectHandler(TSharedPtr<FMCPChangeTracker> InChangeTracker)
         : FMCPCommandHandlerBase("delete_object")
+        , ChangeTracker(InChangeTracker)
     {
     }
 
@@ -162,6 +325,43 @@ public:
      * @return JSON response object
      */
     virtual TSharedPtr<FJsonObject> Execute(const TSharedPtr<FJsonObject>& Params, FSocket* ClientSocket) override;
+
+private:
+    /** Tracker that versions changes to the editor world */
+    TSharedPtr<FMCPChangeTracker> ChangeTracker;
+};
+
+/**
+ * Handler for the delete_objects command
+ *
+ * Deletes the actors named in 'names', or every actor matching an
+ * FMCPActorFilter 'filter', in one pass. With 'dry_run' nothing is deleted
+ * and the names of the matching actors are returned instead.
+ */
+class FMCPDeleteObjectsHandler : public FMCPCommandHandlerBase
+{
+public:
+    /**
+     * Constructor
+     * @param InChangeTracker - The tracker that versions changes to the editor world
+     */
+    explicit FMCPDeleteObjectsHandler(TSharedPtr<FMCPChangeTracker> InChangeTracker)
+        : FMCPCommandHandlerBase("delete_objects")
+        , ChangeTracker(InChangeTracker)
+    {
+    }
+
+    /**
+     * Execute the delete_objects command
+     * @param Params - The command parameters
+     * @param ClientSocket - The client socket
+     * @return JSON response object
+     */
+    virtual TSharedPtr<FJsonObject> Execute(const TSharedPtr<FJsonObject>& Params, FSocket* ClientSocket) override;
+
+private:
+    /** Tracker that versions changes to the editor world */
+    TSharedPtr<FMCPChangeTracker> ChangeTracker;
 };
 
 /**
@@ -170,8 +370,13 @@ public:
 class FMCPExecutePythonHandler : public FMCPCommandHandlerBase
 {
 public:
-    FMCPExecutePythonHandler()
+    /**
+     * Constructor
+     * @param InChangeTracker - The tracker that versions changes to the editor world
+     */
+    explicit FMCPExecutePythonHandler(TSharedPtr<FMCPChangeTracker> InChangeTracker)
         : FMCPCommandHandlerBase("execute_python")
+        , ChangeTracker(InChangeTracker)
     {
     }
 
@@ -182,4 +387,40 @@ public:
      * @return JSON response object
      */
     virtual TSharedPtr<FJsonObject> Execute(const TSharedPtr<FJsonObject>& Params, FSocket* ClientSocket) override;
-}; 
\ No newline at end of file
+
+private:
+    /** Tracker that versions changes to the editor world */
+    TSharedPtr<FMCPChangeTracker> ChangeTracker;
+};
+
+/**
+ * Handler for the batch command
+ *
+ * Runs an ordered list of sub-commands in a single tick through the server's
+ * registered command handlers and reports a result for each of them.
+ */
+class FMCPBatchHandler : public FMCPCommandHandlerBase
+{
+public:
+    /**
+     * Constructor
+     * @param InServer - The server whose command handlers run the sub-commands
+     */
+    explicit FMCPBatchHandler(FMCPTCPServer* InServer)
+        : FMCPCommandHandlerBase("batch")
+        , Server(InServer)
+    {
+    }
+
+    /**
+     * Execute the batch command
+     * @param Params - The command parameters
+     * @param ClientSocket - The client socket
+     * @return JSON response object
+     */
+    virtual TSharedPtr<FJsonObject> Execute(const TSharedPtr<FJsonObject>& Params, FSocket* ClientSocket) override;
+
+private:
+    /** The server that owns this handler */
+    FMCPTCPServer* Server;
+};
@@ -59,11 +59,23 @@ public:
 class FMCPCreateBlueprintHandler : public FMCPCommandHandlerBase
 {
 public:
-    FMCPCreateBlueprintHandler() : FMCPCommandHandlerBase(TEXT("create_blueprint")) {}
+    /**
+     * Constructor
+     * @param InChangeTracker - The tracker that stamps changes to assets
+     */
+    explicit FMCPCreateBlueprintHandler(TSharedPtr<FMCPChangeTracker> InChangeTracker)
+        : FMCPCommandHandlerBase(TEXT("create_blueprint"))
+        , ChangeTracker(InChangeTracker)
+    {
+    }
+
     virtual TSharedPtr<FJsonObject> Execute(const TSharedPtr<FJsonObject>& Params, FSocket* ClientSocket) override;
 
 private:
     TPair<UBlueprint*, bool> CreateBlueprint(const FString& PackagePath, const FString& BlueprintName, const TSharedPtr<FJsonObject>& Properties);
+
+    /** The tracker that stamps changes to assets */
+    TSharedPtr<FMCPChangeTracker> ChangeTracker;
 };
 
 /**
@@ -72,11 +84,23 @@ private:
 class FMCPModifyBlueprintHandler : public FMCPCommandHandlerBase
 {
 public:
-    FMCPModifyBlueprintHandler() : FMCPCommandHandlerBase(TEXT("modify_blueprint")) {}
+    /**
+     * Constructor
+     * @param InChangeTracker - The tracker that stamps changes to assets
+     */
+    explicit FMCPModifyBlueprintHandler(TSharedPtr<FMCPChangeTracker> InChangeTracker)
+        : FMCPCommandHandlerBase(TEXT("modify_blueprint"))
+        , ChangeTracker(InChangeTracker)
+    {
+    }
+
     virtual TSharedPtr<FJsonObject> Execute(const TSharedPtr<FJsonObject>& Params, FSocket* ClientSocket) override;
 
 private:
     bool ModifyBlueprint(UBlueprint* Blueprint, const TSharedPtr<FJsonObject>& Properties);
+
+    /** The tracker that stamps changes to assets */
+    TSharedPtr<FMCPChangeTracker> ChangeTracker;
 };
 
 /**
@@ -85,11 +109,23 @@ private:
 class FMCPGetBlueprintInfoHandler : public FMCPCommandHandlerBase
 {
 public:
-    FMCPGetBlueprintInfoHandler() : FMCPCommandHandlerBase(TEXT("get_blueprint_info")) {}
+    /**
+     * Constructor
+     * @param InChangeTracker - The tracker that stamps changes to assets
+     */
+    explicit FMCPGetBlueprintInfoHandler(TSharedPtr<FMCPChangeTracker> InChangeTracker)
+        : FMCPCommandHandlerBase(TEXT("get_blueprint_info"))
+        , ChangeTracker(InChangeTracker)
+    {
+    }
+
     virtual TSharedPtr<FJsonObject> Execute(const TSharedPtr<FJsonObject>& Params, FSocket* ClientSocket) override;
 
 private:
     TSharedPtr<FJsonObject> GetBlueprintInfo(UBlueprint* Blueprint);
+
+    /** The tracker that stamps changes to assets */
+    TSharedPtr<FMCPChangeTracker> ChangeTracker;
 };
 
 /**
@@ -98,7 +134,16 @@ private:
 class FMCPCreateBlueprintEventHandler : public FMCPCommandHandlerBase
 {
 public:
-    FMCPCreateBlueprintEventHandler() : FMCPCommandHandlerBase(TEXT("create_blueprint_event")) {}
+    /**
+     * Constructor
+     * @param InChangeTracker - The tracker that stamps changes to assets
+     */
+    explicit FMCPCreateBlueprintEventHandler(TSharedPtr<FMCPChangeTracker> InChangeTracker)
+        : FMCPCommandHandlerBase(TEXT("create_blueprint_event"))
+        , ChangeTracker(InChangeTracker)
+    {
+    }
+
     virtual TSharedPtr<FJsonObject> Execute(const TSharedPtr<FJsonObject>& Params, FSocket* ClientSocket) override;
 
 private:
@@ -107,4 +152,7 @@ private:
         const FString& EventName,
         const FString& BlueprintPath,
         const TSharedPtr<FJsonObject>& EventParameters);
+
+    /** The tracker that stamps changes to assets */
+    TSharedPtr<FMCPChangeTracker> ChangeTracker;
 }; 
\ No newline at end of file
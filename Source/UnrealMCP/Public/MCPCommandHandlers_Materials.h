@@ -9,30 +9,66 @@
 class FMCPCreateMaterialHandler : public FMCPCommandHandlerBase
 {
 public:
-    FMCPCreateMaterialHandler() : FMCPCommandHandlerBase(TEXT("create_material")) {}
+    /**
+     * Constructor
+     * @param InChangeTracker - The tracker that stamps changes to assets
+     */
+    explicit FMCPCreateMaterialHandler(TSharedPtr<FMCPChangeTracker> InChangeTracker)
+        : FMCPCommandHandlerBase(TEXT("create_material"))
+        , ChangeTracker(InChangeTracker)
+    {
+    }
+
     virtual TSharedPtr<FJsonObject> Execute(const TSharedPtr<FJsonObject>& Params, FSocket* ClientSocket) override;
 
 private:
     TPair<UMaterial*, bool> CreateMaterial(const FString& PackagePath, const FString& MaterialName, const TSharedPtr<FJsonObject>& Properties);
     bool ModifyMaterialProperties(UMaterial* Material, const TSharedPtr<FJsonObject>& Properties);
+
+    /** The tracker that stamps changes to assets */
+    TSharedPtr<FMCPChangeTracker> ChangeTracker;
 };
 
 class FMCPModifyMaterialHandler : public FMCPCommandHandlerBase
 {
 public:
-    FMCPModifyMaterialHandler() : FMCPCommandHandlerBase(TEXT("modify_material")) {}
+    /**
+     * Constructor
+     * @param InChangeTracker - The tracker that stamps changes to assets
+     */
+    explicit FMCPModifyMaterialHandler(TSharedPtr<FMCPChangeTracker> InChangeTracker)
+        : FMCPCommandHandlerBase(TEXT("modify_material"))
+        , ChangeTracker(InChangeTracker)
+    {
+    }
+
     virtual TSharedPtr<FJsonObject> Execute(const TSharedPtr<FJsonObject>& Params, FSocket* ClientSocket) override;
 
 private:
     bool ModifyMaterialProperties(UMaterial* Material, const TSharedPtr<FJsonObject>& Properties);
+
+    /** The tracker that stamps changes to assets */
+    TSharedPtr<FMCPChangeTracker> ChangeTracker;
 };
 
 class FMCPGetMaterialInfoHandler : public FMCPCommandHandlerBase
 {
 public:
-    FMCPGetMaterialInfoHandler() : FMCPCommandHandlerBase(TEXT("get_material_info")) {}
+    /**
+     * Constructor
+     * @param InChangeTracker - The tracker that stamps changes to assets
+     */
+    explicit FMCPGetMaterialInfoHandler(TSharedPtr<FMCPChangeTracker> InChangeTracker)
+        : FMCPCommandHandlerBase(TEXT("get_material_info"))
+        , ChangeTracker(InChangeTracker)
+    {
+    }
+
     virtual TSharedPtr<FJsonObject> Execute(const TSharedPtr<FJsonObject>& Params, FSocket* ClientSocket) override;
 
 private:
     TSharedPtr<FJsonObject> GetMaterialInfo(UMaterial* Material);
+
+    /** The tracker that stamps changes to assets */
+    TSharedPtr<FMCPChangeTracker> ChangeTracker;
 }; 
\ No newline at end of file
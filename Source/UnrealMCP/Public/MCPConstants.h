@@ -14,6 +14,13 @@ namespace MCPConstants
     constexpr float DEFAULT_CLIENT_TIMEOUT_SECONDS = 30.0f;
     constexpr float DEFAULT_TICK_INTERVAL_SECONDS = 0.1f;
     
+    // Framing constants
+    constexpr const TCHAR* SET_PROTOCOL_COMMAND = TEXT("set_protocol");
+    constexpr const TCHAR* FRAMING_RAW = TEXT("raw");
+    constexpr const TCHAR* FRAMING_LENGTH_PREFIXED = TEXT("length_prefixed");
+    constexpr int32 FRAME_HEADER_SIZE = 4; // Big-endian uint32 payload length
+    constexpr int32 DEFAULT_MAX_FRAME_SIZE = 256 * 1024 * 1024; // 256MB
+    
     // Python constants
     constexpr const TCHAR* PYTHON_TEMP_DIR_NAME = TEXT("PythonTemp");
     constexpr const TCHAR* PYTHON_TEMP_FILE_PREFIX = TEXT("mcp_temp_script_");
@@ -22,7 +29,15 @@ namespace MCPConstants
     constexpr bool DEFAULT_VERBOSE_LOGGING = false;
     
     // Performance constants
-    constexpr int32 MAX_ACTORS_IN_SCENE_INFO = 1000;
+    constexpr int32 MAX_ACTORS_IN_SCENE_INFO = 1000; // Default page size of get_scene_info
+    constexpr int32 MAX_SCENE_INFO_PAGE_SIZE = 10000; // Largest 'limit' accepted by get_scene_info
+    constexpr int32 MAX_BATCH_COMMANDS = 10000; // Sub-commands accepted in one batch command
+    constexpr int32 MAX_REMOVED_ACTORS_IN_CHANGE_JOURNAL = 10000; // Removal records kept for get_scene_changes
+    constexpr int32 MAX_OBJECTS_PER_BULK_COMMAND = 100000; // Actors accepted in one create_objects, modify_objects or delete_objects command
+    
+    // Scene format constants (the 'format' parameter of get_scene_info)
+    constexpr const TCHAR* SCENE_FORMAT_OBJECTS = TEXT("objects"); // One JSON object per actor in 'actors'
+    constexpr const TCHAR* SCENE_FORMAT_COLUMNAR = TEXT("columnar"); // Parallel arrays and base64 float32 buffers in 'columns'
     
     // Path constants - use these instead of hardcoded paths
     // These will be initialized at runtime in the module startup
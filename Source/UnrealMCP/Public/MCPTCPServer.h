@@ -8,6 +8,8 @@
 #include "SocketSubsystem.h"
 #include "MCPConstants.h"
 
+class FMCPChangeTracker;
+
 /**
  * Configuration struct for the TCP server
  * Allows for easy customization of server parameters
@@ -28,6 +30,21 @@ struct FMCPTCPServerConfig
     
     /** Whether to log verbose messages */
     bool bEnableVerboseLogging = MCPConstants::DEFAULT_VERBOSE_LOGGING;
+    
+    /** Largest accepted length-prefixed frame in bytes */
+    int32 MaxFrameSize = MCPConstants::DEFAULT_MAX_FRAME_SIZE;
+};
+
+/**
+ * Wire framing used by a client connection
+ */
+enum class EMCPFraming : uint8
+{
+    /** Bare JSON, one command per receive (the default for new connections) */
+    Raw,
+    
+    /** Each message is a 4-byte big-endian length followed by that many bytes of UTF-8 JSON */
+    LengthPrefixed
 };
 
 /**
@@ -46,6 +63,12 @@ struct FMCPClientConnection
     
     /** Buffer for receiving data */
     TArray<uint8> ReceiveBuffer;
+    
+    /** Framing negotiated for this connection */
+    EMCPFraming Framing;
+    
+    /** Received bytes not yet consumed as a complete frame (length-prefixed framing only) */
+    TArray<uint8> PendingData;
 
     /**
      * Constructor
@@ -57,6 +80,7 @@ struct FMCPClientConnection
         : Socket(InSocket)
         , Endpoint(InEndpoint)
         , TimeSinceLastActivity(0.0f)
+        , Framing(EMCPFraming::Raw)
     {
         ReceiveBuffer.SetNumUninitialized(BufferSize);
     }
@@ -161,6 +185,13 @@ public:
      */
     const TMap<FString, TSharedPtr<IMCPCommandHandler>>& GetCommandHandlers() const { return CommandHandlers; }
 
+    /**
+     * Get the tracker that versions changes to the editor world
+     * External handlers that change actors without an engine notification should report them here.
+     * @return The change tracker
+     */
+    TSharedPtr<FMCPChangeTracker> GetChangeTracker() const { return ChangeTracker; }
+
 protected:
     /**
      * Tick function called by the ticker
@@ -186,6 +217,36 @@ protected:
      */
     virtual void ProcessCommand(const FString& CommandJson, FSocket* ClientSocket);
     
+    /**
+     * Handle a set_protocol request, switching the client's framing after the reply is sent
+     * @param Params - The command parameters
+     * @param ClientSocket - The client socket
+     * @param RequestId - The request's correlation id, echoed in the reply; may be null
+     */
+    virtual void HandleSetProtocol(const TSharedPtr<FJsonObject>& Params, FSocket* ClientSocket, const TSharedPtr<FJsonValue>& RequestId);
+    
+    /**
+     * Read all pending data for a length-prefixed client and process every complete frame
+     * @param ClientSocket - The client socket
+     */
+    virtual void ProcessFramedClientData(FSocket* ClientSocket);
+    
+    /**
+     * Find the connection entry for a client socket
+     * @param ClientSocket - The client socket
+     * @return The connection, or nullptr if the socket is not a known client
+     */
+    FMCPClientConnection* FindClientConnection(FSocket* ClientSocket);
+    
+    /**
+     * Send raw bytes to a client, waiting while the socket would block
+     * @param Client - The client socket
+     * @param Data - The bytes to send
+     * @param NumBytes - The number of bytes to send
+     * @return The number of bytes actually sent
+     */
+    int32 SendAll(FSocket* Client, const uint8* Data, int32 NumBytes);
+    
     /**
      * Check for client timeouts
      * @param DeltaTime - Time since last tick
@@ -241,6 +302,9 @@ protected:
     
     /** Command handlers map */
     TMap<FString, TSharedPtr<IMCPCommandHandler>> CommandHandlers;
+    
+    /** Scene version tracking for get_scene_changes */
+    TSharedPtr<FMCPChangeTracker> ChangeTracker;
 
 private:
     // Disable copy and assignment